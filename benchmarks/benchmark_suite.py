@@ -0,0 +1,598 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Union
+from tabulate import tabulate
+from classes.city_prices import ProductsPricesInAllCities
+from classes.city_prices_vectorized import ProductsPricesInAllCitiesVectorized, is_vectorized_prices_backend_available
+from classes.game import Game
+from classes.game_engine import GameEngine
+from classes.game_snapshot import GameSnapshotFile
+from classes.player import PlayersTransaction
+from classes.products import Product
+from classes.world_config import WorldConfig, load_world_config, load_world_config_file
+from highscores.game_result import GameResult
+from highscores.manage_high_scores_file import ManageHighScoresFile, HighScores
+from input_handling.io_backend import ScriptedIOBackend, use_io_backend
+from simulation.batch_runner import play_single_game
+from simulation.optimal_profit_solver import OptimalProfitSolver
+from simulation.strategies import GreedyTraderStrategy
+from constants import CITIES_LIST, PRODUCTS_LIST, TOTAL_TRADE_DAYS_IN_A_GAME, BENCHMARK_SEED, \
+	BENCHMARK_REGRESSION_TOLERANCE
+
+
+"""
+Benchmarks of the game hot paths - to find out whether a change made the game slower.
+
+Micro benchmarks time a single operation many times ( buying a product, drawing the prices of a new day, looking up a
+voyage time ). Macro benchmarks time complete flows - starting the game, loading a large world file and starting a game
+in it, a full game replayed from a script of player commands through the menus, games played by a bot, and loading and
+saving the high scores at 10k, 100k and 1M results.
+
+Every run of a benchmark starts from the same random seed. The results are written as JSON, and can be compared to the
+results of a previous run ( a baseline ) - a benchmark which became slower than the tolerance is reported as a
+regression, and the command fails. Run from the repository root, for example:
+	python -m benchmarks.benchmark_suite --output /tmp/baseline.json
+	python -m benchmarks.benchmark_suite --baseline /tmp/baseline.json
+"""
+
+
+BENCHMARK_GROUP_MICRO: str = "micro"
+BENCHMARK_GROUP_MACRO: str = "macro"
+HIGH_SCORES_BENCHMARK_SIZES: List[int] = [10000, 100000, 1000000]
+REPOSITORY_ROOT_PATH: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands of a full game session played through the menus - buys wine, sails, sells it, and ends the game
+SCRIPTED_GAME_SESSION_COMMANDS: List[str] = ["1", "1", "Wine", "100", "y", "5", "4", "Larnaka",
+											 "1", "2", "Wine", "100", "y", "5", "8", "y"]
+
+
+class Benchmark:
+	""" A single benchmark - prepares its data, and returns the operation to time """
+	def __init__(self,
+				 name: str,
+				 group: str,
+				 amount_of_operations: int,
+				 prepare: Callable[[str], Callable[[], None]]):
+		"""
+
+		:param name: Unique name of the benchmark, used to compare it with the baseline
+		:param group: BENCHMARK_GROUP_MICRO or BENCHMARK_GROUP_MACRO
+		:param amount_of_operations: Amount of operations done by a single timed run
+		:param prepare: Gets a work directory for files, prepares everything the benchmark needs ( not timed ), and
+						returns the function to time
+		"""
+		self.name: str = name
+		self.group: str = group
+		self.amount_of_operations: int = amount_of_operations
+		self.prepare: Callable[[str], Callable[[], None]] = prepare
+
+
+def prepare_game_engine_with_budget(budget: int) -> GameEngine:
+	""" Creates a game where the player has a given budget
+
+	:param budget:
+	:return: GameEngine
+	"""
+	game_engine = GameEngine(player_name="benchmark")
+	game_engine.player._budget = budget
+	return game_engine
+
+
+def benchmark_buy_product(amount_of_operations: int) -> Benchmark:
+	""" Buys a single unit of a product, directly with PlayersTransaction
+
+	:param amount_of_operations:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		product_transactions: PlayersTransaction = \
+			prepare_game_engine_with_budget(budget=amount_of_operations * 1000).product_transactions
+		product: Product = PRODUCTS_LIST[0]
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				product_transactions.buy_product(product_to_buy=product, amount_to_buy=1)
+		return run
+	return Benchmark(name="players_transaction_buy_product", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def benchmark_sell_product(amount_of_operations: int) -> Benchmark:
+	""" Sells a single unit of a product, directly with PlayersTransaction
+
+	:param amount_of_operations:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_engine: GameEngine = prepare_game_engine_with_budget(budget=0)
+		product: Product = PRODUCTS_LIST[0]
+		game_engine.player_inventory.add_product_to_inventory(product=product, amount_to_add=amount_of_operations)
+		product_transactions: PlayersTransaction = game_engine.product_transactions
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				product_transactions.sell_product(product_to_sell=product, amount_to_sell=1)
+		return run
+	return Benchmark(name="players_transaction_sell_product", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def benchmark_game_engine_buy_product(amount_of_operations: int) -> Benchmark:
+	""" Buys a single unit of a product through the game engine - including the checks and the transactions ledger
+
+	:param amount_of_operations:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_engine: GameEngine = prepare_game_engine_with_budget(budget=amount_of_operations * 1000)
+		product_name: str = PRODUCTS_LIST[0].name
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				game_engine.buy_product(product_name=product_name, amount_to_buy=1)
+		return run
+	return Benchmark(name="game_engine_buy_product", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def benchmark_generate_prices(amount_of_operations: int, is_vectorized: bool) -> Benchmark:
+	""" Moves the prices of all cities to a new trade day
+
+	:param amount_of_operations:
+	:param is_vectorized: Whether to use the numpy prices backend
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		if is_vectorized:
+			prices_in_cities = ProductsPricesInAllCitiesVectorized(cities_names_in_game=CITIES_LIST,
+																   products_in_game=PRODUCTS_LIST,
+																   amount_of_trade_days=TOTAL_TRADE_DAYS_IN_A_GAME,
+																   seed=BENCHMARK_SEED)
+		else:
+			prices_in_cities = ProductsPricesInAllCities(cities_names_in_game=CITIES_LIST,
+														 products_in_game=PRODUCTS_LIST)
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				prices_in_cities.generate_prices_for_all_cities()
+		return run
+	return Benchmark(name="generate_prices_for_all_cities" + ("_vectorized" if is_vectorized else ""),
+					 group=BENCHMARK_GROUP_MICRO, amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def create_large_world_config(amount_of_cities: int) -> WorldConfig:
+	""" Creates a world with many cities, where every city has a route of its own to two other cities
+
+	:param amount_of_cities:
+	:return: WorldConfig
+	"""
+	cities_names: List[str] = [f"city_{city_id}" for city_id in range(amount_of_cities)]
+	return WorldConfig(cities_names=cities_names,
+					   products_list=PRODUCTS_LIST,
+					   routes_voyage_times={(from_city_name, to_city_name): random.randint(1, 12)
+											for from_city_name, to_city_name in zip(cities_names, cities_names[1:])})
+
+
+def benchmark_voyage_times_matrix(amount_of_cities: int) -> Benchmark:
+	""" Calculates the shortest voyage times between all cities of a large world
+
+	:param amount_of_cities:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		world_config: WorldConfig = create_large_world_config(amount_of_cities=amount_of_cities)
+
+		def run() -> None:
+			world_config.voyage_times_matrices.clear()
+			world_config.get_voyage_times_matrix()
+		return run
+	return Benchmark(name=f"voyage_times_matrix_{amount_of_cities}_cities", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=1, prepare=prepare)
+
+
+def benchmark_voyage_time_lookup(amount_of_operations: int) -> Benchmark:
+	""" Looks up the voyage time from the player's city to another city in a large world
+
+	:param amount_of_operations:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_engine = GameEngine(player_name="benchmark", world_config=create_large_world_config(amount_of_cities=1000))
+		game_engine.voyage_times_matrix  # Calculated once, before timing
+		city_name: str = game_engine.cities_list[-1]
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				game_engine.get_voyage_time_to_city(city_name=city_name)
+		return run
+	return Benchmark(name="voyage_time_lookup", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def benchmark_best_reachable_trade(amount_of_operations: int) -> Benchmark:
+	""" Moves a large world to a new trade day, and looks up the best trade reachable from the player's city - builds
+	the arbitrage index of the day and the table of the player's city
+
+	:param amount_of_operations:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_engine = GameEngine(player_name="benchmark", world_config=create_large_world_config(amount_of_cities=1000))
+		game_engine.voyage_times_matrix  # Calculated once, before timing
+
+		def run() -> None:
+			for _ in range(amount_of_operations):
+				game_engine.move_to_next_day()
+				game_engine.get_best_reachable_trade()
+		return run
+	return Benchmark(name="best_reachable_trade", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_operations, prepare=prepare)
+
+
+def benchmark_npc_traders_days(amount_of_traders: int, amount_of_days: int) -> Benchmark:
+	""" Moves a game with many NPC traders to new trade days - every day the traders trade, and move the new prices
+
+	:param amount_of_traders:
+	:param amount_of_days:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_engine = GameEngine(player_name="benchmark", amount_of_npc_traders=amount_of_traders)
+
+		def run() -> None:
+			for _ in range(amount_of_days):
+				game_engine.move_to_next_day()
+		return run
+	return Benchmark(name=f"npc_traders_day_{amount_of_traders}", group=BENCHMARK_GROUP_MICRO,
+					 amount_of_operations=amount_of_days, prepare=prepare)
+
+
+def create_game_results(amount_of_results: int) -> List[GameResult]:
+	""" Creates random game results - the same results for the same random seed
+
+	:param amount_of_results:
+	:return: List[GameResult]
+	"""
+	first_game_datetime = datetime(2020, 1, 1)
+	return [GameResult(name=f"player_{random.randrange(1000)}",
+					   coins_earned=random.randrange(1000000),
+					   amount_of_trade_days=TOTAL_TRADE_DAYS_IN_A_GAME,
+					   game_datetime=first_game_datetime + timedelta(seconds=random.randrange(10 ** 8)))
+			for _ in range(amount_of_results)]
+
+
+def benchmark_high_scores_save(amount_of_results: int) -> Benchmark:
+	""" Writes a high scores file with many results
+
+	:param amount_of_results:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		game_results: List[GameResult] = create_game_results(amount_of_results=amount_of_results)
+		high_scores_file = ManageHighScoresFile(
+			high_scores_file_path=os.path.join(work_directory, f"save_{amount_of_results}.json"),
+			high_scores_journal_file_path=os.path.join(work_directory, f"save_{amount_of_results}.jsonl"))
+
+		def run() -> None:
+			high_scores_file.rewrite_high_scores(game_results_list=game_results)
+		return run
+	return Benchmark(name=f"high_scores_save_{amount_of_results}", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_results, prepare=prepare)
+
+
+def benchmark_high_scores_load(amount_of_results: int) -> Benchmark:
+	""" Loads the high scores leaderboards from a file with many results
+
+	:param amount_of_results:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		high_scores_file_path: str = os.path.join(work_directory, f"load_{amount_of_results}.json")
+		high_scores_journal_file_path: str = os.path.join(work_directory, f"load_{amount_of_results}.jsonl")
+		if not os.path.exists(high_scores_file_path):
+			ManageHighScoresFile(high_scores_file_path=high_scores_file_path,
+								 high_scores_journal_file_path=high_scores_journal_file_path) \
+				.rewrite_high_scores(game_results_list=create_game_results(amount_of_results=amount_of_results))
+
+		def run() -> None:
+			HighScores(high_scores_storage=ManageHighScoresFile(
+				high_scores_file_path=high_scores_file_path,
+				high_scores_journal_file_path=high_scores_journal_file_path)).load_leaderboards()
+		return run
+	return Benchmark(name=f"high_scores_load_{amount_of_results}", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_results, prepare=prepare)
+
+
+def benchmark_game_snapshot_load(amount_of_loads: int) -> Benchmark:
+	""" Restores a game from a snapshot file with the most autosaves kept before it is compacted
+
+	:param amount_of_loads:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		snapshot_file_path: str = os.path.join(work_directory, "game_snapshot.json")
+		if os.path.exists(snapshot_file_path):
+			os.remove(snapshot_file_path)
+		game_engine = GameEngine(player_name="benchmark")
+		snapshot_file = GameSnapshotFile(snapshot_file_path=snapshot_file_path)
+		for _ in range(snapshot_file.max_incremental_saves - 1):
+			game_engine.buy_product(product_name=PRODUCTS_LIST[0].name, amount_to_buy=1)
+			snapshot_file.autosave(game=game_engine)
+
+		def run() -> None:
+			for _ in range(amount_of_loads):
+				GameSnapshotFile(snapshot_file_path=snapshot_file_path).load_into(
+					game=GameEngine(player_name="benchmark"))
+		return run
+	return Benchmark(name="game_snapshot_load", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_loads, prepare=prepare)
+
+
+def benchmark_game_startup(amount_of_launches: int) -> Benchmark:
+	""" Starts the game in a new Python process, until the main menu is shown, and exits it
+
+	:param amount_of_launches:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		def run() -> None:
+			for _ in range(amount_of_launches):
+				subprocess.run([sys.executable, "main.py"], input="3\n", cwd=REPOSITORY_ROOT_PATH,
+							   capture_output=True, text=True, check=True)
+		return run
+	return Benchmark(name="game_startup", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_launches, prepare=prepare)
+
+
+def benchmark_large_world_game_setup(amount_of_cities: int, amount_of_products: int) -> Benchmark:
+	""" Loads a world file with many cities and products, and starts a game in it
+
+	:param amount_of_cities:
+	:param amount_of_products:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		cities_names: List[str] = [f"city_{index}" for index in range(amount_of_cities)]
+		products_names: List[str] = [f"product_{index}" for index in range(amount_of_products)]
+		world_file_path: str = os.path.join(work_directory, "large_world.json")
+		with open(world_file_path, "w", encoding="utf-8") as world_file:
+			json.dump({
+				"cities": [{"name": city_name, "products": products_names[city_id % 2::2]} if city_id % 3 == 0
+						   else {"name": city_name} for city_id, city_name in enumerate(cities_names)],
+				"products": [{"name": product_name, "min_price": 1, "max_price": 100}
+							 for product_name in products_names],
+				"routes": [{"from": from_city_name, "to": to_city_name, "voyage_time": 3}
+						   for from_city_name, to_city_name in zip(cities_names, cities_names[1:])],
+			}, world_file)
+
+		def run() -> None:
+			load_world_config_file.cache_clear()
+			GameEngine(player_name="benchmark", world_config=load_world_config(world_config_file_path=world_file_path))
+		return run
+	return Benchmark(name=f"large_world_game_setup_{amount_of_cities}x{amount_of_products}", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=1, prepare=prepare)
+
+
+def benchmark_scripted_game_sessions(amount_of_games: int) -> Benchmark:
+	""" Plays full games through the game menus, replaying a script of player commands
+
+	:param amount_of_games:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		def run() -> None:
+			for _ in range(amount_of_games):
+				with use_io_backend(ScriptedIOBackend(commands=SCRIPTED_GAME_SESSION_COMMANDS)):
+					Game(player_name="benchmark").start_game()
+		return run
+	return Benchmark(name="scripted_game_session", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_games, prepare=prepare)
+
+
+def benchmark_bot_games(amount_of_games: int) -> Benchmark:
+	""" Plays full games with the greedy bot strategy
+
+	:param amount_of_games:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		def run() -> None:
+			for seed in range(amount_of_games):
+				play_single_game(strategy=GreedyTraderStrategy(), seed=BENCHMARK_SEED + seed)
+		return run
+	return Benchmark(name="greedy_bot_games", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_games, prepare=prepare)
+
+
+def benchmark_optimal_profit_solver(amount_of_games: int) -> Benchmark:
+	""" Solves the best possible final budget of random games of the default world
+
+	:param amount_of_games:
+	:return: Benchmark
+	"""
+	def prepare(work_directory: str) -> Callable[[], None]:
+		prices_schedules: List[List[List[List[int]]]] = [
+			[[[random.randint(product.min_price, product.max_price) for product in PRODUCTS_LIST]
+			  for _ in CITIES_LIST]
+			 for _ in range(TOTAL_TRADE_DAYS_IN_A_GAME)]
+			for _ in range(amount_of_games)]
+
+		def run() -> None:
+			for price_schedule in prices_schedules:
+				OptimalProfitSolver(price_schedule=price_schedule).solve()
+		return run
+	return Benchmark(name="optimal_profit_solver", group=BENCHMARK_GROUP_MACRO,
+					 amount_of_operations=amount_of_games, prepare=prepare)
+
+
+def get_benchmarks(high_scores_sizes: List[int] = HIGH_SCORES_BENCHMARK_SIZES) -> List[Benchmark]:
+	""" Returns all the benchmarks of the suite
+
+	:param high_scores_sizes: Optional - amounts of results to load and save the high scores with
+	:return: List[Benchmark]
+	"""
+	benchmarks: List[Benchmark] = [
+		benchmark_buy_product(amount_of_operations=100000),
+		benchmark_sell_product(amount_of_operations=100000),
+		benchmark_game_engine_buy_product(amount_of_operations=100000),
+		benchmark_generate_prices(amount_of_operations=10000, is_vectorized=False),
+		benchmark_voyage_times_matrix(amount_of_cities=2000),
+		benchmark_voyage_time_lookup(amount_of_operations=100000),
+		benchmark_best_reachable_trade(amount_of_operations=100),
+	]
+	if is_vectorized_prices_backend_available():
+		benchmarks.append(benchmark_generate_prices(amount_of_operations=10000, is_vectorized=True))
+		benchmarks.append(benchmark_npc_traders_days(amount_of_traders=10000, amount_of_days=100))
+	benchmarks.append(benchmark_game_startup(amount_of_launches=10))
+	benchmarks.append(benchmark_large_world_game_setup(amount_of_cities=2000, amount_of_products=200))
+	benchmarks.append(benchmark_scripted_game_sessions(amount_of_games=200))
+	benchmarks.append(benchmark_bot_games(amount_of_games=200))
+	benchmarks.append(benchmark_optimal_profit_solver(amount_of_games=10))
+	for amount_of_results in high_scores_sizes:
+		benchmarks.append(benchmark_high_scores_save(amount_of_results=amount_of_results))
+		benchmarks.append(benchmark_high_scores_load(amount_of_results=amount_of_results))
+	benchmarks.append(benchmark_game_snapshot_load(amount_of_loads=100))
+	return benchmarks
+
+
+class BenchmarkSuite:
+	""" Runs benchmarks, and compares their results to a baseline """
+	def __init__(self, benchmarks: List[Benchmark], repeats: int = 3, seed: int = BENCHMARK_SEED):
+		"""
+
+		:param benchmarks: The benchmarks to run
+		:param repeats: Optional - amount of timed runs of every benchmark, the median run is reported
+		:param seed: Optional - random seed set before every run
+		"""
+		self.benchmarks: List[Benchmark] = benchmarks
+		self.repeats: int = repeats
+		self.seed: int = seed
+
+	def run_benchmark(self, benchmark: Benchmark, work_directory: str) -> Dict[str, Union[str, int, float]]:
+		""" Runs a single benchmark several times
+
+		:param benchmark:
+		:param work_directory: Directory for files created by the benchmark
+		:return: Dict - the benchmark result
+		"""
+		runs_seconds: List[float] = []
+		for _ in range(self.repeats):
+			random.seed(self.seed)
+			run: Callable[[], None] = benchmark.prepare(work_directory)
+			start_time: float = time.perf_counter()
+			run()
+			runs_seconds.append(time.perf_counter() - start_time)
+
+		median_seconds: float = statistics.median(runs_seconds)
+		return {
+			"group": benchmark.group,
+			"amount_of_operations": benchmark.amount_of_operations,
+			"median_seconds": median_seconds,
+			"min_seconds": min(runs_seconds),
+			"seconds_per_operation": median_seconds / benchmark.amount_of_operations,
+		}
+
+	def run(self) -> Dict[str, any]:
+		""" Runs all the benchmarks
+
+		:return: Dict - the results of all benchmarks, keyed by the benchmark name, and details about the environment
+		"""
+		with tempfile.TemporaryDirectory() as work_directory:
+			results: Dict[str, Dict[str, Union[str, int, float]]] = {
+				benchmark.name: self.run_benchmark(benchmark=benchmark, work_directory=work_directory)
+				for benchmark in self.benchmarks
+			}
+		return {
+			"date": datetime.now().isoformat(),
+			"python_version": platform.python_version(),
+			"platform": platform.platform(),
+			"seed": self.seed,
+			"repeats": self.repeats,
+			"results": results,
+		}
+
+	@staticmethod
+	def compare_to_baseline(results: Dict[str, any],
+							baseline_results: Dict[str, any],
+							tolerance: float = BENCHMARK_REGRESSION_TOLERANCE) -> List[Dict[str, Union[str, float]]]:
+		""" Compares the results of the benchmarks to the baseline results
+
+		:param results: Results returned by run()
+		:param baseline_results: Results of a previous run
+		:param tolerance: Optional - how much slower a benchmark can be before it is a regression, for example 0.2 is
+						  20% slower
+		:return: A comparison of every benchmark which is in both results
+		"""
+		comparison: List[Dict[str, Union[str, float]]] = []
+		for name, result in results["results"].items():
+			baseline_result: Optional[Dict] = baseline_results["results"].get(name)
+			if baseline_result is None:
+				continue
+			ratio: float = result["seconds_per_operation"] / baseline_result["seconds_per_operation"]
+			comparison.append({
+				"name": name,
+				"baseline_seconds_per_operation": baseline_result["seconds_per_operation"],
+				"seconds_per_operation": result["seconds_per_operation"],
+				"ratio": ratio,
+				"is_regression": ratio > 1 + tolerance,
+			})
+		return comparison
+
+
+def main():
+	""" Runs the benchmark suite according to the command line arguments
+
+	:return: None, but exits with an error in case a benchmark is slower than the baseline
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark the Sea Trader game")
+	parser.add_argument("--group", choices=[BENCHMARK_GROUP_MICRO, BENCHMARK_GROUP_MACRO], default=None,
+						help="Run only micro or macro benchmarks, default: all")
+	parser.add_argument("--filter", default=None, help="Run only benchmarks with this text in their name")
+	parser.add_argument("--repeats", type=int, default=3, help="Amount of timed runs of every benchmark")
+	parser.add_argument("--high-scores-sizes", type=int, nargs="+", default=HIGH_SCORES_BENCHMARK_SIZES,
+						help="Amounts of results to load and save the high scores with")
+	parser.add_argument("--output", default=None, help="Path of a file to write the JSON results to")
+	parser.add_argument("--baseline", default=None, help="Path of the JSON results of a previous run to compare to")
+	parser.add_argument("--tolerance", type=float, default=BENCHMARK_REGRESSION_TOLERANCE,
+						help="How much slower than the baseline is a regression, 0.2 is 20%% slower")
+	arguments = parser.parse_args()
+
+	benchmarks: List[Benchmark] = [
+		benchmark for benchmark in get_benchmarks(high_scores_sizes=arguments.high_scores_sizes)
+		if (arguments.group is None or benchmark.group == arguments.group)
+		and (arguments.filter is None or arguments.filter in benchmark.name)
+	]
+	results: Dict[str, any] = BenchmarkSuite(benchmarks=benchmarks, repeats=arguments.repeats).run()
+
+	if arguments.output is not None:
+		with open(arguments.output, "w", encoding="utf-8") as output_file:
+			json.dump(results, output_file, indent=4)
+	else:
+		print(json.dumps(results, indent=4))
+
+	if arguments.baseline is None:
+		return None
+	with open(arguments.baseline, "r", encoding="utf-8") as baseline_file:
+		baseline_results: Dict[str, any] = json.load(baseline_file)
+	comparison = BenchmarkSuite.compare_to_baseline(results=results,
+													baseline_results=baseline_results,
+													tolerance=arguments.tolerance)
+	print(tabulate(comparison, headers="keys", floatfmt=".3g"))
+	regressions: List[str] = [benchmark_comparison["name"] for benchmark_comparison in comparison
+							  if benchmark_comparison["is_regression"]]
+	if regressions:
+		sys.exit(f"Benchmarks slower than the baseline: {regressions}")
+	return None
+
+
+if __name__ == "__main__":
+	main()
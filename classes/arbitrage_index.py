@@ -0,0 +1,205 @@
+from array import array
+from typing import List, Dict, Tuple, Optional, Sequence
+from classes.world_registry import WorldRegistry
+from classes.voyage_planner import VoyageTimesMatrix
+
+
+"""
+Contains ArbitrageIndex - the buy low, sell high opportunities in the prices of a single trade day.
+
+The index is built once the prices of a trade day are drawn. For every product it keeps the cheapest city, the most
+expensive city and the spread between their prices, so "the best trade now" is a lookup. Trades are ranked by the ratio
+between the sell price and the buy price - the player's profit when spending all of the budget on a product.
+
+"The best trade from a city reachable within some hours" is kept in a table by the amount of hours, created on the
+first lookup from the city - once per city, trade day and ship speed. After that, every lookup takes O(1).
+"""
+
+
+NO_CITY_ID: int = -1  # City ID of products which are not traded in any city
+
+
+class ArbitrageTrade:
+	""" Represents a trade - buying a product in a city, and selling it in another city """
+	__slots__ = ("product_id", "buy_city_id", "sell_city_id", "buy_price", "sell_price")
+
+	def __init__(self, product_id: int, buy_city_id: int, sell_city_id: int, buy_price: int, sell_price: int):
+		"""
+
+		:param product_id: ID of the traded product
+		:param buy_city_id: ID of the city to buy the product at
+		:param sell_city_id: ID of the city to sell the product at
+		:param buy_price: Price of a unit in the buy city
+		:param sell_price: Price of a unit in the sell city
+		"""
+		self.product_id: int = product_id
+		self.buy_city_id: int = buy_city_id
+		self.sell_city_id: int = sell_city_id
+		self.buy_price: int = buy_price
+		self.sell_price: int = sell_price
+
+	@property
+	def spread(self) -> int:
+		""" Returns the profit of a single unit
+
+		:return: int
+		"""
+		return self.sell_price - self.buy_price
+
+	@property
+	def profit_ratio(self) -> float:
+		""" Returns the ratio between the sell price and the buy price
+
+		:return: float
+		"""
+		return self.sell_price / self.buy_price
+
+
+class ArbitrageIndex:
+	""" Index of the trade opportunities in the prices of all cities in a trade day """
+	def __init__(self, world_registry: WorldRegistry, prices_rows: Sequence[Sequence[int]], max_voyage_time: int):
+		"""
+
+		:param world_registry: Registry of the game's cities and products
+		:param prices_rows: Prices of the trade day - a row for every city, ordered by the cities IDs, with a price for
+							every product, ordered by the products IDs
+		:param max_voyage_time: Longest voyage time looked up by get_best_trade_from_city() - the workday hours
+		"""
+		self.world_registry: WorldRegistry = world_registry
+		self.prices_rows: Sequence[Sequence[int]] = prices_rows
+		self.max_voyage_time: int = max_voyage_time
+		amount_of_cities: int = world_registry.amount_of_cities
+		amount_of_products: int = world_registry.amount_of_products
+		products_availability: Optional[bytearray] = world_registry.products_availability
+
+		# Cheapest and most expensive city of every product, by product ID
+		self.cheapest_cities_ids: array = array("i", [NO_CITY_ID]) * amount_of_products
+		self.most_expensive_cities_ids: array = array("i", [NO_CITY_ID]) * amount_of_products
+		self.lowest_prices: array = array("q", [0]) * amount_of_products
+		self.highest_prices: array = array("q", [0]) * amount_of_products
+		self.best_product_id: Optional[int] = None
+		best_profit_ratio: float = 1
+		for product_id in range(amount_of_products):
+			product_prices: List[int] = [prices_row[product_id] for prices_row in prices_rows]
+			trading_cities_ids: Sequence[int] = range(amount_of_cities) if products_availability is None else [
+				city_id for city_id in range(amount_of_cities)
+				if products_availability[city_id * amount_of_products + product_id]]
+			if not trading_cities_ids:
+				continue
+			cheapest_city_id: int = min(trading_cities_ids, key=product_prices.__getitem__)
+			most_expensive_city_id: int = max(trading_cities_ids, key=product_prices.__getitem__)
+			self.cheapest_cities_ids[product_id] = cheapest_city_id
+			self.most_expensive_cities_ids[product_id] = most_expensive_city_id
+			self.lowest_prices[product_id] = product_prices[cheapest_city_id]
+			self.highest_prices[product_id] = product_prices[most_expensive_city_id]
+			if product_prices[cheapest_city_id] > 0 \
+					and product_prices[most_expensive_city_id] / product_prices[cheapest_city_id] > best_profit_ratio:
+				best_profit_ratio = product_prices[most_expensive_city_id] / product_prices[cheapest_city_id]
+				self.best_product_id = product_id
+
+		# Best trades from cities by the hours of the voyage, keyed by ( city ID, hours reduced by ship upgrades )
+		self.best_trades_from_cities: Dict[Tuple[int, int], List[Optional[ArbitrageTrade]]] = {}
+
+	def get_spread(self, product_id: int) -> int:
+		""" Returns the difference between the highest and the lowest price of a product
+
+		:param product_id:
+		:return: int, 0 in case the product is not traded in any city
+		"""
+		return self.highest_prices[product_id] - self.lowest_prices[product_id]
+
+	def get_product_trade(self, product_id: int) -> Optional[ArbitrageTrade]:
+		""" Returns the trade of a product - buying it at its cheapest city and selling it at its most expensive city
+
+		:param product_id:
+		:return: ArbitrageTrade, or None in case the product is not traded in any city
+		"""
+		if self.cheapest_cities_ids[product_id] == NO_CITY_ID:
+			return None
+		return ArbitrageTrade(product_id=product_id,
+							  buy_city_id=self.cheapest_cities_ids[product_id],
+							  sell_city_id=self.most_expensive_cities_ids[product_id],
+							  buy_price=self.lowest_prices[product_id],
+							  sell_price=self.highest_prices[product_id])
+
+	def get_best_trade(self) -> Optional[ArbitrageTrade]:
+		""" Returns the most profitable trade of the trade day, between any two cities
+
+		:return: ArbitrageTrade, or None in case no trade is profitable
+		"""
+		if self.best_product_id is None:
+			return None
+		return self.get_product_trade(product_id=self.best_product_id)
+
+	def get_best_trade_from_city(self,
+								 from_city_id: int,
+								 hours_left: int,
+								 voyage_times_matrix: VoyageTimesMatrix) -> Optional[ArbitrageTrade]:
+		""" Returns the most profitable trade buying at a city, and selling at a city reachable within some hours. In
+		case a few trades are as profitable, the trade to the city with the lowest ID is returned.
+
+		:param from_city_id: ID of the city to buy at
+		:param hours_left: Hours the voyage to the sell city may take
+		:param voyage_times_matrix: Voyage times of the player's ship
+		:return: ArbitrageTrade, or None in case no trade is profitable
+		"""
+		best_trades_key: Tuple[int, int] = (from_city_id, voyage_times_matrix.hours_reduction)
+		best_trades: Optional[List[Optional[ArbitrageTrade]]] = self.best_trades_from_cities.get(best_trades_key)
+		if best_trades is None:
+			best_trades = self.best_trades_from_cities[best_trades_key] = self.calculate_best_trades_from_city(
+				from_city_id=from_city_id, voyage_times_matrix=voyage_times_matrix)
+		if hours_left < 0:
+			return None
+		return best_trades[min(hours_left, self.max_voyage_time)]
+
+	def calculate_best_trades_from_city(self,
+										from_city_id: int,
+										voyage_times_matrix: VoyageTimesMatrix) -> List[Optional[ArbitrageTrade]]:
+		""" Calculates the most profitable trades from a city, by the hours of the voyage
+
+		:param from_city_id: ID of the city to buy at
+		:param voyage_times_matrix: Voyage times of the player's ship
+		:return: List - the best trade to a city reachable within every amount of hours, up to the max voyage time
+		"""
+		amount_of_products: int = self.world_registry.amount_of_products
+		products_availability: Optional[bytearray] = self.world_registry.products_availability
+		buy_prices: Sequence[int] = self.prices_rows[from_city_id]
+		traded_products_ids: List[int] = [
+			product_id for product_id in range(amount_of_products)
+			if buy_prices[product_id] > 0 and (products_availability is None
+											   or products_availability[from_city_id * amount_of_products + product_id])]
+
+		# Best trade to every reachable city, kept by the voyage time
+		best_trades_by_voyage_time: List[Optional[ArbitrageTrade]] = [None] * (self.max_voyage_time + 1)
+		for to_city_id, sell_prices in enumerate(self.prices_rows):
+			voyage_time: int = voyage_times_matrix.get_voyage_time(from_city_id=from_city_id, to_city_id=to_city_id)
+			if to_city_id == from_city_id or voyage_time > self.max_voyage_time:
+				continue
+			best_profit_ratio: float = 1
+			best_product_id: Optional[int] = None
+			for product_id in traded_products_ids:
+				if products_availability is not None \
+						and not products_availability[to_city_id * amount_of_products + product_id]:
+					continue
+				profit_ratio: float = sell_prices[product_id] / buy_prices[product_id]
+				if profit_ratio > best_profit_ratio:
+					best_profit_ratio = profit_ratio
+					best_product_id = product_id
+			best_trade: Optional[ArbitrageTrade] = best_trades_by_voyage_time[voyage_time]
+			if best_product_id is not None and (best_trade is None or best_profit_ratio > best_trade.profit_ratio):
+				best_trades_by_voyage_time[voyage_time] = ArbitrageTrade(product_id=best_product_id,
+																		 buy_city_id=from_city_id,
+																		 sell_city_id=to_city_id,
+																		 buy_price=buy_prices[best_product_id],
+																		 sell_price=sell_prices[best_product_id])
+
+		# Best trade within every amount of hours - the best of the trades with voyage times up to it
+		best_trades: List[Optional[ArbitrageTrade]] = []
+		best_trade = None
+		for trade in best_trades_by_voyage_time:
+			if trade is not None and (best_trade is None or trade.profit_ratio > best_trade.profit_ratio
+									  or (trade.profit_ratio == best_trade.profit_ratio
+										  and trade.sell_city_id < best_trade.sell_city_id)):
+				best_trade = trade
+			best_trades.append(best_trade)
+		return best_trades
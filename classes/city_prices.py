@@ -1,6 +1,8 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+from array import array
 import random
 from classes.products import Product
+from classes.world_registry import WorldRegistry
 from custom_exceptions.city_custom_exceptions import CustomExceptionCityNameNotFound
 from custom_exceptions.product_custom_exceptions import CustomExceptionProductDoesNotExists
 
@@ -13,18 +15,32 @@ The prices will be used by the player to buy or sell products.
 
 class ProductsPricesInCity:
 	""" Represents the current prices in a city.
+	Prices are kept in an array, indexed by the products IDs given by the game's WorldRegistry.
 	Needed to load: Products list in the game"""
-	def __init__(self, products_list: List[Product]):
+	def __init__(self, products_list: List[Product], world_registry: Optional[WorldRegistry] = None):
 		"""
 
 		:param products_list: A list of all products in a specific Sea Trader game
+		:param world_registry: Optional - registry giving the products IDs, in case not given a new one will be created
+							   for the products list
 		"""
-		self.products_list: List[Product] = products_list
-		self.products_prices: Dict[Product, int] = {}
+		if world_registry is None:
+			world_registry = WorldRegistry(cities_names=[], products_list=products_list)
+		self.world_registry: WorldRegistry = world_registry
+		self.products_list: List[Product] = self.world_registry.products_list
+		self.products_prices_array: array = array("q", [0]) * self.world_registry.amount_of_products
 
 		# Generate initial products prices
 		self.generate_prices_for_the_city()
 
+	@property
+	def products_prices(self) -> Dict[Product, int]:
+		""" Returns the current prices in the city, keyed by product
+
+		:return: Dict[Product, int]
+		"""
+		return {product: price for product, price in zip(self.products_list, self.products_prices_array)}
+
 	def generate_prices_for_the_city(self) -> None:
 		""" Will generate prices for all products in the city.
 		Prices are changed every day - by using this function
@@ -33,9 +49,8 @@ class ProductsPricesInCity:
 
 		:return: None
 		"""
-		self.products_prices = {}
-		for product in self.products_list:
-			self.products_prices[product] = random.randint(product.min_price, product.max_price)
+		for product_id, product in enumerate(self.products_list):
+			self.products_prices_array[product_id] = random.randint(product.min_price, product.max_price)
 		return None
 
 	def get_price_for_product(self, product: Product) -> int:
@@ -45,10 +60,18 @@ class ProductsPricesInCity:
 		:return: int
 		"""
 		try:
-			return self.products_prices[product]
-		except KeyError:
+			return self.get_price_for_product_id(product_id=self.world_registry.get_product_id(product=product))
+		except CustomExceptionProductDoesNotExists:
 			raise CustomExceptionProductDoesNotExists(f"Product {product.name} doesn't exist in player's inventory! ")
 
+	def get_price_for_product_id(self, product_id: int) -> int:
+		""" Returns the price for a specific product according to its ID.
+
+		:param product_id: ID of a product used in the game
+		:return: int
+		"""
+		return self.products_prices_array[product_id]
+
 	def get_prices_of_all_products_as_dict(self) -> Dict[str, int]:
 		""" Will return a dictionary with all products and their current price.
 
@@ -64,16 +87,28 @@ class ProductsPricesInAllCities:
 	""" Manages all prices in all cities.
 	Prices are changed every day in game.
 	"""
-	def __init__(self, cities_names_in_game: List[str], products_in_game: List[Product]):
+	def __init__(self,
+				 cities_names_in_game: List[str],
+				 products_in_game: List[Product],
+				 world_registry: Optional[WorldRegistry] = None):
 		"""
 
 		:param cities_names_in_game:
 		:param products_in_game:
+		:param world_registry: Optional - registry giving the cities and products IDs, in case not given a new one will
+							   be created for the cities and products lists
 		"""
-		self.cities_names: List[str] = cities_names_in_game
-		self.products_list: List[Product] = products_in_game
-		self.prices_in_cities: Dict[str, ProductsPricesInCity] = {}
-		self.generate_prices_for_all_cities()
+		if world_registry is None:
+			world_registry = WorldRegistry(cities_names=cities_names_in_game, products_list=products_in_game)
+		self.world_registry: WorldRegistry = world_registry
+		self.cities_names: List[str] = self.world_registry.cities_names
+		self.products_list: List[Product] = self.world_registry.products_list
+		self.prices_in_cities_by_id: List[ProductsPricesInCity] = [
+			ProductsPricesInCity(products_list=self.products_list, world_registry=self.world_registry)
+			for _ in self.cities_names
+		]
+		self.prices_in_cities: Dict[str, ProductsPricesInCity] = dict(zip(self.cities_names,
+																		  self.prices_in_cities_by_id))
 
 	def generate_prices_for_all_cities(self) -> None:
 		""" Will generate prices for all cities for all products.
@@ -81,10 +116,27 @@ class ProductsPricesInAllCities:
 		This method should be used every time there needs to be a rotation in the prices of products, mainly every new
 		trade day.
 
-		:return: None, but will update self.prices_in_cities with new prices
+		:return: None, but will update the prices of every city in self.prices_in_cities with new prices
+		"""
+		for prices_in_city in self.prices_in_cities_by_id:
+			prices_in_city.generate_prices_for_the_city()
+		return None
+
+	def get_prices_rows(self) -> List[array]:
+		""" Returns the current prices in all cities
+
+		:return: List - the prices array of every city, ordered by the cities IDs
+		"""
+		return [prices_in_city.products_prices_array for prices_in_city in self.prices_in_cities_by_id]
+
+	def set_prices_rows(self, prices_rows: List[List[int]]) -> None:
+		""" Replaces the current prices in all cities
+
+		:param prices_rows: The prices of every city, ordered by the cities IDs, with a price for every product
+		:return: None
 		"""
-		for city in self.cities_names:
-			self.prices_in_cities[city] = ProductsPricesInCity(products_list=self.products_list)
+		for prices_in_city, prices_row in zip(self.prices_in_cities_by_id, prices_rows):
+			prices_in_city.products_prices_array[:] = array("q", prices_row)
 		return None
 
 	def get_prices_in_city_by_city_name(self, city_name: str) -> ProductsPricesInCity:
@@ -97,3 +149,10 @@ class ProductsPricesInAllCities:
 			return prices_in_city
 		except KeyError:
 			raise CustomExceptionCityNameNotFound(f"City {city_name} doesn't exist!")
+
+	def get_prices_in_city_by_city_id(self, city_id: int) -> ProductsPricesInCity:
+		""" Will return the prices in a specific city according to the city ID
+
+		:return: ProductsPricesInCity, representing prices in a specific city
+		"""
+		return self.prices_in_cities_by_id[city_id]
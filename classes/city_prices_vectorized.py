@@ -0,0 +1,192 @@
+from typing import List, Dict, Optional
+from classes.products import Product
+from classes.city_prices import ProductsPricesInCity, ProductsPricesInAllCities
+from classes.world_registry import WorldRegistry
+from custom_exceptions.city_custom_exceptions import CustomExceptionVectorizedPricesBackendNotAvailable
+from custom_exceptions.product_custom_exceptions import CustomExceptionProductDoesNotExists
+from classes.optional_numpy import is_numpy_available, import_numpy
+
+
+"""
+Optional numpy backend for the prices in the different cities in the game.
+
+Instead of creating new ProductsPricesInCity objects every trade day, the prices of all products in all cities for a
+block of trade days are drawn at once into a single (days X cities X products) array. Moving to a new trade day only
+moves the current day index - the prices in each city are served directly from the array.
+
+Requires numpy - which is not a dependency of the game, and should be installed separately.
+"""
+
+
+def is_vectorized_prices_backend_available() -> bool:
+	""" Checks if the numpy backend for prices can be used
+
+	:return: Boolean - true in case numpy is installed
+	"""
+	return is_numpy_available()
+
+
+class ProductsPricesInCityView(ProductsPricesInCity):
+	""" Represents the current prices in a city, served from the prices array of ProductsPricesInAllCitiesVectorized.
+	The view holds no prices of its own - it always reads the prices of the current trade day. """
+	def __init__(self, all_cities_prices: "ProductsPricesInAllCitiesVectorized", city_index: int):
+		"""
+
+		:param all_cities_prices: The object holding the prices array for all cities
+		:param city_index: Index of the city in the prices array
+		"""
+		self.all_cities_prices: ProductsPricesInAllCitiesVectorized = all_cities_prices
+		self.city_index: int = city_index
+		self.world_registry: WorldRegistry = all_cities_prices.world_registry
+		self.products_list: List[Product] = all_cities_prices.products_list
+
+	@property
+	def products_prices(self) -> Dict[Product, int]:
+		""" Returns the current prices in the city, keyed by product
+
+		:return: Dict[Product, int]
+		"""
+		prices_row = self.all_cities_prices.get_prices_row_for_city_index(city_index=self.city_index)
+		return {product: int(price) for product, price in zip(self.products_list, prices_row)}
+
+	def generate_prices_for_the_city(self) -> None:
+		""" Will draw new prices for all products in the city for the current trade day
+
+		:return: None
+		"""
+		self.all_cities_prices.generate_prices_for_city_index(city_index=self.city_index)
+		return None
+
+	def get_price_for_product(self, product: Product) -> int:
+		""" Returns the price for a specific product.
+
+		:param product: A product used in the game
+		:return: int
+		"""
+		try:
+			product_id: int = self.world_registry.get_product_id(product=product)
+		except CustomExceptionProductDoesNotExists:
+			raise CustomExceptionProductDoesNotExists(f"Product {product.name} doesn't exist in player's inventory! ")
+		return self.get_price_for_product_id(product_id=product_id)
+
+	def get_price_for_product_id(self, product_id: int) -> int:
+		""" Returns the price for a specific product according to its ID.
+
+		:param product_id: ID of a product used in the game
+		:return: int
+		"""
+		return int(self.all_cities_prices.prices_tensor[self.all_cities_prices.current_day_index,
+														self.city_index,
+														product_id])
+
+
+class ProductsPricesInAllCitiesVectorized(ProductsPricesInAllCities):
+	""" Manages all prices in all cities, using a numpy array holding the prices of a block of trade days.
+	Keeps the same lookup API as ProductsPricesInAllCities.
+	"""
+	def __init__(self,
+				 cities_names_in_game: List[str],
+				 products_in_game: List[Product],
+				 amount_of_trade_days: int,
+				 seed: Optional[int] = None,
+				 world_registry: Optional[WorldRegistry] = None):
+		"""
+
+		:param cities_names_in_game:
+		:param products_in_game:
+		:param amount_of_trade_days: Amount of trade days to draw prices for at once. In case the game has more days,
+									 a new block of prices will be drawn when the current one is used up.
+		:param seed: Optional - seed for the random generator, used to get the same prices in every game
+		:param world_registry: Optional - registry giving the cities and products IDs, which are the indexes of the
+							   prices array. In case not given a new one will be created for the cities and products
+		"""
+		if not is_vectorized_prices_backend_available():
+			raise CustomExceptionVectorizedPricesBackendNotAvailable("Vectorized prices backend requires numpy! "
+																	 "Install it by running: pip install numpy")
+		numpy = import_numpy()
+		if world_registry is None:
+			world_registry = WorldRegistry(cities_names=cities_names_in_game, products_list=products_in_game)
+		self.world_registry: WorldRegistry = world_registry
+		self.cities_names: List[str] = self.world_registry.cities_names
+		self.products_list: List[Product] = self.world_registry.products_list
+
+		self.amount_of_trade_days: int = amount_of_trade_days
+		self.random_generator = numpy.random.default_rng(seed)
+		self.products_min_prices = numpy.array([product.min_price for product in self.products_list],
+											   dtype=numpy.int64)
+		self.products_max_prices = numpy.array([product.max_price for product in self.products_list],
+											   dtype=numpy.int64)
+		self.prices_tensor = numpy.empty(shape=(0, len(self.cities_names), len(self.products_list)), dtype=numpy.int64)
+		self.current_day_index: int = -1  # Will be moved to the first day by generate_prices_for_all_cities()
+
+		self.prices_in_cities_by_id: List[ProductsPricesInCity] = [
+			ProductsPricesInCityView(all_cities_prices=self, city_index=city_id)
+			for city_id in range(self.world_registry.amount_of_cities)
+		]
+		self.prices_in_cities: Dict[str, ProductsPricesInCity] = dict(zip(self.cities_names,
+																		  self.prices_in_cities_by_id))
+		self.generate_prices_for_all_cities()
+
+	def draw_prices_tensor(self) -> None:
+		""" Will draw the prices of all products in all cities for the next block of trade days, in a single call.
+
+		Each product price will be in a range as defined in the Product object representing the product.
+
+		:return: None, but will replace self.prices_tensor and reset the current day index
+		"""
+		self.prices_tensor = self.random_generator.integers(
+			low=self.products_min_prices,
+			high=self.products_max_prices,
+			size=(self.amount_of_trade_days, len(self.cities_names), len(self.products_list)),
+			endpoint=True)
+		self.current_day_index = 0
+		return None
+
+	def generate_prices_for_all_cities(self) -> None:
+		""" Will move the prices of all cities to the next trade day.
+
+		This method should be used every time there needs to be a rotation in the prices of products, mainly every new
+		trade day.
+
+		:return: None
+		"""
+		self.current_day_index += 1
+		if self.current_day_index >= self.prices_tensor.shape[0]:
+			self.draw_prices_tensor()
+		return None
+
+	def generate_prices_for_city_index(self, city_index: int) -> None:
+		""" Will draw new prices for the current trade day in a single city
+
+		:param city_index: Index of the city in the prices array
+		:return: None
+		"""
+		self.prices_tensor[self.current_day_index, city_index] = self.random_generator.integers(
+			low=self.products_min_prices,
+			high=self.products_max_prices,
+			endpoint=True)
+		return None
+
+	def get_prices_rows(self) -> List[List[int]]:
+		""" Returns the current prices in all cities
+
+		:return: List - the prices of every city as a list, ordered by the cities IDs
+		"""
+		return self.prices_tensor[self.current_day_index].tolist()
+
+	def set_prices_rows(self, prices_rows: List[List[int]]) -> None:
+		""" Replaces the current prices in all cities
+
+		:param prices_rows: The prices of every city, ordered by the cities IDs, with a price for every product
+		:return: None
+		"""
+		self.prices_tensor[self.current_day_index] = prices_rows
+		return None
+
+	def get_prices_row_for_city_index(self, city_index: int):
+		""" Returns the prices of all products in a city for the current trade day
+
+		:param city_index: Index of the city in the prices array
+		:return: numpy array - a view into the prices array, ordered as the products list
+		"""
+		return self.prices_tensor[self.current_day_index, city_index]
@@ -0,0 +1,495 @@
+from typing import List, Optional
+import logging
+import random
+from classes.products import Product, PlayersInventory, PlayerProductInventory
+from classes.ship import Ship
+from classes.city_prices import ProductsPricesInAllCities
+from classes.city_prices_vectorized import ProductsPricesInAllCitiesVectorized
+from classes.world_config import WorldConfig, get_world_config
+from classes.voyage_planner import VoyageTimesMatrix
+from classes.arbitrage_index import ArbitrageIndex, ArbitrageTrade
+from classes.npc_traders import NpcTradersPopulation
+from classes.price_impact import PriceImpactModel, HOURS_IN_A_DAY
+from classes.price_history import PriceHistory
+from classes.player import Player, PlayersTransaction
+from classes.transactions_ledger import TransactionsLedger, TRANSACTION_TYPE_BUY, TRANSACTION_TYPE_SELL, \
+	TRANSACTION_TYPE_SHIP_FIX, TRANSACTION_TYPE_SHIP_UPGRADE, NO_PRODUCT_ID
+from highscores.game_result import GameResult
+from constants import AMOUNT_OF_HOURS_FOR_WORKDAY, TOTAL_TRADE_DAYS_IN_A_GAME, USE_VECTORIZED_PRICES_BACKEND, \
+	AMOUNT_OF_NPC_TRADERS, PRICE_IMPACT_PER_UNIT, PRICE_HISTORY_MAX_LENGTH
+from custom_exceptions.game_custom_exceptions import CustomExceptionNotEnoughHoursLeftInWorkday, \
+	CustomExceptionPlayerIsAlreadyInCity, CustomExceptionGameIsOver
+from custom_exceptions.ship_custom_exceptions import CustomExceptionShipIsBroken, CustomExceptionShipIsNotBroken, \
+	CustomExceptionWrongVoyageTimeValueForShip
+from custom_exceptions.product_custom_exceptions import CustomExceptionPlayerHasNotEnoughBudget, \
+	CustomExceptionProductNotAvailableInCity
+
+"""
+Defines "GameEngine" object - the rules of a whole game of Sea Trader without any terminal input or output.
+
+The engine exposes the player's possible actions (buy, sell, sail, fix, upgrade, end trade day) as plain methods.
+An action which is not allowed by the game rules will raise a custom exception, and will leave the game state unchanged.
+The interactive menus (see classes/game.py) as well as scripted bots are clients of this engine.
+Every buy, sell, ship fix and ship upgrade is recorded in the game's transactions ledger ( see
+classes/transactions_ledger.py ).
+The cities, products, routes and ship of the game are defined by its world ( see classes/world_config.py ).
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class GameEngine:
+	""" Represents the state and rules of a game of Sea Trader, including the player and world status """
+
+	def __init__(self,
+				 player_name: str,
+				 use_vectorized_prices_backend: bool = USE_VECTORIZED_PRICES_BACKEND,
+				 prices_seed: Optional[int] = None,
+				 world_config: Optional[WorldConfig] = None,
+				 amount_of_npc_traders: int = AMOUNT_OF_NPC_TRADERS,
+				 price_impact_per_unit: float = PRICE_IMPACT_PER_UNIT):
+		"""
+
+		:param player_name: Name of the player, will be used for the game results
+		:param use_vectorized_prices_backend: Optional - draw all prices of the game at once using numpy
+		:param prices_seed: Optional - seed for the random generators of the vectorized prices backend and the NPC traders
+		:param world_config: Optional - world the game is played in, default: the world set in constants.py
+		:param amount_of_npc_traders: Optional - amount of NPC traders moving the prices, 0 for none ( Requires numpy )
+		:param price_impact_per_unit: Optional - part of the price added to the next unit for every unit the player buys
+									  in a city ( and removed for every unit sold ), 0 for no price impact
+		"""
+		if world_config is None:
+			world_config = get_world_config()
+
+		# Set constants - imported from constants.py and the game's world
+		self.current_trade_day: int = 1  # First day
+		self.hours_left_for_workday: int = AMOUNT_OF_HOURS_FOR_WORKDAY
+		self.last_trade_day: int = TOTAL_TRADE_DAYS_IN_A_GAME
+		self.world_config: WorldConfig = world_config
+		self.cities_list: List[str] = world_config.cities_names
+		self.products_list: List[Product] = world_config.products_list
+		self.ship_upgrade_price: int = world_config.ship_config.upgrade_price
+
+		# Set boolean flags
+		self.is_last_trade_day: bool = False  # Will be set to true when the last trade day has ended
+		self.is_user_requested_to_finish_game: bool = False  # Set in case player wants to finish game immediately
+
+		# Statistics about the game
+		self.amount_of_ship_breaks: int = 0
+
+		# Set objects used to represent the player and game environment
+		self.world_registry = world_config.world_registry  # Shared by all games of the world
+		self.player = Player(
+			name=player_name,
+			initial_budget=world_config.initial_budget,
+			initial_location=world_config.start_city)
+		self.player_inventory = PlayersInventory(
+			products_list_in_game=self.products_list,
+			world_registry=self.world_registry)
+		self.ship = Ship(
+			voyage_time=world_config.ship_config.voyage_time,
+			min_fix_cost_in_game=world_config.ship_config.min_fix_cost,
+			max_fix_cost_in_game=world_config.ship_config.max_fix_cost,
+			chance_for_ship_to_break=world_config.ship_config.chance_to_break,
+			ship_upgrade_time_by_hours=world_config.ship_config.upgrade_time_reduction,
+			ship_upgrade_work_time_by_hours=world_config.ship_config.upgrade_work_time)
+
+		if use_vectorized_prices_backend:
+			self.products_prices_in_cities = ProductsPricesInAllCitiesVectorized(
+				cities_names_in_game=self.cities_list,
+				products_in_game=self.products_list,
+				amount_of_trade_days=self.last_trade_day,
+				seed=prices_seed,
+				world_registry=self.world_registry)
+		else:
+			self.products_prices_in_cities = ProductsPricesInAllCities(
+				cities_names_in_game=self.cities_list,
+				products_in_game=self.products_list,
+				world_registry=self.world_registry)
+		self.price_impact_model: Optional[PriceImpactModel] = None
+		if price_impact_per_unit > 0:
+			self.price_impact_model = PriceImpactModel(world_registry=self.world_registry,
+													   price_impact_per_unit=price_impact_per_unit)
+		self.product_transactions = PlayersTransaction(
+			player=self.player,
+			player_inventory=self.player_inventory,
+			prices_in_city=self.products_prices_in_cities,
+			price_impact_model=self.price_impact_model)
+		self.transactions_ledger = TransactionsLedger(world_registry=self.world_registry)
+		self.npc_traders: Optional[NpcTradersPopulation] = None
+		if amount_of_npc_traders > 0:
+			self.npc_traders = NpcTradersPopulation(world_registry=self.world_registry,
+													amount_of_traders=amount_of_npc_traders,
+													seed=random.getrandbits(64) if prices_seed is None else prices_seed)
+		self._voyage_times_matrix: Optional[VoyageTimesMatrix] = None
+		self.arbitrage_index: ArbitrageIndex = self.create_arbitrage_index()
+		self.price_history: PriceHistory = self.create_price_history()
+
+	@property
+	def is_game_over(self) -> bool:
+		""" Checks if the game has ended - either the last trade day has ended, or the player asked to finish the game
+		and the current trade day has ended.
+
+		:return: Boolean - true if no more actions can be done in the game
+		"""
+		return self.is_last_trade_day
+
+	def check_game_is_not_over(self) -> None:
+		""" Makes sure the game is still running before doing an action
+
+		:return: None, but will raise an exception in case the game is over
+		"""
+		if self.is_last_trade_day:
+			raise CustomExceptionGameIsOver(f"Game has ended at trade day {self.last_trade_day}! "
+											f"No more actions can be done.")
+		return None
+
+	def get_product_price_in_current_city(self, product: Product) -> int:
+		""" Returns the price of a product in the city the player is currently at
+
+		:param product: A product used in the game
+		:return: int
+		"""
+		return self.products_prices_in_cities.get_prices_in_city_by_city_name(city_name=self.player.location) \
+			.get_price_for_product(product=product)
+
+	def is_product_available_in_current_city(self, product_name: str) -> bool:
+		""" Checks if a product is traded in the city the player is currently at
+
+		:param product_name:
+		:return: Boolean - true in case the product can be bought and sold in the current city
+		"""
+		return self.world_registry.is_product_available_in_city(
+			city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			product_id=self.world_registry.get_product_id_by_name(product_name=product_name))
+
+	def check_product_is_available_in_current_city(self, product_name: str) -> None:
+		""" Makes sure a product is traded in the city the player is currently at before trading it
+
+		:param product_name:
+		:return: None, but will raise an exception in case the product is not traded in the current city
+		"""
+		if not self.is_product_available_in_current_city(product_name=product_name):
+			raise CustomExceptionProductNotAvailableInCity(f"Product {product_name} is not traded at "
+														   f"{self.player.location}!")
+		return None
+
+	def buy_product(self, product_name: str, amount_to_buy: int) -> None:
+		""" Buys an amount of a product in the current city of the player.
+
+		:param product_name: Name of the product to buy
+		:param amount_to_buy: Amount of product units to buy
+		:return: None, but will raise an exception in case the player has not enough budget or the product is not
+				 traded in the current city
+		"""
+		self.check_game_is_not_over()
+		product_inventory: PlayerProductInventory = self.player_inventory.get_product_by_name(product_name=product_name)
+		self.check_product_is_available_in_current_city(product_name=product_name)
+		self.update_price_impact_hour()
+		cost: int = self.product_transactions.buy_product(product_to_buy=product_inventory.product,
+														  amount_to_buy=amount_to_buy)
+		self.record_product_transaction(transaction_type=TRANSACTION_TYPE_BUY,
+										product_name=product_name,
+										amount=amount_to_buy,
+										total_price=cost)
+		return None
+
+	def sell_product(self, product_name: str, amount_to_sell: int) -> None:
+		""" Sells an amount of a product in the current city of the player.
+
+		:param product_name: Name of the product to sell
+		:param amount_to_sell: Amount of product units to sell
+		:return: None, but will raise an exception in case the player has not enough of the product or the product is
+				 not traded in the current city
+		"""
+		self.check_game_is_not_over()
+		product_inventory: PlayerProductInventory = self.player_inventory.get_product_by_name(product_name=product_name)
+		self.check_product_is_available_in_current_city(product_name=product_name)
+		self.update_price_impact_hour()
+		income: int = self.product_transactions.sell_product(product_to_sell=product_inventory.product,
+															 amount_to_sell=amount_to_sell)
+		self.record_product_transaction(transaction_type=TRANSACTION_TYPE_SELL,
+										product_name=product_name,
+										amount=amount_to_sell,
+										total_price=income)
+		return None
+
+	def get_buy_cost(self, product_name: str, amount_to_buy: int) -> int:
+		""" Returns the cost of buying an amount of a product in the current city of the player - including the impact
+		of the order on the price
+
+		:param product_name:
+		:param amount_to_buy:
+		:return: int
+		"""
+		self.update_price_impact_hour()
+		return self.product_transactions.get_buy_cost(
+			product_to_buy=self.player_inventory.get_product_by_name(product_name=product_name).product,
+			amount_to_buy=amount_to_buy)
+
+	def get_sell_income(self, product_name: str, amount_to_sell: int) -> int:
+		""" Returns the income of selling an amount of a product in the current city of the player - including the
+		impact of the order on the price
+
+		:param product_name:
+		:param amount_to_sell:
+		:return: int
+		"""
+		self.update_price_impact_hour()
+		return self.product_transactions.get_sell_income(
+			product_to_sell=self.player_inventory.get_product_by_name(product_name=product_name).product,
+			amount_to_sell=amount_to_sell)
+
+	def get_max_amount_to_buy(self, product_name: str) -> int:
+		""" Returns the biggest amount of a product the player can pay for in the current city
+
+		:param product_name:
+		:return: int
+		"""
+		self.update_price_impact_hour()
+		return self.product_transactions.get_max_amount_to_buy(
+			product_to_buy=self.player_inventory.get_product_by_name(product_name=product_name).product)
+
+	def update_price_impact_hour(self) -> None:
+		""" Sets the game hour of the price impact model to now, so the impact of past orders is decayed until now
+
+		:return: None
+		"""
+		if self.price_impact_model is not None:
+			self.price_impact_model.current_hour = (self.current_trade_day - 1) * HOURS_IN_A_DAY \
+				+ AMOUNT_OF_HOURS_FOR_WORKDAY - self.hours_left_for_workday
+		return None
+
+	def record_product_transaction(self, transaction_type: int, product_name: str, amount: int, total_price: int) -> None:
+		""" Records a buy or sell transaction done now at the current city of the player, in the transactions ledger
+
+		:param transaction_type: TRANSACTION_TYPE_BUY or TRANSACTION_TYPE_SELL
+		:param product_name: Name of the traded product
+		:param amount: Amount of product units traded
+		:param total_price: Price paid ( or received ) for all units
+		:return: None
+		"""
+		self.transactions_ledger.add_transaction(
+			transaction_type=transaction_type,
+			trade_day=self.current_trade_day,
+			hour=AMOUNT_OF_HOURS_FOR_WORKDAY - self.hours_left_for_workday,
+			city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			product_id=self.world_registry.get_product_id_by_name(product_name=product_name),
+			amount=amount,
+			total_price=total_price)
+		return None
+
+	def record_ship_transaction(self, transaction_type: int, cost: int) -> None:
+		""" Records a ship fix or upgrade paid now at the current city of the player, in the transactions ledger
+
+		:param transaction_type: TRANSACTION_TYPE_SHIP_FIX or TRANSACTION_TYPE_SHIP_UPGRADE
+		:param cost: Amount paid
+		:return: None
+		"""
+		self.transactions_ledger.add_transaction(
+			transaction_type=transaction_type,
+			trade_day=self.current_trade_day,
+			hour=AMOUNT_OF_HOURS_FOR_WORKDAY - self.hours_left_for_workday,
+			city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			product_id=NO_PRODUCT_ID,
+			amount=1,
+			total_price=cost)
+		return None
+
+	@property
+	def voyage_times_matrix(self) -> VoyageTimesMatrix:
+		""" Returns the shortest voyage times between all cities for the player's ship. Ship upgrades change the
+		voyage times - the matrix is replaced by the one of the new ship speed on first use after an upgrade.
+
+		:return: VoyageTimesMatrix
+		"""
+		hours_reduction: int = self.ship.initial_voyage_time - self.ship.voyage_time
+		if self._voyage_times_matrix is None or self._voyage_times_matrix.hours_reduction != hours_reduction:
+			self._voyage_times_matrix = self.world_config.get_voyage_times_matrix(hours_reduction=hours_reduction)
+		return self._voyage_times_matrix
+
+	def get_voyage_time_to_city(self, city_name: str) -> int:
+		""" Returns the hours it takes the player's ship to sail from the current city to another city, by the
+		shortest route - which may go through other cities
+
+		:param city_name: Name of the destination city
+		:return: int, but will raise an exception in case the city doesn't exist
+		"""
+		return self.voyage_times_matrix.get_voyage_time(
+			from_city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			to_city_id=self.world_registry.get_city_id(city_name=city_name))
+
+	def get_route_to_city(self, city_name: str) -> List[str]:
+		""" Returns the cities the player's ship sails through on the shortest route from the current city to another
+		city
+
+		:param city_name: Name of the destination city
+		:return: List of cities names, starting with the current city and ending with the destination city
+		"""
+		route: List[int] = self.voyage_times_matrix.get_route(
+			from_city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			to_city_id=self.world_registry.get_city_id(city_name=city_name))
+		return [self.world_registry.get_city_name_by_id(city_id=city_id) for city_id in route]
+
+	def get_shortest_voyage_time_from_current_city(self) -> int:
+		""" Returns the hours it takes the player's ship to sail the shortest route from the current city
+
+		:return: int
+		"""
+		route_voyage_time: int = self.world_config.get_shortest_route_voyage_time(
+			from_city_id=self.world_registry.get_city_id(city_name=self.player.location))
+		return self.ship.get_voyage_time_for_route(route_voyage_time=route_voyage_time)
+
+	def sail_to_city(self, city_name: str) -> bool:
+		""" Sails the player's ship to a new city. The voyage takes the route's voyage time from the workday, and the
+		ship can break during the voyage.
+
+		:param city_name: Name of the destination city
+		:return: Boolean - true in case the ship got broken during the voyage, else false
+		"""
+		self.check_game_is_not_over()
+		voyage_time: int = self.get_voyage_time_to_city(city_name=city_name)
+		if city_name == self.player.location:
+			raise CustomExceptionPlayerIsAlreadyInCity(f"Player is already at {city_name}!")
+		if self.ship.is_ship_broken:
+			raise CustomExceptionShipIsBroken("Ship is broken - it should be fixed before sailing!")
+		if self.hours_left_for_workday < voyage_time:
+			raise CustomExceptionNotEnoughHoursLeftInWorkday(f"Voyage takes {voyage_time} hours, but only "
+															 f"{self.hours_left_for_workday} hours are left today!")
+
+		is_ship_broken_in_voyage: bool = self.ship.do_random_event_damage_ship()
+		if is_ship_broken_in_voyage:
+			self.amount_of_ship_breaks += 1
+
+		self.player.location = city_name
+		self.hours_left_for_workday -= voyage_time
+		return is_ship_broken_in_voyage
+
+	def fix_ship(self) -> None:
+		""" Fixes the player's ship, paying the fix cost from the player's budget.
+
+		:return: None, but will raise an exception in case the ship is not broken or the player has not enough budget
+		"""
+		self.check_game_is_not_over()
+		if not self.ship.is_ship_broken:
+			raise CustomExceptionShipIsNotBroken("Ship is healthy - no need to fix it!")
+		self.product_transactions.remove_money_from_player(amount_to_remove=self.ship.fix_cost)
+		self.record_ship_transaction(transaction_type=TRANSACTION_TYPE_SHIP_FIX, cost=self.ship.fix_cost)
+		self.ship.fix_ship()
+		return None
+
+	def upgrade_ship(self) -> None:
+		""" Upgrades the ship voyage time. Upgrading costs budget and work hours at the shipyard.
+
+		:return: None, but will raise an exception in case the ship can't be upgraded, there are not enough work hours
+				 left or the player has not enough budget
+		"""
+		self.check_game_is_not_over()
+		if not self.ship.is_ship_upgradeable():
+			raise CustomExceptionWrongVoyageTimeValueForShip(f"Ship can not be upgraded anymore! "
+															 f"Current voyage time: {self.ship.voyage_time}")
+		if self.hours_left_for_workday < self.ship.ship_upgrade_work_time_by_hours:
+			raise CustomExceptionNotEnoughHoursLeftInWorkday(f"Upgrade takes {self.ship.ship_upgrade_work_time_by_hours}"
+															 f" hours, but only {self.hours_left_for_workday} hours are "
+															 f"left today!")
+		if not self.product_transactions.check_player_has_enough_budget(self.ship_upgrade_price):
+			raise CustomExceptionPlayerHasNotEnoughBudget(f"Player has not enough budget to upgrade the ship - "
+														  f"upgrade costs {self.ship_upgrade_price}")
+
+		self.product_transactions.remove_money_from_player(amount_to_remove=self.ship_upgrade_price)
+		self.record_ship_transaction(transaction_type=TRANSACTION_TYPE_SHIP_UPGRADE, cost=self.ship_upgrade_price)
+		self.hours_left_for_workday -= self.ship.ship_upgrade_work_time_by_hours
+		self.ship.upgrade_ship_voyage_time()
+		return None
+
+	def request_to_end_game(self) -> None:
+		""" Sets the current trade day as the last one of the game. The game will be over once the trade day ends.
+
+		:return: None
+		"""
+		self.check_game_is_not_over()
+		self.is_user_requested_to_finish_game = True
+		return None
+
+	def end_trade_day(self) -> None:
+		""" Ends the current trade day. In case this is the last trade day, or the player requested to end the game,
+		the game will be over.
+
+		:return: None
+		"""
+		self.check_game_is_not_over()
+		if self.current_trade_day >= self.last_trade_day or self.is_user_requested_to_finish_game:
+			self.is_last_trade_day = True
+		self.move_to_next_day()
+		return None
+
+	def move_to_next_day(self) -> None:
+		""" Moves to next day of trade
+
+		 :return: None
+		 """
+		self.hours_left_for_workday = AMOUNT_OF_HOURS_FOR_WORKDAY
+		self.current_trade_day += 1
+		if self.npc_traders is None:
+			self.products_prices_in_cities.generate_prices_for_all_cities()
+		else:
+			self.npc_traders.trade_day(prices_in_cities=self.products_prices_in_cities)
+		self.update_arbitrage_index()
+		self.price_history.add_prices(prices_rows=self.products_prices_in_cities.get_prices_rows())
+		return None
+
+	def create_price_history(self) -> PriceHistory:
+		""" Creates the history of the prices, starting with the current prices
+
+		:return: PriceHistory
+		"""
+		# The game doesn't last longer than its trade days, so a longer history would never be filled
+		price_history = PriceHistory(world_registry=self.world_registry,
+									 max_length=min(PRICE_HISTORY_MAX_LENGTH, self.last_trade_day + 1))
+		price_history.add_prices(prices_rows=self.products_prices_in_cities.get_prices_rows())
+		return price_history
+
+	def create_arbitrage_index(self) -> ArbitrageIndex:
+		""" Creates the index of the trade opportunities in the current prices
+
+		:return: ArbitrageIndex
+		"""
+		return ArbitrageIndex(world_registry=self.world_registry,
+							  prices_rows=self.products_prices_in_cities.get_prices_rows(),
+							  max_voyage_time=AMOUNT_OF_HOURS_FOR_WORKDAY)
+
+	def update_arbitrage_index(self) -> None:
+		""" Rebuilds the index of the trade opportunities - should be called every time the prices change
+
+		:return: None
+		"""
+		self.arbitrage_index = self.create_arbitrage_index()
+		return None
+
+	def get_best_trade(self) -> Optional[ArbitrageTrade]:
+		""" Returns the most profitable trade in the current prices, between any two cities
+
+		:return: ArbitrageTrade, or None in case no trade is profitable
+		"""
+		return self.arbitrage_index.get_best_trade()
+
+	def get_best_reachable_trade(self) -> Optional[ArbitrageTrade]:
+		""" Returns the most profitable trade buying at the player's current city, and selling at a city the ship can
+		reach within the hours left today
+
+		:return: ArbitrageTrade, or None in case no trade is profitable
+		"""
+		return self.arbitrage_index.get_best_trade_from_city(
+			from_city_id=self.world_registry.get_city_id(city_name=self.player.location),
+			hours_left=self.hours_left_for_workday,
+			voyage_times_matrix=self.voyage_times_matrix)
+
+	@property
+	def game_results(self) -> GameResult:
+		""" Returns the game results which can be recorded in the statistics table
+
+		:return: GameResult object
+		"""
+		return GameResult(name=self.player.name,
+						  coins_earned=self.player.budget,
+						  amount_of_trade_days=self.current_trade_day)
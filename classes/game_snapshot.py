@@ -0,0 +1,602 @@
+import json
+import logging
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple, Type
+from classes.game_engine import GameEngine
+from classes.city_prices_vectorized import ProductsPricesInAllCitiesVectorized
+from classes.transactions_ledger import TransactionsLedger
+from classes.npc_traders import NpcTradersPopulation
+from classes.price_impact import PriceImpactModel
+from classes.price_history import PriceHistory
+from custom_exceptions.snapshot_custom_exceptions import CustomExceptionSnapshotFileIsCorrupted, \
+	CustomExceptionSnapshotDoesNotMatchGame
+from classes.optional_numpy import import_numpy
+from constants import GAME_SNAPSHOT_MAX_INCREMENTAL_SAVES
+
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Saves the state of a running game ( player, inventory, ship, prices, price history, impact of the player's orders on
+the prices, NPC traders and game progress ) to a compact binary file, and restores it.
+
+The state is split to sections, each packed with struct / array into a few bytes. A snapshot file starts with a header,
+followed by frames - a frame is a group of sections written together:
+    header: b"STSNAP" + format version (uint16)
+    frame:  frame length (uint32) + sections
+    section: section ID (uint8) + payload length (uint32) + payload
+
+The first frame holds all sections. Every autosave appends a frame with only the sections which changed since the last
+save, so a save during a trade day usually writes only the player budget and inventory. When restoring, the last
+payload of each section wins - besides the transactions ledger, which is append-only, so every save writes only the
+transactions added since the previous save, and all of them are restored in order. A frame which was only partially
+written ( the process died while saving ) is ignored, so the game is restored as it was at the last complete save, and
+the partial frame is removed from the file.
+
+All numbers are written as little-endian, so a snapshot can be restored on any machine.
+"""
+
+
+SNAPSHOT_FILE_MAGIC: bytes = b"STSNAP"
+SNAPSHOT_FORMAT_VERSION: int = 1
+SNAPSHOT_HEADER_STRUCT = struct.Struct("<6sH")
+FRAME_LENGTH_STRUCT = struct.Struct("<I")
+SECTION_HEADER_STRUCT = struct.Struct("<BI")
+
+# Sections IDs
+SECTION_WORLD: int = 1
+SECTION_GAME_PROGRESS: int = 2
+SECTION_PLAYER: int = 3
+SECTION_SHIP: int = 4
+SECTION_INVENTORY: int = 5
+SECTION_PRICES: int = 6
+SECTION_VECTORIZED_PRICES: int = 7
+SECTION_TRANSACTIONS_LEDGER: int = 8
+SECTION_NPC_TRADERS: int = 9
+SECTION_PRICE_IMPACT: int = 10
+SECTION_PRICE_HISTORY: int = 11
+
+# current day, hours left, last day, ship breaks, is last day ended, is end requested, ship upgrade price
+GAME_PROGRESS_STRUCT = struct.Struct("<IIIIBBq")
+# budget, location city ID
+PLAYER_STRUCT = struct.Struct("<qI")
+# is broken, voyage time, fix cost, min fix cost, max fix cost, chance to break, upgrade reduction, upgrade work time
+SHIP_STRUCT = struct.Struct("<BIqqqdII")
+# current day index, amount of days, cities and products in the prices tensor
+VECTORIZED_PRICES_STRUCT = struct.Struct("<iIII")
+# index of the first transaction, amount of transactions - followed by a packed array of every ledger column
+TRANSACTIONS_LEDGER_STRUCT = struct.Struct("<II")
+TRANSACTIONS_LEDGER_COLUMNS: Tuple[str, ...] = ("transactions_types", "trade_days", "hours", "cities_ids",
+												 "products_ids", "amounts", "total_prices")
+STRING_LENGTH_STRUCT = struct.Struct("<H")
+# amount of traders, amount of markets - followed by the arrays of every trader, the arrays of every market and the
+# generator state
+NPC_TRADERS_STRUCT = struct.Struct("<II")
+NPC_TRADERS_ARRAYS: Tuple[str, ...] = ("budgets", "locations", "cargo_products_ids", "cargo_amounts")
+NPC_TRADERS_MARKETS_ARRAYS: Tuple[str, ...] = ("net_demand", "traded_volume")
+# price impact per unit - followed by the packed impacts array and impacts hours array
+PRICE_IMPACT_STRUCT = struct.Struct("<d")
+# max length, amount of days added - followed by the packed prices ring buffer and the statistics arrays
+PRICE_HISTORY_STRUCT = struct.Struct("<IQ")
+PRICE_HISTORY_ARRAYS: Tuple[str, ...] = ("prices", "prices_sums", "prices_squares_sums", "min_prices", "max_prices")
+
+
+def pack_array(values: array) -> bytes:
+	""" Returns the bytes of an array as little-endian
+
+	:param values:
+	:return: bytes
+	"""
+	if sys.byteorder == "big":
+		values = array(values.typecode, values)
+		values.byteswap()
+	return values.tobytes()
+
+
+def unpack_array(typecode: str, payload: bytes) -> array:
+	""" Returns an array from little-endian bytes
+
+	:param typecode: Type code of the array values
+	:param payload:
+	:return: array
+	"""
+	values: array = array(typecode)
+	values.frombytes(payload)
+	if sys.byteorder == "big":
+		values.byteswap()
+	return values
+
+
+def pack_strings(strings: List[str]) -> bytes:
+	""" Packs a list of strings - each string is prefixed by its length
+
+	:param strings:
+	:return: bytes
+	"""
+	packed_strings: List[bytes] = [STRING_LENGTH_STRUCT.pack(len(strings))]
+	for string in strings:
+		encoded_string: bytes = string.encode("utf-8")
+		packed_strings.append(STRING_LENGTH_STRUCT.pack(len(encoded_string)))
+		packed_strings.append(encoded_string)
+	return b"".join(packed_strings)
+
+
+def unpack_strings(payload: bytes, offset: int = 0) -> Tuple[List[str], int]:
+	""" Unpacks a list of strings packed by pack_strings()
+
+	:param payload:
+	:param offset: Optional - position of the packed strings in the payload, default: 0
+	:return: The strings, and the position in the payload after them
+	"""
+	(amount_of_strings,) = STRING_LENGTH_STRUCT.unpack_from(payload, offset)
+	offset += STRING_LENGTH_STRUCT.size
+	strings: List[str] = []
+	for _ in range(amount_of_strings):
+		(string_length,) = STRING_LENGTH_STRUCT.unpack_from(payload, offset)
+		offset += STRING_LENGTH_STRUCT.size
+		strings.append(payload[offset:offset + string_length].decode("utf-8"))
+		offset += string_length
+	return strings, offset
+
+
+class GameSnapshotFile:
+	""" Saves a game to a binary snapshot file, incrementally, and restores games from it """
+	def __init__(self, snapshot_file_path: str, max_incremental_saves: int = GAME_SNAPSHOT_MAX_INCREMENTAL_SAVES):
+		"""
+
+		:param snapshot_file_path: Path of the snapshot file
+		:param max_incremental_saves: Optional - amount of autosaves appended to the file before it is rewritten with a
+									  single full snapshot, default: GAME_SNAPSHOT_MAX_INCREMENTAL_SAVES
+		"""
+		self.snapshot_file_path: str = snapshot_file_path
+		self.snapshot_file: Path = Path(snapshot_file_path)
+		self.max_incremental_saves: int = max_incremental_saves
+
+		self.saved_sections_payloads: Dict[int, bytes] = {}  # Payloads as written in the file, to find changed sections
+		self.amount_of_saved_transactions: int = 0
+		self.amount_of_incremental_saves: int = 0
+
+	@staticmethod
+	def get_sections_payloads(game: GameEngine) -> Dict[int, bytes]:
+		""" Packs the state of a game into sections payloads
+
+		:param game:
+		:return: Dict[int, bytes] - payload of every section, keyed by section ID
+		"""
+		world_registry = game.world_registry
+		ship = game.ship
+		sections_payloads: Dict[int, bytes] = {
+			SECTION_WORLD: pack_strings(world_registry.cities_names)
+						   + pack_strings([product.name for product in world_registry.products_list]),
+			SECTION_GAME_PROGRESS: GAME_PROGRESS_STRUCT.pack(game.current_trade_day,
+															 game.hours_left_for_workday,
+															 game.last_trade_day,
+															 game.amount_of_ship_breaks,
+															 game.is_last_trade_day,
+															 game.is_user_requested_to_finish_game,
+															 game.ship_upgrade_price),
+			SECTION_PLAYER: PLAYER_STRUCT.pack(game.player.budget,
+											   world_registry.cities_ids[game.player.location])
+							+ pack_strings([game.player.name]),
+			SECTION_SHIP: SHIP_STRUCT.pack(ship.is_ship_broken,
+										   ship.voyage_time,
+										   ship.fix_cost,
+										   ship.min_fix_cost_in_game,
+										   ship.max_fix_cost_in_game,
+										   ship.chance_for_ship_to_break,
+										   ship.ship_upgrade_time_by_hours,
+										   ship.ship_upgrade_work_time_by_hours),
+			SECTION_INVENTORY: pack_array(game.player_inventory.products_amounts),
+			SECTION_PRICE_HISTORY: PRICE_HISTORY_STRUCT.pack(game.price_history.max_length,
+															 game.price_history.amount_of_days_added)
+								   + b"".join(pack_array(getattr(game.price_history, array_name))
+											  for array_name in PRICE_HISTORY_ARRAYS),
+		}
+
+		prices_in_cities = game.products_prices_in_cities
+		if isinstance(prices_in_cities, ProductsPricesInAllCitiesVectorized):
+			# The prices of the following days were already drawn, they are saved with the generator state
+			prices_tensor = prices_in_cities.prices_tensor
+			sections_payloads[SECTION_VECTORIZED_PRICES] = \
+				VECTORIZED_PRICES_STRUCT.pack(prices_in_cities.current_day_index, *prices_tensor.shape) \
+				+ prices_tensor.astype("<i8").tobytes() \
+				+ json.dumps(prices_in_cities.random_generator.bit_generator.state).encode("utf-8")
+		else:
+			sections_payloads[SECTION_PRICES] = b"".join(
+				pack_array(prices_in_city.products_prices_array)
+				for prices_in_city in prices_in_cities.prices_in_cities_by_id
+			)
+		if game.price_impact_model is not None:
+			sections_payloads[SECTION_PRICE_IMPACT] = \
+				PRICE_IMPACT_STRUCT.pack(game.price_impact_model.price_impact_per_unit) \
+				+ pack_array(game.price_impact_model.impacts) \
+				+ pack_array(game.price_impact_model.impacts_hours)
+		if game.npc_traders is not None:
+			sections_payloads[SECTION_NPC_TRADERS] = GameSnapshotFile.get_npc_traders_payload(
+				npc_traders=game.npc_traders)
+		return sections_payloads
+
+	@staticmethod
+	def get_npc_traders_payload(npc_traders: NpcTradersPopulation) -> bytes:
+		""" Packs the state of all NPC traders, and the state of their random generator - so a restored game draws the
+		same trades
+
+		:param npc_traders:
+		:return: bytes
+		"""
+		return NPC_TRADERS_STRUCT.pack(npc_traders.amount_of_traders, len(npc_traders.net_demand)) \
+			+ b"".join(getattr(npc_traders, array_name).astype("<i8").tobytes()
+					   for array_name in NPC_TRADERS_ARRAYS + NPC_TRADERS_MARKETS_ARRAYS) \
+			+ json.dumps(npc_traders.random_generator.bit_generator.state).encode("utf-8")
+
+	@staticmethod
+	def get_transactions_ledger_payload(transactions_ledger: TransactionsLedger, first_transaction_index: int) -> bytes:
+		""" Packs the transactions of the ledger from a given transaction to the last one
+
+		:param transactions_ledger:
+		:param first_transaction_index: Index of the first transaction to pack
+		:return: bytes
+		"""
+		return TRANSACTIONS_LEDGER_STRUCT.pack(first_transaction_index,
+											   len(transactions_ledger) - first_transaction_index) \
+			+ b"".join(pack_array(getattr(transactions_ledger, column_name)[first_transaction_index:])
+					   for column_name in TRANSACTIONS_LEDGER_COLUMNS)
+
+	@staticmethod
+	def pack_frame(sections_payloads: Dict[int, bytes]) -> bytes:
+		""" Packs sections into a frame
+
+		:param sections_payloads: Payload of every section, keyed by section ID
+		:return: bytes
+		"""
+		frame: bytes = b"".join(SECTION_HEADER_STRUCT.pack(section_id, len(payload)) + payload
+								for section_id, payload in sections_payloads.items())
+		return FRAME_LENGTH_STRUCT.pack(len(frame)) + frame
+
+	def save(self, game: GameEngine) -> int:
+		""" Saves a full snapshot of the game, replacing the snapshot file
+
+		:param game:
+		:return: Amount of bytes written
+		"""
+		sections_payloads: Dict[int, bytes] = self.get_sections_payloads(game=game)
+		transactions_ledger_payload: bytes = self.get_transactions_ledger_payload(
+			transactions_ledger=game.transactions_ledger,
+			first_transaction_index=0)
+		snapshot: bytes = SNAPSHOT_HEADER_STRUCT.pack(SNAPSHOT_FILE_MAGIC, SNAPSHOT_FORMAT_VERSION) \
+						  + self.pack_frame(sections_payloads={**sections_payloads,
+															   SECTION_TRANSACTIONS_LEDGER: transactions_ledger_payload})
+
+		# The file is replaced only after the new snapshot is fully written to a temporary file in the same directory
+		file_descriptor, temporary_snapshot_file_path = tempfile.mkstemp(
+			dir=self.snapshot_file.parent,
+			prefix=f"{self.snapshot_file.name}.",
+			suffix=".tmp"
+		)
+		try:
+			with os.fdopen(file_descriptor, "wb") as file:
+				file.write(snapshot)
+				file.flush()
+				os.fsync(file.fileno())
+			os.replace(temporary_snapshot_file_path, self.snapshot_file)
+		except BaseException:
+			os.unlink(temporary_snapshot_file_path)
+			raise
+
+		self.saved_sections_payloads = sections_payloads
+		self.amount_of_saved_transactions = len(game.transactions_ledger)
+		self.amount_of_incremental_saves = 0
+		logger.debug("Saved a game snapshot of %s bytes to %s", len(snapshot), self.snapshot_file_path)
+		return len(snapshot)
+
+	def autosave(self, game: GameEngine) -> int:
+		""" Saves only the sections of the game which changed since the last save or restore, by appending them to
+		the snapshot file. In case there is no previous save, or there are too many appended saves, a full snapshot
+		is saved instead.
+
+		:param game:
+		:return: Amount of bytes written, 0 in case nothing changed
+		"""
+		if not self.saved_sections_payloads or self.amount_of_incremental_saves >= self.max_incremental_saves:
+			return self.save(game=game)
+
+		changed_sections_payloads: Dict[int, bytes] = {
+			section_id: payload
+			for section_id, payload in self.get_sections_payloads(game=game).items()
+			if self.saved_sections_payloads.get(section_id) != payload
+		}
+		if not changed_sections_payloads:
+			return 0
+
+		frame_sections_payloads: Dict[int, bytes] = dict(changed_sections_payloads)
+		amount_of_transactions: int = len(game.transactions_ledger)
+		if amount_of_transactions > self.amount_of_saved_transactions:
+			frame_sections_payloads[SECTION_TRANSACTIONS_LEDGER] = self.get_transactions_ledger_payload(
+				transactions_ledger=game.transactions_ledger,
+				first_transaction_index=self.amount_of_saved_transactions)
+
+		frame: bytes = self.pack_frame(sections_payloads=frame_sections_payloads)
+		with open(self.snapshot_file, "ab") as file:
+			file.write(frame)
+		self.saved_sections_payloads.update(changed_sections_payloads)
+		self.amount_of_saved_transactions = amount_of_transactions
+		self.amount_of_incremental_saves += 1
+		return len(frame)
+
+	def read_sections_payloads(self) -> Tuple[Dict[int, bytes], List[bytes]]:
+		""" Reads the snapshot file, and returns the last saved payload of every section
+
+		:return: Payload of every section keyed by section ID, and all the transactions ledger payloads by their order
+		"""
+		with open(self.snapshot_file, "rb") as file:
+			snapshot: bytes = file.read()
+
+		if len(snapshot) < SNAPSHOT_HEADER_STRUCT.size:
+			raise CustomExceptionSnapshotFileIsCorrupted(f"File {self.snapshot_file_path} is not a game snapshot!")
+		magic, format_version = SNAPSHOT_HEADER_STRUCT.unpack_from(snapshot, 0)
+		if magic != SNAPSHOT_FILE_MAGIC:
+			raise CustomExceptionSnapshotFileIsCorrupted(f"File {self.snapshot_file_path} is not a game snapshot!")
+		if format_version != SNAPSHOT_FORMAT_VERSION:
+			raise CustomExceptionSnapshotFileIsCorrupted(f"Game snapshot {self.snapshot_file_path} has format version "
+														 f"{format_version}, only version {SNAPSHOT_FORMAT_VERSION} "
+														 f"is supported!")
+
+		sections_payloads: Dict[int, bytes] = {}
+		transactions_ledger_payloads: List[bytes] = []
+		amount_of_frames: int = 0
+		offset: int = SNAPSHOT_HEADER_STRUCT.size
+		while offset + FRAME_LENGTH_STRUCT.size <= len(snapshot):
+			(frame_length,) = FRAME_LENGTH_STRUCT.unpack_from(snapshot, offset)
+			frame_end: int = offset + FRAME_LENGTH_STRUCT.size + frame_length
+			if frame_end > len(snapshot):
+				break  # The last save was not fully written
+			offset += FRAME_LENGTH_STRUCT.size
+			while offset < frame_end:
+				section_id, payload_length = SECTION_HEADER_STRUCT.unpack_from(snapshot, offset)
+				offset += SECTION_HEADER_STRUCT.size
+				if section_id == SECTION_TRANSACTIONS_LEDGER:
+					transactions_ledger_payloads.append(snapshot[offset:offset + payload_length])
+				else:
+					sections_payloads[section_id] = snapshot[offset:offset + payload_length]
+				offset += payload_length
+			amount_of_frames += 1
+		if offset < len(snapshot):
+			# Following autosaves are appended after the last complete save, so the partial one is removed
+			os.truncate(self.snapshot_file, offset)
+			logger.warning("Removed a partially written save from the end of the game snapshot %s",
+						   self.snapshot_file_path)
+
+		if amount_of_frames == 0:
+			raise CustomExceptionSnapshotFileIsCorrupted(f"Game snapshot {self.snapshot_file_path} has no saved game!")
+		self.amount_of_incremental_saves = amount_of_frames - 1
+		return sections_payloads, transactions_ledger_payloads
+
+	def load_into(self, game: GameEngine) -> GameEngine:
+		""" Restores the saved state into a game. The game should have the same cities, products and prices backend as
+		the saved game.
+
+		Following autosaves will append to the snapshot file.
+
+		:param game:
+		:return: The given game, restored
+		"""
+		sections_payloads, transactions_ledger_payloads = self.read_sections_payloads()
+		self.restore_sections(game=game, sections_payloads=sections_payloads)
+		self.restore_transactions_ledger(game=game, transactions_ledger_payloads=transactions_ledger_payloads)
+		self.saved_sections_payloads = sections_payloads
+		self.amount_of_saved_transactions = len(game.transactions_ledger)
+		return game
+
+	def load(self, game_class: Type[GameEngine] = GameEngine, **game_arguments) -> GameEngine:
+		""" Creates a new game and restores the saved state into it
+
+		:param game_class: Optional - class of the game to create, for example Game, default: GameEngine
+		:param game_arguments: Optional - more arguments for creating the game, besides the player name, the prices
+							   backend, the amount of NPC traders and the price impact
+		:return: The restored game
+		"""
+		sections_payloads, transactions_ledger_payloads = self.read_sections_payloads()
+		player_name: str = unpack_strings(payload=sections_payloads[SECTION_PLAYER], offset=PLAYER_STRUCT.size)[0][0]
+		amount_of_npc_traders: int = 0
+		if SECTION_NPC_TRADERS in sections_payloads:
+			amount_of_npc_traders = NPC_TRADERS_STRUCT.unpack_from(sections_payloads[SECTION_NPC_TRADERS])[0]
+		price_impact_per_unit: float = 0
+		if SECTION_PRICE_IMPACT in sections_payloads:
+			price_impact_per_unit = PRICE_IMPACT_STRUCT.unpack_from(sections_payloads[SECTION_PRICE_IMPACT])[0]
+		game: GameEngine = game_class(player_name=player_name,
+									  use_vectorized_prices_backend=SECTION_VECTORIZED_PRICES in sections_payloads,
+									  amount_of_npc_traders=amount_of_npc_traders,
+									  price_impact_per_unit=price_impact_per_unit,
+									  **game_arguments)
+		self.restore_sections(game=game, sections_payloads=sections_payloads)
+		self.restore_transactions_ledger(game=game, transactions_ledger_payloads=transactions_ledger_payloads)
+		self.saved_sections_payloads = sections_payloads
+		self.amount_of_saved_transactions = len(game.transactions_ledger)
+		return game
+
+	def restore_transactions_ledger(self, game: GameEngine, transactions_ledger_payloads: List[bytes]) -> None:
+		""" Sets a new transactions ledger to the game, with all saved transactions
+
+		:param game:
+		:param transactions_ledger_payloads: All the transactions ledger payloads, by their order in the file
+		:return: None
+		"""
+		transactions_ledger = TransactionsLedger(world_registry=game.world_registry)
+		for payload in transactions_ledger_payloads:
+			first_transaction_index, amount_of_transactions = TRANSACTIONS_LEDGER_STRUCT.unpack_from(payload)
+			if first_transaction_index != len(transactions_ledger):
+				raise CustomExceptionSnapshotFileIsCorrupted(f"Game snapshot {self.snapshot_file_path} is missing "
+															 f"transactions {len(transactions_ledger)} to "
+															 f"{first_transaction_index}!")
+			columns: List[array] = []
+			offset: int = TRANSACTIONS_LEDGER_STRUCT.size
+			for column_name in TRANSACTIONS_LEDGER_COLUMNS:
+				typecode: str = getattr(transactions_ledger, column_name).typecode
+				column_end: int = offset + amount_of_transactions * array(typecode).itemsize
+				columns.append(unpack_array(typecode=typecode, payload=payload[offset:column_end]))
+				offset = column_end
+			# The transactions are added one by one, to calculate the ledger running totals
+			for transaction in zip(*columns):
+				transactions_ledger.add_transaction(*transaction)
+		game.transactions_ledger = transactions_ledger
+		return None
+
+	def restore_sections(self, game: GameEngine, sections_payloads: Dict[int, bytes]) -> None:
+		""" Sets the state of a game from sections payloads
+
+		:param game:
+		:param sections_payloads: Payload of every section, keyed by section ID
+		:return: None
+		"""
+		world_registry = game.world_registry
+		saved_cities_names, offset = unpack_strings(payload=sections_payloads[SECTION_WORLD])
+		saved_products_names, _ = unpack_strings(payload=sections_payloads[SECTION_WORLD], offset=offset)
+		if saved_cities_names != world_registry.cities_names \
+				or saved_products_names != [product.name for product in world_registry.products_list]:
+			raise CustomExceptionSnapshotDoesNotMatchGame(f"Game snapshot {self.snapshot_file_path} was saved with "
+														  f"cities {saved_cities_names} and products "
+														  f"{saved_products_names}, which are not the game's cities "
+														  f"and products!")
+
+		prices_in_cities = game.products_prices_in_cities
+		is_vectorized_prices_backend: bool = isinstance(prices_in_cities, ProductsPricesInAllCitiesVectorized)
+		if is_vectorized_prices_backend != (SECTION_VECTORIZED_PRICES in sections_payloads):
+			raise CustomExceptionSnapshotDoesNotMatchGame(f"Game snapshot {self.snapshot_file_path} was saved with "
+														  f"another prices backend than the game's!")
+		if (game.npc_traders is not None) != (SECTION_NPC_TRADERS in sections_payloads):
+			raise CustomExceptionSnapshotDoesNotMatchGame(f"Game snapshot {self.snapshot_file_path} does not match the "
+														  f"game - only one of them has NPC traders!")
+		if (game.price_impact_model is not None) != (SECTION_PRICE_IMPACT in sections_payloads):
+			raise CustomExceptionSnapshotDoesNotMatchGame(f"Game snapshot {self.snapshot_file_path} does not match the "
+														  f"game - only one of them has price impact!")
+
+		(game.current_trade_day,
+		 game.hours_left_for_workday,
+		 game.last_trade_day,
+		 game.amount_of_ship_breaks,
+		 is_last_trade_day,
+		 is_user_requested_to_finish_game,
+		 game.ship_upgrade_price) = GAME_PROGRESS_STRUCT.unpack_from(sections_payloads[SECTION_GAME_PROGRESS])
+		game.is_last_trade_day = bool(is_last_trade_day)
+		game.is_user_requested_to_finish_game = bool(is_user_requested_to_finish_game)
+
+		player_payload: bytes = sections_payloads[SECTION_PLAYER]
+		budget, location_city_id = PLAYER_STRUCT.unpack_from(player_payload)
+		game.player.name = unpack_strings(payload=player_payload, offset=PLAYER_STRUCT.size)[0][0]
+		game.player._budget = budget
+		game.player.location = world_registry.cities_names[location_city_id]
+
+		ship = game.ship
+		(is_ship_broken,
+		 ship._voyage_time,
+		 ship.fix_cost,
+		 ship.min_fix_cost_in_game,
+		 ship.max_fix_cost_in_game,
+		 ship.chance_for_ship_to_break,
+		 ship.ship_upgrade_time_by_hours,
+		 ship.ship_upgrade_work_time_by_hours) = SHIP_STRUCT.unpack_from(sections_payloads[SECTION_SHIP])
+		ship._is_ship_broken = bool(is_ship_broken)
+
+		game.player_inventory.products_amounts[:] = unpack_array(typecode="q",
+																 payload=sections_payloads[SECTION_INVENTORY])
+
+		if is_vectorized_prices_backend:
+			self.restore_vectorized_prices(prices_in_cities=prices_in_cities,
+										   payload=sections_payloads[SECTION_VECTORIZED_PRICES])
+		else:
+			saved_prices: array = unpack_array(typecode="q", payload=sections_payloads[SECTION_PRICES])
+			amount_of_products: int = world_registry.amount_of_products
+			for city_id, prices_in_city in enumerate(prices_in_cities.prices_in_cities_by_id):
+				prices_in_city.products_prices_array[:] = \
+					saved_prices[city_id * amount_of_products:(city_id + 1) * amount_of_products]
+		if game.price_impact_model is not None:
+			self.restore_price_impact(price_impact_model=game.price_impact_model,
+									  payload=sections_payloads[SECTION_PRICE_IMPACT])
+		if game.npc_traders is not None:
+			self.restore_npc_traders(npc_traders=game.npc_traders, payload=sections_payloads[SECTION_NPC_TRADERS])
+		game.update_arbitrage_index()
+		game.price_history = self.restore_price_history(price_history=game.price_history,
+														payload=sections_payloads[SECTION_PRICE_HISTORY])
+		return None
+
+	@staticmethod
+	def restore_vectorized_prices(prices_in_cities: ProductsPricesInAllCitiesVectorized, payload: bytes) -> None:
+		""" Sets the prices array and random generator state of the numpy prices backend
+
+		:param prices_in_cities:
+		:param payload: Payload of the vectorized prices section
+		:return: None
+		"""
+		numpy = import_numpy()
+		current_day_index, amount_of_days, amount_of_cities, amount_of_products = \
+			VECTORIZED_PRICES_STRUCT.unpack_from(payload)
+		prices_tensor_end: int = VECTORIZED_PRICES_STRUCT.size + amount_of_days * amount_of_cities * amount_of_products * 8
+		prices_in_cities.prices_tensor = numpy.frombuffer(payload[VECTORIZED_PRICES_STRUCT.size:prices_tensor_end],
+														  dtype="<i8") \
+			.reshape((amount_of_days, amount_of_cities, amount_of_products)).astype(numpy.int64)
+		prices_in_cities.current_day_index = current_day_index
+		prices_in_cities.random_generator.bit_generator.state = json.loads(payload[prices_tensor_end:].decode("utf-8"))
+		return None
+
+	@staticmethod
+	def restore_npc_traders(npc_traders: NpcTradersPopulation, payload: bytes) -> None:
+		""" Sets the state of all NPC traders, and the state of their random generator
+
+		:param npc_traders:
+		:param payload: Payload of the NPC traders section
+		:return: None
+		"""
+		numpy = import_numpy()
+		amount_of_traders, amount_of_markets = NPC_TRADERS_STRUCT.unpack_from(payload)
+		offset: int = NPC_TRADERS_STRUCT.size
+		for array_name in NPC_TRADERS_ARRAYS + NPC_TRADERS_MARKETS_ARRAYS:
+			array_length: int = amount_of_traders if array_name in NPC_TRADERS_ARRAYS else amount_of_markets
+			array_end: int = offset + array_length * 8
+			setattr(npc_traders, array_name,
+					numpy.frombuffer(payload[offset:array_end], dtype="<i8").astype(numpy.int64))
+			offset = array_end
+		npc_traders.amount_of_traders = amount_of_traders
+		npc_traders.random_generator.bit_generator.state = json.loads(payload[offset:].decode("utf-8"))
+		return None
+
+	@staticmethod
+	def restore_price_impact(price_impact_model: PriceImpactModel, payload: bytes) -> None:
+		""" Sets the impacts of the player's orders on the prices, and the hours they were last updated at
+
+		:param price_impact_model:
+		:param payload: Payload of the price impact section
+		:return: None
+		"""
+		(price_impact_model.price_impact_per_unit,) = PRICE_IMPACT_STRUCT.unpack_from(payload)
+		impacts_end: int = PRICE_IMPACT_STRUCT.size + len(price_impact_model.impacts) * price_impact_model.impacts.itemsize
+		price_impact_model.impacts[:] = unpack_array(typecode="d", payload=payload[PRICE_IMPACT_STRUCT.size:impacts_end])
+		price_impact_model.impacts_hours[:] = unpack_array(typecode="q", payload=payload[impacts_end:])
+		return None
+
+	@staticmethod
+	def restore_price_history(price_history: PriceHistory, payload: bytes) -> PriceHistory:
+		""" Creates the history of the prices with the saved prices ring buffer and statistics - the saved history can
+		be of another max length than the game's
+
+		:param price_history: The game's price history, its settings are used by the restored history
+		:param payload: Payload of the price history section
+		:return: PriceHistory
+		"""
+		max_length, amount_of_days_added = PRICE_HISTORY_STRUCT.unpack_from(payload)
+		restored_price_history = PriceHistory(world_registry=price_history.world_registry,
+											  max_length=max_length,
+											  use_numpy=price_history.use_numpy)
+		restored_price_history.amount_of_days_added = amount_of_days_added
+		offset: int = PRICE_HISTORY_STRUCT.size
+		for array_name in PRICE_HISTORY_ARRAYS:
+			values: array = getattr(restored_price_history, array_name)
+			array_end: int = offset + len(values) * values.itemsize
+			values[:] = unpack_array(typecode=values.typecode, payload=payload[offset:array_end])
+			offset = array_end
+		return restored_price_history
@@ -0,0 +1,161 @@
+from typing import Optional
+from classes.world_registry import WorldRegistry
+from classes.city_prices import ProductsPricesInAllCities
+from classes.optional_numpy import is_numpy_available, import_numpy
+from custom_exceptions.npc_traders_custom_exceptions import CustomExceptionNpcTradersRequireNumpy
+from constants import NPC_TRADER_INITIAL_BUDGET, NPC_TRADER_CARGO_CAPACITY, NPC_TRADERS_PRICE_IMPACT, \
+	NPC_TRADERS_MARKET_DEPTH
+
+
+"""
+Contains NpcTradersPopulation - the non-player traders sailing and trading in the game's world.
+
+The state of all traders is kept in numpy arrays, one item for every trader - its budget, the city it is in, and the
+product and amount it carries. Every trade day all traders act at once:
+* Traders carrying cargo sell all of it in the city they arrived at
+* Every trader then picks a random product and a random destination city, and fills its cargo hold with the product
+  ( as much as its budget allows ) in case it is sold for more at the destination
+* All traders sail overnight to their destination
+
+The units bought and sold in every city move the prices of the next trade day - a product bought more than it was sold
+gets more expensive, and a product sold more than it was bought gets cheaper ( see apply_price_impact() ). Prices stay
+in the range of their product. The traders and the state of their random generator are saved in game snapshots, so a
+restored game draws the same trades.
+
+Requires numpy - which is not a dependency of the game, and should be installed separately.
+"""
+
+
+NO_PRODUCT_ID: int = -1  # Product ID of traders carrying no cargo
+
+
+class NpcTradersPopulation:
+	""" Population of non-player traders, whose buying and selling moves the prices in cities """
+	def __init__(self,
+				 world_registry: WorldRegistry,
+				 amount_of_traders: int,
+				 seed: Optional[int] = None,
+				 initial_budget: int = NPC_TRADER_INITIAL_BUDGET,
+				 cargo_capacity: int = NPC_TRADER_CARGO_CAPACITY,
+				 price_impact: float = NPC_TRADERS_PRICE_IMPACT,
+				 market_depth: int = NPC_TRADERS_MARKET_DEPTH):
+		"""
+
+		:param world_registry: Registry of the cities and products the traders trade in
+		:param amount_of_traders:
+		:param seed: Optional - seed for the random generator, used to get the same trades in every game
+		:param initial_budget: Optional - budget of every trader when the population is created
+		:param cargo_capacity: Optional - amount of units every trader can carry
+		:param price_impact: Optional - biggest change of a price by the traders, as a part of the price. A price
+							 changes by this part when a product is only bought ( or only sold ) in a city, in amounts
+							 much bigger than the market depth
+		:param market_depth: Optional - amount of units of a product which, when only bought in a city, move its price
+							 by half of the price impact
+		"""
+		if not is_numpy_available():
+			raise CustomExceptionNpcTradersRequireNumpy("NPC traders require numpy! "
+														"Install it by running: pip install numpy")
+		numpy = import_numpy()
+		self.world_registry: WorldRegistry = world_registry
+		self.amount_of_traders: int = amount_of_traders
+		self.cargo_capacity: int = cargo_capacity
+		self.price_impact: float = price_impact
+		self.market_depth: int = market_depth
+		self.random_generator = numpy.random.default_rng(seed)
+
+		amount_of_cities: int = world_registry.amount_of_cities
+		amount_of_products: int = world_registry.amount_of_products
+		self.products_min_prices = numpy.array([product.min_price for product in world_registry.products_list],
+											   dtype=numpy.int64)
+		self.products_max_prices = numpy.array([product.max_price for product in world_registry.products_list],
+											   dtype=numpy.int64)
+		# Traded products are looked up at ( city ID * amount of products + product ID )
+		self.products_availability = numpy.ones(shape=amount_of_cities * amount_of_products, dtype=bool) \
+			if world_registry.products_availability is None \
+			else numpy.frombuffer(world_registry.products_availability, dtype=numpy.uint8).astype(bool)
+
+		# State of every trader, by trader index
+		self.budgets = numpy.full(shape=amount_of_traders, fill_value=initial_budget, dtype=numpy.int64)
+		self.locations = self.random_generator.integers(low=0, high=amount_of_cities, size=amount_of_traders)
+		self.cargo_products_ids = numpy.full(shape=amount_of_traders, fill_value=NO_PRODUCT_ID, dtype=numpy.int64)
+		self.cargo_amounts = numpy.zeros(shape=amount_of_traders, dtype=numpy.int64)
+
+		# Units bought minus units sold on the last trade day, at ( city ID * amount of products + product ID )
+		self.net_demand = numpy.zeros(shape=amount_of_cities * amount_of_products, dtype=numpy.int64)
+		# Units bought plus units sold on the last trade day, at the same indexes
+		self.traded_volume = numpy.zeros(shape=amount_of_cities * amount_of_products, dtype=numpy.int64)
+
+	def trade(self, prices_rows) -> None:
+		""" All traders sell their cargo, buy new cargo and sail to their next city. The units bought and sold are kept
+		in self.net_demand and self.traded_volume.
+
+		:param prices_rows: Prices of the trade day - (cities X products) numpy array
+		:return: None
+		"""
+		numpy = import_numpy()
+		amount_of_cities: int = self.world_registry.amount_of_cities
+		amount_of_products: int = self.world_registry.amount_of_products
+		amount_of_markets: int = amount_of_cities * amount_of_products
+		prices = prices_rows.reshape(-1)
+
+		# Sell all cargo in the cities the traders arrived at
+		sellers = numpy.flatnonzero(self.cargo_amounts)
+		sold_amounts = self.cargo_amounts[sellers]
+		sold_markets = self.locations[sellers] * amount_of_products + self.cargo_products_ids[sellers]
+		self.budgets[sellers] += sold_amounts * prices[sold_markets]
+		sold_units = numpy.bincount(sold_markets, weights=sold_amounts, minlength=amount_of_markets).astype(numpy.int64)
+		self.cargo_amounts[sellers] = 0
+		self.cargo_products_ids[sellers] = NO_PRODUCT_ID
+
+		# Pick a product and a destination city other than the current one
+		products_ids = self.random_generator.integers(low=0, high=amount_of_products, size=self.amount_of_traders)
+		destinations = self.locations
+		if amount_of_cities > 1:
+			destinations = self.random_generator.integers(low=0, high=amount_of_cities - 1, size=self.amount_of_traders)
+			destinations += destinations >= self.locations
+		buy_markets = self.locations * amount_of_products + products_ids
+		sell_markets = destinations * amount_of_products + products_ids
+		buy_prices = prices[buy_markets]
+
+		# Buy in case the product is traded in both cities, and sold for more at the destination
+		is_buying = self.products_availability[buy_markets] & self.products_availability[sell_markets] \
+			& (prices[sell_markets] > buy_prices) & (buy_prices > 0)
+		bought_amounts = numpy.where(is_buying,
+									 numpy.minimum(self.budgets // numpy.maximum(buy_prices, 1), self.cargo_capacity), 0)
+		self.budgets -= bought_amounts * buy_prices
+		bought_units = numpy.bincount(buy_markets, weights=bought_amounts, minlength=amount_of_markets) \
+			.astype(numpy.int64)
+		self.cargo_amounts = bought_amounts
+		self.cargo_products_ids = numpy.where(bought_amounts > 0, products_ids, NO_PRODUCT_ID)
+
+		self.locations = destinations
+		self.net_demand = bought_units - sold_units
+		self.traded_volume = bought_units + sold_units
+		return None
+
+	def apply_price_impact(self, prices_rows):
+		""" Moves prices by the units bought and sold on the last trade day. A price changes by the price impact times
+		( net demand / ( traded volume + market depth ) ), rounded, and kept in the range of its product.
+
+		:param prices_rows: Prices to move - (cities X products) numpy array
+		:return: numpy array of the moved prices, in the same shape
+		"""
+		numpy = import_numpy()
+		demand_ratio = self.net_demand / (self.traded_volume + self.market_depth)
+		moved_prices = numpy.rint(prices_rows.reshape(-1) * (1 + self.price_impact * demand_ratio)).astype(numpy.int64)
+		moved_prices = moved_prices.reshape(prices_rows.shape)
+		return numpy.clip(moved_prices, self.products_min_prices, self.products_max_prices)
+
+	def trade_day(self, prices_in_cities: ProductsPricesInAllCities) -> None:
+		""" Trades at the prices of the ending trade day, and draws the prices of the next trade day moved by the units
+		traded
+
+		:param prices_in_cities: Prices of the game - moved to the next trade day
+		:return: None
+		"""
+		numpy = import_numpy()
+		self.trade(prices_rows=numpy.array(prices_in_cities.get_prices_rows(), dtype=numpy.int64))
+		prices_in_cities.generate_prices_for_all_cities()
+		next_day_prices = numpy.array(prices_in_cities.get_prices_rows(), dtype=numpy.int64)
+		prices_in_cities.set_prices_rows(prices_rows=self.apply_price_impact(prices_rows=next_day_prices).tolist())
+		return None
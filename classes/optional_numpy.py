@@ -0,0 +1,29 @@
+import importlib.util
+from functools import lru_cache
+from types import ModuleType
+
+
+"""
+numpy is an optional dependency of the game - it is used by the vectorized prices backend and to sort many high scores.
+
+Importing numpy takes longer than starting the rest of the game, so it is not imported when the game starts, but only
+when it is first used.
+"""
+
+
+@lru_cache(maxsize=None)
+def is_numpy_available() -> bool:
+	""" Checks if numpy is installed, without importing it
+
+	:return: Boolean - true in case numpy is installed
+	"""
+	return importlib.util.find_spec("numpy") is not None
+
+
+def import_numpy() -> ModuleType:
+	""" Returns the numpy module, importing it on first use. Should be called only when is_numpy_available()
+
+	:return: The numpy module
+	"""
+	import numpy
+	return numpy
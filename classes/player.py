@@ -1,5 +1,7 @@
 import logging
+from typing import Optional
 from classes.city_prices import ProductsPricesInAllCities, ProductsPricesInCity
+from classes.price_impact import PriceImpactModel
 from classes.products import PlayerProductInventory, PlayersInventory
 from custom_exceptions.product_custom_exceptions import CustomExceptionPlayerHasNotEnoughBudget, \
 	CustomExceptionsTransactionFailNotEnoughItemAmount
@@ -24,8 +26,8 @@ class Player:
 		self._budget: int = initial_budget
 		self._current_location: str = initial_location
 
-		logger.info(f"Initiated player for the game with following details - "
-					f"name: {self.name} , budget: {self._budget} , current_location: {self._current_location}")
+		logger.info("Initiated player for the game with following details - name: %s , budget: %s , current_location: %s",
+					self.name, self._budget, self._current_location)
 
 	@property
 	def location(self) -> str:
@@ -58,9 +60,9 @@ class Player:
 		:param budget_to_add:
 		:return:
 		"""
-		logger.debug(f"Will change player budget - current budget {self._budget} , should add {budget_to_add}")
+		logger.debug("Will change player budget - current budget %s , should add %s", self._budget, budget_to_add)
 		self._budget += budget_to_add
-		logger.debug(f"Changed player budget is {self._budget}")
+		logger.debug("Changed player budget is %s", self._budget)
 		return None
 
 	def sub_budget(self, budget_to_remove: int) -> None:
@@ -69,13 +71,13 @@ class Player:
 		:param budget_to_remove:
 		:return:
 		"""
-		logger.debug(f"Changed player budget - current budget {self._budget} , should remove {budget_to_remove}")
+		logger.debug("Changed player budget - current budget %s , should remove %s", self._budget, budget_to_remove)
 		if self._budget < budget_to_remove:
 			raise CustomExceptionPlayerHasNotEnoughBudget("Player has not enough budget! "
 														  f"Current budget: {self._budget} , "
 														  f"amount to remove: {budget_to_remove}")
 		self._budget -= budget_to_remove
-		logger.debug(f"Changed player budget - new budget {self._budget}")
+		logger.debug("Changed player budget - new budget %s", self._budget)
 		return None
 
 
@@ -85,17 +87,21 @@ class PlayersTransaction:
 	def __init__(self,
 				 player: Player,
 				 player_inventory: PlayersInventory,
-				 prices_in_city: ProductsPricesInAllCities):
+				 prices_in_city: ProductsPricesInAllCities,
+				 price_impact_model: Optional[PriceImpactModel] = None):
 		"""
 
 		:param player: A Player object representing the player in the game. The PLayer object represents the player's
 					   current budget
 		:param player_inventory: An object representing the player's inventory in the game.
 		:param prices_in_city: An object representing the prices for the different products in the different cities
+		:param price_impact_model: Optional - impact of the player's orders on the prices, in case not given every unit
+								   is traded for the current price
 		"""
 		self.player: Player = player
 		self.player_inventory: PlayersInventory = player_inventory
 		self.prices_in_city: ProductsPricesInAllCities = prices_in_city
+		self.price_impact_model: Optional[PriceImpactModel] = price_impact_model
 
 	def check_player_has_enough_budget(self, needed_amount_of_cash: int) -> bool:
 		""" Check if a number, representing a buy transaction, is bigger than the player's budget.
@@ -117,46 +123,112 @@ class PlayersTransaction:
 		self.player.sub_budget(amount_to_remove)
 		return None
 
-	def buy_product(self, product_to_buy: PlayerProductInventory, amount_to_buy: int) -> None:
-		""" Will do a buy transaction for a player.
+	def get_buy_cost(self, product_to_buy: PlayerProductInventory, amount_to_buy: int) -> int:
+		""" Returns the cost of buying an amount of a product in the player's current city
 
 		:param product_to_buy:
 		:param amount_to_buy:
-		:return: True on success, in case the player has not enough budget - will return false.
+		:return: int
 		"""
 		prices_in_city: ProductsPricesInCity = \
 			self.prices_in_city.get_prices_in_city_by_city_name(city_name=self.player.location)
 
 		product_price: int = prices_in_city.get_price_for_product(product=product_to_buy)
-		cost: int = amount_to_buy * product_price
+		if self.price_impact_model is None:
+			return amount_to_buy * product_price
+		world_registry = self.prices_in_city.world_registry
+		return self.price_impact_model.get_buy_cost(city_id=world_registry.get_city_id(city_name=self.player.location),
+													product_id=world_registry.get_product_id(product=product_to_buy),
+													price=product_price,
+													amount=amount_to_buy)
+
+	def get_sell_income(self, product_to_sell: PlayerProductInventory, amount_to_sell: int) -> int:
+		""" Returns the income of selling an amount of a product in the player's current city
+
+		:param product_to_sell:
+		:param amount_to_sell:
+		:return: int
+		"""
+		prices_in_city: ProductsPricesInCity = \
+			self.prices_in_city.get_prices_in_city_by_city_name(city_name=self.player.location)
+
+		product_price: int = prices_in_city.get_price_for_product(product=product_to_sell)
+		if self.price_impact_model is None:
+			return amount_to_sell * product_price
+		world_registry = self.prices_in_city.world_registry
+		return self.price_impact_model.get_sell_income(
+			city_id=world_registry.get_city_id(city_name=self.player.location),
+			product_id=world_registry.get_product_id(product=product_to_sell),
+			price=product_price,
+			amount=amount_to_sell)
+
+	def get_max_amount_to_buy(self, product_to_buy: PlayerProductInventory) -> int:
+		""" Returns the biggest amount of a product the player can pay for in the current city
+
+		:param product_to_buy:
+		:return: int
+		"""
+		prices_in_city: ProductsPricesInCity = \
+			self.prices_in_city.get_prices_in_city_by_city_name(city_name=self.player.location)
+
+		product_price: int = prices_in_city.get_price_for_product(product=product_to_buy)
+		if self.price_impact_model is None:
+			return self.player.budget // product_price
+		world_registry = self.prices_in_city.world_registry
+		return self.price_impact_model.get_max_amount_to_buy(
+			city_id=world_registry.get_city_id(city_name=self.player.location),
+			product_id=world_registry.get_product_id(product=product_to_buy),
+			price=product_price,
+			budget=self.player.budget)
+
+	def add_order_price_impact(self, product: PlayerProductInventory, amount: int) -> None:
+		""" Adds the impact of an order done in the player's current city, in case orders have price impact
+
+		:param product:
+		:param amount: Amount of units - positive for units bought, negative for units sold
+		:return: None
+		"""
+		if self.price_impact_model is not None:
+			world_registry = self.prices_in_city.world_registry
+			self.price_impact_model.add_order(city_id=world_registry.get_city_id(city_name=self.player.location),
+											  product_id=world_registry.get_product_id(product=product),
+											  amount=amount)
+		return None
+
+	def buy_product(self, product_to_buy: PlayerProductInventory, amount_to_buy: int) -> int:
+		""" Will do a buy transaction for a player.
+
+		:param product_to_buy:
+		:param amount_to_buy:
+		:return: The cost paid, in case the player has not enough budget - will raise an exception
+		"""
+		cost: int = self.get_buy_cost(product_to_buy=product_to_buy, amount_to_buy=amount_to_buy)
 		if self.check_player_has_enough_budget(cost):
 			self.player_inventory.add_product_to_inventory(product=product_to_buy,
 														   amount_to_add=amount_to_buy)
 			self.player.sub_budget(budget_to_remove=cost)
-			return None
+			self.add_order_price_impact(product=product_to_buy, amount=amount_to_buy)
+			return cost
 		else:
 			raise CustomExceptionPlayerHasNotEnoughBudget(f"Player has not enough of budget to buy {amount_to_buy} X "
 														  f"{product_to_buy.name} - in a cost of {cost}")
 
-	def sell_product(self, product_to_sell: PlayerProductInventory, amount_to_sell: int) -> None:
+	def sell_product(self, product_to_sell: PlayerProductInventory, amount_to_sell: int) -> int:
 		""" Will do a sell transaction for a player.
 
 		:param product_to_sell:
 		:param amount_to_sell:
-		:return: None on success of transaction, in case the player has not enough of the product to sell - will raise
-		         an exception
+		:return: The income received on success of transaction, in case the player has not enough of the product to
+				 sell - will raise an exception
 		"""
-		prices_in_city: ProductsPricesInCity = \
-			self.prices_in_city.get_prices_in_city_by_city_name(city_name=self.player.location)
-
-		product_price: int = prices_in_city.get_price_for_product(product=product_to_sell)
-		profit: int = amount_to_sell * product_price
+		profit: int = self.get_sell_income(product_to_sell=product_to_sell, amount_to_sell=amount_to_sell)
 		if self.player_inventory.check_if_amount_of_item_exists_in_inventory(product=product_to_sell,
 																			 amount=amount_to_sell):
 			self.player_inventory.remove_product_from_inventory(product=product_to_sell,
 														   		amount_to_remove=amount_to_sell)
 			self.player.add_budget(budget_to_add=profit)
-			return None
+			self.add_order_price_impact(product=product_to_sell, amount=-amount_to_sell)
+			return profit
 		else:
 			raise CustomExceptionsTransactionFailNotEnoughItemAmount(f"Can't do a sell transaction for {amount_to_sell}"
 																	 f" X {product_to_sell.name} "
@@ -0,0 +1,249 @@
+import math
+from array import array
+from typing import List, Sequence, Optional
+from classes.world_registry import WorldRegistry
+from classes.optional_numpy import is_numpy_available, import_numpy
+from constants import PRICE_HISTORY_MAX_LENGTH
+
+
+"""
+Contains PriceHistory - the prices of every product in every city over the last trade days, and their statistics.
+
+Only the last max length trade days are kept, so the memory used doesn't grow in long games. The prices are kept in a
+single ring buffer array of ( max length X cities X products ) - the prices of a new trade day overwrite the prices of
+the oldest day kept. A max length of 0 keeps no history.
+
+The statistics of every product in every city are updated on every new trade day, and read in O(1):
+* Mean and volatility ( standard deviation of the prices ) - from the sum of the prices and the sum of their squares,
+  which are kept as integers, so they don't drift however many days are added
+* Min and max - a new price replaces the min ( or max ) in case it is lower ( or higher ). In case the price of the
+  expired day was the min ( or max ), and the new price doesn't replace it, the prices of the market are scanned for the
+  new min ( or max ) - a scan of max length prices in C ( an array slice ), which happens in about 1 / max length of the
+  days for random prices.
+
+All statistics are kept in flat arrays by ( city ID * amount of products + product ID ), so the history holds no Python
+object per product and city, and creating it takes only a few array allocations even in worlds with thousands of
+cities and products. In case numpy is installed, a new trade day updates all markets at once through numpy views of
+the arrays, instead of a Python loop over the markets.
+"""
+
+
+class PriceHistory:
+	""" Prices of all products in all cities in the last trade days """
+	def __init__(self,
+				 world_registry: WorldRegistry,
+				 max_length: int = PRICE_HISTORY_MAX_LENGTH,
+				 use_numpy: Optional[bool] = None):
+		"""
+
+		:param world_registry: Registry of the cities and products of the prices
+		:param max_length: Optional - amount of trade days to keep the prices of, 0 to keep no history
+		:param use_numpy: Optional - update the statistics of a new trade day with numpy, default: in case numpy is
+						  installed
+		"""
+		self.world_registry: WorldRegistry = world_registry
+		self.max_length: int = max_length
+		self.use_numpy: bool = is_numpy_available() if use_numpy is None else use_numpy
+		self.amount_of_markets: int = world_registry.amount_of_cities * world_registry.amount_of_products
+		self.amount_of_days_added: int = 0
+
+		# Price of market M ( city ID * amount of products + product ID ) in day D is at
+		# ( D % max length ) * amount of markets + M
+		self.prices: array = array("q", [0]) * (max_length * self.amount_of_markets)
+		# Statistics of the prices kept, by market
+		self.prices_sums: array = array("q", [0]) * self.amount_of_markets
+		self.prices_squares_sums: array = array("q", [0]) * self.amount_of_markets
+		self.min_prices: array = array("q", [0]) * self.amount_of_markets
+		self.max_prices: array = array("q", [0]) * self.amount_of_markets
+
+	@property
+	def length(self) -> int:
+		""" Returns the amount of trade days kept
+
+		:return: int
+		"""
+		return min(self.amount_of_days_added, self.max_length)
+
+	def add_prices(self, prices_rows: Sequence[Sequence[int]]) -> None:
+		""" Adds the prices of a new trade day, dropping the prices of the oldest day in case max length days are kept
+
+		:param prices_rows: Prices of the trade day - a row for every city, ordered by the cities IDs, with a price for
+							every product, ordered by the products IDs
+		:return: None
+		"""
+		if self.max_length == 0:
+			return None
+		if self.amount_of_days_added == 0:
+			return self.add_first_prices(prices_rows=prices_rows)
+		if self.use_numpy:
+			return self.add_prices_with_numpy(prices_rows=prices_rows)
+		day: int = self.amount_of_days_added
+		max_length: int = self.max_length
+		amount_of_markets: int = self.amount_of_markets
+		is_full: bool = day >= max_length
+		offset: int = (day % max_length) * amount_of_markets
+		prices: array = self.prices
+		prices_sums: array = self.prices_sums
+		prices_squares_sums: array = self.prices_squares_sums
+		min_prices: array = self.min_prices
+		max_prices: array = self.max_prices
+		for market, price in enumerate(price for prices_row in prices_rows for price in prices_row):
+			index: int = offset + market
+			if is_full:
+				expired_price: int = prices[index]
+				prices[index] = price
+				prices_sums[market] += price - expired_price
+				prices_squares_sums[market] += price * price - expired_price * expired_price
+				# In case the expired price was the min ( or max ) - and the new price doesn't replace it, the days kept
+				# are scanned for the new min ( or max )
+				if price <= min_prices[market]:
+					min_prices[market] = price
+				elif expired_price == min_prices[market]:
+					min_prices[market] = min(prices[market::amount_of_markets])
+				if price >= max_prices[market]:
+					max_prices[market] = price
+				elif expired_price == max_prices[market]:
+					max_prices[market] = max(prices[market::amount_of_markets])
+			else:
+				prices[index] = price
+				prices_sums[market] += price
+				prices_squares_sums[market] += price * price
+				if price < min_prices[market]:
+					min_prices[market] = price
+				if price > max_prices[market]:
+					max_prices[market] = price
+		self.amount_of_days_added += 1
+		return None
+
+	def add_prices_with_numpy(self, prices_rows: Sequence[Sequence[int]]) -> None:
+		""" Adds the prices of a new trade day after the first one, as add_prices() - updating all markets at once
+
+		:param prices_rows: Prices of the trade day, as in add_prices()
+		:return: None
+		"""
+		numpy = import_numpy()
+		# Views of the history arrays - writing to them writes to the arrays
+		prices = numpy.frombuffer(self.prices, dtype=numpy.int64).reshape((self.max_length, self.amount_of_markets))
+		prices_sums = numpy.frombuffer(self.prices_sums, dtype=numpy.int64)
+		prices_squares_sums = numpy.frombuffer(self.prices_squares_sums, dtype=numpy.int64)
+		min_prices = numpy.frombuffer(self.min_prices, dtype=numpy.int64)
+		max_prices = numpy.frombuffer(self.max_prices, dtype=numpy.int64)
+
+		new_prices = numpy.asarray(prices_rows, dtype=numpy.int64).reshape(-1)
+		day_prices = prices[self.amount_of_days_added % self.max_length]
+		if self.amount_of_days_added >= self.max_length:
+			expired_prices = day_prices.copy()
+			day_prices[:] = new_prices
+			prices_sums += new_prices - expired_prices
+			prices_squares_sums += new_prices * new_prices - expired_prices * expired_prices
+			# Markets whose expired price was the min ( or max ), and the new price doesn't replace it, are scanned
+			is_min_expired = (expired_prices == min_prices) & (new_prices > min_prices)
+			is_max_expired = (expired_prices == max_prices) & (new_prices < max_prices)
+			numpy.minimum(min_prices, new_prices, out=min_prices)
+			numpy.maximum(max_prices, new_prices, out=max_prices)
+			if is_min_expired.any():
+				min_prices[is_min_expired] = prices[:, is_min_expired].min(axis=0)
+			if is_max_expired.any():
+				max_prices[is_max_expired] = prices[:, is_max_expired].max(axis=0)
+		else:
+			day_prices[:] = new_prices
+			prices_sums += new_prices
+			prices_squares_sums += new_prices * new_prices
+			numpy.minimum(min_prices, new_prices, out=min_prices)
+			numpy.maximum(max_prices, new_prices, out=max_prices)
+		self.amount_of_days_added += 1
+		return None
+
+	def add_first_prices(self, prices_rows: Sequence[Sequence[int]]) -> None:
+		""" Adds the prices of the first trade day, copying them at once to the prices and statistics arrays
+
+		:param prices_rows: Prices of the trade day, as in add_prices()
+		:return: None
+		"""
+		first_prices: array = array("q")
+		for prices_row in prices_rows:
+			first_prices.extend(prices_row)
+		self.prices[:self.amount_of_markets] = first_prices
+		self.prices_sums[:] = first_prices
+		self.prices_squares_sums[:] = array("q", [price * price for price in first_prices])
+		self.min_prices[:] = first_prices
+		self.max_prices[:] = first_prices
+		self.amount_of_days_added = 1
+		return None
+
+	def get_market(self, city_id: int, product_id: int) -> int:
+		""" Returns the index of a product in a city in the history arrays
+
+		:param city_id:
+		:param product_id:
+		:return: int
+		"""
+		return city_id * self.world_registry.amount_of_products + product_id
+
+	def get_day_price(self, day: int, market: int) -> int:
+		""" Returns the price of a market in a trade day kept
+
+		:param day: Index of the day - 0 for the first day added
+		:param market:
+		:return: int
+		"""
+		return self.prices[(day % self.max_length) * self.amount_of_markets + market]
+
+	def get_prices(self, city_id: int, product_id: int) -> List[int]:
+		""" Returns the prices kept of a product in a city
+
+		:param city_id:
+		:param product_id:
+		:return: List - the price in every trade day kept, from the oldest day to the last day
+		"""
+		market: int = self.get_market(city_id=city_id, product_id=product_id)
+		return [self.get_day_price(day=day, market=market)
+				for day in range(self.amount_of_days_added - self.length, self.amount_of_days_added)]
+
+	def get_mean_price(self, city_id: int, product_id: int) -> float:
+		""" Returns the mean price of a product in a city in the trade days kept
+
+		:param city_id:
+		:param product_id:
+		:return: float, 0 in case no trade days are kept
+		"""
+		if self.length == 0:
+			return 0
+		return self.prices_sums[self.get_market(city_id=city_id, product_id=product_id)] / self.length
+
+	def get_min_price(self, city_id: int, product_id: int) -> int:
+		""" Returns the lowest price of a product in a city in the trade days kept
+
+		:param city_id:
+		:param product_id:
+		:return: int, 0 in case no trade days are kept
+		"""
+		if self.length == 0:
+			return 0
+		return self.min_prices[self.get_market(city_id=city_id, product_id=product_id)]
+
+	def get_max_price(self, city_id: int, product_id: int) -> int:
+		""" Returns the highest price of a product in a city in the trade days kept
+
+		:param city_id:
+		:param product_id:
+		:return: int, 0 in case no trade days are kept
+		"""
+		if self.length == 0:
+			return 0
+		return self.max_prices[self.get_market(city_id=city_id, product_id=product_id)]
+
+	def get_volatility(self, city_id: int, product_id: int) -> float:
+		""" Returns the standard deviation of the prices of a product in a city in the trade days kept
+
+		:param city_id:
+		:param product_id:
+		:return: float, 0 in case no trade days are kept
+		"""
+		length: int = self.length
+		if length == 0:
+			return 0
+		market: int = self.get_market(city_id=city_id, product_id=product_id)
+		variance_times_length_squared: int = \
+			length * self.prices_squares_sums[market] - self.prices_sums[market] * self.prices_sums[market]
+		return math.sqrt(variance_times_length_squared) / length
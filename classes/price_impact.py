@@ -0,0 +1,157 @@
+import math
+from array import array
+from classes.world_registry import WorldRegistry
+from constants import PRICE_IMPACT_PER_UNIT, PRICE_IMPACT_HALF_LIFE_HOURS, PRICE_IMPACT_MIN_PRICE_MULTIPLIER
+
+
+"""
+Contains PriceImpactModel - the change of prices in a city by the player's own orders.
+
+Every unit of a product the player buys in a city makes the next unit more expensive, and every unit sold makes the next
+unit cheaper. The impact of the orders on a product in a city is kept as a number of units ( positive in case bought,
+negative in case sold ), and the price of a unit is:
+	price * max( 1 + price impact per unit * impact , min price multiplier )
+Buying n units from an impact of x pays for the impacts x, x+1 ... x+n-1, and selling n units gets paid for the impacts
+x-1, x-2 ... x-n - so buying units and selling them right back never makes a profit. The cost of an order is the sum of
+an arithmetic series - price * ( n + price impact per unit * ( n*x + n*(n-1)/2 ) ), while above the min price
+multiplier - so it is calculated in O(1) for any amount of units.
+
+The impact decays with time - it is halved every PRICE_IMPACT_HALF_LIFE_HOURS game hours. The impacts are kept in two
+arrays, indexed by ( city ID * amount of products + product ID ) - the impact, and the game hour it was last updated at.
+The decay is applied only when a product is traded or priced in a city, so updating the model takes O(1) per order.
+
+The impacts are saved in game snapshots, so a restored game keeps the prices moved by the player's orders.
+"""
+
+
+HOURS_IN_A_DAY: int = 24  # Game hours passing between the start of two trade days, used to decay the impact overnight
+
+
+class PriceImpactModel:
+	""" Impact of the player's orders on the prices of products in cities """
+	def __init__(self,
+				 world_registry: WorldRegistry,
+				 price_impact_per_unit: float = PRICE_IMPACT_PER_UNIT,
+				 half_life_hours: float = PRICE_IMPACT_HALF_LIFE_HOURS,
+				 min_price_multiplier: float = PRICE_IMPACT_MIN_PRICE_MULTIPLIER):
+		"""
+
+		:param world_registry: Registry of the cities and products traded
+		:param price_impact_per_unit: Optional - part of the price added to the next unit for every unit bought ( and
+									  removed for every unit sold )
+		:param half_life_hours: Optional - game hours after which the impact is halved
+		:param min_price_multiplier: Optional - lowest part of the price a unit can be sold or bought for
+		"""
+		self.world_registry: WorldRegistry = world_registry
+		self.price_impact_per_unit: float = price_impact_per_unit
+		self.half_life_hours: float = half_life_hours
+		self.min_price_multiplier: float = min_price_multiplier
+		self.current_hour: int = 0  # Game hour now - set by the game before every order
+
+		amount_of_markets: int = world_registry.amount_of_cities * world_registry.amount_of_products
+		self.impacts: array = array("d", [0]) * amount_of_markets
+		self.impacts_hours: array = array("q", [0]) * amount_of_markets
+
+	def get_impact(self, city_id: int, product_id: int) -> float:
+		""" Returns the impact of the player's orders on a product in a city, decayed to the current hour
+
+		:param city_id:
+		:param product_id:
+		:return: float - units bought minus units sold, decayed by time
+		"""
+		index: int = city_id * self.world_registry.amount_of_products + product_id
+		impact: float = self.impacts[index]
+		hours_passed: int = self.current_hour - self.impacts_hours[index]
+		if impact and hours_passed:
+			impact *= 0.5 ** (hours_passed / self.half_life_hours)
+			self.impacts[index] = impact
+		self.impacts_hours[index] = self.current_hour
+		return impact
+
+	def get_price_multiplier(self, city_id: int, product_id: int) -> float:
+		""" Returns the part of the price the next unit of a product in a city is traded for
+
+		:param city_id:
+		:param product_id:
+		:return: float
+		"""
+		impact: float = self.get_impact(city_id=city_id, product_id=product_id)
+		return max(1 + self.price_impact_per_unit * impact, self.min_price_multiplier)
+
+	def get_multipliers_sum(self, first_impact: float, amount: int) -> float:
+		""" Sums the price multipliers of units traded at the impacts first_impact, first_impact + 1 ... first_impact +
+		amount - 1
+
+		:param first_impact: Impact of the first unit
+		:param amount: Amount of units
+		:return: float
+		"""
+		if amount <= 0:
+			return 0
+		if self.price_impact_per_unit <= 0:
+			return float(amount)
+		# Units with an impact below this one are traded at the min price multiplier
+		min_multiplier_impact: float = (self.min_price_multiplier - 1) / self.price_impact_per_unit
+		amount_at_min_multiplier: int = min(amount, max(0, math.ceil(min_multiplier_impact - first_impact)))
+		amount_left: int = amount - amount_at_min_multiplier
+		impact_left: float = first_impact + amount_at_min_multiplier
+		return amount_at_min_multiplier * self.min_price_multiplier \
+			+ amount_left + self.price_impact_per_unit * (amount_left * impact_left + amount_left * (amount_left - 1) / 2)
+
+	def get_buy_cost(self, city_id: int, product_id: int, price: int, amount: int) -> int:
+		""" Returns the cost of buying units of a product in a city
+
+		:param city_id:
+		:param product_id:
+		:param price: Current price of the product in the city
+		:param amount: Amount of units to buy
+		:return: int - rounded up
+		"""
+		impact: float = self.get_impact(city_id=city_id, product_id=product_id)
+		return math.ceil(price * self.get_multipliers_sum(first_impact=impact, amount=amount))
+
+	def get_sell_income(self, city_id: int, product_id: int, price: int, amount: int) -> int:
+		""" Returns the income of selling units of a product in a city
+
+		:param city_id:
+		:param product_id:
+		:param price: Current price of the product in the city
+		:param amount: Amount of units to sell
+		:return: int - rounded down
+		"""
+		impact: float = self.get_impact(city_id=city_id, product_id=product_id)
+		return math.floor(price * self.get_multipliers_sum(first_impact=impact - amount, amount=amount))
+
+	def get_max_amount_to_buy(self, city_id: int, product_id: int, price: int, budget: int) -> int:
+		""" Returns the biggest amount of units of a product in a city which can be bought with a budget. Searches the
+		amounts by their cost, which takes O(1) for every amount.
+
+		:param city_id:
+		:param product_id:
+		:param price: Current price of the product in the city
+		:param budget:
+		:return: int
+		"""
+		if price <= 0:
+			return 0
+		low_amount: int = 0
+		high_amount: int = math.floor(budget / (price * min(1.0, self.min_price_multiplier))) + 1  # Can't be paid
+		while high_amount - low_amount > 1:
+			amount: int = (low_amount + high_amount) // 2
+			if self.get_buy_cost(city_id=city_id, product_id=product_id, price=price, amount=amount) <= budget:
+				low_amount = amount
+			else:
+				high_amount = amount
+		return low_amount
+
+	def add_order(self, city_id: int, product_id: int, amount: int) -> None:
+		""" Adds the impact of an order done now
+
+		:param city_id:
+		:param product_id:
+		:param amount: Amount of units - positive for units bought, negative for units sold
+		:return: None
+		"""
+		impact: float = self.get_impact(city_id=city_id, product_id=product_id)
+		self.impacts[city_id * self.world_registry.amount_of_products + product_id] = impact + amount
+		return None
@@ -1,7 +1,9 @@
 import logging
-from typing import List
+from typing import List, Optional
+from array import array
 from custom_exceptions.product_custom_exceptions import CustomExceptionProductDoesNotExists, \
 	CustomExceptionProductMinPriceIsBiggerThanMaxPrice, CustomExceptionProductHasEmptyName
+from classes.world_registry import WorldRegistry
 
 
 logger = logging.getLogger(__name__)
@@ -70,22 +72,63 @@ class PlayerProductInventory:
 		return self.product.name
 
 
+class PlayerProductInventoryView(PlayerProductInventory):
+	""" Represents a product in the player's inventory, served from the amounts array of PlayersInventory.
+	The view holds no amount of its own - reading or updating the amount reads or updates the inventory. """
+	def __init__(self, players_inventory: "PlayersInventory", product_id: int):
+		"""
+
+		:param players_inventory: The inventory holding the amounts array
+		:param product_id: ID of the product in the amounts array
+		"""
+		self.players_inventory: PlayersInventory = players_inventory
+		self.product_id: int = product_id
+		self.product: Product = players_inventory.world_registry.get_product_by_id(product_id=product_id)
+
+	@property
+	def amount(self) -> int:
+		""" Returns the amount of the product in the inventory
+
+		:return: int
+		"""
+		return self.players_inventory.products_amounts[self.product_id]
+
+	@amount.setter
+	def amount(self, amount: int) -> None:
+		""" Sets the amount of the product in the inventory
+
+		:param amount:
+		:return: None
+		"""
+		self.players_inventory.products_amounts[self.product_id] = amount
+
+
 class PlayersInventory:
-	""" Defines the player's inventory - which will details what products player holds and in which quantity
-		# TODO - add in the future a transaction history
+	""" Defines the player's inventory - which will details what products player holds and in which quantity.
+	Amounts are kept in an array, indexed by the products IDs given by the game's WorldRegistry.
+	The history of the transactions is kept by the game's TransactionsLedger ( see classes/transactions_ledger.py ).
 	"""
 
 	def __init__(self,
 				 products_list_in_game: List[Product],
-				 initial_amount: int = 0):
+				 initial_amount: int = 0,
+				 world_registry: Optional[WorldRegistry] = None):
 		""" Will load all products available in a game to the inventory.
 		All products will start with a default 0 amount.
 
+		:param products_list_in_game: A list of all products in a specific Sea Trader game
+		:param initial_amount: Optional - amount of every product at start, default: 0
+		:param world_registry: Optional - registry giving the products IDs, in case not given a new one will be created
+							   for the products list
 		"""
-		self.products_inventory_list: List[PlayerProductInventory] = []
-		for product in products_list_in_game:
-			self.products_inventory_list.append(PlayerProductInventory(product=product,
-																	   amount=initial_amount))
+		if world_registry is None:
+			world_registry = WorldRegistry(cities_names=[], products_list=products_list_in_game)
+		self.world_registry: WorldRegistry = world_registry
+		self.products_amounts: array = array("q", [initial_amount]) * self.world_registry.amount_of_products
+		self.products_inventory_list: List[PlayerProductInventory] = [
+			PlayerProductInventoryView(players_inventory=self, product_id=product_id)
+			for product_id in range(self.world_registry.amount_of_products)
+		]
 
 	def get_product_details_in_inventory(self, product_to_get_details_on: Product) -> PlayerProductInventory:
 		""" Returns product details in the inventory
@@ -93,11 +136,16 @@ class PlayersInventory:
 		:param product_to_get_details_on:
 		:return: A PlayerProductInventory of the product given
 		"""
-		for product_inventory in self.products_inventory_list:
-			if product_inventory.product_name == product_to_get_details_on.name:
-				return product_inventory
-		raise CustomExceptionProductDoesNotExists(f"Product {product_to_get_details_on.name} "
-												  f"doesn't exist in player's inventory! ")
+		product_id: int = self.world_registry.get_product_id(product=product_to_get_details_on)
+		return self.get_product_details_by_id(product_id=product_id)
+
+	def get_product_details_by_id(self, product_id: int) -> PlayerProductInventory:
+		""" Returns product details in the inventory according to the product ID
+
+		:param product_id:
+		:return: A PlayerProductInventory of the product
+		"""
+		return self.products_inventory_list[product_id]
 
 	def add_product_to_inventory(self, product: Product, amount_to_add: int) -> None:
 		""" Adds an amount from a product to the inventory.
@@ -106,11 +154,8 @@ class PlayersInventory:
 		:param amount_to_add:
 		:return None
 		"""
-		for product_inventory in self.products_inventory_list:
-			if product_inventory.product_name == product.name:
-				product_inventory.amount += amount_to_add
-				return None
-		raise CustomExceptionProductDoesNotExists(f"Product {product.name} doesn't exist in player's inventory! ")
+		self.products_amounts[self.world_registry.get_product_id(product=product)] += amount_to_add
+		return None
 
 	def remove_product_from_inventory(self, product: Product, amount_to_remove: int) -> None:
 		""" Removes an amount from a product from the inventory.
@@ -128,16 +173,14 @@ class PlayersInventory:
 		:param amount: an amount of item to be checked
 		:return: boolean - true if there is enough amount of the product, else false
 		"""
-		product_inventory_details: PlayerProductInventory = \
-			self.get_product_details_in_inventory(product_to_get_details_on=product)
-		if amount <= product_inventory_details.amount:
+		if amount <= self.products_amounts[self.world_registry.get_product_id(product=product)]:
 			return True
 		return False
 
 	def get_inventory_content(self) -> List[PlayerProductInventory]:
 		""" Returns a list with the inventory content.
 
-		:return: List[Product]
+		:return: List[PlayerProductInventory]
 		"""
 		return self.products_inventory_list
 
@@ -147,8 +190,9 @@ class PlayersInventory:
 		:param product_name:
 		:return: PlayerProductInventory object
 		"""
-		for product_inventory in self.products_inventory_list:
-			if product_inventory.product_name == product_name:
-				return product_inventory
-		logger.error(f"Failed in searching for product with name {product_name} in the player inventory")
-		raise CustomExceptionProductDoesNotExists(f"Product {product_name} doesn't exist in player's inventory! ")
+		try:
+			product_id: int = self.world_registry.get_product_id_by_name(product_name=product_name)
+		except CustomExceptionProductDoesNotExists:
+			logger.error("Failed in searching for product with name %s in the player inventory", product_name)
+			raise
+		return self.get_product_details_by_id(product_id=product_id)
@@ -36,6 +36,7 @@ class Ship:
 		"""
 		self._is_ship_broken: bool = False
 		self._voyage_time: int = voyage_time
+		self.initial_voyage_time: int = voyage_time  # Voyage time before upgrades
 
 		self.fix_cost: int = 0
 		self.min_fix_cost_in_game: int = min_fix_cost_in_game
@@ -44,14 +45,16 @@ class Ship:
 		self.ship_upgrade_time_by_hours: int = ship_upgrade_time_by_hours
 		self.ship_upgrade_work_time_by_hours: int = ship_upgrade_work_time_by_hours
 
-		logger.info(f"Initiated player ship with following details - "
-					f"fix cost: {self.fix_cost} "
-					f"min_fix_cost_in_game: {self.min_fix_cost_in_game} "
-					f"max_fix_cost_in_game: {self.max_fix_cost_in_game} "
-					f"chance_for_ship_to_break: {self.chance_for_ship_to_break} "
-					f"voyage time: {self._voyage_time} "
-					f"ship upgrade time by hours: {self.ship_upgrade_time_by_hours}"
-					f"ship upgrade process time by hours: {self.ship_upgrade_work_time_by_hours}")
+		logger.info("Initiated player ship with following details - "
+					"fix cost: %s "
+					"min_fix_cost_in_game: %s "
+					"max_fix_cost_in_game: %s "
+					"chance_for_ship_to_break: %s "
+					"voyage time: %s "
+					"ship upgrade time by hours: %s "
+					"ship upgrade process time by hours: %s",
+					self.fix_cost, self.min_fix_cost_in_game, self.max_fix_cost_in_game, self.chance_for_ship_to_break,
+					self._voyage_time, self.ship_upgrade_time_by_hours, self.ship_upgrade_work_time_by_hours)
 
 	def __str__(self) -> str:
 		"""
@@ -76,6 +79,15 @@ class Ship:
 		"""
 		return self._voyage_time
 
+	def get_voyage_time_for_route(self, route_voyage_time: int) -> int:
+		""" Returns the voyage time of the ship on a route - the route's voyage time, reduced by the upgrades done to the
+		ship. Voyage time is always at least one hour.
+
+		:param route_voyage_time: Voyage time of the route before upgrades
+		:return: int
+		"""
+		return max(1, route_voyage_time - (self.initial_voyage_time - self._voyage_time))
+
 	def do_random_event_damage_ship(self) -> bool:
 		""" Will do a random event which can break the ship. If ship breaks then the player can't keep sailing between
 		ports until he fixes it. Also in case damage occurs will set a price for fixing the damage.
@@ -87,7 +99,7 @@ class Ship:
 			# In case random number is smaller than break chance - break ship
 			self._is_ship_broken = True
 			self.fix_cost = random.randint(self.min_fix_cost_in_game, self.max_fix_cost_in_game)
-			logger.info(f"Ship broke - cost fix: {self.fix_cost} , chance to break: {self.chance_for_ship_to_break}")
+			logger.info("Ship broke - cost fix: %s , chance to break: %s", self.fix_cost, self.chance_for_ship_to_break)
 			return True
 		return False
 
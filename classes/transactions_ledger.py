@@ -0,0 +1,237 @@
+from array import array
+from typing import List, Optional, Iterator
+from classes.world_registry import WorldRegistry
+from classes.products import PlayersInventory
+
+
+"""
+Contains TransactionsLedger - an append-only record of every transaction done by the player in a game: buying and
+selling products, fixing the ship and upgrading it.
+
+Every field of the transactions is kept in its own packed array ( columns ), indexed by the transaction number, so a
+transaction takes 33 bytes and adding one doesn't create any objects. The ledger also keeps running totals - the cost
+basis of the products the player holds, and the realized profit per city and product - which are updated on every
+added transaction, so queries don't need to go over all transactions.
+
+Cost basis is calculated by average cost - selling a product removes from its cost basis the average cost of the units
+sold, and the realized profit of the sale is its revenue minus that cost. The ledger keeps the total price of every
+transaction - with price impact the units of an order have different prices, so a unit price is only shown.
+"""
+
+
+# Transactions types
+TRANSACTION_TYPE_BUY: int = 0
+TRANSACTION_TYPE_SELL: int = 1
+TRANSACTION_TYPE_SHIP_FIX: int = 2
+TRANSACTION_TYPE_SHIP_UPGRADE: int = 3
+TRANSACTIONS_TYPES_NAMES: List[str] = ["buy", "sell", "ship fix", "ship upgrade"]
+
+NO_PRODUCT_ID: int = -1  # Product ID of transactions which are not of a product - ship fixes and upgrades
+
+
+class LedgerTransaction:
+	""" Represents a single transaction in the ledger """
+	__slots__ = ("transaction_type", "trade_day", "hour", "city_name", "product_name", "amount", "total_price")
+
+	def __init__(self,
+				 transaction_type: int,
+				 trade_day: int,
+				 hour: int,
+				 city_name: str,
+				 product_name: Optional[str],
+				 amount: int,
+				 total_price: int):
+		"""
+
+		:param transaction_type: One of the TRANSACTION_TYPE_* constants
+		:param trade_day: Trade day of the transaction
+		:param hour: Hour in the workday of the transaction - amount of work hours which passed before it
+		:param city_name: City the transaction was done at
+		:param product_name: Name of the traded product, None for ship fixes and upgrades
+		:param amount: Amount of product units, 1 for ship fixes and upgrades
+		:param total_price: Price paid ( or received ) for all units
+		"""
+		self.transaction_type: int = transaction_type
+		self.trade_day: int = trade_day
+		self.hour: int = hour
+		self.city_name: str = city_name
+		self.product_name: Optional[str] = product_name
+		self.amount: int = amount
+		self.total_price: int = total_price
+
+	@property
+	def price(self) -> int:
+		""" Returns the average price of a single unit, rounded - for display only
+
+		:return: int, 0 in case no units were traded
+		"""
+		return round(self.total_price / self.amount) if self.amount > 0 else 0
+
+	def __str__(self) -> str:
+		"""
+
+		:return: str
+		"""
+		return f"Day {self.trade_day} hour {self.hour} at {self.city_name} - " \
+			   f"{TRANSACTIONS_TYPES_NAMES[self.transaction_type]} " \
+			   f"{f'{self.amount} X {self.product_name} ' if self.product_name is not None else ''}" \
+			   f"for {self.total_price}"
+
+
+class TransactionsLedger:
+	""" Append-only ledger of the player's transactions, with running profit and cost basis totals """
+	def __init__(self, world_registry: WorldRegistry):
+		"""
+
+		:param world_registry: Registry giving the cities and products IDs of the game
+		"""
+		self.world_registry: WorldRegistry = world_registry
+		amount_of_cities: int = world_registry.amount_of_cities
+		amount_of_products: int = world_registry.amount_of_products
+
+		# Columns - a value of every transaction
+		self.transactions_types: array = array("B")
+		self.trade_days: array = array("I")
+		self.hours: array = array("I")
+		self.cities_ids: array = array("I")
+		self.products_ids: array = array("i")
+		self.amounts: array = array("q")
+		self.total_prices: array = array("q")
+
+		# Running totals
+		self.held_amounts: array = array("q", [0]) * amount_of_products
+		self.held_costs: array = array("q", [0]) * amount_of_products  # Cost basis of the held units of every product
+		self.realized_profits: array = array("q", [0]) * (amount_of_cities * amount_of_products)  # By city and product
+		self.ship_expenses: array = array("q", [0]) * amount_of_cities  # Ship fixes and upgrades costs by city
+
+	def __len__(self) -> int:
+		return len(self.transactions_types)
+
+	def __iter__(self) -> Iterator[LedgerTransaction]:
+		return (self.get_transaction(index=index) for index in range(len(self)))
+
+	def add_transaction(self,
+						transaction_type: int,
+						trade_day: int,
+						hour: int,
+						city_id: int,
+						product_id: int,
+						amount: int,
+						total_price: int) -> None:
+		""" Adds a transaction to the ledger, and updates the running totals
+
+		:param transaction_type: One of the TRANSACTION_TYPE_* constants
+		:param trade_day: Trade day of the transaction
+		:param hour: Hour in the workday of the transaction
+		:param city_id: ID of the city the transaction was done at
+		:param product_id: ID of the traded product, NO_PRODUCT_ID for ship fixes and upgrades
+		:param amount: Amount of product units, 1 for ship fixes and upgrades
+		:param total_price: Price paid ( or received ) for all units
+		:return: None
+		"""
+		self.transactions_types.append(transaction_type)
+		self.trade_days.append(trade_day)
+		self.hours.append(hour)
+		self.cities_ids.append(city_id)
+		self.products_ids.append(product_id)
+		self.amounts.append(amount)
+		self.total_prices.append(total_price)
+
+		if transaction_type == TRANSACTION_TYPE_BUY:
+			self.held_amounts[product_id] += amount
+			self.held_costs[product_id] += total_price
+		elif transaction_type == TRANSACTION_TYPE_SELL:
+			held_amount: int = self.held_amounts[product_id]
+			sold_units_cost: int = self.held_costs[product_id] * amount // held_amount if held_amount > 0 else 0
+			self.held_amounts[product_id] = held_amount - amount
+			self.held_costs[product_id] -= sold_units_cost
+			self.realized_profits[city_id * self.world_registry.amount_of_products + product_id] += \
+				total_price - sold_units_cost
+		else:
+			self.ship_expenses[city_id] += total_price
+		return None
+
+	def get_transaction(self, index: int) -> LedgerTransaction:
+		""" Creates a LedgerTransaction object of a single transaction in the ledger
+
+		:param index: Number of the transaction, by the order they were added
+		:return: LedgerTransaction
+		"""
+		product_id: int = self.products_ids[index]
+		return LedgerTransaction(
+			transaction_type=self.transactions_types[index],
+			trade_day=self.trade_days[index],
+			hour=self.hours[index],
+			city_name=self.world_registry.cities_names[self.cities_ids[index]],
+			product_name=self.world_registry.get_product_by_id(product_id=product_id).name
+			if product_id != NO_PRODUCT_ID else None,
+			amount=self.amounts[index],
+			total_price=self.total_prices[index])
+
+	def get_cost_basis(self, product_name: str) -> int:
+		""" Returns the total cost of the held units of a product
+
+		:param product_name:
+		:return: int
+		"""
+		return self.held_costs[self.world_registry.get_product_id_by_name(product_name=product_name)]
+
+	def get_average_cost(self, product_name: str) -> float:
+		""" Returns the average cost of a held unit of a product
+
+		:param product_name:
+		:return: float, 0 in case no units are held
+		"""
+		product_id: int = self.world_registry.get_product_id_by_name(product_name=product_name)
+		held_amount: int = self.held_amounts[product_id]
+		return self.held_costs[product_id] / held_amount if held_amount > 0 else 0.0
+
+	def get_realized_profit(self, product_name: Optional[str] = None, city_name: Optional[str] = None) -> int:
+		""" Returns the profit of the sales done so far - the sales revenue minus the cost of the units sold
+
+		:param product_name: Optional - count only sales of this product, default: all products
+		:param city_name: Optional - count only sales done at this city, default: all cities
+		:return: int
+		"""
+		amount_of_products: int = self.world_registry.amount_of_products
+		cities_ids = range(self.world_registry.amount_of_cities) if city_name is None \
+			else [self.world_registry.get_city_id(city_name=city_name)]
+		products_ids = range(amount_of_products) if product_name is None \
+			else [self.world_registry.get_product_id_by_name(product_name=product_name)]
+		return sum(self.realized_profits[city_id * amount_of_products + product_id]
+				   for city_id in cities_ids for product_id in products_ids)
+
+	def get_ship_expenses(self, city_name: Optional[str] = None) -> int:
+		""" Returns the costs of fixing and upgrading the ship
+
+		:param city_name: Optional - count only costs paid at this city, default: all cities
+		:return: int
+		"""
+		if city_name is None:
+			return sum(self.ship_expenses)
+		return self.ship_expenses[self.world_registry.get_city_id(city_name=city_name)]
+
+	def get_profit_and_loss(self, city_name: Optional[str] = None) -> int:
+		""" Returns the realized profit of the sales, minus the ship expenses
+
+		:param city_name: Optional - count only sales and expenses at this city, default: all cities
+		:return: int
+		"""
+		return self.get_realized_profit(city_name=city_name) - self.get_ship_expenses(city_name=city_name)
+
+	def rebuild_inventory(self, initial_amount: int = 0) -> PlayersInventory:
+		""" Creates the player's inventory by replaying all buy and sell transactions in the ledger
+
+		:param initial_amount: Optional - amount of every product at the start of the game, default: 0
+		:return: PlayersInventory
+		"""
+		inventory = PlayersInventory(products_list_in_game=self.world_registry.products_list,
+									 initial_amount=initial_amount,
+									 world_registry=self.world_registry)
+		products_amounts: array = inventory.products_amounts
+		for transaction_type, product_id, amount in zip(self.transactions_types, self.products_ids, self.amounts):
+			if transaction_type == TRANSACTION_TYPE_BUY:
+				products_amounts[product_id] += amount
+			elif transaction_type == TRANSACTION_TYPE_SELL:
+				products_amounts[product_id] -= amount
+		return inventory
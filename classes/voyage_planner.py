@@ -0,0 +1,150 @@
+import heapq
+from array import array
+from typing import List, Dict, Tuple, TYPE_CHECKING
+if TYPE_CHECKING:
+	from classes.world_config import WorldConfig
+
+
+"""
+Contains VoyageTimesMatrix - the shortest voyage time between every two cities of a world, and the route to sail it.
+
+Every two cities are connected - by a route with its own voyage time, or else by the ship's voyage time. A voyage may
+go through other cities in case that is shorter than the direct route. Ship upgrades shorten every route by the same
+amount of hours ( down to 1 hour ), which may change the shortest routes - so there is a matrix for every amount of
+hours reduced, created once per world and shared by all of its games ( see WorldConfig.get_voyage_times_matrix() ).
+
+The matrix is calculated from every city by Dijkstra's algorithm, without going over the routes which have no voyage
+time of their own - those all take the ship's voyage time, so a city is either reached by routes shorter than it, or
+is reached directly. Calculating the matrix takes time about ( amount of cities ^ 2 + amount of cities * amount of
+routes ), and looking up a voyage time takes O(1).
+"""
+
+
+class VoyageTimesMatrix:
+	""" Shortest voyage times between all cities of a world, for a ship with a given amount of upgrades """
+	def __init__(self, world_config: "WorldConfig", hours_reduction: int = 0):
+		"""
+
+		:param world_config: The world to calculate the voyage times of
+		:param hours_reduction: Optional - hours reduced from every route by the ship upgrades, default: 0
+		"""
+		amount_of_cities: int = world_config.world_registry.amount_of_cities
+		self.amount_of_cities: int = amount_of_cities
+		self.hours_reduction: int = hours_reduction
+		self.default_voyage_time: int = max(1, world_config.ship_config.voyage_time - hours_reduction)
+
+		# Routes with their own voyage time, from every city
+		self.routes: List[Dict[int, int]] = [{} for _ in range(amount_of_cities)]
+		for route_key, voyage_time in world_config.routes_voyage_times.items():
+			self.routes[route_key // amount_of_cities][route_key % amount_of_cities] = \
+				max(1, voyage_time - hours_reduction)
+
+		# Voyage time from city A to city B is at ( A * amount of cities + B )
+		self.voyage_times: array = array("I")
+		for from_city_id in range(amount_of_cities):
+			self.voyage_times.extend(self.calculate_voyage_times_from_city(from_city_id=from_city_id))
+
+	def calculate_voyage_times_from_city(self, from_city_id: int) -> array:
+		""" Calculates the shortest voyage times from a city to all cities
+
+		:param from_city_id:
+		:return: array - voyage time to every city, by city ID
+		"""
+		default_voyage_time: int = self.default_voyage_time
+		routes: List[Dict[int, int]] = self.routes
+		voyage_times: array = array("I", [default_voyage_time]) * self.amount_of_cities
+		voyage_times[from_city_id] = 0
+
+		# Cities reached by routes shorter than the ship's voyage time, in the order they are reached
+		reached_cities: Dict[int, int] = {from_city_id: 0}
+		candidates: List[Tuple[int, int]] = [(voyage_time, city_id) for city_id, voyage_time
+											 in routes[from_city_id].items() if voyage_time < default_voyage_time]
+		heapq.heapify(candidates)
+		while candidates:
+			voyage_time, city_id = heapq.heappop(candidates)
+			if city_id in reached_cities:
+				continue
+			reached_cities[city_id] = voyage_time
+			voyage_times[city_id] = voyage_time
+			for next_city_id, route_voyage_time in routes[city_id].items():
+				if next_city_id not in reached_cities and voyage_time + route_voyage_time < default_voyage_time:
+					heapq.heappush(candidates, (voyage_time + route_voyage_time, next_city_id))
+
+		# All other cities are reached directly by the ship's voyage time - except the ones having a longer route of
+		# their own from this city. Those are reached through another city.
+		longer_routes_cities: Dict[int, None] = dict.fromkeys(
+			city_id for city_id in routes[from_city_id] if city_id not in reached_cities)
+		if not longer_routes_cities:
+			return voyage_times
+		amount_of_directly_reached_cities: int = \
+			self.amount_of_cities - len(reached_cities) - len(longer_routes_cities)
+		for city_id in longer_routes_cities:
+			# Sailing a route of its own from a city which is not one of these cities ( there is one from the origin )
+			best_voyage_time: int = min(voyage_times[previous_city_id] + route_voyage_time
+										for previous_city_id, route_voyage_time in routes[city_id].items()
+										if previous_city_id not in longer_routes_cities)
+			# Sailing the ship's voyage time from the first reached city which has no route of its own to this city,
+			# or else from a directly reached city
+			for previous_city_id, voyage_time in reached_cities.items():
+				if previous_city_id not in routes[city_id]:
+					best_voyage_time = min(best_voyage_time, voyage_time + default_voyage_time)
+					break
+			else:
+				amount_of_directly_reached_cities_with_routes: int = sum(
+					1 for previous_city_id in routes[city_id]
+					if previous_city_id not in reached_cities and previous_city_id not in longer_routes_cities)
+				if amount_of_directly_reached_cities > amount_of_directly_reached_cities_with_routes:
+					best_voyage_time = min(best_voyage_time, 2 * default_voyage_time)
+			candidates.append((best_voyage_time, city_id))
+
+		# Voyages between the cities having longer routes
+		heapq.heapify(candidates)
+		longer_routes_cities_left: Dict[int, None] = dict(longer_routes_cities)
+		while candidates:
+			voyage_time, city_id = heapq.heappop(candidates)
+			if city_id not in longer_routes_cities_left:
+				continue
+			del longer_routes_cities_left[city_id]
+			voyage_times[city_id] = voyage_time
+			for next_city_id in longer_routes_cities_left:
+				route_voyage_time: int = routes[city_id].get(next_city_id, default_voyage_time)
+				heapq.heappush(candidates, (voyage_time + route_voyage_time, next_city_id))
+		return voyage_times
+
+	def get_voyage_time(self, from_city_id: int, to_city_id: int) -> int:
+		""" Returns the shortest voyage time between two cities
+
+		:param from_city_id:
+		:param to_city_id:
+		:return: int
+		"""
+		return self.voyage_times[from_city_id * self.amount_of_cities + to_city_id]
+
+	def get_route(self, from_city_id: int, to_city_id: int) -> List[int]:
+		""" Returns the cities of the shortest voyage between two cities
+
+		:param from_city_id:
+		:param to_city_id:
+		:return: List of cities IDs, starting with the origin city and ending with the destination city
+		"""
+		route: List[int] = [from_city_id]
+		city_id: int = from_city_id
+		while city_id != to_city_id:
+			voyage_time_left: int = self.get_voyage_time(from_city_id=city_id, to_city_id=to_city_id)
+			next_city_id: int = to_city_id
+			if self.routes[city_id].get(to_city_id, self.default_voyage_time) != voyage_time_left:
+				next_city_id = next(
+					(next_city_id for next_city_id, route_voyage_time in self.routes[city_id].items()
+					 if route_voyage_time + self.get_voyage_time(from_city_id=next_city_id, to_city_id=to_city_id)
+					 == voyage_time_left),
+					None)
+				if next_city_id is None:
+					next_city_id = next(
+						next_city_id for next_city_id in range(self.amount_of_cities)
+						if next_city_id != city_id and next_city_id not in self.routes[city_id]
+						and self.default_voyage_time + self.get_voyage_time(from_city_id=next_city_id,
+																			to_city_id=to_city_id)
+						== voyage_time_left)
+			route.append(next_city_id)
+			city_id = next_city_id
+		return route
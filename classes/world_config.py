@@ -0,0 +1,365 @@
+import json
+import os
+from array import array
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Any
+from classes.products import Product
+from classes.world_registry import WorldRegistry
+from classes.voyage_planner import VoyageTimesMatrix
+from constants import CITIES_LIST, INITIAL_START_CITY, PRODUCTS_LIST, INITIAL_BUDGET, \
+	SHIP_TIME_TO_SAIL_BETWEEN_CITIES, SHIP_UPGRADE_TIME_HOURS_REDUCTION, SHIP_UPGRADE_TIME_AT_SHIPYARD, \
+	SHIP_UPGRADE_PRICE, SHIP_MINIMUM_FIX_COST_IN_GAME, SHIP_MAXIMUM_FIX_COST_IN_GAME, CHANCE_FOR_SHIP_TO_BREAK, \
+	GAME_WORLD_CONFIG_FILE_PATH
+from custom_exceptions.world_config_custom_exceptions import CustomExceptionWorldConfigIsInvalid
+from custom_exceptions.city_custom_exceptions import CustomExceptionCityNameAlreadyExists
+from custom_exceptions.product_custom_exceptions import CustomExceptionProductMinPriceIsBiggerThanMaxPrice, \
+	CustomExceptionProductHasEmptyName, CustomExceptionProductNameAlreadyExists
+
+
+"""
+Defines the world of a game - its cities, products, the voyage time of every route, which products are traded in every
+city, and the player's ship.
+
+The world is either the built-in one defined in constants.py, or loaded from a JSON world file, for example:
+	{
+		"cities": [{"name": "Yafo"}, {"name": "Larnaka", "products": ["Wine"]}],
+		"products": [{"name": "Wine", "min_price": 10, "max_price": 30}],
+		"start_city": "Yafo",
+		"initial_budget": 10000,
+		"ship": {"voyage_time": 8, "upgrade_price": 5000},
+		"routes": [{"from": "Yafo", "to": "Larnaka", "voyage_time": 6}]
+	}
+Only "cities" and "products" are required - a city without "products" trades all products, a route not in "routes"
+takes the ship's voyage time ( routes are the same both ways ), and missing values are taken from constants.py.
+See ./worlds/example_world.json.
+
+A world is validated once when created, and loaded worlds are cached by their file - all games of the same world share
+a single WorldConfig and WorldRegistry, and the same voyage times matrices ( see classes/voyage_planner.py ). Creating
+a world takes time linear in the amount of cities, products, routes and listed products - so worlds of thousands of
+cities and products are fine.
+"""
+
+
+class ShipConfig:
+	""" Settings of the player's ship """
+	def __init__(self,
+				 voyage_time: int = SHIP_TIME_TO_SAIL_BETWEEN_CITIES,
+				 upgrade_time_reduction: int = SHIP_UPGRADE_TIME_HOURS_REDUCTION,
+				 upgrade_work_time: int = SHIP_UPGRADE_TIME_AT_SHIPYARD,
+				 upgrade_price: int = SHIP_UPGRADE_PRICE,
+				 min_fix_cost: int = SHIP_MINIMUM_FIX_COST_IN_GAME,
+				 max_fix_cost: int = SHIP_MAXIMUM_FIX_COST_IN_GAME,
+				 chance_to_break: float = CHANCE_FOR_SHIP_TO_BREAK):
+		"""
+
+		:param voyage_time: Optional - hours to sail a route which has no voyage time of its own
+		:param upgrade_time_reduction: Optional - hours reduced from the voyage times by every ship upgrade
+		:param upgrade_work_time: Optional - hours an upgrade takes at the shipyard
+		:param upgrade_price: Optional - price of a ship upgrade
+		:param min_fix_cost: Optional - minimum price for fixing the ship
+		:param max_fix_cost: Optional - maximum price for fixing the ship
+		:param chance_to_break: Optional - chance for the ship to break in every voyage, between 0 to 1
+		"""
+		if voyage_time < 1:
+			raise CustomExceptionWorldConfigIsInvalid(f"Ship voyage time must be at least 1 hour, got {voyage_time}!")
+		if upgrade_time_reduction < 0 or upgrade_work_time < 0 or upgrade_price < 0 or min_fix_cost < 0:
+			raise CustomExceptionWorldConfigIsInvalid("Ship upgrade and fix values must not be negative!")
+		if min_fix_cost > max_fix_cost:
+			raise CustomExceptionWorldConfigIsInvalid(f"Ship minimum fix cost {min_fix_cost} is bigger than its "
+													  f"maximum fix cost {max_fix_cost}!")
+		if not 0 <= chance_to_break <= 1:
+			raise CustomExceptionWorldConfigIsInvalid(f"Ship chance to break must be between 0 to 1, "
+													  f"got {chance_to_break}!")
+		self.voyage_time: int = voyage_time
+		self.upgrade_time_reduction: int = upgrade_time_reduction
+		self.upgrade_work_time: int = upgrade_work_time
+		self.upgrade_price: int = upgrade_price
+		self.min_fix_cost: int = min_fix_cost
+		self.max_fix_cost: int = max_fix_cost
+		self.chance_to_break: float = chance_to_break
+
+
+class WorldConfig:
+	""" Validated world of a game - cities, products, routes voyage times, products availability and ship settings """
+	def __init__(self,
+				 cities_names: List[str],
+				 products_list: List[Product],
+				 start_city: Optional[str] = None,
+				 initial_budget: int = INITIAL_BUDGET,
+				 ship_config: Optional[ShipConfig] = None,
+				 routes_voyage_times: Optional[Dict[Tuple[str, str], int]] = None,
+				 cities_available_products: Optional[Dict[str, List[str]]] = None):
+		"""
+
+		:param cities_names: Names of all cities in the world
+		:param products_list: All products in the world
+		:param start_city: Optional - city the player starts at, default: the first city
+		:param initial_budget: Optional - budget the player starts with
+		:param ship_config: Optional - settings of the player's ship, default: the settings in constants.py
+		:param routes_voyage_times: Optional - voyage time of routes, keyed by the names of the two cities of the route.
+									Routes not given take the ship's voyage time.
+		:param cities_available_products: Optional - names of the products traded in cities, keyed by city name.
+										  Cities not given trade all products.
+		"""
+		if not cities_names or not products_list:
+			raise CustomExceptionWorldConfigIsInvalid("World must have at least one city and one product!")
+		if initial_budget < 0:
+			raise CustomExceptionWorldConfigIsInvalid(f"Initial budget must not be negative, got {initial_budget}!")
+		for product in products_list:
+			if product.min_price < 1:
+				raise CustomExceptionWorldConfigIsInvalid(f"Product {product.name} min price must be at least 1, "
+														  f"got {product.min_price}!")
+		try:
+			self.world_registry = WorldRegistry(cities_names=cities_names, products_list=products_list)
+		except (CustomExceptionCityNameAlreadyExists, CustomExceptionProductNameAlreadyExists) as error:
+			raise CustomExceptionWorldConfigIsInvalid(str(error)) from error
+
+		self.cities_names: List[str] = self.world_registry.cities_names
+		self.products_list: List[Product] = self.world_registry.products_list
+		self.start_city: str = start_city if start_city is not None else self.cities_names[0]
+		self.get_city_id(city_name=self.start_city)
+		self.initial_budget: int = initial_budget
+		self.ship_config: ShipConfig = ship_config if ship_config is not None else ShipConfig()
+
+		# Routes voyage times keyed by ( from city ID * amount of cities + to city ID ), both ways
+		amount_of_cities: int = self.world_registry.amount_of_cities
+		self.routes_voyage_times: Dict[int, int] = {}
+		for (from_city_name, to_city_name), voyage_time in (routes_voyage_times or {}).items():
+			from_city_id: int = self.get_city_id(city_name=from_city_name)
+			to_city_id: int = self.get_city_id(city_name=to_city_name)
+			if from_city_id == to_city_id:
+				raise CustomExceptionWorldConfigIsInvalid(f"Route from {from_city_name} to itself is not allowed!")
+			if voyage_time < 1:
+				raise CustomExceptionWorldConfigIsInvalid(f"Route {from_city_name} - {to_city_name} voyage time must "
+														  f"be at least 1 hour, got {voyage_time}!")
+			route_key: int = from_city_id * amount_of_cities + to_city_id
+			if route_key in self.routes_voyage_times:
+				raise CustomExceptionWorldConfigIsInvalid(f"Route {from_city_name} - {to_city_name} is defined more "
+														  f"than once!")
+			self.routes_voyage_times[route_key] = voyage_time
+			self.routes_voyage_times[to_city_id * amount_of_cities + from_city_id] = voyage_time
+
+		# Shortest route from every city - the ship's voyage time, unless all routes from the city have their own time
+		amount_of_routes_with_voyage_time: array = array("I", [0]) * amount_of_cities
+		shortest_routes_with_voyage_time: Dict[int, int] = {}
+		for route_key, voyage_time in self.routes_voyage_times.items():
+			from_city_id = route_key // amount_of_cities
+			amount_of_routes_with_voyage_time[from_city_id] += 1
+			if voyage_time < shortest_routes_with_voyage_time.get(from_city_id, voyage_time + 1):
+				shortest_routes_with_voyage_time[from_city_id] = voyage_time
+		self.shortest_routes_voyage_times: array = array("I", [self.ship_config.voyage_time]) * amount_of_cities
+		for from_city_id, voyage_time in shortest_routes_with_voyage_time.items():
+			if amount_of_routes_with_voyage_time[from_city_id] == amount_of_cities - 1:
+				self.shortest_routes_voyage_times[from_city_id] = voyage_time
+			else:
+				self.shortest_routes_voyage_times[from_city_id] = min(voyage_time, self.ship_config.voyage_time)
+
+		# Shortest voyage times between all cities, by the hours reduced by ship upgrades - created on first use
+		self.voyage_times_matrices: Dict[int, VoyageTimesMatrix] = {}
+
+		if cities_available_products:
+			self.world_registry.products_availability = self.create_products_availability(
+				cities_available_products=cities_available_products)
+
+	def create_products_availability(self, cities_available_products: Dict[str, List[str]]) -> bytearray:
+		""" Creates the products availability byte array of the world registry
+
+		:param cities_available_products: Names of the products traded in cities, keyed by city name
+		:return: bytearray - byte for every city and product, 1 in case the product is traded in the city
+		"""
+		amount_of_products: int = self.world_registry.amount_of_products
+		products_availability = bytearray(b"\x01") * (self.world_registry.amount_of_cities * amount_of_products)
+		for city_name, products_names in cities_available_products.items():
+			city_row_start: int = self.get_city_id(city_name=city_name) * amount_of_products
+			products_availability[city_row_start:city_row_start + amount_of_products] = bytes(amount_of_products)
+			for product_name in products_names:
+				product_id: Optional[int] = self.world_registry.products_ids.get(product_name)
+				if product_id is None:
+					raise CustomExceptionWorldConfigIsInvalid(f"City {city_name} trades product {product_name} which "
+															  f"doesn't exist!")
+				products_availability[city_row_start + product_id] = 1
+		return products_availability
+
+	def get_city_id(self, city_name: str) -> int:
+		""" Returns the ID of a city in the world
+
+		:param city_name:
+		:return: int, but will raise an exception in case the city doesn't exist
+		"""
+		city_id: Optional[int] = self.world_registry.cities_ids.get(city_name)
+		if city_id is None:
+			raise CustomExceptionWorldConfigIsInvalid(f"City {city_name} doesn't exist in the world!")
+		return city_id
+
+	def get_route_voyage_time(self, from_city_id: int, to_city_id: int) -> int:
+		""" Returns the voyage time of a route, before ship upgrades
+
+		:param from_city_id:
+		:param to_city_id:
+		:return: int
+		"""
+		return self.routes_voyage_times.get(from_city_id * self.world_registry.amount_of_cities + to_city_id,
+											self.ship_config.voyage_time)
+
+	def get_voyage_times_matrix(self, hours_reduction: int = 0) -> VoyageTimesMatrix:
+		""" Returns the shortest voyage times between all cities of the world. The matrix is calculated once for every
+		amount of hours reduced, and shared by all games of the world.
+
+		:param hours_reduction: Optional - hours reduced from every route by the ship upgrades, default: 0
+		:return: VoyageTimesMatrix
+		"""
+		voyage_times_matrix: Optional[VoyageTimesMatrix] = self.voyage_times_matrices.get(hours_reduction)
+		if voyage_times_matrix is None:
+			voyage_times_matrix = self.voyage_times_matrices[hours_reduction] = VoyageTimesMatrix(
+				world_config=self, hours_reduction=hours_reduction)
+		return voyage_times_matrix
+
+	def get_shortest_route_voyage_time(self, from_city_id: int) -> int:
+		""" Returns the voyage time of the shortest route from a city, before ship upgrades
+
+		:param from_city_id:
+		:return: int
+		"""
+		return self.shortest_routes_voyage_times[from_city_id]
+
+
+def get_config_value(config_dict: Dict[str, Any], key: str, value_type: type, default: Any = None) -> Any:
+	""" Returns a value from a part of a world file, checking its type
+
+	:param config_dict: Part of the world file
+	:param key: Key of the value
+	:param value_type: Type the value should be of ( int values are accepted for float )
+	:param default: Optional - value returned in case the key is missing, in case None the key is required
+	:return: The value
+	"""
+	if key not in config_dict:
+		if default is None:
+			raise CustomExceptionWorldConfigIsInvalid(f"World file is missing the value {key}!")
+		return default
+	value: Any = config_dict[key]
+	accepted_types: Tuple[type, ...] = (int, float) if value_type is float else (value_type,)
+	if not isinstance(value, accepted_types) or (isinstance(value, bool) and value_type is not bool):
+		raise CustomExceptionWorldConfigIsInvalid(f"World file value {key} should be of type {value_type.__name__}, "
+												  f"got {value!r}!")
+	return value
+
+
+def parse_world_config(world_dict: Dict[str, Any]) -> WorldConfig:
+	""" Creates a world from the content of a world file
+
+	:param world_dict: The JSON object of a world file
+	:return: WorldConfig
+	"""
+	if not isinstance(world_dict, dict):
+		raise CustomExceptionWorldConfigIsInvalid("World file should contain a JSON object!")
+
+	products_list: List[Product] = []
+	for product_dict in get_config_value(config_dict=world_dict, key="products", value_type=list):
+		try:
+			products_list.append(Product(name=get_config_value(config_dict=product_dict, key="name", value_type=str),
+										 min_price=get_config_value(config_dict=product_dict, key="min_price",
+																	value_type=int),
+										 max_price=get_config_value(config_dict=product_dict, key="max_price",
+																	value_type=int)))
+		except (CustomExceptionProductMinPriceIsBiggerThanMaxPrice, CustomExceptionProductHasEmptyName) as error:
+			raise CustomExceptionWorldConfigIsInvalid(str(error)) from error
+
+	cities_names: List[str] = []
+	cities_available_products: Dict[str, List[str]] = {}
+	for city_dict in get_config_value(config_dict=world_dict, key="cities", value_type=list):
+		city_name: str = get_config_value(config_dict=city_dict, key="name", value_type=str)
+		cities_names.append(city_name)
+		if "products" in city_dict:
+			cities_available_products[city_name] = get_config_value(config_dict=city_dict, key="products",
+																	value_type=list)
+
+	routes_voyage_times: Dict[Tuple[str, str], int] = {}
+	for route_dict in get_config_value(config_dict=world_dict, key="routes", value_type=list, default=[]):
+		route: Tuple[str, str] = (get_config_value(config_dict=route_dict, key="from", value_type=str),
+								  get_config_value(config_dict=route_dict, key="to", value_type=str))
+		if route in routes_voyage_times or route[::-1] in routes_voyage_times:
+			raise CustomExceptionWorldConfigIsInvalid(f"Route {route[0]} - {route[1]} is defined more than once!")
+		routes_voyage_times[route] = get_config_value(config_dict=route_dict, key="voyage_time", value_type=int)
+
+	ship_dict: Dict[str, Any] = get_config_value(config_dict=world_dict, key="ship", value_type=dict, default={})
+	ship_config = ShipConfig(
+		voyage_time=get_config_value(ship_dict, "voyage_time", int, SHIP_TIME_TO_SAIL_BETWEEN_CITIES),
+		upgrade_time_reduction=get_config_value(ship_dict, "upgrade_time_reduction", int,
+												SHIP_UPGRADE_TIME_HOURS_REDUCTION),
+		upgrade_work_time=get_config_value(ship_dict, "upgrade_work_time", int, SHIP_UPGRADE_TIME_AT_SHIPYARD),
+		upgrade_price=get_config_value(ship_dict, "upgrade_price", int, SHIP_UPGRADE_PRICE),
+		min_fix_cost=get_config_value(ship_dict, "min_fix_cost", int, SHIP_MINIMUM_FIX_COST_IN_GAME),
+		max_fix_cost=get_config_value(ship_dict, "max_fix_cost", int, SHIP_MAXIMUM_FIX_COST_IN_GAME),
+		chance_to_break=get_config_value(ship_dict, "chance_to_break", float, CHANCE_FOR_SHIP_TO_BREAK))
+
+	return WorldConfig(cities_names=cities_names,
+					   products_list=products_list,
+					   start_city=get_config_value(config_dict=world_dict, key="start_city", value_type=str,
+												   default=cities_names[0] if cities_names else ""),
+					   initial_budget=get_config_value(config_dict=world_dict, key="initial_budget", value_type=int,
+													   default=INITIAL_BUDGET),
+					   ship_config=ship_config,
+					   routes_voyage_times=routes_voyage_times,
+					   cities_available_products=cities_available_products)
+
+
+@lru_cache(maxsize=8)
+def load_world_config_file(world_config_file_path: str, modification_time: int, file_size: int) -> WorldConfig:
+	""" Reads and validates a world file. Cached - the file is read again only in case it was changed.
+
+	:param world_config_file_path: Absolute path of the world file
+	:param modification_time: Modification time of the file in nanoseconds - part of the cache key
+	:param file_size: Size of the file - part of the cache key
+	:return: WorldConfig
+	"""
+	try:
+		with open(world_config_file_path, "r", encoding="utf-8") as world_file:
+			world_dict: Dict[str, Any] = json.load(world_file)
+	except (OSError, ValueError) as error:
+		raise CustomExceptionWorldConfigIsInvalid(f"Failed reading world file {world_config_file_path}: {error}") \
+			from error
+	try:
+		return parse_world_config(world_dict=world_dict)
+	except (AttributeError, TypeError) as error:
+		raise CustomExceptionWorldConfigIsInvalid(f"World file {world_config_file_path} is not in the world file "
+												  f"format: {error}") from error
+
+
+def load_world_config(world_config_file_path: str) -> WorldConfig:
+	""" Returns the world defined in a world file
+
+	:param world_config_file_path:
+	:return: WorldConfig, but will raise an exception in case the file can't be read or is not valid
+	"""
+	try:
+		world_file_stat: os.stat_result = os.stat(world_config_file_path)
+	except OSError as error:
+		raise CustomExceptionWorldConfigIsInvalid(f"World file {world_config_file_path} can't be read!") from error
+	return load_world_config_file(world_config_file_path=os.path.abspath(world_config_file_path),
+								  modification_time=world_file_stat.st_mtime_ns,
+								  file_size=world_file_stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def get_built_in_world_config() -> WorldConfig:
+	""" Returns the built-in world defined in constants.py
+
+	:return: WorldConfig
+	"""
+	return WorldConfig(cities_names=CITIES_LIST,
+					   products_list=PRODUCTS_LIST,
+					   start_city=INITIAL_START_CITY,
+					   initial_budget=INITIAL_BUDGET)
+
+
+def get_world_config(world_config_file_path: Optional[str] = None) -> WorldConfig:
+	""" Returns the world games are played in
+
+	:param world_config_file_path: Optional - world file to load, default: GAME_WORLD_CONFIG_FILE_PATH, and in case it
+								   is not set the built-in world
+	:return: WorldConfig
+	"""
+	world_config_file_path = world_config_file_path or GAME_WORLD_CONFIG_FILE_PATH
+	if world_config_file_path is None:
+		return get_built_in_world_config()
+	return load_world_config(world_config_file_path=world_config_file_path)
@@ -0,0 +1,122 @@
+from typing import List, Dict, Optional, TYPE_CHECKING
+from custom_exceptions.city_custom_exceptions import CustomExceptionCityNameNotFound, \
+	CustomExceptionCityNameAlreadyExists
+from custom_exceptions.product_custom_exceptions import CustomExceptionProductDoesNotExists, \
+	CustomExceptionProductNameAlreadyExists
+if TYPE_CHECKING:
+	from classes.products import Product
+
+
+"""
+Gives every product and city in a game a dense integer ID - 0, 1, 2 ...
+
+The IDs are used as indexes into the arrays holding the player's inventory amounts and the prices in cities, so
+looking up a product or a city doesn't need to scan lists or compare names.
+
+The registry also tells which products are traded in every city - kept as a single (cities X products) byte array.
+"""
+
+
+class WorldRegistry:
+	""" Registry of all products and cities in a game, mapping each of them to an integer ID """
+	def __init__(self,
+				 cities_names: List[str],
+				 products_list: List["Product"],
+				 products_availability: Optional[bytearray] = None):
+		"""
+
+		:param cities_names: A list of all cities names in a game. A city ID is its index in this list.
+		:param products_list: A list of all products in a game. A product ID is its index in this list.
+		:param products_availability: Optional - byte for every city and product ( at city ID * amount of products +
+									  product ID ), 1 in case the product is traded in the city. Default: all products
+									  are traded in all cities
+		"""
+		self.cities_names: List[str] = list(cities_names)
+		self.products_list: List["Product"] = list(products_list)
+
+		self.cities_ids: Dict[str, int] = {}
+		for city_id, city_name in enumerate(self.cities_names):
+			if city_name in self.cities_ids:
+				raise CustomExceptionCityNameAlreadyExists(f"City {city_name} is defined more than once!")
+			self.cities_ids[city_name] = city_id
+
+		self.products_ids: Dict[str, int] = {}
+		for product_id, product in enumerate(self.products_list):
+			if product.name in self.products_ids:
+				raise CustomExceptionProductNameAlreadyExists(f"Product {product.name} is defined more than once!")
+			self.products_ids[product.name] = product_id
+
+		self.products_availability: Optional[bytearray] = products_availability
+
+	@property
+	def amount_of_cities(self) -> int:
+		""" Returns the amount of cities in the game
+
+		:return: int
+		"""
+		return len(self.cities_names)
+
+	@property
+	def amount_of_products(self) -> int:
+		""" Returns the amount of products in the game
+
+		:return: int
+		"""
+		return len(self.products_list)
+
+	def get_product_id_by_name(self, product_name: str) -> int:
+		""" Returns the ID of a product according to its name
+
+		:param product_name:
+		:return: int
+		"""
+		try:
+			return self.products_ids[product_name]
+		except KeyError:
+			raise CustomExceptionProductDoesNotExists(f"Product {product_name} doesn't exist in game! ")
+
+	def get_product_id(self, product: "Product") -> int:
+		""" Returns the ID of a product
+
+		:param product: A product used in the game
+		:return: int
+		"""
+		return self.get_product_id_by_name(product_name=product.name)
+
+	def get_product_by_id(self, product_id: int) -> "Product":
+		""" Returns a product according to its ID
+
+		:param product_id:
+		:return: Product
+		"""
+		return self.products_list[product_id]
+
+	def get_city_id(self, city_name: str) -> int:
+		""" Returns the ID of a city according to its name
+
+		:param city_name:
+		:return: int
+		"""
+		try:
+			return self.cities_ids[city_name]
+		except KeyError:
+			raise CustomExceptionCityNameNotFound(f"City {city_name} doesn't exist!")
+
+	def get_city_name_by_id(self, city_id: int) -> str:
+		""" Returns a city name according to its ID
+
+		:param city_id:
+		:return: str
+		"""
+		return self.cities_names[city_id]
+
+	def is_product_available_in_city(self, city_id: int, product_id: int) -> bool:
+		""" Checks if a product is traded in a city
+
+		:param city_id:
+		:param product_id:
+		:return: Boolean - true in case the product can be bought and sold in the city
+		"""
+		if self.products_availability is None:
+			return True
+		return self.products_availability[city_id * len(self.products_list) + product_id] == 1
@@ -1,6 +1,8 @@
-from typing import List
+from typing import List, Optional
 from classes.products import Product
 
+# Built-in world - used in case no world file is set at GAME_WORLD_CONFIG_FILE_PATH below
+
 CITIES_LIST: List[str] = [
 	"Yafo",
 	"Larnaka",
@@ -16,6 +18,31 @@ PRODUCTS_LIST: List[Product] = [
 
 INITIAL_BUDGET: int = 10000
 
+# World file - a JSON file defining the cities, products, routes and ship of the game, see ./classes/world_config.py
+# and ./worlds/example_world.json. In case None, the built-in world defined in this file is used.
+GAME_WORLD_CONFIG_FILE_PATH: Optional[str] = None
+
+# Prices backend - set to True to draw all prices of the game at once using numpy ( Requires numpy to be installed )
+USE_VECTORIZED_PRICES_BACKEND: bool = False
+
+# NPC traders - traders sailing the world besides the player, whose trades move the prices of the next trade day
+# ( Requires numpy to be installed ), see ./classes/npc_traders.py. Set to 0 for no NPC traders.
+AMOUNT_OF_NPC_TRADERS: int = 0
+NPC_TRADER_INITIAL_BUDGET: int = 1000
+NPC_TRADER_CARGO_CAPACITY: int = 100  # Amount of units an NPC trader can carry
+NPC_TRADERS_PRICE_IMPACT: float = 0.2  # Biggest change of a price by the NPC traders, as a part of the price
+NPC_TRADERS_MARKET_DEPTH: int = 1000  # Units of a product which, when only bought in a city, move its price by half
+
+# Price impact of the player's orders - every unit bought makes the next unit more expensive, and every unit sold makes
+# the next unit cheaper, see ./classes/price_impact.py. Set to 0 for no price impact.
+PRICE_IMPACT_PER_UNIT: float = 0  # Part of the price added to the next unit for every unit bought
+PRICE_IMPACT_HALF_LIFE_HOURS: float = 8  # Game hours after which the impact of orders is halved
+PRICE_IMPACT_MIN_PRICE_MULTIPLIER: float = 0.1  # Lowest part of the price a unit can be sold for
+
+# Price history - the prices of every product in every city are kept for this amount of last trade days, with their
+# mean, min, max and volatility, see ./classes/price_history.py. Set to 0 to keep no price history.
+PRICE_HISTORY_MAX_LENGTH: int = 30
+
 # Game length time -
 AMOUNT_OF_HOURS_FOR_WORKDAY: int = 16
 TOTAL_TRADE_DAYS_IN_A_GAME: int = 7
@@ -31,6 +58,28 @@ CHANCE_FOR_SHIP_TO_BREAK: float = 0.10  # Should be between 0 and 1
 
 # High-scores file ( If doesn't exist - game will create one automatically )
 GAME_HIGH_SCORES_FILE_PATH: str = "/tmp/sea_trader_high_scores.json"
+# New results are appended to a journal file, which is merged into the high-scores file once it has enough results
+GAME_HIGH_SCORES_JOURNAL_FILE_PATH: str = "/tmp/sea_trader_high_scores_journal.jsonl"
+HIGH_SCORES_JOURNAL_COMPACTION_THRESHOLD: int = 1000
+# High-scores storage backend - "json" for the high-scores files, or "sqlite" for an SQLite database file.
+# ( When the database is created, results in the high-scores files are migrated to it )
+HIGH_SCORES_STORAGE_BACKEND: str = "json"
+GAME_HIGH_SCORES_DATABASE_FILE_PATH: str = "/tmp/sea_trader_high_scores.sqlite3"
+HIGH_SCORES_LEADERBOARD_SIZE: int = 1000  # Amount of top results kept ordered in memory, for the first menu pages
+HIGH_SCORES_MENU_PAGE_SIZE: int = 20  # Amount of results shown in a single page of the high scores menu
+
+# Game server - hosts games played over TCP ( telnet-style ), see ./server/async_game_server.py
+GAME_SERVER_HOST: str = "127.0.0.1"
+GAME_SERVER_PORT: int = 2323
+GAME_SERVER_SESSION_IDLE_TIMEOUT_SECONDS: int = 15 * 60  # Players who don't send any input are disconnected
+
+# Game snapshots - saving a running game to a binary file, see ./classes/game_snapshot.py
+GAME_SNAPSHOT_MAX_INCREMENTAL_SAVES: int = 100  # After this amount of autosaves, the snapshot file is rewritten whole
+
+# Benchmarks - see ./benchmarks/benchmark_suite.py
+BENCHMARK_SEED: int = 1234  # Random seed set before every benchmark run
+BENCHMARK_REGRESSION_TOLERANCE: float = 0.2  # A benchmark 20% slower than the baseline is a regression
 
 # Logging file
 GAME_LOGS_FILE_PATH: str = "/tmp/sear_trader_logs.txt"
+GAME_LOGS_LEVEL: str = "INFO"  # Minimum level of logs written to the logs file, DEBUG logs every budget change
@@ -8,3 +8,13 @@ Defines custom exceptions for city classes
 class CustomExceptionCityNameNotFound(Exception):
 	""" Raises when trying to query by name for a city which doesn't exist """
 	pass
+
+
+class CustomExceptionVectorizedPricesBackendNotAvailable(Exception):
+	""" Raises when trying to use the vectorized prices backend while numpy is not installed """
+	pass
+
+
+class CustomExceptionCityNameAlreadyExists(Exception):
+	""" Raises when trying to register two cities with the same name in a game """
+	pass
@@ -0,0 +1,17 @@
+
+
+"""
+Custom exceptions related to the game engine - used when a player action is not allowed by the game rules
+"""
+
+
+class CustomExceptionNotEnoughHoursLeftInWorkday(Exception):
+	""" Raises when trying to do an action which takes more hours than the hours left for the current workday """
+
+
+class CustomExceptionPlayerIsAlreadyInCity(Exception):
+	""" Raises when trying to sail to the city the player is already porting at """
+
+
+class CustomExceptionGameIsOver(Exception):
+	""" Raises when trying to do an action after the last trade day of the game has ended """
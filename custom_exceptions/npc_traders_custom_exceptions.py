@@ -0,0 +1,8 @@
+"""
+Custom exceptions related to the non-player traders of a game
+"""
+
+
+class CustomExceptionNpcTradersRequireNumpy(Exception):
+	""" Raises when trying to create NPC traders while numpy is not installed """
+	pass
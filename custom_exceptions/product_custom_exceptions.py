@@ -29,3 +29,12 @@ class CustomExceptionPlayerHasNotEnoughBudget(Exception):
 class CustomExceptionsTransactionFailNotEnoughItemAmount(Exception):
 	""" Raises when trying to do a sell transaction, and the player has not enough of the item to sell in his
 	inventory """
+
+
+class CustomExceptionProductNameAlreadyExists(Exception):
+	""" Raises when trying to register two products with the same name in a game. ( Products are identified by their
+	names, so names must be unique ) """
+
+
+class CustomExceptionProductNotAvailableInCity(Exception):
+	""" Raises when trying to buy or sell a product in a city which doesn't trade it """
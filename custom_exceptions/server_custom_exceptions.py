@@ -0,0 +1,13 @@
+
+
+"""
+Custom exceptions related to the game server and the sessions of players connected to it
+"""
+
+
+class CustomExceptionSessionDisconnected(Exception):
+	""" Raises when trying to read an input from a player who has disconnected from the game server """
+
+
+class CustomExceptionSessionIdleTimeout(Exception):
+	""" Raises when a player connected to the game server didn't send any input for too long """
@@ -8,3 +8,11 @@ Custom exceptions related to Ship class
 class CustomExceptionWrongVoyageTimeValueForShip(Exception):
 	""" Raises if trying to upgrade ship voyage time to a time bigger/equals than current ship voyage time. ( Voyage
 	should lower the voyage time. ) """
+
+
+class CustomExceptionShipIsBroken(Exception):
+	""" Raises when trying to sail with a broken ship. ( Ship should be fixed before sailing again ) """
+
+
+class CustomExceptionShipIsNotBroken(Exception):
+	""" Raises when trying to fix a ship which is not broken """
@@ -0,0 +1,13 @@
+
+
+"""
+Custom exceptions related to saving and restoring games snapshots
+"""
+
+
+class CustomExceptionSnapshotFileIsCorrupted(Exception):
+	""" Raises when a game snapshot file is not in the snapshot format, or was written by another format version """
+
+
+class CustomExceptionSnapshotDoesNotMatchGame(Exception):
+	""" Raises when restoring a snapshot into a game with other cities, products or prices backend """
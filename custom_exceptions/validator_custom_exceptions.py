@@ -27,3 +27,7 @@ class ValidateExceptionYesNoInputWrongValue(Exception):
 
 class ValidateExceptionInputIsEmpty(Exception):
 	""" Raises when a string input is not accepted as it is null, and its value must be not null """
+
+
+class ValidationExceptionScriptHasEnded(EOFError):
+	""" Raises when trying to read an input from a script of commands which has no more commands left """
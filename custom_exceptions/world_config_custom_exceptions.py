@@ -0,0 +1,7 @@
+"""
+Custom exceptions related to the world configuration of a game - its cities, products, routes and ship
+"""
+
+
+class CustomExceptionWorldConfigIsInvalid(Exception):
+	""" Raises when a world configuration ( or the world file it is loaded from ) has missing or wrong values """
@@ -1,4 +1,5 @@
 import logging
+from input_handling.io_backend import get_io_backend
 
 
 logger = logging.getLogger(__name__)
@@ -15,12 +16,12 @@ def print_game_intro() -> None:
 
 	:return: None
 	"""
-	print("Welcome to Sea Trader game")
-	print("Sea Trader is a homage to the famous game 'Socher HaYam' by Matach")
+	get_io_backend().write_line("Welcome to Sea Trader game")
+	get_io_backend().write_line("Sea Trader is a homage to the famous game 'Socher HaYam' by Matach")
 	print_ship_art()
-	print("You are a captain of a trading ship, raging the seven seas.\n"
-		  "Your task is to get as many coins as you can after the trading season ends!\n"
-		  "Good luck!\n")
+	get_io_backend().write_line("You are a captain of a trading ship, raging the seven seas.\n"
+								"Your task is to get as many coins as you can after the trading season ends!\n"
+								"Good luck!\n")
 	logger.debug("Game started - printed intro message")
 	return None
 
@@ -47,5 +48,5 @@ def print_ship_art() -> None:
 	*                                         *
 	*******************************************
 	"""
-	print(ship_art)
+	get_io_backend().write_line(ship_art)
 	return None
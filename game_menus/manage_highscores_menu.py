@@ -1,8 +1,10 @@
-from typing import List, Dict
-from tabulate import tabulate
+from typing import List, Dict, Callable
 from highscores.manage_high_scores_file import HighScores
 from highscores.game_result import GameResult
 from input_handling.user_input import UserInput
+from input_handling.io_backend import get_io_backend
+from input_handling.text_formatter import FormatOutput
+from constants import HIGH_SCORES_MENU_PAGE_SIZE
 
 
 """
@@ -12,19 +14,21 @@ Manages game menus for high scores
 
 class HighScoresMenu:
 	""" Will print menus for the game high scores """
-	def __init__(self, high_scores: HighScores):
+	def __init__(self, high_scores: HighScores, page_size: int = HIGH_SCORES_MENU_PAGE_SIZE):
 		"""
 
 		:param high_scores: A HighScores object which will manage the game's high score
+		:param page_size: Optional - amount of results shown in a single page of the high scores table
 		"""
 		self.high_scores: HighScores = high_scores
+		self.page_size: int = page_size
 
 	def manage_high_scores_menu(self) -> None:
 		""" Will manage the high scores menu
 
 		:return: None
 		"""
-		print("High scores menu")
+		get_io_backend().write_line("High scores menu")
 		while True:
 			option_chosen: int = UserInput.get_user_number_input_for_menu(
 				prompt_message="Choose an option: ",
@@ -51,9 +55,8 @@ class HighScoresMenu:
 
 		:return: None
 		"""
-		self.print_games_high_score_table_formatted(
-			game_results_list=self.high_scores.get_game_results_ordered_by_score()
-		)
+		self.high_scores.refresh_game_results()
+		self.browse_game_results_pages(get_page=self.high_scores.get_page_of_game_results_ordered_by_score)
 		return None
 
 	def print_game_high_scores_ordered_by_date(self) -> None:
@@ -61,9 +64,41 @@ class HighScoresMenu:
 
 		:return: None
 		"""
-		self.print_games_high_score_table_formatted(
-			game_results_list=self.high_scores.get_game_results_ordered_by_date()
-		)
+		self.high_scores.refresh_game_results()
+		self.browse_game_results_pages(get_page=self.high_scores.get_page_of_game_results_ordered_by_date)
+		return None
+
+	def browse_game_results_pages(self, get_page: Callable[[int, int], List[GameResult]]) -> None:
+		""" Will print all the game results page by page - only the results of the shown page are formatted, so large
+		high scores tables are printed quickly
+
+		:param get_page: Returns the game results of a page, by the page number and the page size
+		:return: None
+		"""
+		page_number: int = 0
+		amount_of_pages: int = max(1, -(-self.high_scores.get_amount_of_game_results() // self.page_size))
+		while True:
+			self.print_games_high_score_table_formatted(
+				game_results_list=get_page(page_number, self.page_size)
+			)
+			get_io_backend().write_line(f"Page {page_number + 1} of {amount_of_pages}")
+			if amount_of_pages == 1:
+				break
+
+			option_chosen: int = UserInput.get_user_number_input_for_menu(
+				prompt_message="Choose an option: ",
+				options_dict={
+					1: "Next page",
+					2: "Previous page",
+					3: "Back to former menu",
+				}
+			)
+			if option_chosen == 1:
+				page_number = min(page_number + 1, amount_of_pages - 1)
+			elif option_chosen == 2:
+				page_number = max(page_number - 1, 0)
+			elif option_chosen == 3:
+				break
 		return None
 
 	@staticmethod
@@ -73,7 +108,7 @@ class HighScoresMenu:
 		:return: None
 		"""
 		game_results: List[Dict] = [game_result.get_game_result_as_dict() for game_result in game_results_list]
-		print(tabulate(tabular_data=game_results, headers="keys"))
+		get_io_backend().write_line(FormatOutput.format_table(tabular_data=game_results))
 
 		return None
 
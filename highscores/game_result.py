@@ -1,4 +1,4 @@
-from typing import Dict, Union
+from typing import Dict, Union, Optional
 from datetime import datetime
 
 """
@@ -8,22 +8,28 @@ Contains GameResult object which represents a single result of the game
 
 class GameResult:
 	""" Represents a result for Sea Trader game """
+	__slots__ = ("name", "coins_earned", "amount_of_trade_days", "game_datetime")  # Many results are kept in memory
 
 	def __init__(self,
 				 name: str,
 				 coins_earned: int,
 				 amount_of_trade_days: int,
-				 game_datetime: datetime = datetime.now()):
+				 game_datetime: Optional[Union[datetime, str]] = None):
 		"""
 
 		:param name: player's name
 		:param coins_earned: coins earned at end of game. (Profit)
 		:param amount_of_trade_days: Number of trade days in game
-		:param game_datetime: datetime when the game finished, else will take current datetime as default value
+		:param game_datetime: datetime when the game finished, else will take current datetime as default value.
+							  Can be given as a string in ISO format - as saved in the high scores files.
 		"""
 		self.name: str = name
 		self.coins_earned: int = coins_earned
 		self.amount_of_trade_days: int = amount_of_trade_days
+		if game_datetime is None:
+			game_datetime = datetime.now()
+		elif isinstance(game_datetime, str):
+			game_datetime = datetime.fromisoformat(game_datetime)
 		self.game_datetime: datetime = game_datetime
 
 	def __str__(self) -> str:
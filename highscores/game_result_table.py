@@ -0,0 +1,178 @@
+import heapq
+from array import array
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable, Iterator
+from highscores.game_result import GameResult
+from classes.optional_numpy import is_numpy_available, import_numpy
+
+
+"""
+Contains GameResultTable - a compact, columnar store of many game results.
+
+Instead of a GameResult object per result, every field is kept in its own packed array - players names are stored
+once and referenced by an ID, and games dates are stored as epoch timestamps. A result takes 24 bytes, so 10M results
+take about 240MB.
+
+Sorts and filters are done over the arrays. In case numpy is installed they are vectorized, else they are done in
+Python. ( numpy is not a dependency of the game, and should be installed separately )
+"""
+
+
+class GameResultTable:
+	""" Columnar table of game results """
+	def __init__(self, game_results: Iterable[GameResult] = (), use_numpy: Optional[bool] = None):
+		"""
+
+		:param game_results: Optional - game results to add to the table
+		:param use_numpy: Optional - whether to do sorts and filters using numpy, default: when numpy is installed
+		"""
+		self.use_numpy: bool = is_numpy_available() if use_numpy is None else use_numpy
+
+		self.names: List[str] = []  # Every player name is kept once
+		self.names_ids: Dict[str, int] = {}
+		self.name_ids: array = array("I")
+		self.coins_earned: array = array("q")
+		self.amounts_of_trade_days: array = array("I")
+		self.game_timestamps: array = array("d")  # Epoch timestamps of the games dates
+		self.extend(game_results=game_results)
+
+	def __len__(self) -> int:
+		return len(self.coins_earned)
+
+	def __iter__(self) -> Iterator[GameResult]:
+		return (self.get_game_result(index=index) for index in range(len(self)))
+
+	def append(self, game_result: GameResult) -> None:
+		""" Adds a game result to the table
+
+		:param game_result: A game result object
+		:return: None
+		"""
+		name_id: Optional[int] = self.names_ids.get(game_result.name)
+		if name_id is None:
+			name_id = len(self.names)
+			self.names.append(game_result.name)
+			self.names_ids[game_result.name] = name_id
+		self.name_ids.append(name_id)
+		self.coins_earned.append(game_result.coins_earned)
+		self.amounts_of_trade_days.append(game_result.amount_of_trade_days)
+		self.game_timestamps.append(game_result.game_datetime.timestamp())
+		return None
+
+	def extend(self, game_results: Iterable[GameResult]) -> None:
+		""" Adds many game results to the table
+
+		:param game_results:
+		:return: None
+		"""
+		for game_result in game_results:
+			self.append(game_result=game_result)
+		return None
+
+	def clear(self) -> None:
+		""" Removes all game results from the table
+
+		:return: None
+		"""
+		self.names = []
+		self.names_ids = {}
+		del self.name_ids[:], self.coins_earned[:], self.amounts_of_trade_days[:], self.game_timestamps[:]
+		return None
+
+	def get_game_result(self, index: int) -> GameResult:
+		""" Creates a GameResult object of a single result in the table
+
+		:param index: Index of the result in the table
+		:return: GameResult
+		"""
+		return GameResult(name=self.names[self.name_ids[index]],
+						  coins_earned=self.coins_earned[index],
+						  amount_of_trade_days=self.amounts_of_trade_days[index],
+						  game_datetime=datetime.fromtimestamp(self.game_timestamps[index]))
+
+	def get_game_results(self, indexes: Iterable[int]) -> List[GameResult]:
+		""" Creates GameResult objects of the results in the table
+
+		:param indexes: Indexes of the results in the table
+		:return: List[GameResult]
+		"""
+		return [self.get_game_result(index=int(index)) for index in indexes]
+
+	def get_indexes_of_largest_values(self, column: array, limit: Optional[int]) -> List[int]:
+		""" Returns the indexes of the largest values in a column, ordered from the largest. Equal values are kept in
+		the order they were added to the table.
+
+		:param column: One of the table columns
+		:param limit: Maximum amount of indexes to return, None for all indexes
+		:return: List[int]
+		"""
+		if limit is None or limit > len(column):
+			limit = len(column)
+		if limit <= 0:
+			return []
+		if not self.use_numpy:
+			return heapq.nlargest(limit, range(len(column)), key=column.__getitem__)
+
+		numpy = import_numpy()
+		values = numpy.frombuffer(column, dtype=column.typecode)
+		# Find the limit-th largest value without sorting, and sort only the results larger or equal to it
+		limit_value = numpy.partition(values, len(values) - limit)[len(values) - limit]
+		larger_indexes = numpy.flatnonzero(values > limit_value)
+		equal_indexes = numpy.flatnonzero(values == limit_value)[:limit - len(larger_indexes)]
+		indexes = numpy.concatenate((larger_indexes, equal_indexes))
+		# Stable sort by value from the largest - numpy.lexsort sorts by the last key first
+		indexes = indexes[numpy.lexsort((indexes, -values[indexes]))]
+		return indexes.tolist()
+
+	def get_indexes_ordered_by_score(self, limit: Optional[int] = None) -> List[int]:
+		""" Returns the indexes of the results ordered by coins earned, from the highest
+
+		:param limit: Optional - maximum amount of results, default: all results
+		:return: List[int]
+		"""
+		return self.get_indexes_of_largest_values(column=self.coins_earned, limit=limit)
+
+	def get_indexes_ordered_by_date(self, limit: Optional[int] = None) -> List[int]:
+		""" Returns the indexes of the results ordered by game date, from the newest
+
+		:param limit: Optional - maximum amount of results, default: all results
+		:return: List[int]
+		"""
+		return self.get_indexes_of_largest_values(column=self.game_timestamps, limit=limit)
+
+	def get_indexes_between_dates(self, from_datetime: datetime, to_datetime: datetime) -> List[int]:
+		""" Returns the indexes of the results played between two dates, ordered by game date from the newest
+
+		:param from_datetime: Earliest game date ( Including )
+		:param to_datetime: Latest game date ( Including )
+		:return: List[int]
+		"""
+		from_timestamp: float = from_datetime.timestamp()
+		to_timestamp: float = to_datetime.timestamp()
+		if not self.use_numpy:
+			indexes: List[int] = [index for index, game_timestamp in enumerate(self.game_timestamps)
+								  if from_timestamp <= game_timestamp <= to_timestamp]
+			return sorted(indexes, key=self.game_timestamps.__getitem__, reverse=True)
+
+		numpy = import_numpy()
+		game_timestamps = numpy.frombuffer(self.game_timestamps, dtype=numpy.float64)
+		indexes = numpy.flatnonzero((game_timestamps >= from_timestamp) & (game_timestamps <= to_timestamp))
+		return indexes[numpy.lexsort((indexes, -game_timestamps[indexes]))].tolist()
+
+	def get_indexes_of_player(self, player_name: str) -> List[int]:
+		""" Returns the indexes of the results of a single player, ordered by coins earned from the highest
+
+		:param player_name:
+		:return: List[int]
+		"""
+		name_id: Optional[int] = self.names_ids.get(player_name)
+		if name_id is None:
+			return []
+		if not self.use_numpy:
+			indexes: List[int] = [index for index, result_name_id in enumerate(self.name_ids) if result_name_id == name_id]
+			return sorted(indexes, key=self.coins_earned.__getitem__, reverse=True)
+
+		numpy = import_numpy()
+		coins_earned = numpy.frombuffer(self.coins_earned, dtype=numpy.int64)
+		indexes = numpy.flatnonzero(numpy.frombuffer(self.name_ids, dtype=numpy.uint32) == name_id)
+		return indexes[numpy.lexsort((indexes, -coins_earned[indexes]))].tolist()
@@ -0,0 +1,240 @@
+import logging
+import sqlite3
+from typing import List, Optional, Tuple, Iterator
+from datetime import datetime
+from highscores.game_result import GameResult
+from highscores.high_scores_storage import HighScoresStorage
+from constants import GAME_HIGH_SCORES_DATABASE_FILE_PATH
+
+
+logger = logging.getLogger(__name__)
+
+
+"""
+Contains a high scores storage backend using an SQLite database file
+"""
+
+
+GameResultRow = Tuple[str, int, int, str]
+# Database user version ( PRAGMA user_version ) set once the results of the high scores files were migrated to it
+MIGRATED_USER_VERSION: int = 1
+
+
+class ManageHighScoresDatabase(HighScoresStorage):
+	""" Keeps the game results in an SQLite database. The results table is indexed by coins earned, game date and
+	player name - so the top results, a dates range or a player's results are read using the index instead of sorting
+	all results.
+
+	Game dates are stored as text in the same format used by the high scores file ( str(datetime) ), which is ordered
+	the same way as the dates themselves. """
+	def __init__(self, database_file_path: str = GAME_HIGH_SCORES_DATABASE_FILE_PATH):
+		"""
+
+		:param database_file_path: Optional - path of the database file, will be created in case it doesn't exist
+		"""
+		self.database_file_path: str = database_file_path
+		# The connection may be used by a thread other than the one which created it ( such as the high scores thread of
+		# the game server ) - the users of the storage run its operations one at a time
+		self.connection: sqlite3.Connection = sqlite3.connect(self.database_file_path, check_same_thread=False)
+		self.create_database_schema()
+
+	@property
+	def is_migration_required(self) -> bool:
+		""" Checks if the results of the high scores files were not migrated to the database yet. The database is marked
+		as migrated only in the transaction copying the results, so a failed migration is tried again on the next start.
+
+		:return: Boolean - true if the results were not migrated
+		"""
+		user_version: int = self.connection.execute("PRAGMA user_version").fetchone()[0]
+		return user_version < MIGRATED_USER_VERSION
+
+	def create_database_schema(self) -> None:
+		""" Creates the game results table and its indexes, in case they don't exist
+
+		:return: None
+		"""
+		with self.connection:
+			self.connection.execute(
+				"CREATE TABLE IF NOT EXISTS game_results ("
+				"id INTEGER PRIMARY KEY, "
+				"name TEXT NOT NULL, "
+				"coins_earned INTEGER NOT NULL, "
+				"amount_of_trade_days INTEGER NOT NULL, "
+				"game_datetime TEXT NOT NULL)"
+			)
+			self.connection.execute(
+				"CREATE INDEX IF NOT EXISTS game_results_by_coins_earned ON game_results (coins_earned)"
+			)
+			self.connection.execute(
+				"CREATE INDEX IF NOT EXISTS game_results_by_game_datetime ON game_results (game_datetime)"
+			)
+			self.connection.execute(
+				"CREATE INDEX IF NOT EXISTS game_results_by_name ON game_results (name, coins_earned)"
+			)
+		return None
+
+	@staticmethod
+	def format_game_result_to_row(game_result: GameResult) -> GameResultRow:
+		""" Formats a game result to the values of a row in the game results table
+
+		:param game_result: A game result object
+		:return: Tuple of the row values
+		"""
+		return (game_result.name,
+				game_result.coins_earned,
+				game_result.amount_of_trade_days,
+				str(game_result.game_datetime))
+
+	def select_game_results(self, sql_query_suffix: str = "", parameters: tuple = ()) -> List[GameResult]:
+		""" Reads game results from the database
+
+		:param sql_query_suffix: Optional - SQL filters and ordering added after the SELECT statement
+		:param parameters: Optional - parameters of the SQL query suffix
+		:return: List[GameResult]
+		"""
+		return list(self.iterate_selected_game_results(sql_query_suffix=sql_query_suffix, parameters=parameters))
+
+	def iterate_selected_game_results(self, sql_query_suffix: str = "", parameters: tuple = ()) -> Iterator[GameResult]:
+		""" Reads game results from the database one by one, as the cursor fetches the rows
+
+		:param sql_query_suffix: Optional - SQL filters and ordering added after the SELECT statement
+		:param parameters: Optional - parameters of the SQL query suffix
+		:return: Iterator[GameResult]
+		"""
+		cursor = self.connection.execute(
+			f"SELECT name, coins_earned, amount_of_trade_days, game_datetime FROM game_results {sql_query_suffix}",
+			parameters
+		)
+		for name, coins_earned, amount_of_trade_days, game_datetime in cursor:
+			yield GameResult(name=name,
+							 coins_earned=coins_earned,
+							 amount_of_trade_days=amount_of_trade_days,
+							 game_datetime=game_datetime)
+
+	def get_high_scores(self) -> List[GameResult]:
+		""" Will return all the stored game results, in the order they were added
+
+		:return: List[GameResult]
+		"""
+		return self.select_game_results(sql_query_suffix="ORDER BY id")
+
+	def iterate_high_scores(self) -> Iterator[GameResult]:
+		""" Will yield all the stored game results one by one, in the order they were added
+
+		:return: Iterator[GameResult]
+		"""
+		return self.iterate_selected_game_results(sql_query_suffix="ORDER BY id")
+
+	def add_game_result(self, game_result: GameResult) -> None:
+		""" Will insert a single new game result
+
+		:param game_result: A game result object
+		:return: None
+		"""
+		self.add_game_results(game_results_list=[game_result])
+		return None
+
+	def add_game_results(self, game_results_list: List[GameResult]) -> None:
+		""" Will insert many game results in a single transaction
+
+		:param game_results_list:
+		:return: None
+		"""
+		with self.connection:
+			self.connection.executemany(
+				"INSERT INTO game_results (name, coins_earned, amount_of_trade_days, game_datetime) "
+				"VALUES (?, ?, ?, ?)",
+				[self.format_game_result_to_row(game_result=game_result) for game_result in game_results_list]
+			)
+		logger.info("Added %s game results to the high scores database at: %s",
+					len(game_results_list), self.database_file_path)
+		return None
+
+	def rewrite_high_scores(self, game_results_list: List[GameResult]) -> None:
+		""" Will replace all the stored game results with the given ones, in a single transaction
+
+		:param game_results_list: All the game results to keep
+		:return: None
+		"""
+		with self.connection:
+			self.connection.execute("DELETE FROM game_results")
+			self.connection.executemany(
+				"INSERT INTO game_results (name, coins_earned, amount_of_trade_days, game_datetime) "
+				"VALUES (?, ?, ?, ?)",
+				[self.format_game_result_to_row(game_result=game_result) for game_result in game_results_list]
+			)
+		return None
+
+	def migrate_game_results_from_storage(self, high_scores_storage: HighScoresStorage) -> None:
+		""" Copies all the game results of another storage into the database - used to migrate the high scores files
+		when the database is created. The results are copied and the database is marked as migrated in a single
+		transaction. The other storage is not changed.
+
+		:param high_scores_storage: The storage to copy the results from
+		:return: None
+		"""
+		game_results_list: List[GameResult] = high_scores_storage.get_high_scores()
+		with self.connection:
+			self.connection.executemany(
+				"INSERT INTO game_results (name, coins_earned, amount_of_trade_days, game_datetime) "
+				"VALUES (?, ?, ?, ?)",
+				[self.format_game_result_to_row(game_result=game_result) for game_result in game_results_list]
+			)
+			self.connection.execute(f"PRAGMA user_version = {MIGRATED_USER_VERSION}")
+		logger.info("Migrated %s game results to the high scores database at: %s",
+					len(game_results_list), self.database_file_path)
+		return None
+
+	def get_amount_of_game_results(self) -> int:
+		""" Will return the amount of stored game results
+
+		:return: int
+		"""
+		return self.connection.execute("SELECT COUNT(*) FROM game_results").fetchone()[0]
+
+	def get_game_results_ordered_by_score(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by coins earned, from the highest. Read using the coins earned index.
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		return self.select_game_results(sql_query_suffix="ORDER BY coins_earned DESC LIMIT ?",
+										parameters=(-1 if limit is None else limit,))
+
+	def get_game_results_ordered_by_date(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by game date, from the newest. Read using the game date index.
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		return self.select_game_results(sql_query_suffix="ORDER BY game_datetime DESC LIMIT ?",
+										parameters=(-1 if limit is None else limit,))
+
+	def get_game_results_between_dates(self, from_datetime: datetime, to_datetime: datetime) -> List[GameResult]:
+		""" Will return game results played between two dates, ordered by game date from the newest
+
+		:param from_datetime: Earliest game date to return ( Including )
+		:param to_datetime: Latest game date to return ( Including )
+		:return: List[GameResult]
+		"""
+		return self.select_game_results(
+			sql_query_suffix="WHERE game_datetime BETWEEN ? AND ? ORDER BY game_datetime DESC",
+			parameters=(str(from_datetime), str(to_datetime))
+		)
+
+	def get_game_results_of_player(self, player_name: str) -> List[GameResult]:
+		""" Will return the game results of a single player, ordered by coins earned from the highest
+
+		:param player_name:
+		:return: List[GameResult]
+		"""
+		return self.select_game_results(sql_query_suffix="WHERE name = ? ORDER BY coins_earned DESC",
+										parameters=(player_name,))
+
+	def close(self) -> None:
+		""" Closes the connection to the database
+
+		:return: None
+		"""
+		self.connection.close()
+		return None
@@ -0,0 +1,116 @@
+import heapq
+from abc import ABC, abstractmethod
+from typing import List, Optional, Iterator
+from datetime import datetime
+from highscores.game_result import GameResult
+
+
+"""
+Contains the base class of the storage backends keeping the game high scores
+"""
+
+
+class HighScoresStorage(ABC):
+	""" Base class for a storage keeping the game results. New backends should inherit it and implement
+	get_high_scores(), add_game_result() and rewrite_high_scores().
+
+	The queries have a default implementation which goes over the results one by one using iterate_high_scores(), so
+	a query for the top N results keeps only N results in memory. Backends which can do better ( for example using an
+	index ) should override them. """
+	@abstractmethod
+	def get_high_scores(self) -> List[GameResult]:
+		""" Will return all the stored game results
+
+		:return: List[GameResult]
+		"""
+
+	def iterate_high_scores(self) -> Iterator[GameResult]:
+		""" Will yield all the stored game results one by one. Backends which can read the results lazily should
+		override it, so queries will not keep all results in memory.
+
+		:return: Iterator[GameResult]
+		"""
+		return iter(self.get_high_scores())
+
+	@abstractmethod
+	def add_game_result(self, game_result: GameResult) -> None:
+		""" Will store a single new game result
+
+		:param game_result: A game result object
+		:return: None
+		"""
+
+	@abstractmethod
+	def rewrite_high_scores(self, game_results_list: List[GameResult]) -> None:
+		""" Will replace all the stored game results with the given ones
+
+		:param game_results_list: All the game results to keep
+		:return: None
+		"""
+
+	def close(self) -> None:
+		""" Will release the resources of the storage, such as open files or connections. Storages which hold none
+		don't need to override it.
+
+		:return: None
+		"""
+		return None
+
+	def get_game_results_added_elsewhere(self) -> Optional[List[GameResult]]:
+		""" Will return the game results added to the storage by other game processes since it was read. Storages
+		which are not shared between processes return no results.
+
+		:return: List of the new results, or None in case all results should be read again
+		"""
+		return []
+
+	def get_amount_of_game_results(self) -> int:
+		""" Will return the amount of stored game results
+
+		:return: int
+		"""
+		return sum(1 for _ in self.iterate_high_scores())
+
+	def get_game_results_ordered_by_score(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by coins earned, from the highest
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		if limit is None:
+			return sorted(self.iterate_high_scores(), key=lambda game_result: game_result.coins_earned, reverse=True)
+		return heapq.nlargest(limit, self.iterate_high_scores(), key=lambda game_result: game_result.coins_earned)
+
+	def get_game_results_ordered_by_date(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by game date, from the newest
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		if limit is None:
+			return sorted(self.iterate_high_scores(),
+						  key=lambda game_result: game_result.game_datetime,
+						  reverse=True)
+		return heapq.nlargest(limit, self.iterate_high_scores(), key=lambda game_result: game_result.game_datetime)
+
+	def get_game_results_between_dates(self, from_datetime: datetime, to_datetime: datetime) -> List[GameResult]:
+		""" Will return game results played between two dates, ordered by game date from the newest
+
+		:param from_datetime: Earliest game date to return ( Including )
+		:param to_datetime: Latest game date to return ( Including )
+		:return: List[GameResult]
+		"""
+		return sorted((game_result for game_result in self.iterate_high_scores()
+					   if from_datetime <= game_result.game_datetime <= to_datetime),
+					  key=lambda game_result: game_result.game_datetime,
+					  reverse=True)
+
+	def get_game_results_of_player(self, player_name: str) -> List[GameResult]:
+		""" Will return the game results of a single player, ordered by coins earned from the highest
+
+		:param player_name:
+		:return: List[GameResult]
+		"""
+		return sorted((game_result for game_result in self.iterate_high_scores() if game_result.name == player_name),
+					  key=lambda game_result: game_result.coins_earned,
+					  reverse=True)
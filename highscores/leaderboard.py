@@ -0,0 +1,92 @@
+from bisect import bisect_left
+from typing import List, Callable, Any
+from highscores.game_result import GameResult
+
+
+"""
+Contains a leaderboard which keeps the top game results ordered, without sorting all the results
+"""
+
+
+class Leaderboard:
+	""" Keeps the top K game results ordered from the highest key, updated on every new result.
+
+	Adding a result costs a binary search and a list insert of up to K items, instead of sorting the whole high scores
+	history. Results with equal keys are kept in the order they were added. """
+	def __init__(self, capacity: int, key: Callable[[GameResult], Any]):
+		"""
+
+		:param capacity: Maximum amount of results kept in the leaderboard ( K )
+		:param key: Function returning the value the results are ordered by, from the highest
+		"""
+		self.capacity: int = capacity
+		self.key: Callable[[GameResult], Any] = key
+		self._keys: List[Any] = []  # Keys of the results - ordered from the lowest, so the lowest result is last
+		self._game_results: List[GameResult] = []  # Ordered from the highest key
+
+	def __len__(self) -> int:
+		return len(self._game_results)
+
+	@property
+	def game_results(self) -> List[GameResult]:
+		""" Returns the results in the leaderboard, ordered from the highest key
+
+		:return: List[GameResult]
+		"""
+		return list(self._game_results)
+
+	def add_game_result(self, game_result: GameResult) -> None:
+		""" Adds a result to the leaderboard, in case it is one of the top K results
+
+		:param game_result: A game result object
+		:return: None
+		"""
+		game_result_key = self.key(game_result)
+		if len(self._game_results) >= self.capacity and game_result_key <= self._keys[0]:
+			return None
+
+		# Keys are kept ordered from the lowest, while results are ordered from the highest - so the same position is
+		# counted from the start of the keys list and from the end of the results list
+		key_index: int = bisect_left(self._keys, game_result_key)
+		self._keys.insert(key_index, game_result_key)
+		self._game_results.insert(len(self._game_results) - key_index, game_result)
+		if len(self._game_results) > self.capacity:
+			self._keys.pop(0)
+			self._game_results.pop()
+		return None
+
+	def add_game_results(self, game_results: List[GameResult]) -> None:
+		""" Adds many results to the leaderboard
+
+		:param game_results:
+		:return: None
+		"""
+		for game_result in game_results:
+			self.add_game_result(game_result=game_result)
+		return None
+
+	def reset(self) -> None:
+		""" Removes all results from the leaderboard
+
+		:return: None
+		"""
+		self._keys = []
+		self._game_results = []
+		return None
+
+	def get_page(self, page_number: int, page_size: int) -> List[GameResult]:
+		""" Returns a single page of the leaderboard results
+
+		:param page_number: Number of the page, starting from 0
+		:param page_size: Amount of results in a page
+		:return: List[GameResult]
+		"""
+		return self._game_results[page_number * page_size:(page_number + 1) * page_size]
+
+	def get_amount_of_pages(self, page_size: int) -> int:
+		""" Returns the amount of pages of the leaderboard results
+
+		:param page_size: Amount of results in a page
+		:return: int
+		"""
+		return -(-len(self._game_results) // page_size)
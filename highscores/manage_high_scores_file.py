@@ -1,15 +1,33 @@
 import logging
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Optional, Iterator, Iterable, TextIO, Any, Tuple
+import contextlib
+import itertools
 import json
+import re
+import os
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from highscores.game_result import GameResult
-from constants import GAME_HIGH_SCORES_FILE_PATH
+from highscores.game_result_table import GameResultTable
+from highscores.high_scores_storage import HighScoresStorage
+from highscores.high_scores_database import ManageHighScoresDatabase
+from highscores.leaderboard import Leaderboard
+from constants import GAME_HIGH_SCORES_FILE_PATH, GAME_HIGH_SCORES_JOURNAL_FILE_PATH, \
+	HIGH_SCORES_JOURNAL_COMPACTION_THRESHOLD, HIGH_SCORES_STORAGE_BACKEND, HIGH_SCORES_LEADERBOARD_SIZE
+try:
+	import fcntl
+except ImportError:
+	fcntl = None  # Not available on Windows - the files will be locked only between threads of the same process
 
 
 logger = logging.getLogger(__name__)
 
 
+JSON_ARRAY_SEPARATORS_PATTERN = re.compile(r"[\s,\[]*")
+
+
 """
 Contains functionality for managing the high scores table
 """
@@ -24,8 +42,11 @@ class HighScoresFileFieldsNames:
 	GAME_DATETIME: str = "game_datetime"
 
 
-class ManageHighScoresFile:
-	def __init__(self):
+class ManageHighScoresFile(HighScoresStorage):
+	def __init__(self,
+				 high_scores_file_path: str = GAME_HIGH_SCORES_FILE_PATH,
+				 high_scores_journal_file_path: str = GAME_HIGH_SCORES_JOURNAL_FILE_PATH,
+				 journal_compaction_threshold: int = HIGH_SCORES_JOURNAL_COMPACTION_THRESHOLD):
 		""" Game high scores will be stored in a file on the OS volume. The file will contains a JSON string containing
 		the game results. This class will allow to read and write the file, and to transfer the JSON string to a list
 		of GameResult objects which represent the player's games scores.
@@ -39,9 +60,172 @@ class ManageHighScoresFile:
 		 ...
 		]
 
+		New game results are not written to the high scores file. Instead, every new result is appended as a single
+		JSON line to a journal file. Once the journal has enough results, it is compacted - its results are merged into
+		the high scores file in a background thread, and the journal is emptied.
+
+		Several game processes can share the same files - the files are locked with an advisory lock on a separate
+		lock file while they are read or written, and the high scores file is replaced atomically. Results appended
+		by other processes are picked up when a new result is appended, see get_game_results_added_elsewhere().
+
+		:param high_scores_file_path: Optional - path of the high scores file
+		:param high_scores_journal_file_path: Optional - path of the journal file with the results added since the
+											  last compaction
+		:param journal_compaction_threshold: Optional - amount of results in the journal which will trigger compaction
 		"""
-		self.high_scores_file_path: str = GAME_HIGH_SCORES_FILE_PATH
+		self.high_scores_file_path: str = high_scores_file_path
 		self.high_scores_file: Path = Path(self.high_scores_file_path)
+		self.high_scores_journal_file_path: str = high_scores_journal_file_path
+		self.high_scores_journal_file: Path = Path(self.high_scores_journal_file_path)
+		self.high_scores_lock_file: Path = Path(f"{self.high_scores_file_path}.lock")
+		self.journal_compaction_threshold: int = journal_compaction_threshold
+
+		self.amount_of_results_in_journal: int = 0
+		self.is_journal_file_recovered: bool = False
+		# Held while reading or writing the files - reentrant, so results can be added while the files are iterated
+		self.files_lock: threading.RLock = threading.RLock()
+		self.files_lock_depth: int = 0  # The lock file is locked only by the outermost lock_high_scores_files()
+
+		# What was read from the files, used to find results added by other processes
+		self.read_high_scores_file_signature: Optional[Tuple[int, int, int]] = None
+		self.journal_file_read_offset: int = 0
+		self.game_results_added_elsewhere: List[GameResult] = []
+		self.is_reload_required: bool = False
+		self.compaction_thread: Optional[threading.Thread] = None
+		# Results are read from the files only once - and kept in a compact table
+		self.game_results_cache: Optional[GameResultTable] = None
+
+	def get_game_results_table(self) -> GameResultTable:
+		""" Will return a table with all the game results - read from the files on first use
+
+		:return: GameResultTable
+		"""
+		if self.game_results_cache is None:
+			self.game_results_cache = GameResultTable(game_results=self.iterate_high_scores_from_files())
+		return self.game_results_cache
+
+	def get_high_scores(self) -> List[GameResult]:
+		""" Will return all the game results - read from the files on first use
+
+		:return: List[GameResult]
+		"""
+		return list(self.get_game_results_table())
+
+	def add_game_result(self, game_result: GameResult) -> None:
+		""" Will append a new game result to the journal file
+
+		:param game_result: A game result object
+		:return: None
+		"""
+		self.append_game_result_to_journal(game_result=game_result)
+		if self.game_results_cache is not None:
+			self.game_results_cache.append(game_result=game_result)
+		return None
+
+	def rewrite_high_scores(self, game_results_list: List[GameResult]) -> None:
+		""" Will write all the given game results to the high scores file, and will empty the journal file
+
+		:param game_results_list: All the game results to keep
+		:return: None
+		"""
+		self.rewrite_high_scores_files(game_results_list=game_results_list)
+		self.game_results_cache = GameResultTable(game_results=game_results_list)
+		return None
+
+	def get_amount_of_game_results(self) -> int:
+		""" Will return the amount of game results - read from the files on first use
+
+		:return: int
+		"""
+		return len(self.get_game_results_table())
+
+	def get_game_results_ordered_by_score(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by coins earned, from the highest. In case the results were already read
+		from the files, they are sorted in the results table.
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		if self.game_results_cache is None:
+			return super().get_game_results_ordered_by_score(limit=limit)
+		return self.game_results_cache.get_game_results(
+			indexes=self.game_results_cache.get_indexes_ordered_by_score(limit=limit)
+		)
+
+	def get_game_results_ordered_by_date(self, limit: Optional[int] = None) -> List[GameResult]:
+		""" Will return game results ordered by game date, from the newest. In case the results were already read from
+		the files, they are sorted in the results table.
+
+		:param limit: Optional - maximum amount of results to return, default: all results
+		:return: List[GameResult]
+		"""
+		if self.game_results_cache is None:
+			return super().get_game_results_ordered_by_date(limit=limit)
+		return self.game_results_cache.get_game_results(
+			indexes=self.game_results_cache.get_indexes_ordered_by_date(limit=limit)
+		)
+
+	def get_game_results_between_dates(self, from_datetime: datetime, to_datetime: datetime) -> List[GameResult]:
+		""" Will return game results played between two dates, ordered by game date from the newest. Filtered in the
+		results table.
+
+		:param from_datetime: Earliest game date to return ( Including )
+		:param to_datetime: Latest game date to return ( Including )
+		:return: List[GameResult]
+		"""
+		game_results_table: GameResultTable = self.get_game_results_table()
+		return game_results_table.get_game_results(
+			indexes=game_results_table.get_indexes_between_dates(from_datetime=from_datetime, to_datetime=to_datetime)
+		)
+
+	def get_game_results_of_player(self, player_name: str) -> List[GameResult]:
+		""" Will return the game results of a single player, ordered by coins earned from the highest. Filtered in the
+		results table.
+
+		:param player_name:
+		:return: List[GameResult]
+		"""
+		game_results_table: GameResultTable = self.get_game_results_table()
+		return game_results_table.get_game_results(
+			indexes=game_results_table.get_indexes_of_player(player_name=player_name)
+		)
+
+	@contextlib.contextmanager
+	def lock_high_scores_files(self) -> Iterator[None]:
+		""" Locks the high scores files - between threads of this process, and between processes using an exclusive
+		advisory lock on the lock file. Can be used again by a thread already holding the lock.
+
+		:return: Context manager
+		"""
+		with self.files_lock:
+			if self.files_lock_depth > 0 or fcntl is None:
+				self.files_lock_depth += 1
+				try:
+					yield
+				finally:
+					self.files_lock_depth -= 1
+				return
+
+			with self.high_scores_lock_file.open("a") as lock_file:
+				fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+				self.files_lock_depth += 1
+				try:
+					yield
+				finally:
+					self.files_lock_depth -= 1
+					fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+	def get_high_scores_file_signature(self) -> Optional[Tuple[int, int, int]]:
+		""" Returns details identifying the current version of the high scores file - it changes whenever the file is
+		replaced
+
+		:return: Tuple of the file inode, modification time and size, or None in case the file doesn't exist
+		"""
+		try:
+			file_stat = self.high_scores_file.stat()
+		except FileNotFoundError:
+			return None
+		return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
 
 	def is_high_scores_file_exist(self) -> bool:
 		""" Checks if the high scores file exists
@@ -53,48 +237,201 @@ class ManageHighScoresFile:
 		return False
 
 	def read_high_scores_data_from_file(self) -> List[Dict[str, Union[str, int, datetime]]]:
-		""" Will return the high scores file content - as a string.
+		""" Will return the high scores file content - as a list of dictionaries.
 
 		File will still need to be formatted from JSON to a list of GameResult objects
 
-		:return: str
+		:return: List of the game results in the high scores file, as dictionaries
+		"""
+		return list(self.iterate_high_scores_data_from_file())
+
+	def iterate_high_scores_data_from_file(self) -> Iterator[Dict[str, Union[str, int, datetime]]]:
+		""" Will yield the game results in the high scores file one by one, as dictionaries. The file is read in chunks,
+		so the whole file is never kept in memory.
+
+		:return: Iterator of the game results in the high scores file
+		"""
+		return self.iterate_opened_high_scores_file(high_scores_file=self.open_high_scores_file())
+
+	def open_high_scores_file(self) -> Optional[TextIO]:
+		""" Opens the high scores file for reading. The file is never changed in place - it is replaced, so the opened
+		file can be read after the files are unlocked.
+
+		:return: The opened file, or None in case the file doesn't exist
+		"""
+		try:
+			return self.high_scores_file.open("r", encoding="utf-8")
+		except FileNotFoundError:
+			logger.info("Couldn't find a game high-scores file at %s - will not return high-scores details!",
+						self.high_scores_file_path)
+			return None
+
+	def iterate_opened_high_scores_file(self,
+										high_scores_file: Optional[TextIO]) -> Iterator[Dict[str, Union[str, int, datetime]]]:
+		""" Will yield the game results in an opened high scores file one by one, as dictionaries, and will close it
+
+		:param high_scores_file: The opened high scores file, or None in case the file doesn't exist
+		:return: Iterator of the game results in the high scores file
+		"""
+		if high_scores_file is None:
+			return
+		with high_scores_file:
+			yield from self.iterate_json_array_items(file=high_scores_file)
+
+	@staticmethod
+	def iterate_json_array_items(file: TextIO, chunk_size: int = 65536) -> Iterator[Any]:
+		""" Parses a file containing a JSON array, and yields the array items one by one. Only the current chunk of the
+		file and the item being parsed are kept in memory.
+
+		:param file: An opened text file containing a JSON array
+		:param chunk_size: Optional - amount of characters read from the file at once
+		:return: Iterator of the array items
+		"""
+		json_decoder = json.JSONDecoder()
+		buffer: str = ""
+		position: int = 0
+		while True:
+			# Skip the whitespaces, the array opening and the commas between items
+			position = JSON_ARRAY_SEPARATORS_PATTERN.match(buffer, position).end()
+			if position == len(buffer):
+				buffer = file.read(chunk_size)
+				position = 0
+				if not buffer:
+					return
+				continue
+			if buffer[position] == "]":
+				return
+
+			try:
+				item, position = json_decoder.raw_decode(buffer, position)
+			except json.JSONDecodeError:
+				# The item continues in the next chunk of the file
+				chunk: str = file.read(chunk_size)
+				if not chunk:
+					raise
+				buffer = buffer[position:] + chunk
+				position = 0
+				continue
+			yield item
+
+	def read_high_scores_data_from_journal_file(self) -> List[Dict[str, Union[str, int, datetime]]]:
+		""" Will return the game results appended to the journal file since the last compaction.
+
+		:return: List of the game results in the journal file, as dictionaries
+		"""
+		return list(self.iterate_high_scores_data_from_journal_file())
+
+	def iterate_high_scores_data_from_journal_file(self) -> Iterator[Dict[str, Union[str, int, datetime]]]:
+		""" Will yield the game results appended to the journal file since the last compaction, line by line.
+
+		In case the game stopped while appending a result, the last line of the journal can be partially written.
+		Such a line is ignored - and will be removed before the next result is appended.
+
+		:return: Iterator of the game results in the journal file, as dictionaries
+		"""
+		amount_of_results_in_journal: int = 0
+		for game_result_details_in_json in self.iterate_journal_file_from_offset(journal_file_offset=0):
+			amount_of_results_in_journal += 1
+			yield game_result_details_in_json
+		self.amount_of_results_in_journal = amount_of_results_in_journal
+
+	def iterate_journal_file_from_offset(self, journal_file_offset: int) -> Iterator[Dict[str, Union[str, int, datetime]]]:
+		""" Will yield the game results in the journal file, starting at an offset. When the iteration ends,
+		self.journal_file_read_offset is set to the end of the last complete line read.
+
+		:param journal_file_offset: Offset in bytes to start reading from, must be the start of a line
+		:return: Iterator of the game results in the journal file, as dictionaries
 		"""
-		game_high_scores_as_json = ""
 		try:
-			file_content: str = self.high_scores_file.read_text()
-			game_high_scores_as_json = json.loads(file_content)
+			journal_file = self.high_scores_journal_file.open("rb")
 		except FileNotFoundError:
-			logger.info(f"Couldn't find a game high-scores file at {self.high_scores_file_path} - "
-				  f"will not return high-scores details!")
-		return game_high_scores_as_json
+			logger.info("Couldn't find a game high-scores journal file at %s", self.high_scores_journal_file_path)
+			self.journal_file_read_offset = 0
+			return
+		with journal_file:
+			journal_file.seek(journal_file_offset)
+			for line in journal_file:
+				try:
+					game_result_details_in_json = json.loads(line)
+				except json.JSONDecodeError:
+					logger.warning("Ignoring a partially written game result in the high-scores journal file at %s: %s",
+								   self.high_scores_journal_file_path, line)
+					continue
+				journal_file_offset += len(line)
+				yield game_result_details_in_json
+		self.journal_file_read_offset = journal_file_offset
 
 	def get_high_scores_from_file(self) -> List[GameResult]:
-		""" Will return games high-scores data, based on the data file storing them
+		""" Will return games high-scores data, based on the data files storing them - the high scores file and the
+		journal file
 
 		:return: A list of game results, to be used by HighScores object
 		"""
-		game_high_scores_as_json = self.read_high_scores_data_from_file()
-		games_results: List[GameResult] = []
+		return list(self.iterate_high_scores_from_files())
+
+	def iterate_high_scores_from_files(self) -> Iterator[GameResult]:
+		""" Will yield the game results in the high scores file and then the results in the journal file, one by one.
+
+		The files are locked only while the high scores file is opened and the journal file is read - the journal
+		results are kept in memory ( there are at most as many as the compaction threshold ), and the high scores file
+		is then read from the opened file after the files are unlocked. So the files are not kept locked by a caller
+		which stops iterating early.
+
+		:return: Iterator[GameResult]
+		"""
+		with self.lock_high_scores_files():
+			self.read_high_scores_file_signature = self.get_high_scores_file_signature()
+			self.game_results_added_elsewhere = []
+			self.is_reload_required = False
+			high_scores_file: Optional[TextIO] = self.open_high_scores_file()
+			journal_high_scores_data: List[Dict[str, Union[str, int, datetime]]] = \
+				self.read_high_scores_data_from_journal_file()
+		return self.iterate_json_to_game_results(game_high_scores_as_json=itertools.chain(
+			self.iterate_opened_high_scores_file(high_scores_file=high_scores_file),
+			journal_high_scores_data
+		))
+
+	def iterate_high_scores(self) -> Iterator[GameResult]:
+		""" Will yield all the game results one by one - from memory in case they were already read, else from the files
+
+		:return: Iterator[GameResult]
+		"""
+		if self.game_results_cache is not None:
+			return iter(self.game_results_cache)
+		return self.iterate_high_scores_from_files()
 
+	@classmethod
+	def format_json_to_game_results(cls, game_high_scores_as_json: Iterable[Dict[str, any]]) -> List[GameResult]:
+		""" Will format game results read from the high scores files to GameResult objects.
+
+		:param game_high_scores_as_json: Game results as dictionaries, as saved in the high scores files
+		:return: List[GameResult]
+		"""
+		return list(cls.iterate_json_to_game_results(game_high_scores_as_json=game_high_scores_as_json))
+
+	@staticmethod
+	def iterate_json_to_game_results(game_high_scores_as_json: Iterable[Dict[str, any]]) -> Iterator[GameResult]:
+		""" Will format game results read from the high scores files to GameResult objects, one by one.
+
+		:param game_high_scores_as_json: Game results as dictionaries, as saved in the high scores files
+		:return: Iterator[GameResult]
+		"""
 		for game_result_details_in_json in game_high_scores_as_json:
 			try:
 				name: str = game_result_details_in_json[HighScoresFileFieldsNames.NAME]
 				coins_earned: int = game_result_details_in_json[HighScoresFileFieldsNames.COINS_EARNED]
 				amount_of_trade_days: int = game_result_details_in_json[HighScoresFileFieldsNames.AMOUNT_OF_TRADE_DAYS]
 				game_datetime: datetime = game_result_details_in_json[HighScoresFileFieldsNames.GAME_DATETIME]
-
-				games_results.append(
-					GameResult(name=name,
-							   coins_earned=coins_earned,
-							   amount_of_trade_days=amount_of_trade_days,
-							   game_datetime=game_datetime)
-				)
+				game_result = GameResult(name=name,
+										 coins_earned=coins_earned,
+										 amount_of_trade_days=amount_of_trade_days,
+										 game_datetime=game_datetime)
 			except Exception as e:
-				logger.error(f"Failed reading game high score! Reason: no results in file or bad format! "
-							 f"returned error: {e} , "
-							 f"failed reading this details: {game_result_details_in_json}")
+				logger.error("Failed reading game high score! Reason: no results in file or bad format! "
+							 "returned error: %s , failed reading this details: %s", e, game_result_details_in_json)
+				continue
 
-		return games_results
+			yield game_result
 
 	def update_high_scores_file(self, game_results_list: List[GameResult]) -> None:
 		""" Will update the high scores file with the current game high scores.
@@ -112,10 +449,201 @@ class ManageHighScoresFile:
 			sort_keys=True,
 			default=str
 		)
-		with self.high_scores_file.open("w", encoding="utf-8") as file:
-			file.write(game_results_as_text_string)
+		# The file is replaced only after the new content is fully written to a unique temporary file in the same
+		# directory - so a crash will not leave it truncated, and readers see either the old or the new file
+		file_descriptor, temporary_high_scores_file_path = tempfile.mkstemp(
+			dir=self.high_scores_file.parent,
+			prefix=f"{self.high_scores_file.name}.",
+			suffix=".tmp"
+		)
+		try:
+			with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+				file.write(game_results_as_text_string)
+				file.flush()
+				os.fsync(file.fileno())
+			os.replace(temporary_high_scores_file_path, self.high_scores_file)
+		except BaseException:
+			os.unlink(temporary_high_scores_file_path)
+			raise
+		self.read_high_scores_file_signature = self.get_high_scores_file_signature()
+
+		logger.info("Successfully updated the game high scores file at: %s", self.high_scores_file_path)
+		return None
 
-		logger.info(f"Successfully updated the game high scores file at: {self.high_scores_file_path}")
+	def recover_journal_file(self) -> None:
+		""" Removes a partially written last line from the journal file - in case the game stopped while appending a
+		result. Only the end of the file is read.
+
+		:return: None
+		"""
+		try:
+			with self.high_scores_journal_file.open("rb+") as journal_file:
+				journal_file_size: int = journal_file.seek(0, os.SEEK_END)
+				if journal_file_size == 0:
+					return None
+				journal_file.seek(journal_file_size - 1)
+				if journal_file.read(1) == b"\n":
+					return None
+
+				# Find the end of the last complete line, reading the file backwards in blocks
+				block_end: int = journal_file_size
+				last_line_end: int = 0
+				while block_end > 0:
+					block_start: int = max(0, block_end - 4096)
+					journal_file.seek(block_start)
+					block: bytes = journal_file.read(block_end - block_start)
+					newline_index: int = block.rfind(b"\n")
+					if newline_index != -1:
+						last_line_end = block_start + newline_index + 1
+						break
+					block_end = block_start
+				journal_file.truncate(last_line_end)
+				logger.warning("Removed a partially written game result from the high-scores journal file at %s",
+							   self.high_scores_journal_file_path)
+		except FileNotFoundError:
+			pass
+		return None
+
+	def append_game_result_to_journal(self, game_result: GameResult) -> None:
+		""" Will append a single game result to the journal file. In case the journal reached the compaction threshold,
+		a compaction will be started in the background.
+
+		:param game_result: A game result object
+		:return: None
+		"""
+		game_result_as_text_string: str = json.dumps(
+			self.format_game_results_to_json_string(game_results_list=[game_result])[0],
+			sort_keys=True,
+			default=str
+		)
+		with self.lock_high_scores_files():
+			if not self.is_journal_file_recovered:
+				self.recover_journal_file()
+				self.is_journal_file_recovered = True
+			# Pick up the results other processes appended since the files were read, before appending after them
+			self.read_game_results_appended_elsewhere()
+			with self.high_scores_journal_file.open("ab") as journal_file:
+				journal_file.write(game_result_as_text_string.encode("utf-8") + b"\n")
+				self.journal_file_read_offset = journal_file.tell()
+			self.amount_of_results_in_journal += 1
+
+		logger.info("Appended a game result to the game high scores journal file at: %s",
+					self.high_scores_journal_file_path)
+		if self.amount_of_results_in_journal >= self.journal_compaction_threshold:
+			self.start_compaction_in_background()
+		return None
+
+	def read_game_results_appended_elsewhere(self) -> None:
+		""" Reads the results appended to the journal file by other processes since the files were last read. The
+		results are added to the results table, and kept until get_game_results_added_elsewhere() is called.
+
+		In case another process replaced the high scores file since it was read ( compacted or reset the files ), there
+		is no way to tell which results are new - so all results will be read again.
+
+		Must be called while holding the files lock.
+
+		:return: None
+		"""
+		if self.is_reload_required:
+			return None
+		try:
+			journal_file_size: int = self.high_scores_journal_file.stat().st_size
+		except FileNotFoundError:
+			journal_file_size = 0
+		if self.get_high_scores_file_signature() != self.read_high_scores_file_signature \
+				or journal_file_size < self.journal_file_read_offset:
+			logger.info("High scores files were changed by another process - will read all results again")
+			self.is_reload_required = True
+			self.game_results_added_elsewhere = []
+			self.game_results_cache = None
+			return None
+
+		game_results: List[GameResult] = self.format_json_to_game_results(
+			game_high_scores_as_json=self.iterate_journal_file_from_offset(
+				journal_file_offset=self.journal_file_read_offset)
+		)
+		self.amount_of_results_in_journal += len(game_results)
+		self.game_results_added_elsewhere += game_results
+		if self.game_results_cache is not None:
+			self.game_results_cache.extend(game_results=game_results)
+		return None
+
+	def get_game_results_added_elsewhere(self) -> Optional[List[GameResult]]:
+		""" Will return the game results other processes added to the files since they were read by this object
+
+		:return: List of the new results, or None in case all results should be read again
+		"""
+		with self.lock_high_scores_files():
+			self.read_game_results_appended_elsewhere()
+			if self.is_reload_required:
+				return None
+			game_results_added_elsewhere: List[GameResult] = self.game_results_added_elsewhere
+			self.game_results_added_elsewhere = []
+		return game_results_added_elsewhere
+
+	def start_compaction_in_background(self) -> None:
+		""" Will start compacting the high scores files in a background thread - unless a compaction is already running
+
+		:return: None
+		"""
+		if self.compaction_thread is not None and self.compaction_thread.is_alive():
+			return None
+		self.compaction_thread = threading.Thread(target=self.compact_high_scores_files,
+												  name="high-scores-compaction")
+		self.compaction_thread.start()
+		return None
+
+	def wait_for_compaction(self) -> None:
+		""" Will wait until a running background compaction ends
+
+		:return: None
+		"""
+		if self.compaction_thread is not None:
+			self.compaction_thread.join()
+		return None
+
+	def close(self) -> None:
+		""" Will wait for a running background compaction, so the files are not left half merged on exit
+
+		:return: None
+		"""
+		self.wait_for_compaction()
+		return None
+
+	def compact_high_scores_files(self) -> None:
+		""" Will merge the results in the journal file into the high scores file, and will empty the journal file.
+
+		:return: None
+		"""
+		with self.lock_high_scores_files():
+			# The files are read again while locked, so results appended by other processes are merged too
+			self.read_game_results_appended_elsewhere()
+			game_high_scores_as_json = self.read_high_scores_data_from_file()
+			game_high_scores_as_json += self.read_high_scores_data_from_journal_file()
+			self.update_high_scores_file(
+				game_results_list=self.format_json_to_game_results(game_high_scores_as_json=game_high_scores_as_json)
+			)
+			self.high_scores_journal_file.open("w").close()
+			self.amount_of_results_in_journal = 0
+			self.journal_file_read_offset = 0
+		logger.info("Compacted %s game results to the high scores file at: %s",
+					len(game_high_scores_as_json), self.high_scores_file_path)
+		return None
+
+	def rewrite_high_scores_files(self, game_results_list: List[GameResult]) -> None:
+		""" Will write all the given game results to the high scores file, and will empty the journal file
+
+		:param game_results_list: All the game results to keep
+		:return: None
+		"""
+		self.wait_for_compaction()
+		with self.lock_high_scores_files():
+			self.update_high_scores_file(game_results_list=game_results_list)
+			self.high_scores_journal_file.open("w").close()
+			self.amount_of_results_in_journal = 0
+			self.journal_file_read_offset = 0
+			self.game_results_added_elsewhere = []
+			self.is_reload_required = False
 		return None
 
 	@staticmethod
@@ -141,16 +669,85 @@ class ManageHighScoresFile:
 		return game_results_dict_formatted
 
 
+def create_high_scores_storage(storage_backend: str = HIGH_SCORES_STORAGE_BACKEND) -> HighScoresStorage:
+	""" Creates the storage keeping the game high scores, according to the backend set in constants.py.
+
+	When the SQLite database is created for the first time, the results kept in the high scores files are migrated to it.
+
+	:param storage_backend: Optional - "json" or "sqlite"
+	:return: HighScoresStorage
+	"""
+	if storage_backend == "json":
+		return ManageHighScoresFile()
+	if storage_backend == "sqlite":
+		manage_high_scores_database = ManageHighScoresDatabase()
+		if manage_high_scores_database.is_migration_required:
+			try:
+				manage_high_scores_database.migrate_game_results_from_storage(high_scores_storage=ManageHighScoresFile())
+			except Exception:
+				logger.exception("Failed migrating the high scores files to the high scores database")
+				manage_high_scores_database.close()
+				raise
+		return manage_high_scores_database
+	raise ValueError(f"Unknown high scores storage backend: {storage_backend}")
+
+
 class HighScores:
 	""" Will manage the game's high score table """
 
-	def __init__(self):
+	def __init__(self,
+				 high_scores_storage: Optional[HighScoresStorage] = None,
+				 leaderboard_size: int = HIGH_SCORES_LEADERBOARD_SIZE):
 		"""
 
+		:param high_scores_storage: Optional - storage keeping the game results, in case not given the backend set in
+									constants.py will be used
+		:param leaderboard_size: Optional - amount of top results kept ordered by score and by date
 		"""
-		self._game_results: List[GameResult] = []
-		self.manage_high_scores_file_helper = ManageHighScoresFile()
-		self.get_game_results_from_file()
+		self.high_scores_storage: HighScoresStorage = high_scores_storage or create_high_scores_storage()
+
+		# The top results are kept ordered and updated on every new result, so they are not sorted on every read
+		self.leaderboard_by_score = Leaderboard(capacity=leaderboard_size,
+												key=lambda game_result: game_result.coins_earned)
+		self.leaderboard_by_date = Leaderboard(capacity=leaderboard_size,
+											   key=lambda game_result: game_result.game_datetime)
+		# The results are read from the storage only when first needed - so a long high scores history doesn't slow
+		# down the game start
+		self.is_leaderboards_loaded: bool = False
+
+	def load_leaderboards(self) -> None:
+		""" Fills the leaderboards with the top results in the storage
+
+		:return: None
+		"""
+		self.is_leaderboards_loaded = True
+		self.leaderboard_by_score.reset()
+		self.leaderboard_by_date.reset()
+		self.leaderboard_by_score.add_game_results(
+			self.high_scores_storage.get_game_results_ordered_by_score(limit=self.leaderboard_by_score.capacity)
+		)
+		self.leaderboard_by_date.add_game_results(
+			self.high_scores_storage.get_game_results_ordered_by_date(limit=self.leaderboard_by_date.capacity)
+		)
+		return None
+
+	def refresh_game_results(self) -> None:
+		""" Adds to the leaderboards the results added to the storage by other game processes. In case the leaderboards
+		were not loaded yet, loads them.
+
+		:return: None
+		"""
+		if not self.is_leaderboards_loaded:
+			self.load_leaderboards()
+			return None
+		game_results_added_elsewhere: Optional[List[GameResult]] = \
+			self.high_scores_storage.get_game_results_added_elsewhere()
+		if game_results_added_elsewhere is None:
+			self.load_leaderboards()
+			return None
+		self.leaderboard_by_score.add_game_results(game_results_added_elsewhere)
+		self.leaderboard_by_date.add_game_results(game_results_added_elsewhere)
+		return None
 
 	@property
 	def game_results(self) -> List[GameResult]:
@@ -158,32 +755,65 @@ class HighScores:
 
 		:return: List[GameResult]
 		"""
-		logger.info(f"Current game results: {self._game_results}")
-		return self._game_results
+		game_results: List[GameResult] = self.high_scores_storage.get_high_scores()
+		logger.info("Current game results: %s", game_results)
+		return game_results
 
-	def get_game_results_ordered_by_score(self) -> List[GameResult]:
+	def get_game_results_ordered_by_score(self, limit: Optional[int] = None) -> List[GameResult]:
 		""" Will return game results ordered by cash profit at end of game in ascending order
 
+		:param limit: Optional - maximum amount of results to return, default: all results
 		:return: A list of all game results ordered by cash profit
 		"""
-		game_results_ordered_by_coins_earned: List[GameResult] = sorted(
-			self.game_results,
-			key=lambda game_result: game_result.coins_earned,
-			reverse=True
-		)
-		return game_results_ordered_by_coins_earned
+		if limit is not None and limit <= self.leaderboard_by_score.capacity:
+			if not self.is_leaderboards_loaded:
+				self.load_leaderboards()
+			return self.leaderboard_by_score.game_results[:limit]
+		return self.high_scores_storage.get_game_results_ordered_by_score(limit=limit)
 
-	def get_game_results_ordered_by_date(self) -> List[GameResult]:
+	def get_game_results_ordered_by_date(self, limit: Optional[int] = None) -> List[GameResult]:
 		""" Will return game results ordered by date games played in ascending order
 
+		:param limit: Optional - maximum amount of results to return, default: all results
 		:return: A list of all game results ordered by game dates
 		"""
-		game_results_ordered_by_date: List[GameResult] = sorted(
-			self.game_results,
-			key=lambda game_result: game_result.game_datetime,
-			reverse=True
-		)
-		return game_results_ordered_by_date
+		if limit is not None and limit <= self.leaderboard_by_date.capacity:
+			if not self.is_leaderboards_loaded:
+				self.load_leaderboards()
+			return self.leaderboard_by_date.game_results[:limit]
+		return self.high_scores_storage.get_game_results_ordered_by_date(limit=limit)
+
+	def get_amount_of_game_results(self) -> int:
+		""" Will return the amount of game results. In case all results fit in the leaderboards they are counted there,
+		else they are counted by the storage.
+
+		:return: int
+		"""
+		if not self.is_leaderboards_loaded:
+			self.load_leaderboards()
+		if len(self.leaderboard_by_score) < self.leaderboard_by_score.capacity:
+			return len(self.leaderboard_by_score)
+		return self.high_scores_storage.get_amount_of_game_results()
+
+	def get_page_of_game_results_ordered_by_score(self, page_number: int, page_size: int) -> List[GameResult]:
+		""" Will return a single page of the game results ordered by cash profit. Pages of the top results are read from
+		the leaderboard, and pages after them from the storage.
+
+		:param page_number: Number of the page, starting from 0
+		:param page_size: Amount of results in a page
+		:return: List[GameResult]
+		"""
+		return self.get_game_results_ordered_by_score(limit=(page_number + 1) * page_size)[page_number * page_size:]
+
+	def get_page_of_game_results_ordered_by_date(self, page_number: int, page_size: int) -> List[GameResult]:
+		""" Will return a single page of the game results ordered by game date. Pages of the newest results are read
+		from the leaderboard, and pages after them from the storage.
+
+		:param page_number: Number of the page, starting from 0
+		:param page_size: Amount of results in a page
+		:return: List[GameResult]
+		"""
+		return self.get_game_results_ordered_by_date(limit=(page_number + 1) * page_size)[page_number * page_size:]
 
 	def add_new_game_result(self, game_result: GameResult) -> None:
 		""" Will add a game result to the high-scores. Als will update the high scores file so the result will be shown
@@ -192,25 +822,18 @@ class HighScores:
 		:param game_result: A game result object
 		:return: None
 		"""
-		self._game_results.append(game_result)
-		self.update_game_results_file()
-		return None
-
-	def update_game_results_file(self) -> None:
-		""" Updates the game results in a physical file on the machine's volume so it will be kept for future games.
-
-		:return: None
-		"""
-		self.manage_high_scores_file_helper.update_high_scores_file(game_results_list=self._game_results)
+		self.refresh_game_results()
+		self.high_scores_storage.add_game_result(game_result=game_result)
+		self.leaderboard_by_score.add_game_result(game_result=game_result)
+		self.leaderboard_by_date.add_game_result(game_result=game_result)
 		return None
 
-	def get_game_results_from_file(self) -> None:
-		""" Will get the history of game scores from the file containing them.
-		File is kept at the computer volume
+	def close(self) -> None:
+		""" Will close the storage keeping the game results
 
 		:return: None
 		"""
-		self._game_results: List[GameResult] = self.manage_high_scores_file_helper.get_high_scores_from_file()
+		self.high_scores_storage.close()
 		return None
 
 	def reset_game_high_scores(self) -> None:
@@ -218,6 +841,8 @@ class HighScores:
 
 		:return: None
 		"""
-		self._game_results: List[GameResult] = []
-		self.update_game_results_file()
+		self.high_scores_storage.rewrite_high_scores(game_results_list=[])
+		self.leaderboard_by_score.reset()
+		self.leaderboard_by_date.reset()
+		self.is_leaderboards_loaded = True
 		return None
@@ -0,0 +1,134 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Coroutine, Any, TypeVar
+from input_handling.io_backend import get_io_backend
+from custom_exceptions.server_custom_exceptions import CustomExceptionSessionDisconnected, \
+	CustomExceptionSessionIdleTimeout
+
+
+"""
+Asynchronous input/output of a game session - used instead of input() and print() by games which are played over the
+network, so many sessions can wait for their players' input at the same time in a single thread.
+
+The terminal game plays the same asynchronous menus over IOBackendGameIO, which never waits for an event loop - so
+the menus are run synchronously to their end by run_synchronously().
+"""
+
+
+CoroutineResult = TypeVar("CoroutineResult")
+
+
+def run_synchronously(coroutine: Coroutine[Any, Any, CoroutineResult]) -> CoroutineResult:
+	""" Runs a coroutine which never waits for an event loop to its end - used to play the asynchronous game menus over
+	IOBackendGameIO, without starting an event loop
+
+	:param coroutine: The coroutine to run
+	:return: The result of the coroutine
+	"""
+	try:
+		coroutine.send(None)
+	except StopIteration as e:
+		return e.value
+	coroutine.close()
+	raise RuntimeError("The coroutine has waited for an event loop - it can't be run synchronously")
+
+
+class AsyncGameIO(ABC):
+	""" Base class for the input/output of an asynchronous game session """
+	@abstractmethod
+	async def read_line(self) -> str:
+		""" Waits for the next line of input from the player
+
+		:return: The line, without the line break
+		"""
+
+	@abstractmethod
+	def write_line(self, message: str = "") -> None:
+		""" Writes a line of output to the player. The output may be buffered until the next input is read.
+
+		:param message:
+		:return: None
+		"""
+
+	async def flush(self) -> None:
+		""" Waits until all the buffered output is sent to the player
+
+		:return: None
+		"""
+		return None
+
+
+class StreamGameIO(AsyncGameIO):
+	""" Input/output of a game session over an asyncio stream - a TCP connection of a telnet-style client """
+	def __init__(self,
+				 reader: asyncio.StreamReader,
+				 writer: asyncio.StreamWriter,
+				 idle_timeout_seconds: float):
+		"""
+
+		:param reader: The connection stream to read the player's input from
+		:param writer: The connection stream to write the output to
+		:param idle_timeout_seconds: Maximum time to wait for an input from the player
+		"""
+		self.reader: asyncio.StreamReader = reader
+		self.writer: asyncio.StreamWriter = writer
+		self.idle_timeout_seconds: float = idle_timeout_seconds
+
+	async def read_line(self) -> str:
+		""" Sends the buffered output, and waits for the next line of input from the player
+
+		:return: The line, without the line break
+		"""
+		await self.flush()
+		try:
+			line: bytes = await asyncio.wait_for(self.reader.readline(), timeout=self.idle_timeout_seconds)
+		except asyncio.TimeoutError:
+			raise CustomExceptionSessionIdleTimeout(f"No input for {self.idle_timeout_seconds} seconds")
+		if not line:
+			raise CustomExceptionSessionDisconnected("Player has disconnected")
+		return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+	def write_line(self, message: str = "") -> None:
+		""" Writes a line of output to the connection buffer. ( Telnet clients expect CRLF line breaks )
+
+		:param message:
+		:return: None
+		"""
+		self.writer.write(message.replace("\n", "\r\n").encode("utf-8") + b"\r\n")
+		return None
+
+	async def flush(self) -> None:
+		""" Waits until the connection buffer is sent - in case the player reads the output slowly
+
+		:return: None
+		"""
+		await self.writer.drain()
+		return None
+
+
+class IOBackendGameIO(AsyncGameIO):
+	""" Input/output of a game played through the game input/output backend ( the terminal by default ). Reading blocks
+	until the backend returns the next line, and never waits for an event loop. """
+	async def read_line(self) -> str:
+		""" Reads the next line of input from the backend
+
+		:return: The line, without the line break
+		"""
+		return get_io_backend().read_line()
+
+	def write_line(self, message: str = "") -> None:
+		""" Writes a line of output to the backend
+
+		:param message:
+		:return: None
+		"""
+		get_io_backend().write_line(message)
+		return None
+
+	async def flush(self) -> None:
+		""" Writes any output kept in memory by the backend
+
+		:return: None
+		"""
+		get_io_backend().flush()
+		return None
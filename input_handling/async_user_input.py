@@ -0,0 +1,136 @@
+from typing import List, Optional, Dict
+from input_handling.async_game_io import AsyncGameIO
+from input_handling.validators import ValidateUserInput
+from custom_exceptions.validator_custom_exceptions import ValidationExceptionInputNotInOptionsList, \
+	ValidationExceptionWrongNumericValue, ValidationExceptionInputNotNumeric, ValidateExceptionYesNoInputWrongValue, \
+	ValidateExceptionInputIsEmpty
+from input_handling.text_formatter import FormatOutput
+
+
+"""
+AsyncUserInput class used to accept user input of a game session played over the network
+"""
+
+
+class AsyncUserInput:
+	""" Used to get user input and validate it - the same prompts as UserInput, using an asynchronous game I/O """
+
+	def __init__(self, game_io: AsyncGameIO):
+		"""
+
+		:param game_io: The input/output of the game session
+		"""
+		self.game_io: AsyncGameIO = game_io
+
+	async def get_user_string_input(self,
+									prompt_message: str,
+									options_list: Optional[List[str]] = None,
+									is_none_allowed: bool = False,
+									is_case_sensitive: bool = True) -> str:
+		""" Will get a user string input.
+
+		:param prompt_message: The question to ask the user before accepting the input
+		:param options_list: Optional - a list of values which the input should be one of
+		:param is_none_allowed: Optional - can a null string be accepted, default: False
+		:param is_case_sensitive: Optional - allows to select an option without case-sensitivity, default: True
+		:return: input (str)
+		"""
+		while True:
+			self.game_io.write_line(
+				f"{prompt_message} {f'( Possible value: {options_list} )' if options_list is not None else ''}"
+			)
+			input_value: str = await self.game_io.read_line()
+			try:
+				if options_list is not None:
+					return ValidateUserInput.parse_string_from_options_list(input_value=input_value,
+																			options_list=options_list,
+																			is_case_sensitive=is_case_sensitive)
+				return ValidateUserInput.parse_string(input_value=input_value, is_none_allowed=is_none_allowed)
+			except ValidationExceptionInputNotInOptionsList:
+				self.game_io.write_line(f"Bad input. Value should be one of: {options_list}")
+			except ValidateExceptionInputIsEmpty:
+				self.game_io.write_line(f"Bad input. Value must not be empty! ")
+
+	async def get_user_numeric_input(self,
+									 prompt_message: str,
+									 options_list: Optional[List[int]] = None,
+									 min_value: Optional[int] = None,
+									 max_value: Optional[int] = None) -> int:
+		""" Will get a user numeric input.
+		Optional - specify a minimum or maximum value which the value should be between these
+
+		:param prompt_message: The question to ask the user before accepting the input
+		:param options_list: A list of possible values for the number ot be
+		:param min_value: Min value for the number
+		:param max_value: Max value for the number
+		:return: input (num)
+		"""
+		while True:
+			self.game_io.write_line(
+				f"{prompt_message} {f'( Possible value: {options_list} )' if options_list is not None else ''}"
+			)
+			input_value: str = await self.game_io.read_line()
+			try:
+				user_input: int = ValidateUserInput.parse_number(input_value=input_value,
+																 min_value=min_value,
+																 max_value=max_value)
+				if options_list is not None and user_input not in options_list:
+					raise ValidationExceptionInputNotInOptionsList
+				return user_input
+			except ValidationExceptionWrongNumericValue:
+				self.game_io.write_line(f"Bad input. Value should be "
+										f"{f'minimum {min_value}' if min_value is not None else ''} "
+										f"{'and' if min_value is not None and max_value is not None else ''} "
+										f"{f'maximum {max_value}' if max_value is not None else ''}")
+			except ValidationExceptionInputNotNumeric:
+				self.game_io.write_line(f"Bad input. Value needs to be numeric!")
+			except ValidationExceptionInputNotInOptionsList:
+				self.game_io.write_line(f"Bad input. Value should be one of: {options_list}")
+
+	async def get_user_number_input_for_menu(self, prompt_message: str, options_dict: Dict[int, str]) -> int:
+		""" Will get a numeric option from a set of predefined numbers with option. This will also show a small
+		description for each option.
+
+		:param prompt_message: The question to ask the user before accepting the input
+		:param options_dict: A dictionary (int, str) describing the options to choose - key should be the input number and
+		                     value should be a description for the option
+		:return: The selected option
+		"""
+		self.game_io.write_line(prompt_message)
+		for key, value in options_dict.items():
+			self.game_io.write_line(f"{key} - {value}")
+
+		options_list_text_formatted: str = FormatOutput.return_options_list_as_string(
+			options_list=list(options_dict.keys())
+		)
+		while True:
+			self.game_io.write_line(f"Choose a number: ( Possible value: {options_list_text_formatted} )")
+			input_value: str = await self.game_io.read_line()
+			try:
+				return ValidateUserInput.parse_int_from_options_list(input_value=input_value,
+																	 options_list=list(options_dict.keys()))
+			except ValidationExceptionInputNotInOptionsList:
+				self.game_io.write_line(f"Bad input. Value should be one of: {options_list_text_formatted}")
+			except ValidationExceptionInputNotNumeric:
+				self.game_io.write_line(f"Bad input. Value needs to be numeric!")
+
+	async def get_user_yes_no_input(self, prompt_message: str) -> bool:
+		""" Will get a yes/no input from the user and will return it as a boolean value.
+
+		Currently supported input options: yes, no, Yes, No, y, n, Y, N
+
+		:param prompt_message: The question to ask the user before accepting the input
+		:return: Boolean
+		"""
+		accepted_yes_values: List[str] = ["y", "Y", "Yes", "yes"]
+		accepted_no_values: List[str] = ["n", "N", "No", "no"]
+
+		self.game_io.write_line(f"{prompt_message} ({accepted_yes_values[0]}/{accepted_no_values[0]})")
+		while True:
+			input_value: str = await self.game_io.read_line()
+			try:
+				return ValidateUserInput.parse_yes_no(input_value=input_value,
+													  accepted_yes_values=accepted_yes_values,
+													  accepted_no_values=accepted_no_values)
+			except ValidateExceptionYesNoInputWrongValue as e:
+				self.game_io.write_line(str(e))
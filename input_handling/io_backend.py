@@ -0,0 +1,174 @@
+import contextlib
+import sys
+from abc import ABC, abstractmethod
+from typing import List, Iterable, Iterator, Optional, TextIO
+from custom_exceptions.validator_custom_exceptions import ValidationExceptionScriptHasEnded
+
+
+"""
+Input/output backends of the terminal game. UserInput, ValidateUserInput and the game messages read and write through
+the current backend instead of calling input() and print() directly:
+* TerminalIOBackend - interactive terminal, the default
+* BufferedIOBackend - reads from a stream, and collects the output in memory to write it in bulk
+* ScriptedIOBackend - reads a preloaded script of commands, used to replay a recorded game session at full speed
+"""
+
+
+class IOBackend(ABC):
+	""" Base class for the input/output of the game """
+	@abstractmethod
+	def read_line(self) -> str:
+		""" Reads the next line of input
+
+		:return: The line, without the line break
+		"""
+
+	@abstractmethod
+	def write_line(self, message: str = "") -> None:
+		""" Writes a line of output
+
+		:param message:
+		:return: None
+		"""
+
+	def flush(self) -> None:
+		""" Writes any output kept in memory
+
+		:return: None
+		"""
+		return None
+
+
+class TerminalIOBackend(IOBackend):
+	""" Interactive terminal - uses input() and print() """
+	def read_line(self) -> str:
+		return input()
+
+	def write_line(self, message: str = "") -> None:
+		print(message)
+		return None
+
+
+class BufferedIOBackend(IOBackend):
+	""" Reads lines from an input stream, and collects the output in memory - the output is written in bulk when
+	flushed, which is done before waiting for the next input. """
+	def __init__(self, input_stream: TextIO = sys.stdin, output_stream: Optional[TextIO] = sys.stdout):
+		"""
+
+		:param input_stream: Optional - stream to read the input from, default: standard input
+		:param output_stream: Optional - stream to write the output to, None to keep it in memory, default: standard
+							  output
+		"""
+		self.input_stream: TextIO = input_stream
+		self.output_stream: Optional[TextIO] = output_stream
+		self.output_lines: List[str] = []
+
+	def read_line(self) -> str:
+		""" Flushes the output, so the player can see the prompt, and reads the next line of input
+
+		:return: The line, without the line break
+		"""
+		self.flush()
+		line: str = self.input_stream.readline()
+		if not line:
+			raise EOFError("Input stream has ended")
+		return line.rstrip("\n")
+
+	def write_line(self, message: str = "") -> None:
+		self.output_lines.append(message)
+		return None
+
+	def flush(self) -> None:
+		""" Writes all output lines collected to the output stream at once. In case there is no output stream, the
+		lines are kept in memory.
+
+		:return: None
+		"""
+		if self.output_stream is None or not self.output_lines:
+			return None
+		self.output_stream.write("\n".join(self.output_lines) + "\n")
+		self.output_stream.flush()
+		self.output_lines = []
+		return None
+
+	def get_output(self) -> str:
+		""" Returns the output kept in memory
+
+		:return: str
+		"""
+		return "\n".join(self.output_lines)
+
+
+class ScriptedIOBackend(BufferedIOBackend):
+	""" Reads the input from a preloaded script of commands, without waiting. The output is kept in memory, unless an
+	output stream is given. """
+	def __init__(self, commands: Iterable[str], output_stream: Optional[TextIO] = None):
+		"""
+
+		:param commands: The input lines, in the order they will be read
+		:param output_stream: Optional - stream to write the output to, default: keep the output in memory
+		"""
+		super().__init__(input_stream=sys.stdin, output_stream=output_stream)
+		self.commands: Iterator[str] = iter(commands)
+
+	@classmethod
+	def from_file(cls, script_file_path: str, output_stream: Optional[TextIO] = None) -> "ScriptedIOBackend":
+		""" Creates a scripted backend reading the commands from a file - a command per line
+
+		:param script_file_path:
+		:param output_stream: Optional - stream to write the output to, default: keep the output in memory
+		:return: ScriptedIOBackend
+		"""
+		with open(script_file_path, "r", encoding="utf-8") as script_file:
+			commands: List[str] = script_file.read().splitlines()
+		return cls(commands=commands, output_stream=output_stream)
+
+	def read_line(self) -> str:
+		""" Returns the next command of the script
+
+		:return: str
+		"""
+		try:
+			return next(self.commands)
+		except StopIteration:
+			self.flush()
+			raise ValidationExceptionScriptHasEnded("No more commands left in the script")
+
+
+# The backend used by the game - terminal unless replaced
+_current_io_backend: IOBackend = TerminalIOBackend()
+
+
+def get_io_backend() -> IOBackend:
+	""" Returns the input/output backend used by the game
+
+	:return: IOBackend
+	"""
+	return _current_io_backend
+
+
+def set_io_backend(io_backend: IOBackend) -> None:
+	""" Replaces the input/output backend used by the game
+
+	:param io_backend:
+	:return: None
+	"""
+	global _current_io_backend
+	_current_io_backend = io_backend
+	return None
+
+
+@contextlib.contextmanager
+def use_io_backend(io_backend: IOBackend) -> Iterator[IOBackend]:
+	""" Uses an input/output backend inside a with block, and restores the former backend after it
+
+	:param io_backend:
+	:return: Context manager - returning the backend
+	"""
+	former_io_backend: IOBackend = get_io_backend()
+	set_io_backend(io_backend=io_backend)
+	try:
+		yield io_backend
+	finally:
+		io_backend.flush()
+		set_io_backend(io_backend=former_io_backend)
@@ -1,8 +1,11 @@
-from typing import List, Union
+from typing import List, Dict, Union
 
 
 """
 Includes methods for formatting text to nice output strings. The formatted output will be shown to the player
+
+Tables are formatted with tabulate. Importing tabulate takes a noticeable part of the game start time, and tables are
+shown only after the game started - so it is imported on first use, by format_table(), and not when the game starts.
 """
 
 
@@ -21,3 +24,13 @@ class FormatOutput:
 		"""
 		options_list_str_formatted: List[str] = [str(option) for option in options_list]
 		return ", ".join(options_list_str_formatted)
+
+	@staticmethod
+	def format_table(tabular_data: List[Dict]) -> str:
+		""" Will return a table of the given rows, with the keys of the rows as the table headers
+
+		:param tabular_data: Rows of the table, all with the same keys
+		:return: The table as a string
+		"""
+		from tabulate import tabulate
+		return tabulate(tabular_data=tabular_data, headers="keys")
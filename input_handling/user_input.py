@@ -4,10 +4,11 @@ from custom_exceptions.validator_custom_exceptions import ValidationExceptionInp
 	ValidationExceptionWrongNumericValue, ValidationExceptionInputNotNumeric, ValidateExceptionYesNoInputWrongValue, \
 	ValidateExceptionInputIsEmpty
 from input_handling.text_formatter import FormatOutput
+from input_handling.io_backend import get_io_backend
 
 
 """
-UserInput class used to accept user input from terminal
+UserInput class used to accept user input from terminal ( or from the input/output backend replacing it )
 """
 
 
@@ -32,7 +33,9 @@ class UserInput:
 		:return: input (str)
 		"""
 		while True:
-			print(prompt_message, f"( Possible value: {options_list} )" if options_list is not None else "")
+			get_io_backend().write_line(
+				f"{prompt_message} {f'( Possible value: {options_list} )' if options_list is not None else ''}"
+			)
 			try:
 				if options_list is not None:
 					user_input: str = ValidateUserInput.input_string_from_options_list(
@@ -43,9 +46,9 @@ class UserInput:
 					user_input: str = ValidateUserInput.input_string(is_none_allowed=is_none_allowed)
 				return user_input
 			except ValidationExceptionInputNotInOptionsList:
-				print(f"Bad input. Value should be one of: {options_list}")
+				get_io_backend().write_line(f"Bad input. Value should be one of: {options_list}")
 			except ValidateExceptionInputIsEmpty:
-				print(f"Bad input. Value must not be empty! ")
+				get_io_backend().write_line(f"Bad input. Value must not be empty! ")
 
 	@staticmethod
 	def get_user_numeric_input(prompt_message: str,
@@ -62,7 +65,9 @@ class UserInput:
 		:return: input (num)
 		"""
 		while True:
-			print(prompt_message, f"( Possible value: {options_list} )" if options_list is not None else "")
+			get_io_backend().write_line(
+				f"{prompt_message} {f'( Possible value: {options_list} )' if options_list is not None else ''}"
+			)
 			try:
 				user_input: int = ValidateUserInput.get_input_number(min_value=min_value, max_value=max_value)
 				if options_list is not None:
@@ -70,14 +75,14 @@ class UserInput:
 						raise ValidationExceptionInputNotInOptionsList
 				return user_input
 			except ValidationExceptionWrongNumericValue:
-				print(f"Bad input. Value should be "
-					  f"{f'minimum {min_value}' if min_value is not None else ''} "
-					  f"{'and' if min_value is not None and max_value is not None else ''} "
-					  f"{f'maximum {max_value}' if max_value is not None else ''}")
+				get_io_backend().write_line(f"Bad input. Value should be "
+											f"{f'minimum {min_value}' if min_value is not None else ''} "
+											f"{'and' if min_value is not None and max_value is not None else ''} "
+											f"{f'maximum {max_value}' if max_value is not None else ''}")
 			except ValidationExceptionInputNotNumeric:
-				print(f"Bad input. Value needs to be numeric!")
+				get_io_backend().write_line(f"Bad input. Value needs to be numeric!")
 			except ValidationExceptionInputNotInOptionsList:
-				print(f"Bad input. Value should be one of: {options_list}")
+				get_io_backend().write_line(f"Bad input. Value should be one of: {options_list}")
 
 	@staticmethod
 	def get_user_number_input_for_menu(prompt_message: str, options_dict: Dict[int, str]) -> int:
@@ -89,23 +94,23 @@ class UserInput:
 		                     value should be a description for the option
 		:return: The selected option
 		"""
-		print(prompt_message)
+		get_io_backend().write_line(prompt_message)
 		for key, value in options_dict.items():
-			print(f"{key} - {value}")
+			get_io_backend().write_line(f"{key} - {value}")
 
 		while True:
 			options_list_text_formatted: str = FormatOutput.return_options_list_as_string(
 				options_list=list(options_dict.keys())
 			)
-			print(f"Choose a number: ( Possible value: {options_list_text_formatted} )")
+			get_io_backend().write_line(f"Choose a number: ( Possible value: {options_list_text_formatted} )")
 			try:
 				user_input: int = ValidateUserInput.input_int_from_options_list(
 					options_list=[key for key in options_dict.keys()])
 				return user_input
 			except ValidationExceptionInputNotInOptionsList:
-				print(f"Bad input. Value should be one of: {options_list_text_formatted}")
+				get_io_backend().write_line(f"Bad input. Value should be one of: {options_list_text_formatted}")
 			except ValidationExceptionInputNotNumeric:
-				print(f"Bad input. Value needs to be numeric!")
+				get_io_backend().write_line(f"Bad input. Value needs to be numeric!")
 
 	@staticmethod
 	def get_user_yes_no_input(prompt_message: str) -> bool:
@@ -119,11 +124,11 @@ class UserInput:
 		accepted_yes_values: List[str] = ["y", "Y", "Yes", "yes"]
 		accepted_no_values: List[str] = ["n", "N", "No", "no"]
 
-		print(prompt_message, f"({accepted_yes_values[0]}/{accepted_no_values[0]})")
+		get_io_backend().write_line(f"{prompt_message} ({accepted_yes_values[0]}/{accepted_no_values[0]})")
 		while True:
 			try:
 				user_input: bool = ValidateUserInput.input_yes_no(accepted_yes_values=accepted_yes_values,
 																  accepted_no_values=accepted_no_values)
 				return user_input
 			except ValidateExceptionYesNoInputWrongValue as e:
-				print(e)
+				get_io_backend().write_line(str(e))
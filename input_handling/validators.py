@@ -3,6 +3,7 @@ from custom_exceptions.validator_custom_exceptions import ValidationExceptionWro
 	ValidationExceptionInputNotNumeric, ValidationExceptionInputNotInOptionsList, \
 	ValidateExceptionYesNoInputWrongValue, ValidateExceptionInputIsEmpty
 from input_handling.text_formatter import FormatOutput
+from input_handling.io_backend import get_io_backend
 
 
 """
@@ -18,10 +19,23 @@ class ValidateUserInput:
 
 		Optional - a min or max value can be specified
 
+		:return: input as number (int) , in case input is illegal - an exception will be thrown
+		"""
+		return ValidateUserInput.parse_number(input_value=get_io_backend().read_line(),
+											  min_value=min_value,
+											  max_value=max_value)
+
+	@staticmethod
+	def parse_number(input_value: str, min_value: Optional[int] = None, max_value: Optional[int] = None) -> int:
+		""" Validates a numeric input given as a string.
+
+		Optional - a min or max value can be specified
+
+		:param input_value: The input given by the user
 		:return: input as number (int) , in case input is illegal - an exception will be thrown
 		"""
 		try:
-			input_casted_to_int: int = int(input())
+			input_casted_to_int: int = int(input_value)
 		except ValueError:
 			raise ValidationExceptionInputNotNumeric("Wrong input - input not numeric!")
 		if min_value is not None:
@@ -39,7 +53,16 @@ class ValidateUserInput:
 		:param is_none_allowed: Optional - can a null string be accepted, default: False
 		:return: input (str) , in case is_none_allows=True and input is empty - an exception will be raised
 		"""
-		input_value: str = input()
+		return ValidateUserInput.parse_string(input_value=get_io_backend().read_line(), is_none_allowed=is_none_allowed)
+
+	@staticmethod
+	def parse_string(input_value: str, is_none_allowed: bool = False) -> str:
+		""" Validates a string input - checks it is not empty in case it is not allowed.
+
+		:param input_value: The input given by the user
+		:param is_none_allowed: Optional - can a null string be accepted, default: False
+		:return: input (str) , in case is_none_allows=True and input is empty - an exception will be raised
+		"""
 		if not is_none_allowed and input_value == "":
 			raise ValidateExceptionInputIsEmpty("Input value must not be null!")
 		return input_value
@@ -52,7 +75,19 @@ class ValidateUserInput:
 		:param is_case_sensitive: Optional - allows to select an option without case-sensitivity, default: True
 		:return: input (str) , in case the input is not one of the options - an exception will raise
 		"""
-		input_value: str = input()
+		return ValidateUserInput.parse_string_from_options_list(input_value=get_io_backend().read_line(),
+																options_list=options_list,
+																is_case_sensitive=is_case_sensitive)
+
+	@staticmethod
+	def parse_string_from_options_list(input_value: str, options_list: List[str], is_case_sensitive: bool = True) -> str:
+		""" Checks if a string input is one of the given options
+
+		:param input_value: The input given by the user
+		:param options_list: A list of options (str) which can be the input
+		:param is_case_sensitive: Optional - allows to select an option without case-sensitivity, default: True
+		:return: input (str) , in case the input is not one of the options - an exception will raise
+		"""
 		try:
 			if not is_case_sensitive:
 				return next((option for option in options_list if input_value.casefold() == option.casefold()))
@@ -71,11 +106,22 @@ class ValidateUserInput:
 		:param options_list: A list of options (int) which can be the input
 		:return: input (int) , in case the input is not one of the options - an exception will raise
 		"""
-		input_value: int = ValidateUserInput.get_input_number()
-		if input_value in options_list:
-			return input_value
+		return ValidateUserInput.parse_int_from_options_list(input_value=get_io_backend().read_line(),
+															 options_list=options_list)
+
+	@staticmethod
+	def parse_int_from_options_list(input_value: str, options_list: List[int]) -> int:
+		""" Checks if a numeric input given as a string is one of the given options
+
+		:param input_value: The input given by the user
+		:param options_list: A list of options (int) which can be the input
+		:return: input (int) , in case the input is not one of the options - an exception will raise
+		"""
+		input_number: int = ValidateUserInput.parse_number(input_value=input_value)
+		if input_number in options_list:
+			return input_number
 		else:
-			raise ValidationExceptionInputNotInOptionsList(f"Input given {input_value} "
+			raise ValidationExceptionInputNotInOptionsList(f"Input given {input_number} "
 														   f"is not in the options list: {options_list}")
 
 	@staticmethod
@@ -88,7 +134,21 @@ class ValidateUserInput:
 						   accepted no list of values.
 						   In case value is different from both lists - an exception will raise
 		"""
-		input_value: str = input()
+		return ValidateUserInput.parse_yes_no(input_value=get_io_backend().read_line(),
+											  accepted_yes_values=accepted_yes_values,
+											  accepted_no_values=accepted_no_values)
+
+	@staticmethod
+	def parse_yes_no(input_value: str, accepted_yes_values: List[str], accepted_no_values: List[str]) -> bool:
+		""" Checks if a yes/no input given as a string is one of the accepted values, and returns it as a boolean value.
+
+		:param input_value: The input given by the user
+		:param accepted_yes_values: A list of value which will be accepted as yes
+		:param accepted_no_values: A list of value which will be accepted as no
+		:return: Boolean - true in case input is in the accepted yes list of values, false in case input is in the
+						   accepted no list of values.
+						   In case value is different from both lists - an exception will raise
+		"""
 		if input_value in accepted_yes_values:
 			return True
 		elif input_value in accepted_no_values:
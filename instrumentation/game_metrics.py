@@ -0,0 +1,263 @@
+import cProfile
+import json
+import time
+from array import array
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
+from classes.game_engine import GameEngine
+from classes.player import PlayersTransaction
+from classes.city_prices import ProductsPricesInAllCities
+from classes.city_prices_vectorized import ProductsPricesInAllCitiesVectorized
+from highscores.manage_high_scores_file import HighScores
+
+
+"""
+Opt-in instrumentation of the game - counts the game operations ( buy, sell, sail, day rollover, high score write ... )
+and measures their latency.
+
+Instrumentation is disabled by default, and then it costs nothing - the game classes are not changed at all. Enabling
+it replaces the instrumented methods on their classes with wrappers which time every call, and disabling it puts the
+original methods back. For example:
+	game_metrics: GameMetrics = enable_instrumentation()
+	... play ...
+	game_metrics.export_to_json_file(metrics_file_path="/tmp/metrics.json")
+	disable_instrumentation()
+
+profile_to_file() runs a whole session under cProfile, and writes the stats to a file which can be read with pstats.
+"""
+
+
+AMOUNT_OF_LATENCY_BUCKETS: int = 40
+
+# Instrumented methods - class, method name and the operation name the calls are counted under
+INSTRUMENTED_METHODS: List[Tuple[type, str, str]] = [
+	(PlayersTransaction, "buy_product", "buy"),
+	(PlayersTransaction, "sell_product", "sell"),
+	(GameEngine, "sail_to_city", "sail"),
+	(GameEngine, "fix_ship", "fix_ship"),
+	(GameEngine, "upgrade_ship", "upgrade_ship"),
+	(GameEngine, "move_to_next_day", "day_rollover"),
+	(ProductsPricesInAllCities, "generate_prices_for_all_cities", "generate_prices"),
+	(ProductsPricesInAllCitiesVectorized, "generate_prices_for_all_cities", "generate_prices"),
+	(HighScores, "add_new_game_result", "high_score_write"),
+	(HighScores, "load_leaderboards", "high_scores_load"),
+]
+
+
+class LatencyHistogram:
+	""" Histogram of the latencies of an operation. Latencies are counted in buckets by powers of 2 microseconds - bucket
+	0 counts latencies below 1 microsecond, and bucket i counts latencies from 2^(i-1) up to 2^i microseconds. """
+	def __init__(self):
+		self.buckets: array = array("Q", [0]) * AMOUNT_OF_LATENCY_BUCKETS
+		self.count: int = 0
+		self.total_seconds: float = 0.0
+		self.min_seconds: Optional[float] = None
+		self.max_seconds: float = 0.0
+
+	def record(self, seconds: float) -> None:
+		""" Adds a latency to the histogram
+
+		:param seconds:
+		:return: None
+		"""
+		self.buckets[min(int(seconds * 1000000).bit_length(), AMOUNT_OF_LATENCY_BUCKETS - 1)] += 1
+		self.count += 1
+		self.total_seconds += seconds
+		if self.min_seconds is None or seconds < self.min_seconds:
+			self.min_seconds = seconds
+		if seconds > self.max_seconds:
+			self.max_seconds = seconds
+		return None
+
+	def get_percentile_seconds(self, percentile: float) -> float:
+		""" Returns an estimate of a latency percentile - the upper limit of the bucket the percentile is in
+
+		:param percentile: Between 0 to 100
+		:return: float
+		"""
+		if self.count == 0:
+			return 0.0
+		latencies_counted: int = 0
+		for bucket_index, bucket_count in enumerate(self.buckets):
+			latencies_counted += bucket_count
+			if latencies_counted * 100 >= percentile * self.count:
+				return min(2 ** bucket_index / 1000000, self.max_seconds)
+		return self.max_seconds
+
+	def get_histogram_as_dict(self) -> Dict[str, Union[int, float, Dict[str, int]]]:
+		""" Returns the histogram summary, and the counts of the not empty buckets keyed by their upper limit
+
+		:return: Dict
+		"""
+		return {
+			"count": self.count,
+			"total_seconds": self.total_seconds,
+			"mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+			"min_seconds": self.min_seconds or 0.0,
+			"max_seconds": self.max_seconds,
+			"p50_seconds": self.get_percentile_seconds(percentile=50),
+			"p90_seconds": self.get_percentile_seconds(percentile=90),
+			"p99_seconds": self.get_percentile_seconds(percentile=99),
+			"buckets_microseconds": {f"<{2 ** bucket_index}": bucket_count
+									 for bucket_index, bucket_count in enumerate(self.buckets) if bucket_count},
+		}
+
+
+class GameMetrics:
+	""" Counters and latency histograms of the game operations """
+	def __init__(self):
+		self.counters: Dict[str, int] = {}
+		self.latencies: Dict[str, LatencyHistogram] = {}
+
+	def increment_counter(self, counter_name: str, amount: int = 1) -> None:
+		""" Adds to a counter
+
+		:param counter_name:
+		:param amount: Optional - amount to add, default: 1
+		:return: None
+		"""
+		self.counters[counter_name] = self.counters.get(counter_name, 0) + amount
+		return None
+
+	def record_latency(self, operation_name: str, seconds: float) -> None:
+		""" Adds a latency of an operation
+
+		:param operation_name:
+		:param seconds:
+		:return: None
+		"""
+		latency_histogram: Optional[LatencyHistogram] = self.latencies.get(operation_name)
+		if latency_histogram is None:
+			latency_histogram = self.latencies[operation_name] = LatencyHistogram()
+		latency_histogram.record(seconds=seconds)
+		return None
+
+	def get_metrics_as_dict(self) -> Dict[str, Dict[str, Any]]:
+		""" Returns all counters and latencies
+
+		:return: Dict
+		"""
+		return {
+			"counters": dict(self.counters),
+			"latencies": {operation_name: latency_histogram.get_histogram_as_dict()
+						  for operation_name, latency_histogram in self.latencies.items()},
+		}
+
+	def export_to_json_file(self, metrics_file_path: str) -> None:
+		""" Writes all counters and latencies to a JSON file
+
+		:param metrics_file_path:
+		:return: None
+		"""
+		with open(metrics_file_path, "w", encoding="utf-8") as metrics_file:
+			json.dump(self.get_metrics_as_dict(), metrics_file, indent=4)
+		return None
+
+
+def instrument_method(method: Callable, operation_name: str, game_metrics: GameMetrics) -> Callable:
+	""" Wraps a method, so every call is counted and timed. Calls which raise an exception are also counted under
+	"<operation name>_failed".
+
+	:param method: The original method
+	:param operation_name: Name to count the calls under
+	:param game_metrics: Metrics to count the calls at
+	:return: The wrapped method
+	"""
+	failed_counter_name: str = f"{operation_name}_failed"
+
+	@wraps(method)
+	def instrumented_method(*args, **kwargs):
+		start_time: float = time.perf_counter()
+		try:
+			return method(*args, **kwargs)
+		except Exception:
+			game_metrics.increment_counter(counter_name=failed_counter_name)
+			raise
+		finally:
+			game_metrics.record_latency(operation_name=operation_name, seconds=time.perf_counter() - start_time)
+			game_metrics.increment_counter(counter_name=operation_name)
+	return instrumented_method
+
+
+_current_game_metrics: Optional[GameMetrics] = None
+_original_methods: List[Tuple[type, str, Callable]] = []
+
+
+def enable_instrumentation() -> GameMetrics:
+	""" Starts counting and timing the game operations. Does nothing in case instrumentation is already enabled.
+
+	:return: The metrics the operations are counted at
+	"""
+	global _current_game_metrics
+	if _current_game_metrics is not None:
+		return _current_game_metrics
+
+	game_metrics = GameMetrics()
+	for instrumented_class, method_name, operation_name in INSTRUMENTED_METHODS:
+		original_method: Callable = instrumented_class.__dict__[method_name]
+		_original_methods.append((instrumented_class, method_name, original_method))
+		setattr(instrumented_class, method_name, instrument_method(method=original_method,
+																   operation_name=operation_name,
+																   game_metrics=game_metrics))
+	_current_game_metrics = game_metrics
+	return game_metrics
+
+
+def disable_instrumentation() -> Optional[GameMetrics]:
+	""" Stops counting and timing the game operations, putting the original methods back
+
+	:return: The metrics counted while instrumentation was enabled, None in case it was not enabled
+	"""
+	global _current_game_metrics
+	while _original_methods:
+		instrumented_class, method_name, original_method = _original_methods.pop()
+		setattr(instrumented_class, method_name, original_method)
+	game_metrics: Optional[GameMetrics] = _current_game_metrics
+	_current_game_metrics = None
+	return game_metrics
+
+
+def get_game_metrics() -> Optional[GameMetrics]:
+	""" Returns the metrics of the game operations
+
+	:return: GameMetrics, None in case instrumentation is disabled
+	"""
+	return _current_game_metrics
+
+
+def profile_to_file(function: Callable[[], Any], profile_stats_file_path: str) -> Any:
+	""" Runs a function under cProfile, and writes the profile stats to a file. The file can be read with pstats, for
+	example: python -m pstats <file>
+
+	:param function: Function to profile, for example a whole game session
+	:param profile_stats_file_path:
+	:return: What the function returned
+	"""
+	profiler = cProfile.Profile()
+	try:
+		return profiler.runcall(function)
+	finally:
+		profiler.dump_stats(profile_stats_file_path)
+
+
+def run_instrumented_session(session: Callable[[], Any],
+							 metrics_file_path: Optional[str] = None,
+							 profile_stats_file_path: Optional[str] = None) -> Any:
+	""" Runs a game session, optionally counting its operations and profiling it
+
+	:param session: Function running the session, for example main()
+	:param metrics_file_path: Optional - in case given, the operations are counted and timed, and written to this
+							  JSON file when the session ends
+	:param profile_stats_file_path: Optional - in case given, the session runs under cProfile, and the stats are
+									written to this file when the session ends
+	:return: What the session returned
+	"""
+	if metrics_file_path is not None:
+		enable_instrumentation()
+	try:
+		if profile_stats_file_path is not None:
+			return profile_to_file(function=session, profile_stats_file_path=profile_stats_file_path)
+		return session()
+	finally:
+		if metrics_file_path is not None:
+			disable_instrumentation().export_to_json_file(metrics_file_path=metrics_file_path)
@@ -1,31 +1,102 @@
-import logging
+import atexit
 import json
-from constants import GAME_LOGS_FILE_PATH
+import logging
+import logging.handlers
+import queue
+from datetime import datetime
+from typing import Optional, Dict, Union
+from constants import GAME_LOGS_FILE_PATH, GAME_LOGS_LEVEL
 
 """
 Defines a logger configurations for the game
+
+Log records are written as JSON lines - a single JSON object per line. Loggers don't write to the logs file themselves,
+they put the records on a queue and a QueueListener thread formats them and writes them to the file. This way the game
+loop never waits for the disk.
+
+Log messages should be formatted lazily, so records of disabled levels cost nothing to create -
+    logger.debug("Changed player budget is %s", budget)  # and not logger.debug(f"Changed player budget is {budget}")
 """
 
 
-def configure_logger():
-	""" Will configure the logging module to use a JSON customized logging
+class JsonLinesFormatter(logging.Formatter):
+	""" Formats a log record as a single line JSON object """
+	def __init__(self, datefmt: str = "%Y-%m-%d %H:%M:%S"):
+		"""
 
-	:return: None
-	"""
-	logger_format: str = json.dumps(
-		{
-			"module_name": "%(name)s",
-			"date": "%(asctime)s",
-			"log_level": "%(levelname)s",
-			"message": "%(message)s"
+		:param datefmt: Optional - format of the record date, default: "%Y-%m-%d %H:%M:%S"
+		"""
+		super().__init__(datefmt=datefmt)
+
+	def format(self, record: logging.LogRecord) -> str:
+		""" Returns the log record as a JSON line - quotes, new lines and other special characters in the message are
+		escaped by the JSON encoder, so every line is always a valid JSON object
+
+		:param record: A log record
+		:return: str
+		"""
+		log_line: Dict[str, str] = {
+			"module_name": record.name,
+			"date": datetime.fromtimestamp(record.created).strftime(self.datefmt),
+			"log_level": record.levelname,
+			"message": record.getMessage(),
 		}
-	)
+		if record.exc_info:
+			log_line["exception"] = self.formatException(record.exc_info)
+		return json.dumps(log_line)
+
+
+_logs_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logger(log_file_path: str = GAME_LOGS_FILE_PATH,
+					 log_level: Union[int, str] = GAME_LOGS_LEVEL) -> logging.handlers.QueueListener:
+	""" Will configure the logging module to write JSON lines logs to a file, using a background thread.
+
+	Calling it again replaces the previous configuration.
 
-	logging.basicConfig(
-		filename=GAME_LOGS_FILE_PATH,
-		format=logger_format,
-		level=logging.INFO,
-		datefmt="%Y-%m-%d %H:%M:%S",
-	)
+	:param log_file_path: Optional - path of the logs file, default: GAME_LOGS_FILE_PATH
+	:param log_level: Optional - minimum level of logs to write, default: GAME_LOGS_LEVEL
+	:return: The started queue listener, which writes the records to the file
+	"""
+	stop_logger()
+
+	file_handler = logging.FileHandler(filename=log_file_path)
+	file_handler.setFormatter(JsonLinesFormatter())
+
+	logs_queue: queue.SimpleQueue = queue.SimpleQueue()
+	queue_listener = logging.handlers.QueueListener(logs_queue, file_handler)
+
+	root_logger: logging.Logger = logging.getLogger()
+	root_logger.setLevel(log_level)
+	root_logger.addHandler(logging.handlers.QueueHandler(logs_queue))
+
+	global _logs_queue_listener
+	_logs_queue_listener = queue_listener
+	queue_listener.start()
+	return queue_listener
+
+
+def stop_logger() -> None:
+	""" Writes all waiting log records to the logs file and stops the background thread. Called on exit.
 
+	Does nothing in case the logger was not configured.
+
+	:return: None
+	"""
+	global _logs_queue_listener
+	if _logs_queue_listener is None:
+		return None
+
+	root_logger: logging.Logger = logging.getLogger()
+	for handler in list(root_logger.handlers):
+		if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is _logs_queue_listener.queue:
+			root_logger.removeHandler(handler)
+	_logs_queue_listener.stop()  # Writes the records left in the queue before stopping
+	for handler in _logs_queue_listener.handlers:
+		handler.close()
+	_logs_queue_listener = None
 	return None
+
+
+atexit.register(stop_logger)
@@ -1,3 +1,4 @@
+import argparse
 import logging
 from classes.game import Game
 from input_handling.user_input import UserInput
@@ -6,6 +7,7 @@ from highscores.game_result import GameResult
 from game_menus.manage_highscores_menu import HighScoresMenu
 from game_menus.into_message import print_game_intro
 from logger.custom_logger import configure_logger
+from instrumentation.game_metrics import run_instrumented_session
 
 
 logger = logging.getLogger(__name__)
@@ -22,33 +24,45 @@ def main():
 	game_high_scores = HighScores()
 	high_scores_menu = HighScoresMenu(high_scores=game_high_scores)
 
-	while True:
-		menu_option_chosen: int = UserInput.get_user_number_input_for_menu(
-			prompt_message="Choose an option from these: ",
-			options_dict={
-				1: "Start game",
-				2: "High scores",
-				3: "Exit",
-			}
-		)
-		if menu_option_chosen == 1:
-			player_name: str = UserInput.get_user_string_input(prompt_message="Please enter your name:",
-															   is_none_allowed=False)
-			game = Game(player_name=player_name)
-			game.start_game()
-
-			# Get game results - and save them
-			game_result: GameResult = game.game_results
-			logger.info(f"Finished a game - with results: {game_result}")
-			game_high_scores.add_new_game_result(game_result=game_result)
-		elif menu_option_chosen == 2:
-			high_scores_menu.manage_high_scores_menu()
-		elif menu_option_chosen == 3:
-			break
+	try:
+		while True:
+			menu_option_chosen: int = UserInput.get_user_number_input_for_menu(
+				prompt_message="Choose an option from these: ",
+				options_dict={
+					1: "Start game",
+					2: "High scores",
+					3: "Exit",
+				}
+			)
+			if menu_option_chosen == 1:
+				player_name: str = UserInput.get_user_string_input(prompt_message="Please enter your name:",
+																   is_none_allowed=False)
+				game = Game(player_name=player_name)
+				game.start_game()
+
+				# Get game results - and save them
+				game_result: GameResult = game.game_results
+				logger.info("Finished a game - with results: %s", game_result)
+				game_high_scores.add_new_game_result(game_result=game_result)
+			elif menu_option_chosen == 2:
+				high_scores_menu.manage_high_scores_menu()
+			elif menu_option_chosen == 3:
+				break
+	finally:
+		game_high_scores.close()
 
 	return None
 
 
 if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Play Sea Trader")
+	parser.add_argument("--metrics-output", default=None,
+						help="Count and time the game operations, and write them to this JSON file on exit")
+	parser.add_argument("--profile-output", default=None,
+						help="Run the game under cProfile, and write the stats to this file on exit")
+	arguments = parser.parse_args()
+
 	configure_logger()
-	main()
+	run_instrumented_session(session=main,
+							 metrics_file_path=arguments.metrics_output,
+							 profile_stats_file_path=arguments.profile_output)
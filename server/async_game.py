@@ -0,0 +1,20 @@
+from classes.game import GameMenus
+
+"""
+Defines "AsyncGame" object - a game of Sea Trader played over the network.
+
+AsyncGame plays the same menus as Game ( see classes/game.py ), but the player's choices are awaited from the
+connection instead of blocking on the terminal - so a single thread can run the games of many connected players.
+"""
+
+
+class AsyncGame(GameMenus):
+	""" Represents a game of Sea Trader played over the network, including the player and world status"""
+
+	async def start_game(self) -> None:
+		""" Will start a game and manage it until the end
+
+		:return: None
+		"""
+		await self.play_game()
+		return None
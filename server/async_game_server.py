@@ -0,0 +1,202 @@
+import argparse
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Callable, TypeVar
+from highscores.manage_high_scores_file import HighScores
+from highscores.game_result import GameResult
+from input_handling.async_game_io import StreamGameIO
+from input_handling.async_user_input import AsyncUserInput
+from input_handling.text_formatter import FormatOutput
+from server.async_game import AsyncGame
+from custom_exceptions.server_custom_exceptions import CustomExceptionSessionDisconnected, \
+	CustomExceptionSessionIdleTimeout
+from logger.custom_logger import configure_logger
+from instrumentation.game_metrics import run_instrumented_session
+from constants import GAME_SERVER_HOST, GAME_SERVER_PORT, GAME_SERVER_SESSION_IDLE_TIMEOUT_SECONDS, \
+	HIGH_SCORES_MENU_PAGE_SIZE
+
+
+logger = logging.getLogger(__name__)
+
+
+HighScoresOperationResult = TypeVar("HighScoresOperationResult")
+
+
+"""
+Hosts many simultaneous Sea Trader sessions from a single process.
+
+Every TCP connection gets its own game. All sessions run as asyncio tasks in a single thread - a session waiting for
+its player's input costs only its game objects, so the server can hold thousands of idle sessions. The high scores are
+read and written in a separate thread, so a session saving its result doesn't stop the other sessions.
+
+Run from the repository root, and connect with a telnet-style client, for example:
+	python -m server.async_game_server --port 2323
+	telnet 127.0.0.1 2323
+"""
+
+
+class AsyncGameServer:
+	""" TCP server hosting a game session for every connection """
+	def __init__(self,
+				 host: str = GAME_SERVER_HOST,
+				 port: int = GAME_SERVER_PORT,
+				 high_scores: Optional[HighScores] = None,
+				 idle_timeout_seconds: float = GAME_SERVER_SESSION_IDLE_TIMEOUT_SECONDS):
+		"""
+
+		:param host: Optional - address to listen on
+		:param port: Optional - port to listen on, 0 to choose a free port
+		:param high_scores: Optional - high scores table shared by all sessions, default: the game high scores
+		:param idle_timeout_seconds: Optional - disconnect players who didn't send any input for this time
+		"""
+		self.host: str = host
+		self.port: int = port
+		self.high_scores: HighScores = high_scores or HighScores()
+		self.idle_timeout_seconds: float = idle_timeout_seconds
+		self.amount_of_connected_sessions: int = 0
+		self.server: Optional[asyncio.AbstractServer] = None
+		# The high scores storage reads and writes files - its operations run one at a time in this thread
+		self.high_scores_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1,
+																		   thread_name_prefix="high-scores")
+
+	async def run_high_scores_operation(self,
+										operation: Callable[[], HighScoresOperationResult]) -> HighScoresOperationResult:
+		""" Runs an operation of the high scores in the high scores thread, and waits for it without blocking the other
+		sessions
+
+		:param operation: The operation to run
+		:return: The result of the operation
+		"""
+		return await asyncio.get_running_loop().run_in_executor(self.high_scores_executor, operation)
+
+	async def start(self) -> asyncio.AbstractServer:
+		""" Starts listening for connections
+
+		:return: The listening server - its sockets hold the actual port in case port 0 was given
+		"""
+		self.server = await asyncio.start_server(self.handle_connection, host=self.host, port=self.port)
+		logger.info("Game server is listening on %s", [socket.getsockname() for socket in self.server.sockets])
+		return self.server
+
+	async def serve_forever(self) -> None:
+		""" Starts the server and serves connections until cancelled
+
+		:return: None
+		"""
+		server: asyncio.AbstractServer = await self.start()
+		try:
+			async with server:
+				await server.serve_forever()
+		finally:
+			await self.run_high_scores_operation(operation=self.high_scores.close)
+			self.high_scores_executor.shutdown()
+		return None
+
+	async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		""" Runs the session of a single connected player, until the player exits or disconnects
+
+		:param reader:
+		:param writer:
+		:return: None
+		"""
+		peer_name = writer.get_extra_info("peername")
+		self.amount_of_connected_sessions += 1
+		logger.info("Player connected from %s - %s connected sessions", peer_name, self.amount_of_connected_sessions)
+		game_io = StreamGameIO(reader=reader, writer=writer, idle_timeout_seconds=self.idle_timeout_seconds)
+		try:
+			await self.manage_session_menu(game_io=game_io)
+			await game_io.flush()
+		except (CustomExceptionSessionDisconnected, CustomExceptionSessionIdleTimeout, ConnectionError) as e:
+			logger.info("Session of %s has ended: %s", peer_name, e)
+		finally:
+			self.amount_of_connected_sessions -= 1
+			writer.close()
+			try:
+				await writer.wait_closed()
+			except ConnectionError:
+				pass
+		return None
+
+	async def manage_session_menu(self, game_io: StreamGameIO) -> None:
+		""" The main menu of a session - the same options as the terminal game
+
+		:param game_io: The input/output of the session
+		:return: None
+		"""
+		user_input = AsyncUserInput(game_io=game_io)
+		game_io.write_line("Welcome to Sea Trader game")
+		while True:
+			menu_option_chosen: int = await user_input.get_user_number_input_for_menu(
+				prompt_message="Choose an option from these: ",
+				options_dict={
+					1: "Start game",
+					2: "High scores",
+					3: "Exit",
+				}
+			)
+			if menu_option_chosen == 1:
+				player_name: str = await user_input.get_user_string_input(prompt_message="Please enter your name:",
+																		  is_none_allowed=False)
+				game = AsyncGame(player_name=player_name, game_io=game_io)
+				await game.start_game()
+
+				game_result: GameResult = game.game_results
+				logger.info("Finished a game - with results: %s", game_result)
+				await self.run_high_scores_operation(
+					operation=lambda: self.high_scores.add_new_game_result(game_result=game_result))
+			elif menu_option_chosen == 2:
+				await self.print_top_high_scores(game_io=game_io)
+			elif menu_option_chosen == 3:
+				game_io.write_line("Goodbye captain!")
+				break
+		return None
+
+	async def print_top_high_scores(self, game_io: StreamGameIO) -> None:
+		""" Writes the top high scores table to the session
+
+		:param game_io: The input/output of the session
+		:return: None
+		"""
+		top_game_results: List[GameResult] = await self.run_high_scores_operation(
+			operation=self.get_top_high_scores)
+		game_results: List[Dict] = [game_result.get_game_result_as_dict() for game_result in top_game_results]
+		game_io.write_line(FormatOutput.format_table(tabular_data=game_results))
+		return None
+
+	def get_top_high_scores(self) -> List[GameResult]:
+		""" Returns the top high scores, including the results added by other game processes
+
+		:return: List[GameResult]
+		"""
+		self.high_scores.refresh_game_results()
+		return self.high_scores.get_game_results_ordered_by_score(limit=HIGH_SCORES_MENU_PAGE_SIZE)
+
+
+def main():
+	""" Runs the game server according to the command line arguments
+
+	:return: None
+	"""
+	parser = argparse.ArgumentParser(description="Host Sea Trader games over TCP")
+	parser.add_argument("--host", default=GAME_SERVER_HOST, help="Address to listen on")
+	parser.add_argument("--port", type=int, default=GAME_SERVER_PORT, help="Port to listen on")
+	parser.add_argument("--metrics-output", default=None,
+						help="Count and time the game operations, and write them to this JSON file on exit")
+	parser.add_argument("--profile-output", default=None,
+						help="Run the server under cProfile, and write the stats to this file on exit")
+	arguments = parser.parse_args()
+
+	configure_logger()
+	game_server = AsyncGameServer(host=arguments.host, port=arguments.port)
+	try:
+		run_instrumented_session(session=lambda: asyncio.run(game_server.serve_forever()),
+								 metrics_file_path=arguments.metrics_output,
+								 profile_stats_file_path=arguments.profile_output)
+	except KeyboardInterrupt:
+		pass  # The metrics and profile stats are written when the server is stopped
+	return None
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,223 @@
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import time
+from array import array
+from typing import List, Dict, Optional, Tuple, Type
+from classes.game_engine import GameEngine
+from simulation.strategies import TradingStrategy, STRATEGIES_BY_NAME
+
+
+"""
+Plays many complete games of Sea Trader with a bot strategy, across a pool of processes, and summarizes the results.
+
+Used to tune the game economy. Run from the repository root, for example:
+	python -m simulation.batch_runner --games 100000 --strategy greedy
+"""
+
+
+class BatchRunSummary:
+	""" Summary statistics of the final budgets ( GameResult.coins_earned ) of a batch of games """
+	def __init__(self,
+				 coins_earned_results: array,
+				 ship_breaks_results: array,
+				 elapsed_seconds: float):
+		"""
+
+		:param coins_earned_results: Final budget of every game in the batch
+		:param ship_breaks_results: Amount of times the ship broke in every game in the batch
+		:param elapsed_seconds: Wall-clock time taken to play the batch
+		"""
+		self.amount_of_games: int = len(coins_earned_results)
+		self.elapsed_seconds: float = elapsed_seconds
+		self.games_per_second: float = self.amount_of_games / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+		self.mean_coins_earned: float = statistics.fmean(coins_earned_results)
+		self.stdev_coins_earned: float = statistics.pstdev(coins_earned_results)
+		self.min_coins_earned: int = min(coins_earned_results)
+		self.max_coins_earned: int = max(coins_earned_results)
+		self.coins_earned_percentiles: Dict[int, float] = self.calculate_percentiles(
+			values=coins_earned_results,
+			percentiles=[5, 25, 50, 75, 95])
+
+		self.total_ship_breaks: int = sum(ship_breaks_results)
+		self.games_with_ship_breaks: int = sum(1 for ship_breaks in ship_breaks_results if ship_breaks > 0)
+
+	@staticmethod
+	def calculate_percentiles(values: array, percentiles: List[int]) -> Dict[int, float]:
+		""" Calculates percentiles of a list of values
+
+		:param values:
+		:param percentiles: The percentiles to calculate - numbers between 1 to 99
+		:return: Dict[int, float] - percentile and its value
+		"""
+		if len(values) < 2:
+			return {percentile: float(values[0]) for percentile in percentiles}
+		all_percentiles: List[float] = statistics.quantiles(values, n=100, method="inclusive")
+		return {percentile: all_percentiles[percentile - 1] for percentile in percentiles}
+
+	def get_summary_as_dict(self) -> Dict[str, float]:
+		""" Returns the summary as a dictionary
+
+		:return: Dict[str, float]
+		"""
+		summary: Dict[str, float] = {
+			"Amount of games": self.amount_of_games,
+			"Mean coins earned": round(self.mean_coins_earned, 2),
+			"Stdev coins earned": round(self.stdev_coins_earned, 2),
+			"Min coins earned": self.min_coins_earned,
+			"Max coins earned": self.max_coins_earned,
+		}
+		for percentile, value in self.coins_earned_percentiles.items():
+			summary[f"P{percentile} coins earned"] = value
+		summary["Total ship breaks"] = self.total_ship_breaks
+		summary["Games with ship breaks"] = self.games_with_ship_breaks
+		summary["Elapsed seconds"] = round(self.elapsed_seconds, 3)
+		summary["Games per second"] = round(self.games_per_second, 1)
+		return summary
+
+	def __str__(self) -> str:
+		"""
+
+		:return:
+		"""
+		return "\n".join(f"{key}: {value}" for key, value in self.get_summary_as_dict().items())
+
+
+def play_single_game(strategy: TradingStrategy, seed: int) -> Tuple[int, int]:
+	""" Plays a complete game with a strategy. All the game randomness is seeded, so the same seed will replay the same
+	game.
+
+	:param strategy: The bot strategy playing the game
+	:param seed: Seed for the game randomness
+	:return: Tuple of the game final budget and the amount of times the ship broke
+	"""
+	random.seed(seed)
+	game_engine = GameEngine(player_name=f"{type(strategy).__name__}_{seed}", prices_seed=seed)
+	strategy.play_game(game_engine=game_engine)
+	return game_engine.game_results.coins_earned, game_engine.amount_of_ship_breaks
+
+
+def play_games_chunk(strategy_class: Type[TradingStrategy], seeds: range) -> Tuple[array, array]:
+	""" Plays a chunk of games in a single worker process. Games are sent to workers in chunks, so the cost of passing
+	the tasks between processes is shared by many games.
+
+	:param strategy_class: Class of the bot strategy playing the games
+	:param seeds: Seeds of the games to play - a game is played for every seed
+	:return: Tuple of arrays - final budget and amount of ship breaks of every game
+	"""
+	strategy: TradingStrategy = strategy_class()
+	coins_earned_results: array = array("q")
+	ship_breaks_results: array = array("q")
+	for seed in seeds:
+		coins_earned, ship_breaks = play_single_game(strategy=strategy, seed=seed)
+		coins_earned_results.append(coins_earned)
+		ship_breaks_results.append(ship_breaks)
+	return coins_earned_results, ship_breaks_results
+
+
+class BatchGamesRunner:
+	""" Plays N complete games with a bot strategy across a pool of processes """
+	def __init__(self,
+				 strategy_class: Type[TradingStrategy],
+				 amount_of_workers: Optional[int] = None,
+				 chunks_per_worker: int = 4):
+		"""
+
+		:param strategy_class: Class of the bot strategy playing the games, must be defined at module level
+		:param amount_of_workers: Optional - amount of worker processes, default: amount of CPU cores
+		:param chunks_per_worker: Amount of chunks the games are split to per worker, to balance the work between them
+		"""
+		self.strategy_class: Type[TradingStrategy] = strategy_class
+		self.amount_of_workers: int = amount_of_workers or os.cpu_count() or 1
+		self.chunks_per_worker: int = chunks_per_worker
+
+	def split_seeds_to_chunks(self, amount_of_games: int, first_seed: int) -> List[range]:
+		""" Splits the games seeds to chunks - one task for a worker process per chunk
+
+		:param amount_of_games:
+		:param first_seed: Seed of the first game, every next game gets the next seed
+		:return: List of seeds ranges
+		"""
+		amount_of_chunks: int = max(1, min(amount_of_games, self.amount_of_workers * self.chunks_per_worker))
+		chunk_size, games_left = divmod(amount_of_games, amount_of_chunks)
+		chunks: List[range] = []
+		chunk_first_seed: int = first_seed
+		for chunk_index in range(amount_of_chunks):
+			chunk_end_seed: int = chunk_first_seed + chunk_size + (1 if chunk_index < games_left else 0)
+			chunks.append(range(chunk_first_seed, chunk_end_seed))
+			chunk_first_seed = chunk_end_seed
+		return chunks
+
+	def run(self, amount_of_games: int, first_seed: int = 0) -> BatchRunSummary:
+		""" Plays a batch of games and summarizes their results
+
+		:param amount_of_games: Amount of complete games to play
+		:param first_seed: Optional - seed of the first game, every next game gets the next seed
+		:return: BatchRunSummary
+		"""
+		chunks: List[range] = self.split_seeds_to_chunks(amount_of_games=amount_of_games, first_seed=first_seed)
+		coins_earned_results: array = array("q")
+		ship_breaks_results: array = array("q")
+
+		start_time: float = time.perf_counter()
+		if self.amount_of_workers == 1:
+			chunks_results = [play_games_chunk(self.strategy_class, chunk) for chunk in chunks]
+		else:
+			with multiprocessing.Pool(processes=self.amount_of_workers) as pool:
+				chunks_results = pool.starmap(play_games_chunk, [(self.strategy_class, chunk) for chunk in chunks])
+		for chunk_coins_earned, chunk_ship_breaks in chunks_results:
+			coins_earned_results.extend(chunk_coins_earned)
+			ship_breaks_results.extend(chunk_ship_breaks)
+		elapsed_seconds: float = time.perf_counter() - start_time
+
+		return BatchRunSummary(coins_earned_results=coins_earned_results,
+							   ship_breaks_results=ship_breaks_results,
+							   elapsed_seconds=elapsed_seconds)
+
+
+def positive_int(value: str) -> int:
+	""" Parses a command line argument which must be a positive number
+
+	:param value: The argument given
+	:return: int
+	"""
+	try:
+		number: int = int(value)
+	except ValueError:
+		raise argparse.ArgumentTypeError(f"{value} is not a number!")
+	if number < 1:
+		raise argparse.ArgumentTypeError(f"{value} must be 1 or more!")
+	return number
+
+
+def create_arguments_parser() -> argparse.ArgumentParser:
+	""" Creates the parser of the command line arguments
+
+	:return: argparse.ArgumentParser
+	"""
+	parser = argparse.ArgumentParser(description="Play many Sea Trader games with a bot strategy")
+	parser.add_argument("--games", type=positive_int, default=10000, help="Amount of games to play")
+	parser.add_argument("--strategy", choices=sorted(STRATEGIES_BY_NAME.keys()), default="greedy")
+	parser.add_argument("--workers", type=positive_int, default=None, help="Amount of processes, default: CPU cores")
+	parser.add_argument("--seed", type=int, default=0, help="Seed of the first game")
+	return parser
+
+
+def main():
+	""" Runs a batch of games according to the command line arguments and prints the summary
+
+	:return: None
+	"""
+	arguments = create_arguments_parser().parse_args()
+
+	runner = BatchGamesRunner(strategy_class=STRATEGIES_BY_NAME[arguments.strategy],
+							  amount_of_workers=arguments.workers)
+	print(runner.run(amount_of_games=arguments.games, first_seed=arguments.seed))
+	return None
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,333 @@
+from typing import List, Dict, Tuple, Sequence, Optional
+from classes.city_prices import ProductsPricesInAllCities
+from classes.world_config import WorldConfig, ShipConfig
+from highscores.game_result import GameResult
+from constants import INITIAL_BUDGET, AMOUNT_OF_HOURS_FOR_WORKDAY
+
+
+"""
+Computes the best final budget which can be achieved in a game by a player holding a single product at a time, given
+all the prices of the game in advance. Used to grade recorded game results as a percentage of that result.
+
+The solver plans a whole game with perfect information:
+* The prices of all trade days in all cities are known - as a price schedule indexed [day][city ID][product ID].
+* The ship never breaks. ( Breaks are random events, so the result is an upper bound of what such a player achieves )
+* At every moment the player holds coins, and possibly a single product bought with all the coins the player had.
+  ( The solver assumes orders have no price impact - see PRICE_IMPACT_PER_UNIT in constants.py )
+* In case a world is given, the ship sails the shortest routes of the world ( see classes/voyage_planner.py ), and
+  products are bought and sold only in the cities they are traded in.
+
+The result is not always the maximum final budget - units are whole, so the coins left over after buying a product
+can sometimes buy units of a second profitable product. A game played that way can end with a bigger budget than the
+solver's result, and is graded 100.
+
+The search is a dynamic programming over the states (trade day, hours left, city, ship voyage time). Every state keeps
+only its non-dominated holdings - "labels" of (coins, product ID, units). A label is dropped in case another label in
+the same state, or in the same city and voyage time with more hours left, has at least as many coins and units.
+A label holding a product is also dropped in case the coins of the best coins-only label are at least its coins plus
+the units at the best price the product will ever be sold at.
+"""
+
+COINS_ONLY: int = -1  # Product ID of the labels holding only coins
+
+# Labels of a state - by product ID, a list of (coins, units of product)
+Labels = Dict[int, List[Tuple[int, int]]]
+PriceSchedule = Sequence[Sequence[Sequence[int]]]
+
+
+def merge_labels(labels: Labels, labels_to_add: Labels) -> None:
+	""" Adds labels to an existing group of labels
+
+	:param labels: Labels to add to
+	:param labels_to_add:
+	:return: None
+	"""
+	for product_id, product_labels in labels_to_add.items():
+		labels.setdefault(product_id, []).extend(product_labels)
+	return None
+
+
+class OptimalProfitSolver:
+	""" Finds the best final budget of a player holding a single product at a time, for a game with a known price
+	schedule """
+	def __init__(self,
+				 price_schedule: PriceSchedule,
+				 world_config: Optional[WorldConfig] = None,
+				 initial_city_id: Optional[int] = None,
+				 initial_budget: Optional[int] = None,
+				 hours_for_workday: int = AMOUNT_OF_HOURS_FOR_WORKDAY,
+				 voyage_time: Optional[int] = None,
+				 ship_upgrade_time_by_hours: Optional[int] = None,
+				 ship_upgrade_work_time_by_hours: Optional[int] = None,
+				 ship_upgrade_price: Optional[int] = None):
+		"""
+
+		:param price_schedule: Prices of all trade days, indexed [day][city ID][product ID]. ( Day 0 is the first
+							   trade day ) Can be a nested list or a numpy array.
+		:param world_config: Optional - world the game is played in, for its routes voyage times and the products
+							 traded in every city, default: every route takes the ship's voyage time, and all products
+							 are traded in all cities
+		:param initial_city_id: Optional - ID of the city the player starts at, default: the world's start city
+		:param initial_budget: Optional - budget of the player at game start, default: the world's initial budget
+		:param hours_for_workday: Optional - amount of work hours in every trade day
+		:param voyage_time: Optional - ship voyage time at game start, default: the world's ship settings
+		:param ship_upgrade_time_by_hours: Optional - the amount of time reduced from the voyage times per upgrade,
+										   default: the world's ship settings
+		:param ship_upgrade_work_time_by_hours: Optional - the amount of work hours an upgrade takes, default: the
+												world's ship settings
+		:param ship_upgrade_price: Optional - price of a single ship upgrade, default: the world's ship settings
+		"""
+		# Values not given are taken from the world, or from constants.py in case no world is given
+		ship_config: ShipConfig = world_config.ship_config if world_config is not None else ShipConfig()
+		if initial_city_id is None:
+			initial_city_id = world_config.get_city_id(city_name=world_config.start_city) \
+				if world_config is not None else 0
+		if initial_budget is None:
+			initial_budget = world_config.initial_budget if world_config is not None else INITIAL_BUDGET
+
+		self.price_schedule: List[List[List[int]]] = [[[int(price) for price in city_prices]
+													   for city_prices in day_prices]
+													  for day_prices in price_schedule]
+		self.world_config: Optional[WorldConfig] = world_config
+		self.amount_of_days: int = len(self.price_schedule)
+		self.amount_of_cities: int = len(self.price_schedule[0]) if self.amount_of_days > 0 else 0
+		self.initial_city_id: int = initial_city_id
+		self.initial_budget: int = initial_budget
+		self.hours_for_workday: int = hours_for_workday
+		self.voyage_time: int = voyage_time if voyage_time is not None else ship_config.voyage_time
+		self.ship_upgrade_time_by_hours: int = ship_upgrade_time_by_hours if ship_upgrade_time_by_hours is not None \
+			else ship_config.upgrade_time_reduction
+		self.ship_upgrade_work_time_by_hours: int = ship_upgrade_work_time_by_hours \
+			if ship_upgrade_work_time_by_hours is not None else ship_config.upgrade_work_time
+		self.ship_upgrade_price: int = ship_upgrade_price if ship_upgrade_price is not None \
+			else ship_config.upgrade_price
+
+		self.max_future_prices: List[List[int]] = self.calculate_max_future_prices()
+		self._final_budget: Optional[int] = None
+
+	def is_product_available_in_city(self, city_id: int, product_id: int) -> bool:
+		""" Checks if a product is traded in a city of the world
+
+		:param city_id:
+		:param product_id:
+		:return: Boolean - true in case the product is traded in the city, or no world is given
+		"""
+		if self.world_config is None:
+			return True
+		return self.world_config.world_registry.is_product_available_in_city(city_id=city_id, product_id=product_id)
+
+	def get_voyage_time(self, from_city_id: int, to_city_id: int, ship_voyage_time: int) -> int:
+		""" Returns the hours it takes the ship to sail between two cities, by the shortest route
+
+		:param from_city_id:
+		:param to_city_id:
+		:param ship_voyage_time: Voyage time of the ship, after its upgrades
+		:return: int
+		"""
+		if self.world_config is None:
+			return ship_voyage_time
+		return self.world_config.get_voyage_times_matrix(hours_reduction=self.voyage_time - ship_voyage_time) \
+			.get_voyage_time(from_city_id=from_city_id, to_city_id=to_city_id)
+
+	def calculate_max_future_prices(self) -> List[List[int]]:
+		""" Calculates for every day the best price every product can be sold at, in any city it is traded in, from that
+		day until the end of the game. Used to drop labels holding a product which can't beat the coins of another
+		label.
+
+		:return: List[List[int]] - indexed [day][product ID]
+		"""
+		max_future_prices: List[List[int]] = []
+		next_day_max_prices: Optional[List[int]] = None
+		for day_prices in reversed(self.price_schedule):
+			day_max_prices: List[int] = [
+				max(price if self.is_product_available_in_city(city_id=city_id, product_id=product_id) else 0
+					for city_id, price in enumerate(product_prices))
+				for product_id, product_prices in enumerate(zip(*day_prices))]
+			if next_day_max_prices is not None:
+				day_max_prices = [max(prices) for prices in zip(day_max_prices, next_day_max_prices)]
+			max_future_prices.append(day_max_prices)
+			next_day_max_prices = day_max_prices
+		max_future_prices.reverse()
+		return max_future_prices
+
+	@staticmethod
+	def prune_labels(labels: Labels, max_future_prices: List[int]) -> Labels:
+		""" Removes dominated labels from a group of labels
+
+		:param labels:
+		:param max_future_prices: Best price every product can be sold at from now on
+		:return: Labels - only the non-dominated ones
+		"""
+		best_coins: int = max(coins for coins, _ in labels.get(COINS_ONLY, [(0, 0)]))
+		non_dominated_labels: Labels = {COINS_ONLY: [(best_coins, 0)]}
+		for product_id, product_labels in labels.items():
+			if product_id == COINS_ONLY:
+				continue
+			max_future_price: int = max_future_prices[product_id]
+			non_dominated_product_labels: List[Tuple[int, int]] = []
+			max_units: int = -1
+			# Labels with more coins are checked first - a label is dominated by them unless it has more units
+			for coins, units in sorted(product_labels, reverse=True):
+				if units > max_units and coins + units * max_future_price > best_coins:
+					non_dominated_product_labels.append((coins, units))
+					max_units = units
+			if non_dominated_product_labels:
+				non_dominated_labels[product_id] = non_dominated_product_labels
+		return non_dominated_labels
+
+	@staticmethod
+	def get_new_labels(labels: Labels, former_labels: Labels) -> Labels:
+		""" Returns the labels which don't appear in a former group of labels
+
+		:param labels:
+		:param former_labels:
+		:return: Labels
+		"""
+		new_labels: Labels = {}
+		for product_id, product_labels in labels.items():
+			former_product_labels = set(former_labels.get(product_id, []))
+			product_new_labels: List[Tuple[int, int]] = [label for label in product_labels
+														 if label not in former_product_labels]
+			if product_new_labels:
+				new_labels[product_id] = product_new_labels
+		return new_labels
+
+	def trade_in_city(self, labels: Labels, city_id: int, city_prices: List[int], max_future_prices: List[int]) -> Labels:
+		""" Adds the labels which can be reached by trading in a city - selling the held product, and buying a product
+		with all the coins. Products which are not traded in the city are kept.
+
+		:param labels: Labels of the player arriving to the city
+		:param city_id:
+		:param city_prices: Prices of the products in the city, indexed by product ID
+		:param max_future_prices: Best price every product can be sold at from now on
+		:return: Labels - only the non-dominated ones after trading
+		"""
+		# Labels holding only products which are not traded in the city have no coins to trade with
+		best_coins: int = max((max(coins + units * city_prices[product_id] for coins, units in product_labels)
+							   if product_id != COINS_ONLY else max(coins for coins, _ in product_labels)
+							   for product_id, product_labels in labels.items()
+							   if product_id == COINS_ONLY
+							   or self.is_product_available_in_city(city_id=city_id, product_id=product_id)),
+							  default=0)
+		traded_labels: Labels = {product_id: list(product_labels) for product_id, product_labels in labels.items()}
+		traded_labels.setdefault(COINS_ONLY, []).append((best_coins, 0))
+		for product_id, price in enumerate(city_prices):
+			if not self.is_product_available_in_city(city_id=city_id, product_id=product_id):
+				continue
+			units, coins_left = divmod(best_coins, price)
+			if units > 0:
+				traded_labels.setdefault(product_id, []).append((coins_left, units))
+		return self.prune_labels(labels=traded_labels, max_future_prices=max_future_prices)
+
+	def solve(self) -> int:
+		""" Calculates the best final budget of a player holding a single product at a time. The result is cached, so
+		the search runs only once.
+
+		:return: int - the best budget such a player can have when the game ends
+		"""
+		if self._final_budget is not None:
+			return self._final_budget
+
+		final_budget: int = self.initial_budget
+		# Labels at the start of a trade day, by (city ID, voyage time)
+		day_start_labels: Dict[Tuple[int, int], Labels] = {
+			(self.initial_city_id, self.voyage_time): {COINS_ONLY: [(self.initial_budget, 0)]}
+		}
+
+		for day in range(self.amount_of_days):
+			day_prices: List[List[int]] = self.price_schedule[day]
+			max_future_prices: List[int] = self.max_future_prices[day]
+			# Labels waiting to be handled, by hours left and then (city ID, voyage time)
+			labels_by_hours: Dict[int, Dict[Tuple[int, int], Labels]] = {self.hours_for_workday: day_start_labels}
+			# Non-dominated labels already handled at states with more hours left, by (city ID, voyage time)
+			handled_labels: Dict[Tuple[int, int], Labels] = {}
+			next_day_start_labels: Dict[Tuple[int, int], Labels] = {}
+
+			for hours_left in range(self.hours_for_workday, -1, -1):
+				# An upgrade which takes no work hours adds labels to the current hour, so they are handled again
+				while hours_left in labels_by_hours:
+					for (city_id, voyage_time), labels in labels_by_hours.pop(hours_left).items():
+						labels = self.trade_in_city(labels=labels,
+													city_id=city_id,
+													city_prices=day_prices[city_id],
+													max_future_prices=max_future_prices)
+						state_handled_labels: Labels = handled_labels.get((city_id, voyage_time), {})
+						if state_handled_labels:
+							all_state_labels: Labels = {product_id: list(product_labels)
+														for product_id, product_labels in state_handled_labels.items()}
+							merge_labels(labels=all_state_labels, labels_to_add=labels)
+							all_state_labels = self.prune_labels(labels=all_state_labels,
+																 max_future_prices=max_future_prices)
+							labels = self.get_new_labels(labels=all_state_labels, former_labels=state_handled_labels)
+							handled_labels[(city_id, voyage_time)] = all_state_labels
+						else:
+							handled_labels[(city_id, voyage_time)] = labels
+						if not labels:
+							continue
+
+						# End the trade day
+						merge_labels(labels=next_day_start_labels.setdefault((city_id, voyage_time), {}),
+									 labels_to_add=labels)
+
+						# Sail to another city - the labels are pruned together with all labels arriving at the same hour,
+						# when they are handled
+						for destination_city_id in range(self.amount_of_cities):
+							if destination_city_id == city_id:
+								continue
+							route_voyage_time: int = self.get_voyage_time(from_city_id=city_id,
+																		  to_city_id=destination_city_id,
+																		  ship_voyage_time=voyage_time)
+							if hours_left >= route_voyage_time:
+								merge_labels(labels=labels_by_hours.setdefault(hours_left - route_voyage_time, {})
+											 .setdefault((destination_city_id, voyage_time), {}),
+											 labels_to_add=labels)
+
+						# Upgrade the ship
+						upgraded_voyage_time: int = voyage_time - self.ship_upgrade_time_by_hours
+						if self.ship_upgrade_time_by_hours > 0 and upgraded_voyage_time >= 1 \
+								and hours_left >= self.ship_upgrade_work_time_by_hours:
+							upgraded_labels: Labels = {}
+							for product_id, product_labels in labels.items():
+								product_upgraded_labels: List[Tuple[int, int]] = [
+									(coins - self.ship_upgrade_price, units) for coins, units in product_labels
+									if coins >= self.ship_upgrade_price]
+								if product_upgraded_labels:
+									upgraded_labels[product_id] = product_upgraded_labels
+							if upgraded_labels:
+								merge_labels(labels=labels_by_hours.setdefault(
+									hours_left - self.ship_upgrade_work_time_by_hours, {}).setdefault(
+									(city_id, upgraded_voyage_time), {}), labels_to_add=upgraded_labels)
+
+			if day == self.amount_of_days - 1:
+				# Products left in the ship are worth nothing when the game ends
+				final_budget = max(state_labels[COINS_ONLY][0][0] for state_labels in handled_labels.values())
+			else:
+				next_day_max_future_prices: List[int] = self.max_future_prices[day + 1]
+				day_start_labels = {state: self.prune_labels(labels=labels,
+															 max_future_prices=next_day_max_future_prices)
+									for state, labels in next_day_start_labels.items()}
+
+		self._final_budget = final_budget
+		return final_budget
+
+	def grade_game_result(self, game_result: GameResult) -> float:
+		""" Grades a game result played with the same price schedule, as a percentage of the solver's final budget.
+		Results with a bigger budget ( possible by spending the coins left over after buying a product on a second
+		product ) are graded 100.
+
+		:param game_result: A recorded game result
+		:return: float - percentage of the solver's final budget, up to 100
+		"""
+		return min(100.0, game_result.coins_earned / self.solve() * 100)
+
+	@staticmethod
+	def get_prices_of_current_day(products_prices_in_cities: ProductsPricesInAllCities) -> List[List[int]]:
+		""" Returns the current prices in all cities, in the format of a single day of a price schedule.
+		Can be called once every trade day in order to record the price schedule of a game.
+
+		:param products_prices_in_cities: The prices in all cities of a game
+		:return: List[List[int]] - indexed [city ID][product ID]
+		"""
+		return [[prices_in_city.get_price_for_product_id(product_id=product_id)
+				 for product_id in range(len(products_prices_in_cities.products_list))]
+				for prices_in_city in products_prices_in_cities.prices_in_cities_by_id]
@@ -0,0 +1,154 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple, Dict, Type
+from classes.game_engine import GameEngine
+from classes.products import Product
+from classes.arbitrage_index import ArbitrageTrade
+from custom_exceptions.game_custom_exceptions import CustomExceptionNotEnoughHoursLeftInWorkday
+from custom_exceptions.ship_custom_exceptions import CustomExceptionShipIsBroken
+from custom_exceptions.product_custom_exceptions import CustomExceptionPlayerHasNotEnoughBudget
+
+
+"""
+Trading strategies for bots playing Sea Trader using the headless GameEngine.
+
+A strategy decides the actions of a single trade day. New strategies should inherit TradingStrategy and implement
+play_trade_day(). Strategies are passed by class to the batch runner, so they must be defined at module level.
+"""
+
+
+class TradingStrategy(ABC):
+	""" Base class for a bot strategy playing a whole game """
+	def play_game(self, game_engine: GameEngine) -> None:
+		""" Plays all trade days of a game until it is over
+
+		:param game_engine: A new game to play
+		:return: None
+		"""
+		while not game_engine.is_game_over:
+			self.play_trade_day(game_engine=game_engine)
+			game_engine.end_trade_day()
+		return None
+
+	@abstractmethod
+	def play_trade_day(self, game_engine: GameEngine) -> None:
+		""" Does all the actions of the bot in a single trade day. ( The trade day will be ended by play_game() )
+
+		:param game_engine: The game played
+		:return: None
+		"""
+
+	@staticmethod
+	def sell_all_products(game_engine: GameEngine) -> None:
+		""" Sells all products in the player's inventory which are traded in the current city
+
+		:param game_engine: The game played
+		:return: None
+		"""
+		for product_inventory in game_engine.player_inventory.get_inventory_content():
+			if product_inventory.amount > 0 \
+					and game_engine.is_product_available_in_current_city(product_name=product_inventory.product_name):
+				game_engine.sell_product(product_name=product_inventory.product_name,
+										 amount_to_sell=product_inventory.amount)
+		return None
+
+	@staticmethod
+	def buy_product_with_all_budget(game_engine: GameEngine, product: Product) -> None:
+		""" Buys as many units as the player can pay for of a product in the current city
+
+		:param game_engine: The game played
+		:param product: The product to buy
+		:return: None
+		"""
+		amount_to_buy: int = game_engine.get_max_amount_to_buy(product_name=product.name)
+		if amount_to_buy > 0:
+			game_engine.buy_product(product_name=product.name, amount_to_buy=amount_to_buy)
+		return None
+
+	@staticmethod
+	def fix_ship_if_broken(game_engine: GameEngine) -> None:
+		""" Fixes the player's ship in case it is broken and the player can pay for it
+
+		:param game_engine: The game played
+		:return: None
+		"""
+		if game_engine.ship.is_ship_broken:
+			try:
+				game_engine.fix_ship()
+			except CustomExceptionPlayerHasNotEnoughBudget:
+				pass
+		return None
+
+
+class RandomTraderStrategy(TradingStrategy):
+	""" Bot which buys a random product with all of its budget, and sails to a random city to sell it """
+	def play_trade_day(self, game_engine: GameEngine) -> None:
+		"""
+
+		:param game_engine: The game played
+		:return: None
+		"""
+		self.sell_all_products(game_engine=game_engine)
+		if game_engine.is_user_requested_to_finish_game or game_engine.current_trade_day == game_engine.last_trade_day:
+			return None
+
+		self.fix_ship_if_broken(game_engine=game_engine)
+		available_products: List[Product] = [
+			product for product in game_engine.products_list
+			if game_engine.is_product_available_in_current_city(product_name=product.name)]
+		if available_products:
+			self.buy_product_with_all_budget(game_engine=game_engine, product=random.choice(available_products))
+		other_cities: List[str] = [city for city in game_engine.cities_list if city != game_engine.player.location]
+		try:
+			game_engine.sail_to_city(city_name=random.choice(other_cities))
+			self.fix_ship_if_broken(game_engine=game_engine)
+			self.sell_all_products(game_engine=game_engine)
+		except (CustomExceptionShipIsBroken, CustomExceptionNotEnoughHoursLeftInWorkday):
+			pass
+		return None
+
+
+class GreedyTraderStrategy(TradingStrategy):
+	""" Bot which looks at the prices in all cities, and does the most profitable trade from its current city - buying
+	the product with the biggest price ratio between another city and the current one, and sailing there to sell it.
+	Does as many trades as the workday hours allow - only to cities which can be reached today. """
+	def play_trade_day(self, game_engine: GameEngine) -> None:
+		"""
+
+		:param game_engine: The game played
+		:return: None
+		"""
+		self.sell_all_products(game_engine=game_engine)
+		self.fix_ship_if_broken(game_engine=game_engine)
+
+		while game_engine.hours_left_for_workday >= game_engine.get_shortest_voyage_time_from_current_city() \
+				and not game_engine.ship.is_ship_broken:
+			best_trade: Optional[Tuple[Product, str]] = self.find_best_trade(game_engine=game_engine)
+			if best_trade is None:
+				break
+			product, destination_city = best_trade
+			self.buy_product_with_all_budget(game_engine=game_engine, product=product)
+			game_engine.sail_to_city(city_name=destination_city)
+			self.fix_ship_if_broken(game_engine=game_engine)
+			self.sell_all_products(game_engine=game_engine)
+		return None
+
+	@staticmethod
+	def find_best_trade(game_engine: GameEngine) -> Optional[Tuple[Product, str]]:
+		""" Finds the product and destination city giving the biggest profit ratio for a trade from the current city,
+		using the game's arbitrage index
+
+		:param game_engine: The game played
+		:return: A tuple of the product to buy and the city to sell it at, or None in case no trade is profitable
+		"""
+		best_trade: Optional[ArbitrageTrade] = game_engine.get_best_reachable_trade()
+		if best_trade is None:
+			return None
+		return (game_engine.world_registry.get_product_by_id(product_id=best_trade.product_id),
+				game_engine.world_registry.get_city_name_by_id(city_id=best_trade.sell_city_id))
+
+
+STRATEGIES_BY_NAME: Dict[str, Type[TradingStrategy]] = {
+	"random": RandomTraderStrategy,
+	"greedy": GreedyTraderStrategy,
+}
@@ -0,0 +1,150 @@
+import os
+import random
+import tempfile
+import unittest
+from typing import List, Optional
+from classes.arbitrage_index import ArbitrageIndex, ArbitrageTrade
+from classes.game_engine import GameEngine
+from classes.game_snapshot import GameSnapshotFile
+from classes.products import Product
+from classes.world_config import WorldConfig, ShipConfig, load_world_config
+from benchmarks.benchmark_suite import REPOSITORY_ROOT_PATH
+
+
+"""
+Tests for the daily arbitrage index
+"""
+
+
+EXAMPLE_WORLD_FILE_PATH: str = os.path.join(REPOSITORY_ROOT_PATH, "worlds", "example_world.json")
+
+
+def find_best_reachable_profit_ratio(game: GameEngine) -> Optional[float]:
+	""" Finds the profit ratio of the best trade from the player's city the slow and simple way, going over every
+	product and every city reachable today
+
+	:param game:
+	:return: float, or None in case no trade is profitable
+	"""
+	world_registry = game.world_registry
+	current_city_id: int = world_registry.get_city_id(city_name=game.player.location)
+	prices_rows = game.products_prices_in_cities.get_prices_rows()
+	best_profit_ratio: Optional[float] = None
+	for city_id, city_name in enumerate(game.cities_list):
+		if city_id == current_city_id or game.get_voyage_time_to_city(city_name=city_name) > game.hours_left_for_workday:
+			continue
+		for product_id in range(len(game.products_list)):
+			if not world_registry.is_product_available_in_city(city_id=current_city_id, product_id=product_id) \
+					or not world_registry.is_product_available_in_city(city_id=city_id, product_id=product_id):
+				continue
+			profit_ratio: float = prices_rows[city_id][product_id] / prices_rows[current_city_id][product_id]
+			if profit_ratio > 1 and (best_profit_ratio is None or profit_ratio > best_profit_ratio):
+				best_profit_ratio = profit_ratio
+	return best_profit_ratio
+
+
+class TestArbitrageIndex(unittest.TestCase):
+	""" Tests for ArbitrageIndex object """
+	def setUp(self):
+		self.products_list: List[Product] = [Product(name="Wine", min_price=10, max_price=30),
+											 Product(name="Olives", min_price=5, max_price=20)]
+		# Yafo - Tyre takes 3 hours, all other routes take 8 hours
+		self.world_config = WorldConfig(cities_names=["Yafo", "Tyre", "Athena"],
+										products_list=self.products_list,
+										ship_config=ShipConfig(voyage_time=8),
+										routes_voyage_times={("Yafo", "Tyre"): 3},
+										cities_available_products={"Athena": ["Wine"]})
+		# Olives are cheapest at Athena, but Athena doesn't trade them
+		self.prices_rows: List[List[int]] = [[10, 5],   # Yafo
+											 [12, 10],  # Tyre
+											 [30, 1]]   # Athena
+		self.arbitrage_index = ArbitrageIndex(world_registry=self.world_config.world_registry,
+											  prices_rows=self.prices_rows,
+											  max_voyage_time=16)
+
+	def test_products_trades(self):
+		""" Checks the cheapest and most expensive cities of every product, and the best trade of the day
+
+		:return:
+		"""
+		wine_trade: ArbitrageTrade = self.arbitrage_index.get_product_trade(product_id=0)
+		self.assertEqual(first=(0, 2, 10, 30), second=(wine_trade.buy_city_id, wine_trade.sell_city_id,
+													   wine_trade.buy_price, wine_trade.sell_price))
+		self.assertEqual(first=20, second=self.arbitrage_index.get_spread(product_id=0))
+		self.assertEqual(first=5, second=self.arbitrage_index.get_spread(product_id=1))
+
+		best_trade: ArbitrageTrade = self.arbitrage_index.get_best_trade()
+		self.assertEqual(first=0, second=best_trade.product_id)
+		self.assertEqual(first=3, second=best_trade.profit_ratio)
+
+	def test_best_trade_from_city_by_hours(self):
+		""" Looks up the best trade from Yafo by the hours left - Athena can be reached only with 8 hours
+
+		:return:
+		"""
+		voyage_times_matrix = self.world_config.get_voyage_times_matrix()
+		self.assertIsNone(self.arbitrage_index.get_best_trade_from_city(from_city_id=0, hours_left=2,
+																		 voyage_times_matrix=voyage_times_matrix))
+		trade: ArbitrageTrade = self.arbitrage_index.get_best_trade_from_city(
+			from_city_id=0, hours_left=5, voyage_times_matrix=voyage_times_matrix)
+		self.assertEqual(first=(1, 1), second=(trade.product_id, trade.sell_city_id))
+		trade = self.arbitrage_index.get_best_trade_from_city(from_city_id=0, hours_left=16,
+															  voyage_times_matrix=voyage_times_matrix)
+		self.assertEqual(first=(0, 2), second=(trade.product_id, trade.sell_city_id))
+		# Nothing is worth buying at Athena
+		self.assertIsNone(self.arbitrage_index.get_best_trade_from_city(from_city_id=2, hours_left=16,
+																		 voyage_times_matrix=voyage_times_matrix))
+
+	def test_game_index_matches_prices(self):
+		""" Plays a few trade days - the game's index should always give the most profitable trade in its prices
+
+		:return:
+		"""
+		random.seed(8)
+		game = GameEngine(player_name="Sinbad")
+		for _ in range(5):
+			prices_rows: List[List[int]] = [list(prices_row)
+											for prices_row in game.products_prices_in_cities.get_prices_rows()]
+			best_profit_ratio: float = max(max(prices_row[product_id] for prices_row in prices_rows)
+										   / min(prices_row[product_id] for prices_row in prices_rows)
+										   for product_id in range(len(game.products_list)))
+			best_trade: ArbitrageTrade = game.get_best_trade()
+			self.assertEqual(first=best_profit_ratio if best_profit_ratio > 1 else None,
+							 second=best_trade.profit_ratio if best_trade is not None else None)
+			game.move_to_next_day()
+
+	def test_game_reachable_trade_matches_brute_force(self):
+		""" Sails around the example world - the best reachable trade should match going over all cities, also after the
+		game is restored from a snapshot
+
+		:return:
+		"""
+		random.seed(9)
+		world_config: WorldConfig = load_world_config(world_config_file_path=EXAMPLE_WORLD_FILE_PATH)
+		game = GameEngine(player_name="Sinbad", world_config=world_config)
+		game.ship.chance_for_ship_to_break = 0
+		for _ in range(30):
+			best_trade: Optional[ArbitrageTrade] = game.get_best_reachable_trade()
+			self.assertEqual(first=find_best_reachable_profit_ratio(game=game),
+							 second=best_trade.profit_ratio if best_trade is not None else None)
+			reachable_cities: List[str] = [city_name for city_name in game.cities_list
+										   if city_name != game.player.location
+										   and game.get_voyage_time_to_city(city_name=city_name)
+										   <= game.hours_left_for_workday]
+			if reachable_cities:
+				game.sail_to_city(city_name=random.choice(reachable_cities))
+			else:
+				game.move_to_next_day()
+
+		with tempfile.TemporaryDirectory() as temp_dir:
+			snapshot_file_path: str = os.path.join(temp_dir, "snapshot.bin")
+			GameSnapshotFile(snapshot_file_path=snapshot_file_path).save(game=game)
+			restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=snapshot_file_path).load(
+				world_config=world_config)
+		best_trade = restored_game.get_best_reachable_trade()
+		self.assertEqual(first=find_best_reachable_profit_ratio(game=restored_game),
+						 second=best_trade.profit_ratio if best_trade is not None else None)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+from typing import List
+from highscores.game_result import GameResult
+from highscores.manage_high_scores_file import HighScores, ManageHighScoresFile
+from server.async_game_server import AsyncGameServer
+
+
+"""
+Tests for hosting games over TCP
+"""
+
+
+class TestAsyncGameServer(unittest.IsolatedAsyncioTestCase):
+	""" Tests for AsyncGameServer object """
+	async def asyncSetUp(self):
+		""" Starts a game server on a free port, saving the high scores to temporary files """
+		self.temporary_directory = tempfile.TemporaryDirectory()
+		high_scores = HighScores(high_scores_storage=ManageHighScoresFile(
+			high_scores_file_path=str(Path(self.temporary_directory.name, "high_scores.json")),
+			high_scores_journal_file_path=str(Path(self.temporary_directory.name, "high_scores_journal.jsonl"))))
+		self.game_server = AsyncGameServer(port=0, high_scores=high_scores, idle_timeout_seconds=5)
+		self.server = await self.game_server.start()
+		self.port: int = self.server.sockets[0].getsockname()[1]
+
+	async def asyncTearDown(self):
+		self.server.close()
+		await self.server.wait_closed()
+		self.game_server.high_scores_executor.shutdown()
+		self.temporary_directory.cleanup()
+
+	async def play_session(self, player_name: str) -> str:
+		""" Connects to the server, plays a game which is ended on the first day, and exits
+
+		:param player_name:
+		:return: All the output of the session
+		"""
+		reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+		commands: List[str] = ["1", player_name, "8", "y", "3"]
+		writer.write("".join(f"{command}\r\n" for command in commands).encode("utf-8"))
+		await writer.drain()
+		output: bytes = await asyncio.wait_for(reader.read(), timeout=5)
+		writer.close()
+		await writer.wait_closed()
+		return output.decode("utf-8")
+
+	async def test_play_session(self):
+		""" Plays a short game over a connection - result should be saved to the high scores
+
+		:return:
+		"""
+		output: str = await self.play_session(player_name="dummy_name")
+		self.assertIn(member="Well done captain dummy_name!", container=output)
+		self.assertIn(member="Goodbye captain!", container=output)
+		self.assertEqual(first=["dummy_name"],
+						 second=[game_result.name for game_result in self.game_server.high_scores.game_results])
+
+	async def test_many_simultaneous_sessions(self):
+		""" Plays many sessions at the same time in a single thread
+
+		:return:
+		"""
+		outputs: List[str] = await asyncio.gather(*(self.play_session(player_name=f"player_{index}")
+													for index in range(50)))
+		for index, output in enumerate(outputs):
+			self.assertIn(member=f"Well done captain player_{index}!", container=output)
+		self.assertEqual(first=50, second=len(self.game_server.high_scores.game_results))
+		self.assertEqual(first=0, second=self.game_server.amount_of_connected_sessions)
+
+	async def test_high_scores_are_saved_outside_the_event_loop(self):
+		""" Plays a game while saving high scores is slow - the result should be saved in another thread, so the other
+		sessions keep running
+
+		:return:
+		"""
+		high_scores: HighScores = self.game_server.high_scores
+		saving_threads: List[threading.Thread] = []
+
+		def add_new_game_result_slowly(game_result: GameResult) -> None:
+			saving_threads.append(threading.current_thread())
+			time.sleep(0.2)
+			HighScores.add_new_game_result(high_scores, game_result=game_result)
+
+		with mock.patch.object(high_scores, "add_new_game_result", side_effect=add_new_game_result_slowly):
+			session = asyncio.ensure_future(self.play_session(player_name="dummy_name"))
+			while not saving_threads:
+				await asyncio.sleep(0.01)
+			self.assertFalse(session.done())  # The event loop is running while the result is saved
+			await session
+		self.assertNotEqual(first=threading.main_thread(), second=saving_threads[0])
+		self.assertEqual(first=["dummy_name"], second=[game_result.name for game_result in high_scores.game_results])
+
+	async def test_disconnected_session_is_closed(self):
+		""" Disconnects in the middle of a game - the session should end
+
+		:return:
+		"""
+		reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+		writer.write(b"1\r\ndummy_name\r\n")
+		await writer.drain()
+		await reader.readuntil(b"Choose a number")
+		writer.close()
+		await writer.wait_closed()
+		for _ in range(100):
+			if self.game_server.amount_of_connected_sessions == 0:
+				break
+			await asyncio.sleep(0.01)
+		self.assertEqual(first=0, second=self.game_server.amount_of_connected_sessions)
+
+
+if __name__ == '__main__':
+	unittest.main()
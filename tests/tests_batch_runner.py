@@ -0,0 +1,57 @@
+import contextlib
+import io
+import unittest
+from simulation.batch_runner import BatchGamesRunner, BatchRunSummary, play_single_game, create_arguments_parser
+from simulation.strategies import GreedyTraderStrategy, RandomTraderStrategy
+
+
+"""
+Tests for playing batches of games with bot strategies
+"""
+
+
+class TestBatchGamesRunner(unittest.TestCase):
+	""" Tests for BatchGamesRunner object """
+	def test_split_seeds_to_chunks(self):
+		""" Checks every game gets a single unique seed
+
+		:return:
+		"""
+		runner = BatchGamesRunner(strategy_class=GreedyTraderStrategy, amount_of_workers=3)
+		chunks = runner.split_seeds_to_chunks(amount_of_games=100, first_seed=10)
+		seeds = [seed for chunk in chunks for seed in chunk]
+		self.assertEqual(first=list(range(10, 110)), second=seeds)
+
+	def test_same_seed_replays_same_game(self):
+		""" Plays the same game twice - results should be the same
+
+		:return:
+		"""
+		self.assertEqual(first=play_single_game(strategy=RandomTraderStrategy(), seed=7),
+						 second=play_single_game(strategy=RandomTraderStrategy(), seed=7))
+
+	def test_run_batch(self):
+		""" Runs a small batch of games in a single process and checks the summary
+
+		:return:
+		"""
+		runner = BatchGamesRunner(strategy_class=GreedyTraderStrategy, amount_of_workers=1)
+		summary: BatchRunSummary = runner.run(amount_of_games=20)
+		self.assertEqual(first=20, second=summary.amount_of_games)
+		self.assertLessEqual(a=summary.min_coins_earned, b=summary.coins_earned_percentiles[50])
+		self.assertLessEqual(a=summary.coins_earned_percentiles[50], b=summary.max_coins_earned)
+		self.assertLessEqual(a=summary.games_with_ship_breaks, b=summary.total_ship_breaks)
+
+	def test_arguments_require_games(self):
+		""" Parses command line arguments with no games to play - they should be rejected
+
+		:return:
+		"""
+		for amount_of_games in ["0", "-3", "many"]:
+			with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+				create_arguments_parser().parse_args(["--games", amount_of_games])
+		self.assertEqual(first=5, second=create_arguments_parser().parse_args(["--games", "5"]).games)
+
+
+if __name__ == '__main__':
+	unittest.main()
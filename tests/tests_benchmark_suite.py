@@ -0,0 +1,45 @@
+import json
+import unittest
+from benchmarks.benchmark_suite import BenchmarkSuite, benchmark_buy_product, benchmark_high_scores_load, \
+	benchmark_scripted_game_sessions
+
+
+"""
+Tests for the benchmark suite
+"""
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+	""" Tests for BenchmarkSuite object """
+	def test_run_benchmarks(self):
+		""" Runs small benchmarks - the results should be JSON serializable and have every benchmark
+
+		:return:
+		"""
+		suite = BenchmarkSuite(benchmarks=[benchmark_buy_product(amount_of_operations=100),
+										   benchmark_high_scores_load(amount_of_results=100),
+										   benchmark_scripted_game_sessions(amount_of_games=2)],
+							   repeats=2)
+		results = json.loads(json.dumps(suite.run()))
+		self.assertEqual(first=["players_transaction_buy_product", "high_scores_load_100", "scripted_game_session"],
+						 second=list(results["results"].keys()))
+		for result in results["results"].values():
+			self.assertGreater(a=result["seconds_per_operation"], b=0)
+			self.assertLessEqual(a=result["min_seconds"], b=result["median_seconds"])
+
+	def test_compare_to_baseline(self):
+		""" Compares results to a baseline - only the benchmark slower than the tolerance should be a regression
+
+		:return:
+		"""
+		baseline_results = {"results": {"a": {"seconds_per_operation": 1.0}, "b": {"seconds_per_operation": 1.0}}}
+		results = {"results": {"a": {"seconds_per_operation": 1.1},
+							   "b": {"seconds_per_operation": 1.5},
+							   "c": {"seconds_per_operation": 9.0}}}
+		comparison = BenchmarkSuite.compare_to_baseline(results=results, baseline_results=baseline_results, tolerance=0.2)
+		self.assertEqual(first={"a": False, "b": True},
+						 second={benchmark["name"]: benchmark["is_regression"] for benchmark in comparison})
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,54 @@
+from typing import List
+import unittest
+from classes.products import Product
+from classes.city_prices_vectorized import ProductsPricesInAllCitiesVectorized, is_vectorized_prices_backend_available
+from custom_exceptions.city_custom_exceptions import CustomExceptionCityNameNotFound
+
+
+@unittest.skipUnless(is_vectorized_prices_backend_available(), "numpy is not installed")
+class TestProductsPricesInAllCitiesVectorized(unittest.TestCase):
+	""" Will test the numpy prices backend """
+	def setUp(self):
+		""" Set up some objects used generally by the tests running by this class """
+		self.products_list: List[Product] = [Product(name="dummy_product", min_price=1, max_price=10),
+											 Product(name="fixed_price_product", min_price=7, max_price=7)]
+		self.cities_list: List[str] = ["Yafo", "Haifa"]
+
+	def test_prices_are_in_products_range(self):
+		""" Will check all prices drawn for all days are in the products prices range
+
+		:return:
+		"""
+		prices = ProductsPricesInAllCitiesVectorized(cities_names_in_game=self.cities_list,
+													 products_in_game=self.products_list,
+													 amount_of_trade_days=3,
+													 seed=1)
+		for _ in range(7):  # More days than a single prices block
+			for city in self.cities_list:
+				prices_in_city = prices.get_prices_in_city_by_city_name(city_name=city)
+				self.assertIn(member=prices_in_city.get_price_for_product(self.products_list[0]), container=range(1, 11))
+				self.assertEqual(first=7, second=prices_in_city.get_price_for_product(self.products_list[1]))
+			prices.generate_prices_for_all_cities()
+
+	def test_city_prices_follow_current_day(self):
+		""" Will check the prices of a city served are the prices of the current trade day
+
+		:return:
+		"""
+		prices = ProductsPricesInAllCitiesVectorized(cities_names_in_game=self.cities_list,
+													 products_in_game=self.products_list,
+													 amount_of_trade_days=5,
+													 seed=1)
+		prices_in_city = prices.get_prices_in_city_by_city_name(city_name="Haifa")
+		prices.generate_prices_for_all_cities()
+		self.assertEqual(first=int(prices.prices_tensor[1, 1, 0]),
+						 second=prices_in_city.get_price_for_product(self.products_list[0]))
+		self.assertEqual(first={"dummy_product": int(prices.prices_tensor[1, 1, 0]), "fixed_price_product": 7},
+						 second=prices_in_city.get_prices_of_all_products_as_dict())
+
+		with self.assertRaises(CustomExceptionCityNameNotFound):
+			prices.get_prices_in_city_by_city_name(city_name="Atlantis")
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+from classes.game_engine import GameEngine
+from constants import INITIAL_BUDGET, AMOUNT_OF_HOURS_FOR_WORKDAY, TOTAL_TRADE_DAYS_IN_A_GAME, CITIES_LIST
+from custom_exceptions.game_custom_exceptions import CustomExceptionNotEnoughHoursLeftInWorkday, \
+	CustomExceptionPlayerIsAlreadyInCity, CustomExceptionGameIsOver
+from custom_exceptions.ship_custom_exceptions import CustomExceptionShipIsBroken, CustomExceptionShipIsNotBroken
+from custom_exceptions.product_custom_exceptions import CustomExceptionsTransactionFailNotEnoughItemAmount
+
+
+"""
+Tests for the headless game engine
+"""
+
+
+class TestGameEngine(unittest.TestCase):
+	""" Tests for GameEngine object """
+	def setUp(self):
+		""" Creates a game engine used by the tests """
+		self.game_engine = GameEngine(player_name="dummy_name")
+		self.game_engine.ship.chance_for_ship_to_break = 0  # Make voyages deterministic
+
+	def test_buy_and_sell_product(self):
+		""" Buys a product and sells it back in the same city - budget should return to its initial value
+
+		:return:
+		"""
+		product_name: str = self.game_engine.products_list[0].name
+		self.game_engine.buy_product(product_name=product_name, amount_to_buy=10)
+		self.assertEqual(first=10, second=self.game_engine.player_inventory.get_product_by_name(product_name).amount)
+		self.assertLess(a=self.game_engine.player.budget, b=INITIAL_BUDGET)
+
+		self.game_engine.sell_product(product_name=product_name, amount_to_sell=10)
+		self.assertEqual(first=INITIAL_BUDGET, second=self.game_engine.player.budget)
+
+		with self.assertRaises(CustomExceptionsTransactionFailNotEnoughItemAmount):
+			self.game_engine.sell_product(product_name=product_name, amount_to_sell=1)
+
+	def test_sail_to_city(self):
+		""" Sails between cities until the workday hours are over
+
+		:return:
+		"""
+		with self.assertRaises(CustomExceptionPlayerIsAlreadyInCity):
+			self.game_engine.sail_to_city(city_name=self.game_engine.player.location)
+
+		self.game_engine.sail_to_city(city_name=CITIES_LIST[1])
+		self.assertEqual(first=CITIES_LIST[1], second=self.game_engine.player.location)
+		self.assertEqual(first=AMOUNT_OF_HOURS_FOR_WORKDAY - self.game_engine.ship.voyage_time,
+						 second=self.game_engine.hours_left_for_workday)
+
+		self.game_engine.hours_left_for_workday = self.game_engine.ship.voyage_time - 1
+		with self.assertRaises(CustomExceptionNotEnoughHoursLeftInWorkday):
+			self.game_engine.sail_to_city(city_name=CITIES_LIST[0])
+
+	def test_broken_ship_must_be_fixed_before_sailing(self):
+		""" Breaks the ship during a voyage, and checks it can't sail until fixed
+
+		:return:
+		"""
+		with self.assertRaises(CustomExceptionShipIsNotBroken):
+			self.game_engine.fix_ship()
+
+		self.game_engine.ship.chance_for_ship_to_break = 1
+		self.assertTrue(expr=self.game_engine.sail_to_city(city_name=CITIES_LIST[1]))
+		self.assertEqual(first=1, second=self.game_engine.amount_of_ship_breaks)
+		with self.assertRaises(CustomExceptionShipIsBroken):
+			self.game_engine.sail_to_city(city_name=CITIES_LIST[0])
+
+		fix_cost: int = self.game_engine.ship.fix_cost
+		self.game_engine.fix_ship()
+		self.assertFalse(expr=self.game_engine.ship.is_ship_broken)
+		self.assertEqual(first=INITIAL_BUDGET - fix_cost, second=self.game_engine.player.budget)
+
+	def test_upgrade_ship(self):
+		""" Upgrades the ship - budget and work hours should be reduced
+
+		:return:
+		"""
+		voyage_time_before_upgrade: int = self.game_engine.ship.voyage_time
+		self.game_engine.upgrade_ship()
+		self.assertLess(a=self.game_engine.ship.voyage_time, b=voyage_time_before_upgrade)
+		self.assertEqual(first=INITIAL_BUDGET - self.game_engine.ship_upgrade_price,
+						 second=self.game_engine.player.budget)
+		self.assertEqual(first=AMOUNT_OF_HOURS_FOR_WORKDAY - self.game_engine.ship.ship_upgrade_work_time_by_hours,
+						 second=self.game_engine.hours_left_for_workday)
+
+	def test_play_full_game(self):
+		""" Ends all trade days of a game - no more actions should be allowed after the last one
+
+		:return:
+		"""
+		for _ in range(TOTAL_TRADE_DAYS_IN_A_GAME):
+			self.assertFalse(expr=self.game_engine.is_game_over)
+			self.game_engine.end_trade_day()
+		self.assertTrue(expr=self.game_engine.is_game_over)
+
+		with self.assertRaises(CustomExceptionGameIsOver):
+			self.game_engine.end_trade_day()
+		self.assertEqual(first=INITIAL_BUDGET, second=self.game_engine.game_results.coins_earned)
+
+	def test_request_to_end_game(self):
+		""" Requests to end the game early - game should be over when the current trade day ends
+
+		:return:
+		"""
+		self.game_engine.request_to_end_game()
+		self.assertFalse(expr=self.game_engine.is_game_over)
+		self.game_engine.end_trade_day()
+		self.assertTrue(expr=self.game_engine.is_game_over)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import pstats
+import random
+import tempfile
+import unittest
+from classes.game_engine import GameEngine
+from classes.player import PlayersTransaction
+from custom_exceptions.product_custom_exceptions import CustomExceptionPlayerHasNotEnoughBudget
+from instrumentation.game_metrics import enable_instrumentation, disable_instrumentation, get_game_metrics, \
+	LatencyHistogram, run_instrumented_session
+
+
+"""
+Tests for the game instrumentation
+"""
+
+
+def play_short_game() -> int:
+	""" Plays a short game with a few operations
+
+	:return: Final budget of the player
+	"""
+	random.seed(2)
+	game = GameEngine(player_name="dummy_name")
+	game.buy_product(product_name="Wine", amount_to_buy=10)
+	try:
+		game.buy_product(product_name="Wine", amount_to_buy=100000)
+	except CustomExceptionPlayerHasNotEnoughBudget:
+		pass
+	game.ship.chance_for_ship_to_break = 0
+	game.sail_to_city(city_name="Larnaka")
+	game.sell_product(product_name="Wine", amount_to_sell=10)
+	game.end_trade_day()
+	return game.player.budget
+
+
+class TestGameMetrics(unittest.TestCase):
+	""" Tests for the game instrumentation """
+	def tearDown(self):
+		disable_instrumentation()
+
+	def test_operations_are_counted(self):
+		""" Plays with instrumentation enabled - every operation should be counted and timed
+
+		:return:
+		"""
+		game_metrics = enable_instrumentation()
+		play_short_game()
+		self.assertEqual(first={"buy": 2, "buy_failed": 1, "sell": 1, "sail": 1, "day_rollover": 1,
+								"generate_prices": 1},
+						 second=game_metrics.counters)
+		self.assertEqual(first=2, second=game_metrics.latencies["buy"].count)
+		self.assertGreater(a=game_metrics.latencies["day_rollover"].total_seconds, b=0)
+
+	def test_disabled_instrumentation_restores_methods(self):
+		""" Disables instrumentation - the original methods should be put back, and nothing should be counted
+
+		:return:
+		"""
+		original_buy_product = PlayersTransaction.buy_product
+		enable_instrumentation()
+		self.assertIsNot(expr1=original_buy_product, expr2=PlayersTransaction.buy_product)
+		game_metrics = disable_instrumentation()
+		self.assertIs(expr1=original_buy_product, expr2=PlayersTransaction.buy_product)
+		self.assertIsNone(get_game_metrics())
+
+		play_short_game()
+		self.assertNotIn(member="sell", container=game_metrics.counters)
+
+	def test_latency_histogram_percentiles(self):
+		""" Records latencies of 1 to 100 microseconds - percentiles are the upper limit of their bucket
+
+		:return:
+		"""
+		latency_histogram = LatencyHistogram()
+		for microseconds in range(1, 101):
+			latency_histogram.record(seconds=microseconds / 1000000)
+		self.assertEqual(first=100, second=latency_histogram.count)
+		self.assertAlmostEqual(first=64 / 1000000, second=latency_histogram.get_percentile_seconds(percentile=50))
+		self.assertAlmostEqual(first=100 / 1000000, second=latency_histogram.get_percentile_seconds(percentile=99))
+
+	def test_instrumented_session_writes_metrics_and_profile(self):
+		""" Runs a session with metrics and profiling - both files should be written
+
+		:return:
+		"""
+		with tempfile.TemporaryDirectory() as temp_dir:
+			metrics_file_path: str = os.path.join(temp_dir, "metrics.json")
+			profile_stats_file_path: str = os.path.join(temp_dir, "profile.stats")
+			final_budget: int = run_instrumented_session(session=play_short_game,
+														 metrics_file_path=metrics_file_path,
+														 profile_stats_file_path=profile_stats_file_path)
+
+			self.assertEqual(first=play_short_game(), second=final_budget)
+			with open(metrics_file_path) as metrics_file:
+				self.assertEqual(first=1, second=json.load(metrics_file)["latencies"]["sell"]["count"])
+			self.assertGreater(a=pstats.Stats(profile_stats_file_path).total_calls, b=0)
+		self.assertIsNone(get_game_metrics())
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime
+from highscores.game_result import GameResult
+from highscores.game_result_table import GameResultTable
+from classes.optional_numpy import is_numpy_available
+
+
+"""
+Tests for the columnar table of game results
+"""
+
+
+class TestGameResultTable(unittest.TestCase):
+	""" Tests for GameResultTable object - using Python sorts """
+	use_numpy: bool = False
+
+	def setUp(self):
+		""" Creates a table with a few game results """
+		self.game_results_table = GameResultTable(use_numpy=self.use_numpy, game_results=[
+			GameResult(name="first_player", coins_earned=200, amount_of_trade_days=7, game_datetime=datetime(2024, 1, 3)),
+			GameResult(name="second_player", coins_earned=300, amount_of_trade_days=7,
+					   game_datetime="2024-01-01 10:00:00"),
+			GameResult(name="first_player", coins_earned=200, amount_of_trade_days=5, game_datetime=datetime(2024, 1, 2)),
+		])
+
+	def test_game_result_has_no_dict(self):
+		""" GameResult uses slots - and converts dates read from files to datetime
+
+		:return:
+		"""
+		game_result = GameResult(name="dummy_name", coins_earned=1, amount_of_trade_days=7,
+								 game_datetime="2024-01-01 10:00:00.5")
+		self.assertFalse(hasattr(game_result, "__dict__"))
+		self.assertEqual(first=datetime(2024, 1, 1, 10, 0, 0, 500000), second=game_result.game_datetime)
+
+	def test_results_are_kept(self):
+		""" Reads a result back from the table
+
+		:return:
+		"""
+		game_result: GameResult = self.game_results_table.get_game_result(index=1)
+		self.assertEqual(first=("second_player", 300, 7, datetime(2024, 1, 1, 10)),
+						 second=(game_result.name, game_result.coins_earned, game_result.amount_of_trade_days,
+								 game_result.game_datetime))
+		self.assertEqual(first=2, second=len(self.game_results_table.names))
+
+	def test_ordered_indexes(self):
+		""" Orders the results by score and by date - equal scores should keep the order they were added
+
+		:return:
+		"""
+		self.assertEqual(first=[1, 0, 2], second=self.game_results_table.get_indexes_ordered_by_score())
+		self.assertEqual(first=[1, 0], second=self.game_results_table.get_indexes_ordered_by_score(limit=2))
+		self.assertEqual(first=[0, 2, 1], second=self.game_results_table.get_indexes_ordered_by_date())
+
+	def test_filtered_indexes(self):
+		""" Filters the results by dates and by player
+
+		:return:
+		"""
+		self.assertEqual(first=[2, 1], second=self.game_results_table.get_indexes_between_dates(
+			from_datetime=datetime(2024, 1, 1), to_datetime=datetime(2024, 1, 2)))
+		self.assertEqual(first=[0, 2], second=self.game_results_table.get_indexes_of_player(player_name="first_player"))
+		self.assertEqual(first=[], second=self.game_results_table.get_indexes_of_player(player_name="unknown_player"))
+
+
+@unittest.skipUnless(is_numpy_available(), "numpy is not installed")
+class TestGameResultTableNumpy(TestGameResultTable):
+	""" Tests for GameResultTable object - using numpy sorts """
+	use_numpy: bool = True
+
+
+if __name__ == '__main__':
+	unittest.main()
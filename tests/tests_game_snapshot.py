@@ -0,0 +1,258 @@
+import os
+import random
+import tempfile
+import unittest
+from classes.game_engine import GameEngine
+from classes.game_snapshot import GameSnapshotFile
+from classes.world_config import WorldConfig
+from classes.city_prices_vectorized import is_vectorized_prices_backend_available
+from custom_exceptions.snapshot_custom_exceptions import CustomExceptionSnapshotDoesNotMatchGame, \
+	CustomExceptionSnapshotFileIsCorrupted
+from constants import PRODUCTS_LIST
+
+
+"""
+Tests for saving and restoring games snapshots
+"""
+
+
+def get_game_state(game: GameEngine) -> tuple:
+	""" Returns the state of a game, to compare games
+
+	:param game:
+	:return: tuple
+	"""
+	return (game.current_trade_day, game.hours_left_for_workday, game.is_last_trade_day,
+			game.is_user_requested_to_finish_game, game.amount_of_ship_breaks,
+			game.player.name, game.player.budget, game.player.location,
+			game.ship.is_ship_broken, game.ship.voyage_time, game.ship.fix_cost,
+			list(game.player_inventory.products_amounts),
+			[prices_in_city.get_prices_of_all_products_as_dict()
+			 for prices_in_city in game.products_prices_in_cities.prices_in_cities_by_id],
+			[str(transaction) for transaction in game.transactions_ledger],
+			game.transactions_ledger.get_profit_and_loss(),
+			get_price_history_state(game=game))
+
+
+def get_price_history_state(game: GameEngine) -> tuple:
+	""" Returns the prices kept in the price history of a game, with their statistics, to compare games
+
+	:param game:
+	:return: tuple
+	"""
+	price_history = game.price_history
+	markets = [(city_id, product_id) for city_id in range(game.world_registry.amount_of_cities)
+			   for product_id in range(game.world_registry.amount_of_products)]
+	return (price_history.max_length, price_history.length,
+			[(price_history.get_prices(city_id=city_id, product_id=product_id),
+			  price_history.get_mean_price(city_id=city_id, product_id=product_id),
+			  price_history.get_min_price(city_id=city_id, product_id=product_id),
+			  price_history.get_max_price(city_id=city_id, product_id=product_id),
+			  price_history.get_volatility(city_id=city_id, product_id=product_id))
+			 for city_id, product_id in markets])
+
+
+def play_some_actions(game: GameEngine) -> None:
+	""" Does a few actions in the game, which change all of its sections
+
+	:param game:
+	:return: None
+	"""
+	game.buy_product(product_name="Wine", amount_to_buy=100)
+	game.ship.chance_for_ship_to_break = 1
+	game.sail_to_city(city_name="Larnaka")
+	game.sell_product(product_name="Wine", amount_to_sell=40)
+	game.end_trade_day()
+	return None
+
+
+class TestGameSnapshotFile(unittest.TestCase):
+	""" Tests for GameSnapshotFile object """
+	def setUp(self):
+		random.seed(3)
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.snapshot_file_path: str = os.path.join(self.temp_dir.name, "game.snapshot")
+
+	def tearDown(self):
+		self.temp_dir.cleanup()
+
+	def test_save_and_load(self):
+		""" Saves a game in the middle, and restores it into a new game
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		play_some_actions(game=game)
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).save(game=game)
+
+		restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+		self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=restored_game))
+		self.assertTrue(restored_game.ship.is_ship_broken)
+		self.assertEqual(first=2, second=restored_game.price_history.length)
+
+	def test_autosave_writes_only_changed_sections(self):
+		""" Autosaves after every action - only the sections which changed should be appended
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		snapshot_file = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path)
+		full_snapshot_size: int = snapshot_file.autosave(game=game)
+		self.assertEqual(first=0, second=snapshot_file.autosave(game=game))
+
+		game.buy_product(product_name="Olives", amount_to_buy=10)
+		self.assertLess(a=snapshot_file.autosave(game=game), b=full_snapshot_size // 2)
+		play_some_actions(game=game)
+		snapshot_file.autosave(game=game)
+
+		restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+		self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=restored_game))
+
+	def test_autosave_is_compacted(self):
+		""" Autosaves more than the maximum amount of incremental saves - the file should be rewritten whole
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		snapshot_file = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path, max_incremental_saves=3)
+		snapshot_file.save(game=game)
+		for _ in range(4):
+			game.buy_product(product_name="Flour", amount_to_buy=1)
+			snapshot_file.autosave(game=game)
+
+		full_snapshot_file_path: str = os.path.join(self.temp_dir.name, "full_game.snapshot")
+		full_snapshot_size: int = GameSnapshotFile(snapshot_file_path=full_snapshot_file_path).save(game=game)
+		self.assertEqual(first=full_snapshot_size, second=os.path.getsize(self.snapshot_file_path))
+
+	def test_partially_written_autosave_is_ignored(self):
+		""" Cuts the last autosave in the middle - the game should be restored as of the save before it, and the
+		following autosaves should still be restored
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		snapshot_file = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path)
+		snapshot_file.save(game=game)
+		game.buy_product(product_name="Wine", amount_to_buy=5)
+		snapshot_file.autosave(game=game)
+		state_before_last_save: tuple = get_game_state(game=game)
+		game.buy_product(product_name="Wine", amount_to_buy=5)
+		snapshot_file.autosave(game=game)
+		os.truncate(self.snapshot_file_path, os.path.getsize(self.snapshot_file_path) - 3)
+
+		restore_snapshot_file = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path)
+		restored_game: GameEngine = restore_snapshot_file.load()
+		self.assertEqual(first=state_before_last_save, second=get_game_state(game=restored_game))
+
+		restored_game.buy_product(product_name="Olives", amount_to_buy=7)
+		restore_snapshot_file.autosave(game=restored_game)
+		self.assertEqual(first=get_game_state(game=restored_game),
+						 second=get_game_state(game=GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()))
+
+	def test_load_into_another_world_fails(self):
+		""" Restores a snapshot into a game with other cities
+
+		:return:
+		"""
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).save(game=GameEngine(player_name="Sinbad"))
+		game = GameEngine(player_name="Sinbad",
+						  world_config=WorldConfig(cities_names=["Yafo", "Larnaka"], products_list=PRODUCTS_LIST))
+		with self.assertRaises(CustomExceptionSnapshotDoesNotMatchGame):
+			GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load_into(game=game)
+
+	def test_load_file_which_is_not_a_snapshot_fails(self):
+		""" Restores a file which is not a snapshot
+
+		:return:
+		"""
+		with open(self.snapshot_file_path, "w") as file:
+			file.write("[]")
+		with self.assertRaises(CustomExceptionSnapshotFileIsCorrupted):
+			GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+
+	def test_load_after_many_autosaves(self):
+		""" Restores a game with many autosaves - all of them should be applied
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		snapshot_file = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path)
+		for _ in range(snapshot_file.max_incremental_saves - 1):
+			game.buy_product(product_name="Flour", amount_to_buy=1)
+			snapshot_file.autosave(game=game)
+
+		game_to_restore = GameEngine(player_name="Sinbad")
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load_into(game=game_to_restore)
+		self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=game_to_restore))
+
+	@unittest.skipUnless(is_vectorized_prices_backend_available(), "Requires numpy")
+	def test_save_and_load_vectorized_prices(self):
+		""" Restores a game using the numpy prices backend - the following days prices should be the same as well
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad", use_vectorized_prices_backend=True, prices_seed=5)
+		game.end_trade_day()
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).save(game=game)
+
+		restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+		for _ in range(10):
+			self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=restored_game))
+			game.move_to_next_day()
+			restored_game.move_to_next_day()
+
+	def test_save_and_load_price_impact(self):
+		""" Restores a game right after buying many units of a product - the product should still be as expensive, so
+		the units can't be bought again at the price before the order
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad", price_impact_per_unit=0.01)
+		buy_cost_before_order: int = game.get_buy_cost(product_name="Wine", amount_to_buy=50)
+		game.buy_product(product_name="Wine", amount_to_buy=50)
+		game.sell_product(product_name="Wine", amount_to_sell=10)
+		buy_cost_after_order: int = game.get_buy_cost(product_name="Wine", amount_to_buy=50)
+		self.assertGreater(a=buy_cost_after_order, b=buy_cost_before_order)
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).save(game=game)
+
+		restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+		self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=restored_game))
+		self.assertEqual(first=list(game.price_impact_model.impacts),
+						 second=list(restored_game.price_impact_model.impacts))
+		self.assertEqual(first=buy_cost_after_order,
+						 second=restored_game.get_buy_cost(product_name="Wine", amount_to_buy=50))
+		self.assertEqual(first=game.get_sell_income(product_name="Wine", amount_to_sell=40),
+						 second=restored_game.get_sell_income(product_name="Wine", amount_to_sell=40))
+
+		with self.assertRaises(CustomExceptionSnapshotDoesNotMatchGame):
+			GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load_into(game=GameEngine(player_name="Sinbad"))
+
+	@unittest.skipUnless(is_vectorized_prices_backend_available(), "Requires numpy")
+	def test_save_and_load_npc_traders(self):
+		""" Restores a game with NPC traders - the traders should trade the same, so the following days prices should
+		be the same as well
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad", use_vectorized_prices_backend=True, prices_seed=5,
+						  amount_of_npc_traders=1000)
+		for _ in range(3):
+			game.end_trade_day()
+		GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).save(game=game)
+
+		restored_game: GameEngine = GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load()
+		self.assertEqual(first=1000, second=restored_game.npc_traders.amount_of_traders)
+		self.assertEqual(first=4, second=restored_game.price_history.length)
+		for _ in range(10):
+			self.assertEqual(first=get_game_state(game=game), second=get_game_state(game=restored_game))
+			self.assertEqual(first=game.npc_traders.budgets.tolist(), second=restored_game.npc_traders.budgets.tolist())
+			game.move_to_next_day()
+			restored_game.move_to_next_day()
+
+		with self.assertRaises(CustomExceptionSnapshotDoesNotMatchGame):
+			GameSnapshotFile(snapshot_file_path=self.snapshot_file_path).load_into(
+				game=GameEngine(player_name="Sinbad", use_vectorized_prices_backend=True))
+
+
+if __name__ == '__main__':
+	unittest.main()
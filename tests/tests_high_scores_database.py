@@ -0,0 +1,118 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from highscores.game_result import GameResult
+from highscores.high_scores_database import ManageHighScoresDatabase
+from highscores.manage_high_scores_file import ManageHighScoresFile, HighScores
+
+
+"""
+Tests for storing the game high scores in an SQLite database
+"""
+
+
+class TestHighScoresDatabase(unittest.TestCase):
+	""" Tests for ManageHighScoresDatabase object """
+	def setUp(self):
+		""" Creates a database in a temporary directory """
+		self.temporary_directory = tempfile.TemporaryDirectory()
+		self.database_file_path: str = str(Path(self.temporary_directory.name, "high_scores.sqlite3"))
+		self.manage_high_scores_database = ManageHighScoresDatabase(database_file_path=self.database_file_path)
+		self.manage_high_scores_database.add_game_results(game_results_list=[
+			GameResult(name="first_player", coins_earned=300, amount_of_trade_days=7,
+					   game_datetime=datetime(2024, 1, 3)),
+			GameResult(name="second_player", coins_earned=100, amount_of_trade_days=7,
+					   game_datetime=datetime(2024, 1, 1)),
+			GameResult(name="first_player", coins_earned=200, amount_of_trade_days=7,
+					   game_datetime=datetime(2024, 1, 2)),
+		])
+
+	def tearDown(self):
+		self.manage_high_scores_database.close()
+		self.temporary_directory.cleanup()
+
+	def test_ordered_queries(self):
+		""" Reads the top results by score and by date
+
+		:return:
+		"""
+		self.assertEqual(first=[300, 200], second=[
+			game_result.coins_earned
+			for game_result in self.manage_high_scores_database.get_game_results_ordered_by_score(limit=2)])
+		self.assertEqual(first=[300, 200, 100], second=[
+			game_result.coins_earned for game_result in self.manage_high_scores_database.get_game_results_ordered_by_date()])
+
+	def test_filtered_queries(self):
+		""" Reads the results of a dates range and of a single player
+
+		:return:
+		"""
+		game_results = self.manage_high_scores_database.get_game_results_between_dates(
+			from_datetime=datetime(2024, 1, 1, 12), to_datetime=datetime(2024, 1, 3))
+		self.assertEqual(first=[300, 200], second=[game_result.coins_earned for game_result in game_results])
+		game_results = self.manage_high_scores_database.get_game_results_of_player(player_name="second_player")
+		self.assertEqual(first=[100], second=[game_result.coins_earned for game_result in game_results])
+
+	def test_results_are_kept_and_reset(self):
+		""" Opens the database again - results should be kept until the high scores are reset
+
+		:return:
+		"""
+		high_scores = HighScores(high_scores_storage=ManageHighScoresDatabase(database_file_path=self.database_file_path))
+		self.assertEqual(first=3, second=len(high_scores.game_results))
+		high_scores.reset_game_high_scores()
+		self.assertEqual(first=[], second=self.manage_high_scores_database.get_high_scores())
+
+	def test_migrate_from_high_scores_files(self):
+		""" Migrates results from the high scores files to a new database
+
+		:return:
+		"""
+		manage_high_scores_file = ManageHighScoresFile(
+			high_scores_file_path=str(Path(self.temporary_directory.name, "high_scores.json")),
+			high_scores_journal_file_path=str(Path(self.temporary_directory.name, "high_scores_journal.jsonl")))
+		manage_high_scores_file.add_game_result(GameResult(name="dummy_name", coins_earned=500, amount_of_trade_days=7))
+
+		new_database = ManageHighScoresDatabase(database_file_path=str(Path(self.temporary_directory.name, "new.db")))
+		self.assertTrue(new_database.is_migration_required)
+		new_database.migrate_game_results_from_storage(high_scores_storage=manage_high_scores_file)
+		self.assertEqual(first=[500], second=[game_result.coins_earned for game_result in new_database.get_high_scores()])
+		new_database.close()
+
+		new_database = ManageHighScoresDatabase(database_file_path=str(Path(self.temporary_directory.name, "new.db")))
+		self.assertFalse(new_database.is_migration_required)
+		new_database.close()
+
+	def test_failed_migration_is_tried_again(self):
+		""" Fails migrating a corrupt high scores file - the database should not be marked as migrated, so the results
+		are migrated once the file is fixed
+
+		:return:
+		"""
+		high_scores_file: Path = Path(self.temporary_directory.name, "high_scores.json")
+		manage_high_scores_file = ManageHighScoresFile(
+			high_scores_file_path=str(high_scores_file),
+			high_scores_journal_file_path=str(Path(self.temporary_directory.name, "high_scores_journal.jsonl")))
+		high_scores_file.write_text('[{"name": "dummy_name", "coins_')
+
+		new_database = ManageHighScoresDatabase(database_file_path=str(Path(self.temporary_directory.name, "new.db")))
+		with self.assertRaises(json.JSONDecodeError):
+			new_database.migrate_game_results_from_storage(high_scores_storage=manage_high_scores_file)
+		new_database.close()
+
+		high_scores_file.write_text('[{"name": "dummy_name", "coins_earned": 500, "amount_of_trade_days": 7, '
+									'"game_datetime": "2024-01-01 00:00:00"}]')
+		new_database = ManageHighScoresDatabase(database_file_path=str(Path(self.temporary_directory.name, "new.db")))
+		self.assertTrue(new_database.is_migration_required)
+		new_database.migrate_game_results_from_storage(high_scores_storage=ManageHighScoresFile(
+			high_scores_file_path=str(high_scores_file),
+			high_scores_journal_file_path=str(Path(self.temporary_directory.name, "high_scores_journal.jsonl"))))
+		self.assertEqual(first=[500], second=[game_result.coins_earned for game_result in new_database.get_high_scores()])
+		self.assertFalse(new_database.is_migration_required)
+		new_database.close()
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,184 @@
+import io
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import List
+from highscores.game_result import GameResult
+from highscores.manage_high_scores_file import ManageHighScoresFile, HighScores
+
+
+"""
+Tests for storing the game high scores in files
+"""
+
+
+class TestHighScoresFiles(unittest.TestCase):
+	""" Tests for ManageHighScoresFile and HighScores objects """
+	def setUp(self):
+		""" Creates high scores files in a temporary directory """
+		self.temporary_directory = tempfile.TemporaryDirectory()
+		self.high_scores_file_path: str = str(Path(self.temporary_directory.name, "high_scores.json"))
+		self.journal_file_path: str = str(Path(self.temporary_directory.name, "high_scores_journal.jsonl"))
+
+	def tearDown(self):
+		self.temporary_directory.cleanup()
+
+	def create_high_scores(self, journal_compaction_threshold: int = 1000) -> HighScores:
+		""" Creates a high scores object using the temporary files
+
+		:param journal_compaction_threshold:
+		:return: HighScores
+		"""
+		manage_high_scores_file_helper = ManageHighScoresFile(high_scores_file_path=self.high_scores_file_path,
+															  high_scores_journal_file_path=self.journal_file_path,
+															  journal_compaction_threshold=journal_compaction_threshold)
+		return HighScores(high_scores_storage=manage_high_scores_file_helper)
+
+	def test_new_results_are_appended_to_journal(self):
+		""" Adds game results - they should be kept in the journal file and loaded by a new game
+
+		:return:
+		"""
+		high_scores = self.create_high_scores()
+		for coins_earned in [100, 300, 200]:
+			high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+													   amount_of_trade_days=7))
+		self.assertFalse(Path(self.high_scores_file_path).exists())
+		self.assertEqual(first=3, second=len(Path(self.journal_file_path).read_text().splitlines()))
+
+		loaded_high_scores = self.create_high_scores()
+		self.assertEqual(first=[300, 200, 100],
+						 second=[result.coins_earned for result in loaded_high_scores.get_game_results_ordered_by_score()])
+
+	def test_journal_is_compacted(self):
+		""" Adds enough game results to compact the journal - all results should move to the high scores file
+
+		:return:
+		"""
+		high_scores = self.create_high_scores(journal_compaction_threshold=3)
+		for coins_earned in range(4):
+			high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+													   amount_of_trade_days=7))
+			high_scores.high_scores_storage.wait_for_compaction()
+		self.assertEqual(first=1, second=len(Path(self.journal_file_path).read_text().splitlines()))
+		self.assertEqual(first=4, second=len(self.create_high_scores().game_results))
+
+	def test_partially_written_result_is_recovered(self):
+		""" Simulates a crash while appending a result - the torn line should be ignored and then removed
+
+		:return:
+		"""
+		high_scores = self.create_high_scores()
+		high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=100, amount_of_trade_days=7))
+		with open(self.journal_file_path, "a") as journal_file:
+			journal_file.write('{"coins_earned": 5')
+
+		high_scores = self.create_high_scores()
+		self.assertEqual(first=1, second=len(high_scores.game_results))
+		high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=200, amount_of_trade_days=7))
+		self.assertEqual(first=2, second=len(self.create_high_scores().game_results))
+
+	def test_json_array_is_parsed_in_chunks(self):
+		""" Parses a JSON array reading a few characters at a time - items split between chunks should be parsed
+
+		:return:
+		"""
+		items = [{"name": "dummy, \"name\"", "coins_earned": coins_earned} for coins_earned in range(20)]
+		file = io.StringIO(json.dumps(items, indent=4))
+		self.assertEqual(first=items, second=list(ManageHighScoresFile.iterate_json_array_items(file=file, chunk_size=7)))
+		self.assertEqual(first=[], second=list(ManageHighScoresFile.iterate_json_array_items(file=io.StringIO("[]"))))
+
+	def test_top_results_are_read_lazily(self):
+		""" Reads the top results from the files - results should not be all loaded to memory
+
+		:return:
+		"""
+		high_scores = self.create_high_scores(journal_compaction_threshold=50)
+		for coins_earned in range(60):
+			high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=coins_earned % 30,
+													   amount_of_trade_days=7))
+		high_scores.high_scores_storage.wait_for_compaction()
+
+		loaded_high_scores = self.create_high_scores()
+		top_results = loaded_high_scores.high_scores_storage.get_game_results_ordered_by_score(limit=3)
+		self.assertEqual(first=[29, 29, 28], second=[game_result.coins_earned for game_result in top_results])
+		self.assertIsNone(loaded_high_scores.high_scores_storage.game_results_cache)
+
+	def test_files_are_unlocked_while_iterating(self):
+		""" Stops iterating the results in the files early - the files should not be kept locked, so results can be
+		added by another thread, and the iterated results should not change
+
+		:return:
+		"""
+		high_scores = self.create_high_scores(journal_compaction_threshold=3)
+		for coins_earned in range(5):
+			high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+													   amount_of_trade_days=7))
+		high_scores.high_scores_storage.wait_for_compaction()
+
+		manage_high_scores_file: ManageHighScoresFile = self.create_high_scores().high_scores_storage
+		game_results_iterator = manage_high_scores_file.iterate_high_scores()
+		self.assertEqual(first=0, second=next(game_results_iterator).coins_earned)
+		adding_thread = threading.Thread(target=high_scores.add_new_game_result,
+										 args=(GameResult(name="dummy_name", coins_earned=5, amount_of_trade_days=7),))
+		adding_thread.start()
+		adding_thread.join(timeout=5)
+		self.assertFalse(adding_thread.is_alive())
+		high_scores.high_scores_storage.wait_for_compaction()
+		self.assertEqual(first=[1, 2, 3, 4], second=[game_result.coins_earned for game_result in game_results_iterator])
+
+	def test_results_added_by_other_process_are_merged(self):
+		""" Uses two high scores objects sharing the same files, like two game processes
+
+		:return:
+		"""
+		first_high_scores = self.create_high_scores(journal_compaction_threshold=3)
+		second_high_scores = self.create_high_scores(journal_compaction_threshold=3)
+		first_high_scores.add_new_game_result(GameResult(name="first", coins_earned=100, amount_of_trade_days=7))
+		second_high_scores.add_new_game_result(GameResult(name="second", coins_earned=200, amount_of_trade_days=7))
+		self.assertEqual(first=["second", "first"],
+						 second=[game_result.name for game_result in second_high_scores.leaderboard_by_score.game_results])
+
+		# The third result compacts the files - so the first object will read all results again
+		second_high_scores.add_new_game_result(GameResult(name="second", coins_earned=300, amount_of_trade_days=7))
+		second_high_scores.high_scores_storage.wait_for_compaction()
+		first_high_scores.add_new_game_result(GameResult(name="first", coins_earned=50, amount_of_trade_days=7))
+		self.assertEqual(first=[300, 200, 100, 50], second=[
+			game_result.coins_earned for game_result in first_high_scores.leaderboard_by_score.game_results])
+		self.assertEqual(first=4, second=len(self.create_high_scores().game_results))
+
+	def test_reset_high_scores(self):
+		""" Resets the high scores - both files should be emptied
+
+		:return:
+		"""
+		high_scores = self.create_high_scores()
+		high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=100, amount_of_trade_days=7))
+		high_scores.reset_game_high_scores()
+		self.assertEqual(first=[], second=self.create_high_scores().game_results)
+
+	def test_results_after_leaderboard_are_paged(self):
+		""" Pages results beyond the leaderboards capacity - all results should be shown, ordered by score and by date
+
+		:return:
+		"""
+		high_scores = HighScores(high_scores_storage=self.create_high_scores().high_scores_storage, leaderboard_size=3)
+		for coins_earned in [500, 100, 800, 300, 700, 200, 600, 400]:
+			high_scores.add_new_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+													   amount_of_trade_days=7))
+		self.assertEqual(first=8, second=high_scores.get_amount_of_game_results())
+		pages: List[List[int]] = [
+			[game_result.coins_earned
+			 for game_result in high_scores.get_page_of_game_results_ordered_by_score(page_number=page_number,
+																					  page_size=3)]
+			for page_number in range(3)
+		]
+		self.assertEqual(first=[[800, 700, 600], [500, 400, 300], [200, 100]], second=pages)
+		self.assertEqual(first=8, second=len(high_scores.get_page_of_game_results_ordered_by_date(page_number=0,
+																								  page_size=10)))
+
+
+if __name__ == '__main__':
+	unittest.main()
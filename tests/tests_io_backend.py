@@ -0,0 +1,63 @@
+import io
+import random
+import unittest
+from classes.game import Game
+from input_handling.io_backend import ScriptedIOBackend, BufferedIOBackend, use_io_backend
+from input_handling.user_input import UserInput
+from custom_exceptions.validator_custom_exceptions import ValidationExceptionScriptHasEnded
+
+
+"""
+Tests for the input/output backends of the game
+"""
+
+
+class TestIOBackend(unittest.TestCase):
+	""" Tests for the IOBackend objects """
+	def test_scripted_input(self):
+		""" Answers prompts from a script - bad inputs should be asked again
+
+		:return:
+		"""
+		with use_io_backend(ScriptedIOBackend(commands=["abc", "9", "2", "maybe", "y"])) as io_backend:
+			self.assertEqual(first=2, second=UserInput.get_user_number_input_for_menu(
+				prompt_message="Choose an option", options_dict={1: "First", 2: "Second"}))
+			self.assertTrue(UserInput.get_user_yes_no_input(prompt_message="Are you sure?"))
+			with self.assertRaises(ValidationExceptionScriptHasEnded):
+				UserInput.get_user_string_input(prompt_message="Please enter your name:")
+		output: str = io_backend.get_output()
+		self.assertIn(member="Bad input. Value needs to be numeric!", container=output)
+		self.assertIn(member="Bad input. Value should be one of: 1, 2", container=output)
+
+	def test_buffered_output_is_written_in_bulk(self):
+		""" Output should be written only when flushed - before reading the next input
+
+		:return:
+		"""
+		output_stream = io.StringIO()
+		with use_io_backend(BufferedIOBackend(input_stream=io.StringIO("Yafo\n"), output_stream=output_stream)):
+			UserInput.get_user_string_input(prompt_message="Choose a city", options_list=["Yafo"])
+			self.assertIn(member="Choose a city", container=output_stream.getvalue())
+			Game(player_name="dummy_name").print_current_budget()
+			self.assertNotIn(member="coins", container=output_stream.getvalue())
+		self.assertIn(member="You currently have", container=output_stream.getvalue())
+
+	def test_replay_game_session(self):
+		""" Replays a recorded game session twice - both replays should end with the same output
+
+		:return:
+		"""
+		commands = ["1", "1", "Wine", "100", "y", "5", "4", "Larnaka", "1", "2", "Wine", "100", "y", "5", "8", "y"]
+		outputs = []
+		for _ in range(2):
+			random.seed(3)
+			with use_io_backend(ScriptedIOBackend(commands=commands)) as io_backend:
+				game = Game(player_name="dummy_name")
+				game.start_game()
+			outputs.append(io_backend.get_output())
+		self.assertIn(member="Well done captain dummy_name!", container=outputs[0])
+		self.assertEqual(first=outputs[0], second=outputs[1])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from highscores.game_result import GameResult
+from highscores.leaderboard import Leaderboard
+
+
+"""
+Tests for the leaderboard keeping the top game results
+"""
+
+
+class TestLeaderboard(unittest.TestCase):
+	""" Tests for Leaderboard object """
+	def setUp(self):
+		""" Creates a leaderboard keeping the top 3 results by score """
+		self.leaderboard = Leaderboard(capacity=3, key=lambda game_result: game_result.coins_earned)
+
+	def test_keeps_top_results_ordered(self):
+		""" Adds results in a random order - only the top 3 should be kept, ordered from the highest
+
+		:return:
+		"""
+		for coins_earned in [200, 500, 100, 400, 300]:
+			self.leaderboard.add_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+														amount_of_trade_days=7))
+		self.assertEqual(first=[500, 400, 300],
+						 second=[game_result.coins_earned for game_result in self.leaderboard.game_results])
+
+	def test_equal_results_keep_adding_order(self):
+		""" Adds results with the same score - the first added should be ranked first
+
+		:return:
+		"""
+		for name in ["first", "second", "third", "fourth"]:
+			self.leaderboard.add_game_result(GameResult(name=name, coins_earned=100, amount_of_trade_days=7))
+		self.assertEqual(first=["first", "second", "third"],
+						 second=[game_result.name for game_result in self.leaderboard.game_results])
+
+	def test_pages_and_reset(self):
+		""" Reads the leaderboard page by page, and then resets it
+
+		:return:
+		"""
+		for coins_earned in [100, 200, 300]:
+			self.leaderboard.add_game_result(GameResult(name="dummy_name", coins_earned=coins_earned,
+														amount_of_trade_days=7))
+		self.assertEqual(first=2, second=self.leaderboard.get_amount_of_pages(page_size=2))
+		self.assertEqual(first=[100], second=[game_result.coins_earned
+											  for game_result in self.leaderboard.get_page(page_number=1, page_size=2)])
+		self.leaderboard.reset()
+		self.assertEqual(first=0, second=len(self.leaderboard))
+
+
+if __name__ == '__main__':
+	unittest.main()
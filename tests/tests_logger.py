@@ -0,0 +1,83 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from logger.custom_logger import JsonLinesFormatter, configure_logger, stop_logger
+
+
+"""
+Tests for the game logging configuration
+"""
+
+
+class CountStrCalls:
+	""" Counts how many times it was converted to a string """
+	def __init__(self):
+		self.amount_of_str_calls: int = 0
+
+	def __str__(self) -> str:
+		self.amount_of_str_calls += 1
+		return "counted"
+
+
+class TestGameLogger(unittest.TestCase):
+	""" Tests for JsonLinesFormatter and configure_logger """
+	def setUp(self):
+		self.temp_dir = tempfile.TemporaryDirectory()
+		self.log_file_path: str = os.path.join(self.temp_dir.name, "logs.txt")
+		self.root_logger_level: int = logging.getLogger().level
+
+	def tearDown(self):
+		stop_logger()
+		logging.getLogger().setLevel(self.root_logger_level)
+		self.temp_dir.cleanup()
+
+	def read_log_lines(self) -> list:
+		with open(self.log_file_path) as log_file:
+			return [json.loads(line) for line in log_file]
+
+	def test_message_with_quotes_is_valid_json(self):
+		""" Formats messages with quotes and new lines - every record should be a single valid JSON line
+
+		:return:
+		"""
+		record = logging.LogRecord(name="tests", level=logging.INFO, pathname=__file__, lineno=1,
+								   msg='Player named "%s" said:\n%s', args=("Sinbad", "{'a': 1}"), exc_info=None)
+		log_line: str = JsonLinesFormatter().format(record)
+		self.assertNotIn(member="\n", container=log_line)
+		self.assertEqual(first='Player named "Sinbad" said:\n{\'a\': 1}', second=json.loads(log_line)["message"])
+		self.assertEqual(first="INFO", second=json.loads(log_line)["log_level"])
+
+	def test_records_are_written_by_the_queue_listener(self):
+		""" Logs records through the queue, and checks they are all written to the file once the logger is stopped
+
+		:return:
+		"""
+		configure_logger(log_file_path=self.log_file_path, log_level=logging.INFO)
+		logger = logging.getLogger("tests")
+		for index in range(100):
+			logger.info('Record "%s"', index)
+		stop_logger()
+
+		log_lines = self.read_log_lines()
+		self.assertEqual(first=[f'Record "{index}"' for index in range(100)],
+						 second=[log_line["message"] for log_line in log_lines])
+		self.assertEqual(first="tests", second=log_lines[0]["module_name"])
+
+	def test_disabled_level_is_not_formatted(self):
+		""" Logs a debug record while the level is INFO - its arguments should not be converted to strings
+
+		:return:
+		"""
+		configure_logger(log_file_path=self.log_file_path, log_level=logging.INFO)
+		count_str_calls = CountStrCalls()
+		logging.getLogger("tests").debug("Not written %s", count_str_calls)
+		stop_logger()
+
+		self.assertEqual(first=0, second=count_str_calls.amount_of_str_calls)
+		self.assertEqual(first=[], second=self.read_log_lines())
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+from typing import List
+from classes.game_engine import GameEngine
+from classes.products import Product
+from classes.world_config import WorldConfig
+from classes.optional_numpy import is_numpy_available, import_numpy
+from classes.npc_traders import NpcTradersPopulation, NO_PRODUCT_ID
+
+
+"""
+Tests for the NPC traders population and its impact on prices
+"""
+
+
+@unittest.skipUnless(is_numpy_available(), "numpy is not installed")
+class TestNpcTradersPopulation(unittest.TestCase):
+	""" Tests for NpcTradersPopulation object """
+	def setUp(self):
+		self.products_list: List[Product] = [Product(name="Wine", min_price=10, max_price=30),
+											 Product(name="Olives", min_price=5, max_price=20)]
+		# Olives are not traded at Athena
+		self.world_config = WorldConfig(cities_names=["Yafo", "Tyre", "Athena"],
+										products_list=self.products_list,
+										cities_available_products={"Athena": ["Wine"]})
+
+	def test_traders_sell_what_they_bought(self):
+		""" Trades for a few days - every trader should sell the next day all units it bought, and never buy more than
+		its budget and cargo hold allow, or products not traded in its cities
+
+		:return:
+		"""
+		numpy = import_numpy()
+		npc_traders = NpcTradersPopulation(world_registry=self.world_config.world_registry, amount_of_traders=500,
+										   seed=1, cargo_capacity=50)
+		random_generator = numpy.random.default_rng(2)
+		olives_at_athena_index: int = 2 * len(self.products_list) + 1
+		for _ in range(10):
+			# Units carried into every city, at ( city ID * amount of products + product ID )
+			is_carrying = npc_traders.cargo_amounts > 0
+			arriving_units = numpy.bincount(
+				npc_traders.locations[is_carrying] * 2 + npc_traders.cargo_products_ids[is_carrying],
+				weights=npc_traders.cargo_amounts[is_carrying], minlength=6)
+			previous_locations = npc_traders.locations
+			npc_traders.trade(prices_rows=random_generator.integers(low=5, high=30, size=(3, 2), endpoint=True))
+
+			sold_units = (npc_traders.traded_volume - npc_traders.net_demand) // 2
+			bought_units = (npc_traders.traded_volume + npc_traders.net_demand) // 2
+			is_carrying = npc_traders.cargo_amounts > 0
+			departing_units = numpy.bincount(
+				previous_locations[is_carrying] * 2 + npc_traders.cargo_products_ids[is_carrying],
+				weights=npc_traders.cargo_amounts[is_carrying], minlength=6)
+			self.assertEqual(first=arriving_units.tolist(), second=sold_units.tolist())
+			self.assertEqual(first=departing_units.tolist(), second=bought_units.tolist())
+			self.assertEqual(first=0, second=npc_traders.traded_volume[olives_at_athena_index])
+			self.assertTrue((npc_traders.budgets >= 0).all())
+			self.assertTrue((npc_traders.cargo_amounts <= 50).all())
+			self.assertTrue((npc_traders.cargo_products_ids[~is_carrying] == NO_PRODUCT_ID).all())
+
+	def test_price_impact(self):
+		""" Moves prices by net demands - bought products should get more expensive, sold products cheaper, and prices
+		should stay in the range of their product
+
+		:return:
+		"""
+		numpy = import_numpy()
+		npc_traders = NpcTradersPopulation(world_registry=self.world_config.world_registry, amount_of_traders=1,
+										   price_impact=0.2, market_depth=100)
+		npc_traders.net_demand = numpy.array([100, -100, 0, 0, 10 ** 6, -(10 ** 6)], dtype=numpy.int64)
+		npc_traders.traded_volume = numpy.array([100, 100, 50, 50, 10 ** 6, 10 ** 6], dtype=numpy.int64)
+		prices_rows = numpy.array([[20, 10], [20, 10], [29, 6]], dtype=numpy.int64)
+		self.assertEqual(first=[[22, 9], [20, 10], [30, 5]],
+						 second=npc_traders.apply_price_impact(prices_rows=prices_rows).tolist())
+
+	def test_game_prices_are_moved_by_npc_traders(self):
+		""" Plays games with NPC traders in both prices backends - prices should stay in the range of their product, and
+		be the same for the same seed
+
+		:return:
+		"""
+		for use_vectorized_prices_backend in [False, True]:
+			games_prices: List[List[List[int]]] = []
+			for _ in range(2):
+				game = GameEngine(player_name="Sinbad", world_config=self.world_config, prices_seed=3,
+								  use_vectorized_prices_backend=use_vectorized_prices_backend,
+								  amount_of_npc_traders=10000)
+				for _ in range(20):
+					game.move_to_next_day()
+				prices_rows: List[List[int]] = [list(prices_row)
+												for prices_row in game.products_prices_in_cities.get_prices_rows()]
+				for prices_row in prices_rows:
+					for product, price in zip(self.products_list, prices_row):
+						self.assertIn(member=price, container=range(product.min_price, product.max_price + 1))
+				games_prices.append(prices_rows)
+			if use_vectorized_prices_backend:
+				self.assertEqual(first=games_prices[0], second=games_prices[1])
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,197 @@
+import random
+import unittest
+from functools import lru_cache
+from typing import List, Optional
+from simulation.optimal_profit_solver import OptimalProfitSolver, PriceSchedule
+from classes.products import Product
+from classes.world_config import WorldConfig, ShipConfig
+from highscores.game_result import GameResult
+from constants import PRODUCTS_LIST, CITIES_LIST, TOTAL_TRADE_DAYS_IN_A_GAME
+
+
+"""
+Tests for the optimal profit solver
+"""
+
+
+def calculate_final_budget_by_brute_force(price_schedule: PriceSchedule,
+										  world_config: WorldConfig,
+										  hours_for_workday: int) -> int:
+	""" Tries every game of a player holding a single product at a time, the slow and simple way, to compare with the
+	solver. In every city the player can sell the product held, and buy a product with all the coins.
+
+	:param price_schedule: Prices of all trade days, indexed [day][city ID][product ID]
+	:param world_config: The world of the game - with its routes, products traded in cities and ship settings
+	:param hours_for_workday: Amount of work hours in every trade day
+	:return: The best final budget
+	"""
+	world_registry = world_config.world_registry
+	ship_config: ShipConfig = world_config.ship_config
+
+	@lru_cache(maxsize=None)
+	def trade(day: int, hours_left: int, city_id: int, hours_reduction: int, coins: int, product_id: Optional[int],
+			  units: int) -> int:
+		best_final_budget: int = act(day, hours_left, city_id, hours_reduction, coins, product_id, units)
+		if product_id is not None:
+			if not world_registry.is_product_available_in_city(city_id=city_id, product_id=product_id):
+				return best_final_budget
+			coins += units * price_schedule[day][city_id][product_id]
+			best_final_budget = max(best_final_budget, act(day, hours_left, city_id, hours_reduction, coins, None, 0))
+		for product_to_buy_id, price in enumerate(price_schedule[day][city_id]):
+			if world_registry.is_product_available_in_city(city_id=city_id, product_id=product_to_buy_id) \
+					and coins >= price:
+				best_final_budget = max(best_final_budget, act(day, hours_left, city_id, hours_reduction, coins % price,
+															   product_to_buy_id, coins // price))
+		return best_final_budget
+
+	@lru_cache(maxsize=None)
+	def act(day: int, hours_left: int, city_id: int, hours_reduction: int, coins: int, product_id: Optional[int],
+			units: int) -> int:
+		# End the trade day - products left when the game ends are worth nothing
+		best_final_budget: int = coins if day == len(price_schedule) - 1 \
+			else trade(day + 1, hours_for_workday, city_id, hours_reduction, coins, product_id, units)
+		for destination_city_id in range(world_registry.amount_of_cities):
+			voyage_time: int = world_config.get_voyage_times_matrix(hours_reduction=hours_reduction).get_voyage_time(
+				from_city_id=city_id, to_city_id=destination_city_id)
+			if destination_city_id != city_id and voyage_time <= hours_left:
+				best_final_budget = max(best_final_budget, trade(day, hours_left - voyage_time, destination_city_id,
+																 hours_reduction, coins, product_id, units))
+		if ship_config.upgrade_time_reduction > 0 \
+				and ship_config.voyage_time - hours_reduction - ship_config.upgrade_time_reduction >= 1 \
+				and hours_left >= ship_config.upgrade_work_time and coins >= ship_config.upgrade_price:
+			best_final_budget = max(best_final_budget, trade(day, hours_left - ship_config.upgrade_work_time, city_id,
+															 hours_reduction + ship_config.upgrade_time_reduction,
+															 coins - ship_config.upgrade_price, product_id, units))
+		return best_final_budget
+
+	return trade(0, hours_for_workday, world_config.get_city_id(city_name=world_config.start_city),
+				 0, world_config.initial_budget, None, 0)
+
+
+class TestOptimalProfitSolver(unittest.TestCase):
+	""" Tests for OptimalProfitSolver object """
+	def test_solve_small_game(self):
+		""" Solves a game of 2 days, 2 cities and a single product, which was solved by hand:
+		Day 1 - buy 10 units at city 0 for 10, sail to city 1 and keep them for the next day.
+		Day 2 - sell them at city 1 for 30, sail to city 0 to buy 30 units, and sail back to sell them - total 900 coins.
+
+		:return:
+		"""
+		solver = OptimalProfitSolver(price_schedule=[[[10], [20]], [[10], [30]]],
+									 initial_budget=100,
+									 hours_for_workday=16,
+									 voyage_time=8,
+									 ship_upgrade_price=1000000)
+		self.assertEqual(first=900, second=solver.solve())
+
+	def test_ship_upgrade_is_used(self):
+		""" Solves a game where upgrading the ship allows an extra trade in the day
+
+		:return:
+		"""
+		price_schedule = [[[10], [20]]]
+		solver_without_upgrade = OptimalProfitSolver(price_schedule=price_schedule,
+													 initial_budget=100,
+													 hours_for_workday=10,
+													 voyage_time=4,
+													 ship_upgrade_price=1000000)
+		solver_with_upgrade = OptimalProfitSolver(price_schedule=price_schedule,
+												  initial_budget=100,
+												  hours_for_workday=10,
+												  voyage_time=4,
+												  ship_upgrade_time_by_hours=2,
+												  ship_upgrade_work_time_by_hours=2,
+												  ship_upgrade_price=50)
+		self.assertEqual(first=200, second=solver_without_upgrade.solve())
+		# Sell at city 1 for 200, upgrade there for 50 and use the 4 hours left to trade once more - 15 units for 300
+		self.assertEqual(first=300, second=solver_with_upgrade.solve())
+
+	def test_solver_matches_brute_force(self):
+		""" Solves tiny random games in random worlds, with routes of their own and products not traded in all cities,
+		and compares the results with trying every game
+
+		:return:
+		"""
+		random.seed(7)
+		for _ in range(200):
+			amount_of_cities: int = random.randint(2, 3)
+			amount_of_products: int = random.randint(1, 2)
+			cities_names: List[str] = [f"city_{city_id}" for city_id in range(amount_of_cities)]
+			products_list: List[Product] = [Product(name=f"product_{product_id}", min_price=1, max_price=9)
+											for product_id in range(amount_of_products)]
+			world_config = WorldConfig(
+				cities_names=cities_names,
+				products_list=products_list,
+				initial_budget=random.randint(5, 40),
+				ship_config=ShipConfig(voyage_time=random.randint(1, 5),
+									   upgrade_time_reduction=random.randint(0, 2),
+									   upgrade_work_time=random.randint(0, 2),
+									   upgrade_price=random.randint(0, 10)),
+				routes_voyage_times={(cities_names[0], cities_names[-1]): random.randint(1, 6)}
+				if random.random() < 0.5 else None,
+				cities_available_products={
+					city_name: [product.name for product in products_list if random.random() < 0.7]
+					for city_name in cities_names if random.random() < 0.5})
+			price_schedule: List[List[List[int]]] = [[[random.randint(1, 9) for _ in products_list]
+													  for _ in cities_names]
+													 for _ in range(random.randint(1, 2))]
+			hours_for_workday: int = random.randint(2, 4)
+
+			solver = OptimalProfitSolver(price_schedule=price_schedule, world_config=world_config,
+										 hours_for_workday=hours_for_workday)
+			self.assertEqual(first=calculate_final_budget_by_brute_force(price_schedule=price_schedule,
+																		 world_config=world_config,
+																		 hours_for_workday=hours_for_workday),
+							 second=solver.solve())
+
+	def test_coins_left_over_can_beat_the_solver(self):
+		""" Solves a game where the coins left over after buying one product buy a unit of another profitable product -
+		the solver holds a single product, so a game result spreading the coins is better, and is graded 100
+
+		:return:
+		"""
+		solver = OptimalProfitSolver(price_schedule=[[[6, 4], [12, 8]]], initial_budget=10)
+		self.assertEqual(first=18, second=solver.solve())
+		# Buying a unit of each product at city 0 for 10, and selling both at city 1 ends with 20
+		game_result = GameResult(name="dummy_name", coins_earned=20, amount_of_trade_days=1)
+		self.assertEqual(first=100, second=solver.grade_game_result(game_result=game_result))
+
+	def test_world_routes_and_products_are_used(self):
+		""" Solves a game in a world where the direct route is too long for a trade, and wine is not traded at the
+		city it is most expensive in
+
+		:return:
+		"""
+		world_config = WorldConfig(cities_names=["Yafo", "Tyre", "Athena"],
+								   products_list=[Product(name="Wine", min_price=1, max_price=100)],
+								   initial_budget=100,
+								   ship_config=ShipConfig(voyage_time=10, upgrade_price=1000000),
+								   routes_voyage_times={("Yafo", "Tyre"): 4, ("Tyre", "Athena"): 4},
+								   cities_available_products={"Athena": []})
+		price_schedule: List[List[List[int]]] = [[[10], [20], [50]]]
+		solver = OptimalProfitSolver(price_schedule=price_schedule, world_config=world_config, hours_for_workday=8)
+		# Athena is reached through Tyre in 8 hours, but wine can't be sold there - so it is sold at Tyre
+		self.assertEqual(first=200, second=solver.solve())
+		# Without the world, every route takes the ship's voyage time, which is longer than the workday
+		self.assertEqual(first=100, second=OptimalProfitSolver(price_schedule=price_schedule, initial_budget=100,
+															   voyage_time=10, hours_for_workday=8).solve())
+
+	def test_default_world_is_solved(self):
+		""" Solves a random game of the default world, and grades a game result with it
+
+		:return:
+		"""
+		random.seed(1)
+		price_schedule = [[[random.randint(product.min_price, product.max_price) for product in PRODUCTS_LIST]
+						   for _ in CITIES_LIST]
+						  for _ in range(TOTAL_TRADE_DAYS_IN_A_GAME)]
+		solver = OptimalProfitSolver(price_schedule=price_schedule)
+		optimal_final_budget: int = solver.solve()
+		self.assertGreater(a=optimal_final_budget, b=0)
+
+		game_result = GameResult(name="dummy_name", coins_earned=optimal_final_budget // 2, amount_of_trade_days=7)
+		self.assertAlmostEqual(first=50, second=solver.grade_game_result(game_result=game_result), places=3)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,105 @@
+import itertools
+import random
+import statistics
+import unittest
+from typing import List
+from classes.game_engine import GameEngine
+from classes.price_history import PriceHistory
+from classes.products import Product
+from classes.world_registry import WorldRegistry
+from classes.optional_numpy import is_numpy_available
+from constants import PRICE_HISTORY_MAX_LENGTH
+
+
+"""
+Tests for the price history and its rolling statistics
+"""
+
+
+class TestPriceHistory(unittest.TestCase):
+	""" Tests for PriceHistory object """
+	def setUp(self):
+		self.products_list: List[Product] = [Product(name="Wine", min_price=10, max_price=30),
+											 Product(name="Olives", min_price=5, max_price=20)]
+		self.world_registry = WorldRegistry(cities_names=["Yafo", "Tyre", "Athena"], products_list=self.products_list)
+
+	def test_statistics_match_prices_kept(self):
+		""" Adds random prices for many days, with and without numpy - the prices kept and their statistics should match
+		the last days added, and the history arrays should not grow
+
+		:return:
+		"""
+		random.seed(13)
+		for max_length, use_numpy in itertools.product([1, 2, 7], [False, True] if is_numpy_available() else [False]):
+			price_history = PriceHistory(world_registry=self.world_registry, max_length=max_length, use_numpy=use_numpy)
+			arrays_lengths: List[int] = [len(price_history.prices), len(price_history.prices_sums)]
+			all_prices_rows: List[List[List[int]]] = []
+			for _ in range(40):
+				prices_rows: List[List[int]] = [[random.randint(1, 10) for _ in self.products_list]
+												for _ in range(self.world_registry.amount_of_cities)]
+				all_prices_rows.append(prices_rows)
+				price_history.add_prices(prices_rows=prices_rows)
+
+				self.assertEqual(first=min(len(all_prices_rows), max_length), second=price_history.length)
+				for city_id in range(self.world_registry.amount_of_cities):
+					for product_id in range(len(self.products_list)):
+						prices_kept: List[int] = [prices_rows[city_id][product_id]
+												  for prices_rows in all_prices_rows[-max_length:]]
+						self.assertEqual(first=prices_kept,
+										 second=price_history.get_prices(city_id=city_id, product_id=product_id))
+						self.assertEqual(first=min(prices_kept),
+										 second=price_history.get_min_price(city_id=city_id, product_id=product_id))
+						self.assertEqual(first=max(prices_kept),
+										 second=price_history.get_max_price(city_id=city_id, product_id=product_id))
+						self.assertAlmostEqual(first=statistics.mean(prices_kept),
+											   second=price_history.get_mean_price(city_id=city_id,
+																				   product_id=product_id))
+						self.assertAlmostEqual(first=statistics.pstdev(prices_kept),
+											   second=price_history.get_volatility(city_id=city_id,
+																				   product_id=product_id))
+			self.assertEqual(first=arrays_lengths,
+							 second=[len(price_history.prices), len(price_history.prices_sums)])
+
+	def test_empty_history(self):
+		""" Reads the statistics of a history with no days
+
+		:return:
+		"""
+		price_history = PriceHistory(world_registry=self.world_registry, max_length=5)
+		self.assertEqual(first=[], second=price_history.get_prices(city_id=0, product_id=0))
+		self.assertEqual(first=(0, 0, 0, 0), second=(price_history.get_mean_price(city_id=0, product_id=0),
+													 price_history.get_min_price(city_id=0, product_id=0),
+													 price_history.get_max_price(city_id=0, product_id=0),
+													 price_history.get_volatility(city_id=0, product_id=0)))
+
+	def test_disabled_history(self):
+		""" Adds prices to a history with a max length of 0 - no prices should be kept
+
+		:return:
+		"""
+		price_history = PriceHistory(world_registry=self.world_registry, max_length=0)
+		for _ in range(3):
+			price_history.add_prices(prices_rows=[[10, 5] for _ in range(self.world_registry.amount_of_cities)])
+		self.assertEqual(first=0, second=price_history.length)
+		self.assertEqual(first=0, second=len(price_history.prices))
+		self.assertEqual(first=[], second=price_history.get_prices(city_id=0, product_id=0))
+
+	def test_game_keeps_price_history(self):
+		""" Plays a few trade days - the game's history should hold the prices of every day, starting with the first
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad")
+		wine_prices: List[int] = []
+		for _ in range(5):
+			wine_prices.append(game.get_product_price_in_current_city(product=game.products_list[0]))
+			game.move_to_next_day()
+		wine_prices.append(game.get_product_price_in_current_city(product=game.products_list[0]))
+		self.assertEqual(first=wine_prices, second=game.price_history.get_prices(city_id=0, product_id=0))
+		# The history is not longer than the days of the game
+		self.assertEqual(first=min(PRICE_HISTORY_MAX_LENGTH, game.last_trade_day + 1),
+						 second=game.price_history.max_length)
+
+
+if __name__ == '__main__':
+	unittest.main()
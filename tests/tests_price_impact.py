@@ -0,0 +1,110 @@
+import random
+import unittest
+from typing import List
+from classes.game_engine import GameEngine
+from classes.price_impact import PriceImpactModel
+from classes.products import Product
+from classes.world_registry import WorldRegistry
+from simulation.strategies import GreedyTraderStrategy
+
+
+"""
+Tests for the price impact of the player's orders
+"""
+
+
+class TestPriceImpactModel(unittest.TestCase):
+	""" Tests for PriceImpactModel object """
+	def setUp(self):
+		self.products_list: List[Product] = [Product(name="Wine", min_price=10, max_price=30),
+											 Product(name="Olives", min_price=5, max_price=20)]
+		self.world_registry = WorldRegistry(cities_names=["Yafo", "Tyre"], products_list=self.products_list)
+		self.price_impact_model = PriceImpactModel(world_registry=self.world_registry, price_impact_per_unit=0.01,
+												   half_life_hours=8, min_price_multiplier=0.1)
+
+	def test_order_cost_matches_unit_by_unit_sum(self):
+		""" Compares the cost of orders with summing the price of every unit - also for orders getting down to the min
+		price multiplier
+
+		:return:
+		"""
+		random.seed(10)
+		for _ in range(200):
+			first_impact: float = random.uniform(-150, 150)
+			amount: int = random.randint(0, 300)
+			expected_sum: float = sum(max(1 + 0.01 * (first_impact + unit), 0.1) for unit in range(amount))
+			self.assertAlmostEqual(first=expected_sum,
+								   second=self.price_impact_model.get_multipliers_sum(first_impact=first_impact,
+																					   amount=amount),
+								   places=6)
+
+	def test_orders_move_prices(self):
+		""" Buys and sells Wine in Yafo - every order should move the price of the next one, buying back what was sold
+		should not make a profit, and other cities and products should not be moved
+
+		:return:
+		"""
+		self.assertEqual(first=1495, second=self.price_impact_model.get_buy_cost(
+			city_id=0, product_id=0, price=10, amount=100))
+		self.price_impact_model.add_order(city_id=0, product_id=0, amount=100)
+		self.assertAlmostEqual(first=2, second=self.price_impact_model.get_price_multiplier(city_id=0, product_id=0))
+		self.assertEqual(first=1495, second=self.price_impact_model.get_sell_income(
+			city_id=0, product_id=0, price=10, amount=100))
+		self.assertEqual(first=1, second=self.price_impact_model.get_price_multiplier(city_id=1, product_id=0))
+		self.assertEqual(first=1, second=self.price_impact_model.get_price_multiplier(city_id=0, product_id=1))
+
+		self.price_impact_model.add_order(city_id=0, product_id=0, amount=-250)
+		self.assertAlmostEqual(first=0.1, second=self.price_impact_model.get_price_multiplier(city_id=0, product_id=0))
+
+	def test_impact_decays(self):
+		""" Buys Wine, and lets hours pass - the impact should be halved every half life
+
+		:return:
+		"""
+		self.price_impact_model.add_order(city_id=0, product_id=0, amount=80)
+		self.price_impact_model.current_hour = 8
+		self.assertAlmostEqual(first=40, second=self.price_impact_model.get_impact(city_id=0, product_id=0))
+		self.price_impact_model.current_hour = 24
+		self.assertAlmostEqual(first=10, second=self.price_impact_model.get_impact(city_id=0, product_id=0))
+
+	def test_max_amount_to_buy(self):
+		""" Finds the biggest amount to buy with random budgets - it should be paid for, and one more unit should not
+
+		:return:
+		"""
+		random.seed(11)
+		for _ in range(50):
+			self.price_impact_model.add_order(city_id=0, product_id=0, amount=random.randint(-200, 200))
+			price: int = random.randint(1, 30)
+			budget: int = random.randint(0, 100000)
+			amount: int = self.price_impact_model.get_max_amount_to_buy(city_id=0, product_id=0, price=price,
+																		budget=budget)
+			self.assertLessEqual(a=self.price_impact_model.get_buy_cost(city_id=0, product_id=0, price=price,
+																		amount=amount), b=budget)
+			self.assertGreater(a=self.price_impact_model.get_buy_cost(city_id=0, product_id=0, price=price,
+																	  amount=amount + 1), b=budget)
+
+	def test_game_with_price_impact(self):
+		""" Plays a game where orders move prices - big orders should cost more than their amount times the price, the
+		ledger should record the average price paid, and bots should be able to play
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad", price_impact_per_unit=0.001)
+		wine_price: int = game.get_product_price_in_current_city(product=game.products_list[0])
+		cost: int = game.get_buy_cost(product_name="Wine", amount_to_buy=200)
+		self.assertGreater(a=cost, b=200 * wine_price)
+		game.buy_product(product_name="Wine", amount_to_buy=200)
+		self.assertEqual(first=game.world_config.initial_budget - cost, second=game.player.budget)
+		self.assertEqual(first=round(cost / 200), second=game.transactions_ledger.get_transaction(index=0).price)
+		self.assertLessEqual(a=game.get_sell_income(product_name="Wine", amount_to_sell=200), b=cost)
+
+		random.seed(12)
+		for _ in range(5):
+			game = GameEngine(player_name="Sinbad", price_impact_per_unit=0.001)
+			GreedyTraderStrategy().play_game(game_engine=game)
+			self.assertGreaterEqual(a=game.player.budget, b=0)
+
+
+if __name__ == '__main__':
+	unittest.main()
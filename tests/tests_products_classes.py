@@ -103,6 +103,23 @@ class TestPlayersInventory(unittest.TestCase):
 		self.assertNotEqual(first=product_amount, second=10)
 		self.assertNotEqual(first=product_amount, second=15)
 
+	def test_product_inventory_is_live(self):
+		""" Will test that products returned from the inventory follow its amounts, and that updating their amount
+		updates the inventory
+
+		:return:
+		"""
+		player_inventory = PlayersInventory(products_list_in_game=self.dummy_products_list,
+											initial_amount=10)
+		product_inventory: PlayerProductInventory = player_inventory.get_product_by_name(product_name="dummy_product")
+		player_inventory.add_product_to_inventory(product=self.dummy_product, amount_to_add=5)
+		self.assertEqual(first=15, second=product_inventory.amount)
+
+		product_inventory.amount += 3
+		self.assertTrue(player_inventory.check_if_amount_of_item_exists_in_inventory(product=self.dummy_product,
+																					amount=18))
+		self.assertEqual(first=18, second=player_inventory.get_inventory_content()[0].amount)
+
 	def test_check_getting_product_which_doesnt_exist(self):
 		""" Will test getting product from player inventory, where this product doesn't exist
 
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import unittest
+from unittest import mock
+import main
+from highscores.manage_high_scores_file import HighScores
+from input_handling.io_backend import ScriptedIOBackend, use_io_backend
+from benchmarks.benchmark_suite import REPOSITORY_ROOT_PATH
+
+
+"""
+Tests that the game starts without doing work which is not needed for the main menu
+"""
+
+
+class TestGameStartup(unittest.TestCase):
+	""" Tests for the game startup """
+	def test_heavy_modules_are_not_imported(self):
+		""" Imports the game in a new process - numpy and tabulate should not be imported until used
+
+		:return:
+		"""
+		imported_modules: str = subprocess.run(
+			[sys.executable, "-c", "import sys, main; print([name for name in ('numpy', 'tabulate') if name in sys.modules])"],
+			cwd=REPOSITORY_ROOT_PATH, capture_output=True, text=True, check=True).stdout.strip()
+		self.assertEqual(first="[]", second=imported_modules)
+
+	def test_high_scores_are_not_loaded(self):
+		""" Starts the game and exits from the main menu - the high scores should not be read
+
+		:return:
+		"""
+		with mock.patch.object(HighScores, "load_leaderboards") as load_leaderboards:
+			with use_io_backend(ScriptedIOBackend(commands=["3"])):
+				main.main()
+		load_leaderboards.assert_not_called()
+
+
+if __name__ == '__main__':
+	unittest.main()
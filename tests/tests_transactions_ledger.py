@@ -0,0 +1,101 @@
+import random
+import unittest
+from classes.game_engine import GameEngine
+from classes.transactions_ledger import TransactionsLedger, TRANSACTION_TYPE_BUY, TRANSACTION_TYPE_SELL, \
+	TRANSACTION_TYPE_SHIP_FIX, TRANSACTION_TYPE_SHIP_UPGRADE, NO_PRODUCT_ID
+from classes.world_registry import WorldRegistry
+from constants import CITIES_LIST, PRODUCTS_LIST
+
+
+"""
+Tests for the transactions ledger
+"""
+
+
+class TestTransactionsLedger(unittest.TestCase):
+	""" Tests for TransactionsLedger object """
+	def setUp(self):
+		self.world_registry = WorldRegistry(cities_names=CITIES_LIST, products_list=PRODUCTS_LIST)
+		self.ledger = TransactionsLedger(world_registry=self.world_registry)
+		self.wine_id: int = self.world_registry.get_product_id_by_name(product_name="Wine")
+		self.yafo_id: int = self.world_registry.get_city_id(city_name="Yafo")
+		self.larnaka_id: int = self.world_registry.get_city_id(city_name="Larnaka")
+
+	def test_cost_basis_and_profit(self):
+		""" Buys wine twice in different prices and sells some of it - calculated by hand:
+		Bought 10 for 10 and 10 for 20 - average cost is 15, cost basis is 300.
+		Sold 5 for 30 at Larnaka - profit is 150 - 75 = 75, and the cost basis of the 15 left is 225.
+
+		:return:
+		"""
+		self.ledger.add_transaction(TRANSACTION_TYPE_BUY, 1, 0, self.yafo_id, self.wine_id, 10, 100)
+		self.ledger.add_transaction(TRANSACTION_TYPE_BUY, 1, 0, self.yafo_id, self.wine_id, 10, 200)
+		self.assertEqual(first=300, second=self.ledger.get_cost_basis(product_name="Wine"))
+		self.assertEqual(first=15, second=self.ledger.get_average_cost(product_name="Wine"))
+
+		self.ledger.add_transaction(TRANSACTION_TYPE_SELL, 1, 8, self.larnaka_id, self.wine_id, 5, 150)
+		self.assertEqual(first=225, second=self.ledger.get_cost_basis(product_name="Wine"))
+		self.assertEqual(first=75, second=self.ledger.get_realized_profit())
+		self.assertEqual(first=75, second=self.ledger.get_realized_profit(product_name="Wine", city_name="Larnaka"))
+		self.assertEqual(first=0, second=self.ledger.get_realized_profit(city_name="Yafo"))
+		self.assertEqual(first=0, second=self.ledger.get_realized_profit(product_name="Olives"))
+
+		self.ledger.add_transaction(TRANSACTION_TYPE_SHIP_FIX, 1, 8, self.larnaka_id, NO_PRODUCT_ID, 1, 100)
+		self.assertEqual(first=-25, second=self.ledger.get_profit_and_loss(city_name="Larnaka"))
+		self.assertEqual(first=100, second=self.ledger.get_ship_expenses())
+		self.assertEqual(first=4, second=len(self.ledger))
+		self.assertEqual(first="Day 1 hour 8 at Larnaka - sell 5 X Wine for 150",
+						 second=str(self.ledger.get_transaction(index=2)))
+
+	def test_game_engine_records_transactions(self):
+		""" Plays a few actions - every one of them should be recorded, and the inventory rebuilt from the ledger should
+		be the game's inventory
+
+		:return:
+		"""
+		random.seed(4)
+		game = GameEngine(player_name="Sinbad")
+		game.buy_product(product_name="Wine", amount_to_buy=100)
+		game.buy_product(product_name="Flour", amount_to_buy=30)
+		game.ship.chance_for_ship_to_break = 1
+		game.sail_to_city(city_name="Athena")
+		game.sell_product(product_name="Wine", amount_to_sell=60)
+		game.fix_ship()
+		game.upgrade_ship()
+
+		ledger: TransactionsLedger = game.transactions_ledger
+		self.assertEqual(first=[TRANSACTION_TYPE_BUY, TRANSACTION_TYPE_BUY, TRANSACTION_TYPE_SELL,
+								TRANSACTION_TYPE_SHIP_FIX, TRANSACTION_TYPE_SHIP_UPGRADE],
+						 second=[transaction.transaction_type for transaction in ledger])
+		self.assertEqual(first=[0, 0, 8, 8, 8], second=[transaction.hour for transaction in ledger])
+		self.assertEqual(first=list(game.player_inventory.products_amounts),
+						 second=list(ledger.rebuild_inventory().products_amounts))
+		# Everything bought was either sold or is still held
+		self.assertEqual(first=game.player.budget - 10000,
+						 second=ledger.get_profit_and_loss() - ledger.get_cost_basis(product_name="Wine")
+						 - ledger.get_cost_basis(product_name="Flour"))
+
+	def test_profit_and_loss_with_price_impact(self):
+		""" Buys Wine twice and sells all of it in a game where orders move prices - the units of every order have
+		different prices, and the ledger's profit should still be the change of the budget
+
+		:return:
+		"""
+		random.seed(5)
+		game = GameEngine(player_name="Sinbad", price_impact_per_unit=0.01)
+		initial_budget: int = game.player.budget
+		game.buy_product(product_name="Wine", amount_to_buy=7)
+		game.buy_product(product_name="Wine", amount_to_buy=13)
+		game.sell_product(product_name="Wine", amount_to_sell=20)
+
+		ledger: TransactionsLedger = game.transactions_ledger
+		self.assertEqual(first=game.player.budget - initial_budget, second=ledger.get_profit_and_loss())
+		self.assertEqual(first=0, second=ledger.get_cost_basis(product_name="Wine"))
+		self.assertEqual(first=initial_budget - game.player.budget,
+						 second=sum(transaction.total_price for transaction in ledger
+									if transaction.transaction_type == TRANSACTION_TYPE_BUY)
+						 - ledger.get_transaction(index=2).total_price)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,138 @@
+import itertools
+import random
+import unittest
+from typing import List, Dict, Tuple
+from classes.game_engine import GameEngine
+from classes.products import Product
+from classes.voyage_planner import VoyageTimesMatrix
+from classes.world_config import WorldConfig, ShipConfig
+
+
+"""
+Tests for the voyage times matrix and the route planner
+"""
+
+
+def calculate_voyage_times_by_floyd_warshall(amount_of_cities: int,
+											 default_voyage_time: int,
+											 routes: Dict[Tuple[int, int], int]) -> List[List[int]]:
+	""" Calculates the shortest voyage times between all cities the slow and simple way, to compare with the matrix
+
+	:param amount_of_cities:
+	:param default_voyage_time: Voyage time of routes which have no voyage time of their own
+	:param routes: Voyage times of routes, keyed by the IDs of their two cities
+	:return: Voyage time from every city to every city
+	"""
+	voyage_times: List[List[int]] = [[0 if from_city_id == to_city_id else default_voyage_time
+									  for to_city_id in range(amount_of_cities)]
+									 for from_city_id in range(amount_of_cities)]
+	for (from_city_id, to_city_id), voyage_time in routes.items():
+		voyage_times[from_city_id][to_city_id] = voyage_times[to_city_id][from_city_id] = voyage_time
+	for middle_city_id, from_city_id, to_city_id in itertools.product(range(amount_of_cities), repeat=3):
+		voyage_times[from_city_id][to_city_id] = min(
+			voyage_times[from_city_id][to_city_id],
+			voyage_times[from_city_id][middle_city_id] + voyage_times[middle_city_id][to_city_id])
+	return voyage_times
+
+
+class TestVoyageTimesMatrix(unittest.TestCase):
+	""" Tests for VoyageTimesMatrix object """
+	def setUp(self):
+		self.products_list: List[Product] = [Product(name="Wine", min_price=10, max_price=30)]
+
+	def test_matrix_matches_all_pairs_shortest_paths(self):
+		""" Creates random worlds, and compares their matrices and routes with Floyd-Warshall
+
+		:return:
+		"""
+		random.seed(5)
+		for _ in range(100):
+			amount_of_cities: int = random.randint(1, 10)
+			ship_voyage_time: int = random.randint(1, 12)
+			cities_pairs: List[Tuple[int, int]] = list(itertools.combinations(range(amount_of_cities), 2))
+			routes: Dict[Tuple[int, int], int] = {
+				cities_pair: random.randint(1, 25)
+				for cities_pair in random.sample(cities_pairs, random.randint(0, len(cities_pairs)))}
+			cities_names: List[str] = [f"city_{city_id}" for city_id in range(amount_of_cities)]
+			world_config = WorldConfig(
+				cities_names=cities_names,
+				products_list=self.products_list,
+				ship_config=ShipConfig(voyage_time=ship_voyage_time),
+				routes_voyage_times={(cities_names[from_city_id], cities_names[to_city_id]): voyage_time
+									 for (from_city_id, to_city_id), voyage_time in routes.items()})
+
+			for hours_reduction in [0, 3]:
+				voyage_times_matrix: VoyageTimesMatrix = world_config.get_voyage_times_matrix(
+					hours_reduction=hours_reduction)
+				expected_voyage_times: List[List[int]] = calculate_voyage_times_by_floyd_warshall(
+					amount_of_cities=amount_of_cities,
+					default_voyage_time=max(1, ship_voyage_time - hours_reduction),
+					routes={cities_pair: max(1, voyage_time - hours_reduction)
+							for cities_pair, voyage_time in routes.items()})
+				for from_city_id, to_city_id in itertools.product(range(amount_of_cities), repeat=2):
+					expected_voyage_time: int = expected_voyage_times[from_city_id][to_city_id]
+					self.assertEqual(first=expected_voyage_time,
+									 second=voyage_times_matrix.get_voyage_time(from_city_id=from_city_id,
+																				to_city_id=to_city_id))
+					route: List[int] = voyage_times_matrix.get_route(from_city_id=from_city_id, to_city_id=to_city_id)
+					self.assertEqual(first=(from_city_id, to_city_id), second=(route[0], route[-1]))
+					self.assertEqual(first=expected_voyage_time,
+									 second=sum(expected_voyage_times[route_city_id][next_route_city_id]
+												for route_city_id, next_route_city_id in zip(route, route[1:])))
+
+	def test_game_sails_shortest_route(self):
+		""" Sails in a world where the direct route is longer than going through another city, and upgrades the ship -
+		the voyage times should be of the new ship speed, and the matrices shared by the games of the world
+
+		:return:
+		"""
+		world_config = WorldConfig(cities_names=["Yafo", "Tyre", "Athena"],
+								   products_list=self.products_list,
+								   ship_config=ShipConfig(voyage_time=8, upgrade_time_reduction=2, upgrade_work_time=0),
+								   routes_voyage_times={("Yafo", "Athena"): 15, ("Yafo", "Tyre"): 3})
+		game = GameEngine(player_name="Sinbad", world_config=world_config)
+		self.assertEqual(first=11, second=game.get_voyage_time_to_city(city_name="Athena"))
+		self.assertEqual(first=["Yafo", "Tyre", "Athena"], second=game.get_route_to_city(city_name="Athena"))
+		self.assertIs(game.voyage_times_matrix,
+					  GameEngine(player_name="Sinbad", world_config=world_config).voyage_times_matrix)
+
+		game.upgrade_ship()
+		self.assertEqual(first=7, second=game.get_voyage_time_to_city(city_name="Athena"))
+		game.ship.chance_for_ship_to_break = 0
+		game.sail_to_city(city_name="Athena")
+		self.assertEqual(first=16 - 7, second=game.hours_left_for_workday)
+
+	def test_large_world_matrix(self):
+		""" Creates the matrix of a world with 2000 cities and a few thousands routes, and checks the voyage times and
+		routes between random cities
+
+		:return:
+		"""
+		random.seed(6)
+		cities_names: List[str] = [f"city_{city_id}" for city_id in range(2000)]
+		routes_voyage_times: Dict[Tuple[str, str], int] = {}
+		for from_city_id, to_city_id in zip(range(2000), random.sample(range(2000), 2000)):
+			if from_city_id != to_city_id and (cities_names[to_city_id], cities_names[from_city_id]) \
+					not in routes_voyage_times:
+				routes_voyage_times[(cities_names[from_city_id], cities_names[to_city_id])] = random.randint(1, 20)
+		world_config = WorldConfig(cities_names=cities_names, products_list=self.products_list,
+								   routes_voyage_times=routes_voyage_times)
+
+		voyage_times_matrix: VoyageTimesMatrix = world_config.get_voyage_times_matrix()
+		for _ in range(100):
+			from_city_id, to_city_id = random.sample(range(2000), 2)
+			voyage_time: int = voyage_times_matrix.get_voyage_time(from_city_id=from_city_id, to_city_id=to_city_id)
+			self.assertEqual(first=voyage_time,
+							 second=voyage_times_matrix.get_voyage_time(from_city_id=to_city_id,
+																		to_city_id=from_city_id))
+			self.assertLessEqual(a=voyage_time, b=world_config.ship_config.voyage_time)
+			route: List[int] = voyage_times_matrix.get_route(from_city_id=from_city_id, to_city_id=to_city_id)
+			self.assertEqual(first=(from_city_id, to_city_id), second=(route[0], route[-1]))
+			self.assertEqual(first=voyage_time,
+							 second=sum(voyage_times_matrix.get_voyage_time(from_city_id=route_city_id,
+																			to_city_id=next_route_city_id)
+										for route_city_id, next_route_city_id in zip(route, route[1:])))
+
+
+if __name__ == '__main__':
+	unittest.main()
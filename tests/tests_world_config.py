@@ -0,0 +1,162 @@
+import json
+import os
+import tempfile
+import unittest
+from typing import List, Dict, Any
+from classes.game_engine import GameEngine
+from classes.products import Product
+from classes.world_config import WorldConfig, ShipConfig, load_world_config, parse_world_config
+from custom_exceptions.world_config_custom_exceptions import CustomExceptionWorldConfigIsInvalid
+from custom_exceptions.product_custom_exceptions import CustomExceptionProductNotAvailableInCity
+from custom_exceptions.game_custom_exceptions import CustomExceptionNotEnoughHoursLeftInWorkday
+from benchmarks.benchmark_suite import REPOSITORY_ROOT_PATH
+
+
+"""
+Tests for the world configuration - loading worlds from world files, and playing games in them
+"""
+
+
+EXAMPLE_WORLD_FILE_PATH: str = os.path.join(REPOSITORY_ROOT_PATH, "worlds", "example_world.json")
+
+
+def get_small_world_dict() -> Dict[str, Any]:
+	""" Returns the content of a world file with three cities
+
+	:return: Dict
+	"""
+	return {
+		"cities": [{"name": "Yafo"}, {"name": "Larnaka", "products": ["Wine"]}, {"name": "Athena"}],
+		"products": [{"name": "Wine", "min_price": 10, "max_price": 30},
+					 {"name": "Olives", "min_price": 5, "max_price": 20}],
+		"ship": {"voyage_time": 8, "upgrade_time_reduction": 2, "upgrade_work_time": 8, "upgrade_price": 10},
+		"routes": [{"from": "Yafo", "to": "Larnaka", "voyage_time": 3}],
+	}
+
+
+class TestWorldConfig(unittest.TestCase):
+	""" Tests for WorldConfig object """
+	def test_load_world_file(self):
+		""" Loads the example world file - it should be read once, and give the routes and products of every city
+
+		:return:
+		"""
+		world_config: WorldConfig = load_world_config(world_config_file_path=EXAMPLE_WORLD_FILE_PATH)
+		self.assertIs(world_config, load_world_config(world_config_file_path=EXAMPLE_WORLD_FILE_PATH))
+
+		yafo_id: int = world_config.get_city_id(city_name="Yafo")
+		tyre_id: int = world_config.get_city_id(city_name="Tyre")
+		larnaka_id: int = world_config.get_city_id(city_name="Larnaka")
+		self.assertEqual(first=3, second=world_config.get_route_voyage_time(from_city_id=yafo_id, to_city_id=tyre_id))
+		self.assertEqual(first=3, second=world_config.get_route_voyage_time(from_city_id=tyre_id, to_city_id=yafo_id))
+		self.assertEqual(first=8, second=world_config.get_route_voyage_time(from_city_id=yafo_id,
+																			to_city_id=larnaka_id))
+		self.assertEqual(first=3, second=world_config.get_shortest_route_voyage_time(from_city_id=yafo_id))
+
+		papyrus_id: int = world_config.world_registry.get_product_id_by_name(product_name="Papyrus")
+		self.assertTrue(world_config.world_registry.is_product_available_in_city(city_id=yafo_id,
+																				 product_id=papyrus_id))
+		self.assertFalse(world_config.world_registry.is_product_available_in_city(city_id=tyre_id,
+																				  product_id=papyrus_id))
+
+	def test_changed_world_file_is_loaded_again(self):
+		""" Changes a world file after loading it - the changed world should be loaded
+
+		:return:
+		"""
+		with tempfile.TemporaryDirectory() as temp_dir:
+			world_file_path: str = os.path.join(temp_dir, "world.json")
+			world_dict: Dict[str, Any] = get_small_world_dict()
+			with open(world_file_path, "w") as world_file:
+				json.dump(world_dict, world_file)
+			self.assertEqual(first=3, second=len(load_world_config(world_config_file_path=world_file_path).cities_names))
+
+			world_dict["cities"].append({"name": "Tyre"})
+			with open(world_file_path, "w") as world_file:
+				json.dump(world_dict, world_file)
+			self.assertEqual(first=4, second=len(load_world_config(world_config_file_path=world_file_path).cities_names))
+
+	def test_invalid_worlds(self):
+		""" Creates worlds with missing or wrong values - all of them should fail
+
+		:return:
+		"""
+		invalid_worlds: List[Dict[str, Any]] = []
+		for key, value in [("cities", [{"name": "Yafo"}, {"name": "Yafo"}]),
+						   ("cities", [{"name": "Yafo", "products": ["Gold"]}]),
+						   ("products", [{"name": "Wine", "min_price": 30, "max_price": 10}]),
+						   ("products", [{"name": "Wine", "min_price": "10", "max_price": 30}]),
+						   ("products", [{"name": "Wine", "min_price": 0, "max_price": 30}]),
+						   ("routes", [{"from": "Yafo", "to": "Atlantis", "voyage_time": 3}]),
+						   ("routes", [{"from": "Yafo", "to": "Larnaka", "voyage_time": 3},
+									   {"from": "Larnaka", "to": "Yafo", "voyage_time": 4}]),
+						   ("routes", [{"from": "Yafo", "to": "Larnaka", "voyage_time": 0}]),
+						   ("ship", {"chance_to_break": 2}),
+						   ("start_city", "Atlantis")]:
+			world_dict: Dict[str, Any] = get_small_world_dict()
+			world_dict[key] = value
+			invalid_worlds.append(world_dict)
+		world_dict = get_small_world_dict()
+		del world_dict["products"]
+		invalid_worlds.append(world_dict)
+
+		for world_dict in invalid_worlds:
+			with self.assertRaises(CustomExceptionWorldConfigIsInvalid, msg=str(world_dict)):
+				parse_world_config(world_dict=world_dict)
+
+	def test_product_min_price_must_be_positive(self):
+		""" Creates worlds with a product which can be traded for 0 coins or less - should fail
+
+		:return:
+		"""
+		for min_price in [0, -5]:
+			with self.assertRaises(CustomExceptionWorldConfigIsInvalid):
+				WorldConfig(cities_names=["Yafo"], products_list=[Product(name="Wine", min_price=min_price, max_price=30)])
+
+	def test_game_in_world(self):
+		""" Plays a game in a small world - voyages take their route's time shortened by upgrades, and products are
+		traded only in the cities which trade them
+
+		:return:
+		"""
+		game = GameEngine(player_name="Sinbad", world_config=parse_world_config(world_dict=get_small_world_dict()))
+		self.assertEqual(first=3, second=game.get_voyage_time_to_city(city_name="Larnaka"))
+		self.assertEqual(first=8, second=game.get_voyage_time_to_city(city_name="Athena"))
+
+		game.ship.chance_for_ship_to_break = 0
+		game.buy_product(product_name="Olives", amount_to_buy=10)
+		game.sail_to_city(city_name="Larnaka")
+		self.assertEqual(first=13, second=game.hours_left_for_workday)
+		with self.assertRaises(CustomExceptionProductNotAvailableInCity):
+			game.sell_product(product_name="Olives", amount_to_sell=10)
+
+		game.upgrade_ship()
+		self.assertEqual(first=1, second=game.get_voyage_time_to_city(city_name="Yafo"))
+		self.assertEqual(first=6, second=game.get_voyage_time_to_city(city_name="Athena"))
+		with self.assertRaises(CustomExceptionNotEnoughHoursLeftInWorkday):
+			game.sail_to_city(city_name="Athena")
+
+	def test_large_world_setup(self):
+		""" Creates a world with thousands of cities and a game in it
+
+		:return:
+		"""
+		cities_names: List[str] = [f"city_{index}" for index in range(5000)]
+		products_list: List[Product] = [Product(name=f"product_{index}", min_price=1, max_price=100)
+										for index in range(2000)]
+		world_config = WorldConfig(
+			cities_names=cities_names,
+			products_list=products_list,
+			ship_config=ShipConfig(voyage_time=8),
+			routes_voyage_times={(from_city_name, to_city_name): 3
+								 for from_city_name, to_city_name in zip(cities_names, cities_names[1:])},
+			cities_available_products={city_name: ["product_1", "product_2"] for city_name in cities_names[::2]})
+		self.assertEqual(first=3, second=world_config.get_shortest_route_voyage_time(from_city_id=4999))
+
+		game = GameEngine(player_name="Sinbad", world_config=WorldConfig(cities_names=cities_names[:1000],
+																		 products_list=products_list[:100]))
+		self.assertEqual(first=cities_names[:1000], second=game.cities_list)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,64 @@
+from typing import List
+import unittest
+from classes.products import Product, PlayersInventory
+from classes.city_prices import ProductsPricesInAllCities
+from classes.world_registry import WorldRegistry
+from custom_exceptions.city_custom_exceptions import CustomExceptionCityNameNotFound, \
+	CustomExceptionCityNameAlreadyExists
+from custom_exceptions.product_custom_exceptions import CustomExceptionProductDoesNotExists, \
+	CustomExceptionProductNameAlreadyExists
+
+
+class TestWorldRegistry(unittest.TestCase):
+	""" Will test WorldRegistry class """
+	def setUp(self):
+		""" Set up some objects used generally by the tests running by this class """
+		self.products_list: List[Product] = [Product(name=f"product_{index}", min_price=1, max_price=10)
+											 for index in range(2000)]
+		self.cities_list: List[str] = ["Yafo", "Haifa", "Larnaka"]
+		self.world_registry = WorldRegistry(cities_names=self.cities_list, products_list=self.products_list)
+
+	def test_ids_are_dense(self):
+		""" Will check products and cities get their index in the lists as ID
+
+		:return:
+		"""
+		self.assertEqual(first=1500, second=self.world_registry.get_product_id(self.products_list[1500]))
+		self.assertEqual(first=self.products_list[1500], second=self.world_registry.get_product_by_id(1500))
+		self.assertEqual(first=2, second=self.world_registry.get_city_id("Larnaka"))
+		self.assertEqual(first="Larnaka", second=self.world_registry.get_city_name_by_id(2))
+
+		with self.assertRaises(CustomExceptionProductDoesNotExists):
+			self.world_registry.get_product_id_by_name(product_name="not_exist")
+		with self.assertRaises(CustomExceptionCityNameNotFound):
+			self.world_registry.get_city_id(city_name="Atlantis")
+
+	def test_duplicate_names_are_not_allowed(self):
+		""" Will try to register products or cities with the same name twice
+
+		:return:
+		"""
+		with self.assertRaises(CustomExceptionProductNameAlreadyExists):
+			WorldRegistry(cities_names=[], products_list=[self.products_list[0], self.products_list[0]])
+		with self.assertRaises(CustomExceptionCityNameAlreadyExists):
+			WorldRegistry(cities_names=["Yafo", "Yafo"], products_list=[])
+
+	def test_inventory_and_prices_share_registry(self):
+		""" Will check inventory amounts and city prices are indexed by the same products IDs
+
+		:return:
+		"""
+		player_inventory = PlayersInventory(products_list_in_game=self.products_list,
+											world_registry=self.world_registry)
+		prices = ProductsPricesInAllCities(cities_names_in_game=self.cities_list,
+										   products_in_game=self.products_list,
+										   world_registry=self.world_registry)
+		product: Product = self.products_list[1999]
+		player_inventory.add_product_to_inventory(product=product, amount_to_add=3)
+		self.assertEqual(first=3, second=player_inventory.products_amounts[1999])
+		self.assertEqual(first=prices.get_prices_in_city_by_city_name("Haifa").get_price_for_product(product),
+						 second=prices.get_prices_in_city_by_city_id(1).get_price_for_product_id(1999))
+
+
+if __name__ == '__main__':
+	unittest.main()